@@ -0,0 +1,99 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Benchmark: y-band queries through `PlatformGroup.heights` vs. scanning `items`.
+
+Builds a level of `count` platforms stacked ~9 px apart on average, then times
+the three queries a vertical scroller makes every frame, each once through the
+height index and once by filtering every slot: the visible band, the landing
+band under a falling player, and recycling the platforms that scrolled off the
+bottom up to the top. Results of both ways must agree:
+
+    python benchmarks/bands.py
+    python benchmarks/bands.py --counts 1000 100000
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default=os.path.join(ROOT, "game"), help="directory containing the tph package")
+    parser.add_argument("--counts", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.path)
+    from tph import rlapi as rl
+    rl.use_backend("null")
+    from tph import sprites
+
+    random.seed(0)
+    print(f"tph.sprites from {args.path}")
+    print(f"  {'platforms':>9} {'query':<10} {'index':>11} {'scan':>11} {'speedup':>8}")
+    for count in args.counts:
+        top = -count * 9 # the level grows upwards, into negative y
+        group = sprites.PlatformGroup(
+            *(sprites.Entity(random.uniform(0, 540), random.uniform(top, 900), 60, 16) for _ in range(count)),
+        )
+        player = sprites.Entity(270, 400, 60, 80)
+
+        def scan_visible() -> list:
+            band_top, band_bottom = group.visible_band
+            return [platform for platform in group
+                    if platform.hitbox.y < band_bottom and platform.hitbox.y + platform.hitbox.height > band_top]
+
+        def scan_landing() -> list:
+            bottom = player.hitbox.y + player.hitbox.height
+            return [platform for platform in group
+                    if bottom <= platform.hitbox.y <= bottom + 40
+                    and platform.hitbox.x < player.hitbox.x + player.hitbox.width
+                    and player.hitbox.x < platform.hitbox.x + platform.hitbox.width]
+
+        if {id(e) for e in group.visible()} != {id(e) for e in scan_visible()}:
+            sys.exit(f"{count} platforms: visible bands differ")
+        if {id(e) for e in group.landing_candidates(player, 40)} != {id(e) for e in scan_landing()}:
+            sys.exit(f"{count} platforms: landing candidates differ")
+
+        def index_recycle() -> None:
+            # scroll one step: everything in the bottom 9 px goes back to the top
+            bottom = group.visible_band[1] - 9
+            group.visible_band = group.visible_band[0] - 9, bottom
+            for platform in group.recycle_below(bottom):
+                platform.hitbox.y -= count * 9
+                group.register_item(platform)
+
+        def scan_recycle() -> None:
+            bottom = group.visible_band[1] - 9
+            group.visible_band = group.visible_band[0] - 9, bottom
+            for platform in group:
+                if platform.hitbox.y >= bottom:
+                    platform.hitbox.y -= count * 9
+
+        for title, indexed, scanned in (
+            ("visible", group.visible, scan_visible),
+            ("landing", lambda: group.landing_candidates(player, 40), scan_landing),
+            ("recycle", index_recycle, scan_recycle),
+        ):
+            index_time = min(timeit.repeat(indexed, number=args.number, repeat=3)) / args.number
+            scan_time = min(timeit.repeat(scanned, number=args.number, repeat=3)) / args.number
+            print(f"  {count:>9} {title:<10} {index_time * 1e6:>8.1f} us {scan_time * 1e6:>8.1f} us {scan_time / index_time:>7.0f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Benchmark: Python-side cost of drawing many rectangles per frame.
+
+Compares `EntityGroup.render` (one `draw_rectangle_rec` per entity) with
+`EntityGroup.render_batched` and with `rl.draw_rectangles` fed a prebuilt
+`Rectangle` array, each in a `rl.drawing()` block (the render queue only takes
+calls within a frame, and flushes them at its end). Only the time spent before
+raylib takes over is measured, so no window is needed; a frame at 60 FPS has 16.7 ms. Without raylib, run it
+on the null backend:
+
+    python benchmarks/batched.py --count 10000
+    TPH_RLAPI_BACKEND=null python benchmarks/batched.py --count 10000
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+import typing
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def per_frame(fn, frames: int) -> float:
+    return min(timeit.repeat(fn, number=frames, repeat=3)) / frames * 1e3
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default=os.path.join(ROOT, "game"), help="directory containing the tph package")
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument("--frames", type=int, default=20)
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.path)
+    from tph import rlapi as rl
+    from tph.sprites import EntityGroup
+    from tph.sprites.player import Player
+
+    group = EntityGroup(*(Player(random.uniform(0, 600), random.uniform(0, 900)) for _ in range(args.count)))
+    recs = (rl.Rectangle * args.count)(*(sprite.hitbox for sprite in group))
+    colors = (rl.Color * args.count)(*(sprite._hitbox_color for sprite in group))
+
+    def framed(draw) -> typing.Callable[[], None]:
+        def frame() -> None:
+            with rl.drawing():
+                draw()
+        return frame
+
+    print(f"{args.count} rectangles, ms per frame")
+    print(f"  EntityGroup.render          {per_frame(framed(lambda: group.render(0)), args.frames):8.2f}")
+    print(f"  EntityGroup.render_batched  {per_frame(framed(lambda: group.render_batched(0)), args.frames):8.2f}")
+    print(f"  draw_rectangles(arrays)     {per_frame(framed(lambda: rl.draw_rectangles(recs, colors)), args.frames):8.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Benchmark: spatial hash broadphase vs. an all-pairs check for entity contacts.
+
+Scatters platform-sized entities over a 600 px wide level that grows with the
+count (so the density stays that of a screen with ~100 platforms), moves them a
+little every frame and finds all overlapping pairs, once through
+`EntityGroup.spatial` and once by testing every pair. Both must find the same
+pairs. All-pairs above `--full-limit` entities is timed on a sample of rows and
+scaled up, since the real thing takes minutes:
+
+    python benchmarks/broadphase.py
+    python benchmarks/broadphase.py --counts 100 1000 10000 100000
+"""
+
+import argparse
+import itertools
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default=os.path.join(ROOT, "game"), help="directory containing the tph package")
+    parser.add_argument("--counts", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--frames", type=int, default=10)
+    parser.add_argument("--full-limit", type=int, default=2000, help="largest count checked with the full all-pairs loop")
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.path)
+    from tph import rlapi as rl
+    rl.use_backend("null")
+    from tph import sprites
+
+    random.seed(0)
+    print(f"tph.sprites from {args.path}")
+    print(f"  {'entities':>8} {'pairs':>7} {'spatial hash':>14} {'all pairs':>14} {'speedup':>8}")
+    for count in args.counts:
+        height = count * 9
+        entities = [sprites.Entity(random.uniform(0, 540), random.uniform(0, height), 60, 16) for _ in range(count)]
+        group = sprites.EntityGroup(*entities)
+
+        start = time.perf_counter()
+        for frame in range(args.frames):
+            for entity in entities:
+                entity.hitbox.y += 3 if frame % 2 else -3
+                group.spatial.update(entity)
+            hashed = list(group.spatial.pairs())
+        spatial_time = (time.perf_counter() - start) / args.frames
+
+        # all pairs gets the same head start as SpatialHash.pairs: the edges are read once per frame
+        start = time.perf_counter()
+        boxes = [(e, e.hitbox.x, e.hitbox.y, e.hitbox.x + e.hitbox.width, e.hitbox.y + e.hitbox.height) for e in entities]
+        if count <= args.full_limit:
+            brute = [(a, b) for (a, x, y, r, b_), (b, ox, oy, o_r, o_b) in itertools.combinations(boxes, 2)
+                     if x < o_r and ox < r and y < o_b and oy < b_]
+            brute_time = time.perf_counter() - start
+            found = {frozenset(pair) for pair in hashed}
+            if found != {frozenset(pair) for pair in brute}:
+                sys.exit(f"{count} entities: spatial hash found {len(found)} pairs, all pairs {len(brute)}")
+            note = ""
+        else:
+            rows = random.sample(range(count), 200)
+            for row in rows:
+                _, x, y, r, b_ = boxes[row]
+                [other for other, ox, oy, o_r, o_b in boxes[row + 1:] if x < o_r and ox < r and y < o_b and oy < b_]
+            brute_time = (time.perf_counter() - start) / len(rows) * count
+            note = " (est.)"
+
+        print(f"  {count:>8} {len(hashed):>7} {spatial_time * 1e3:>11.2f} ms {brute_time * 1e3:>11.2f} ms{note:<6}"
+              f" {brute_time / spatial_time:>6.0f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Benchmark: `SpriteGroup` under spawn/despawn churn.
+
+Keeps `--count` platforms alive in a `SpriteGroup` and, every simulated frame at
+60 FPS, despawns the oldest ones and registers them again as new ones at
+`--rate` platforms per second, then walks the live platforms once (what render and refresh do).
+Prints the time per frame for churn and iteration. Works with the slot-list
+groups of older checkouts too, to compare:
+
+    python benchmarks/churn.py --rate 1000
+    python benchmarks/churn.py --rate 1000 --path /tmp/old-checkout/game
+"""
+
+import argparse
+import collections
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default=os.path.join(ROOT, "game"), help="directory containing the tph package")
+    parser.add_argument("--count", type=int, default=1000, help="platforms alive at any time")
+    parser.add_argument("--rate", type=int, nargs="+", default=[1000, 10000], help="platforms recycled per second")
+    parser.add_argument("--frames", type=int, default=600)
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.path)
+    from tph import rlapi as rl
+    if hasattr(rl, "use_backend"):
+        rl.use_backend("null")
+    from tph import sprites
+
+    slot_list = not hasattr(sprites, "SlotMap") # groups of SpriteSlots, deleted by index
+
+    def spawn(group: sprites.SpriteGroup, platform: sprites.Entity):
+        if slot_list:
+            deleted = group._recently_deleted_items
+            index = deleted[-1] if len(deleted) != 0 else len(group.items)
+            group.register_item(platform)
+            return index
+        return group.register_item(platform)
+
+    def walk(group: sprites.SpriteGroup) -> float:
+        total = 0.0
+        if slot_list:
+            for slot in group.items:
+                if slot.content is not None:
+                    total += slot.content.hitbox.y
+        else:
+            for platform in group:
+                total += platform.hitbox.y
+        return total
+
+    print(f"tph.sprites from {args.path}, {args.count} live platforms")
+    for rate in args.rate:
+        group = sprites.SpriteGroup()
+        platforms = collections.deque(sprites.Entity(0, i, 60, 16) for i in range(args.count))
+        alive = collections.deque(spawn(group, platform) for platform in platforms)
+        carry = 0.0
+        churn_time = walk_time = 0.0
+        for frame in range(args.frames):
+            carry += rate / 60
+            start = time.perf_counter()
+            while carry >= 1:
+                carry -= 1
+                group.delete_item(alive.popleft())
+                platforms.rotate(-1) # the oldest one, reused as the newest
+                alive.append(spawn(group, platforms[-1]))
+            middle = time.perf_counter()
+            walk(group)
+            end = time.perf_counter()
+            churn_time += middle - start
+            walk_time += end - middle
+        print(f"  {rate:>6} recycled/s: churn {churn_time / args.frames * 1e6:8.1f} us, "
+              f"iteration {walk_time / args.frames * 1e6:8.1f} us per frame")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Microbenchmark: struct argument coercion (`_vec2`, `_rect`, `_color`, ...).
+
+Every drawing function runs its arguments through one of these, so they are
+called several times per sprite per frame. Prints the cost per call and then
+checks with tracemalloc that, once warmed up, the calls allocate nothing, and
+that out-parameters (`check_collision_lines`) don't write into the structs cached
+for tuples; exits non-zero if either fails. Point `--path` at another checkout's `game` directory to
+compare:
+
+    python benchmarks/coercion.py
+    python benchmarks/coercion.py --path /tmp/old-checkout/game
+"""
+
+import argparse
+import itertools
+import os
+import sys
+import timeit
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SETUP = """
+t2, l2 = (10.0, 20.0), [10.0, 20.0]
+t3, l3 = (1, 2, 3), [1, 2, 3]
+t4, l4 = (1.0, 2.0, 3.0, 4.0), [1.0, 2.0, 3.0, 4.0]
+tc, lc = (230, 41, 55, 255), [230, 41, 55, 255]
+s2 = rl.Vector2(10, 20)
+"""
+
+CALLS = [
+    "_vec2(t2)",
+    "_vec2(l2)",
+    "_vec2(s2)",
+    "_vec3(t3)",
+    "_vec3(l3)",
+    "_vec4(t4)",
+    "_vec4(l4)",
+    "_rect(t4)",
+    "_rect(l4)",
+    "_color(tc)",
+    "_color(lc)",
+]
+
+def per_call(stmt: str, namespace: dict, number: int) -> float:
+    timer = timeit.Timer(stmt, SETUP, globals=namespace)
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+def allocated(stmt: str, namespace: dict, number: int) -> int:
+    """Peak bytes allocated while running `stmt` `number` times, after a warm-up."""
+    scope = dict(namespace, repeat=itertools.repeat)
+    exec(SETUP, scope)
+    code = compile(f"for _ in repeat(None, {number}): {stmt}", "<coercion>", "exec")
+    exec(code, scope) # warm up caches and scratch structs
+
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        exec(code, scope)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - start
+
+def _noop(seq):
+    return seq
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default=os.path.join(ROOT, "game"), help="directory containing the tph package")
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.path)
+    from tph import rlapi as rl
+    if hasattr(rl, "use_backend"):
+        rl.use_backend("null")
+    from tph.rlapi import core
+
+    namespace = {"rl": rl, **{name: getattr(core, name) for name in ("_vec2", "_vec3", "_vec4", "_rect", "_color")}}
+    print(f"tph.rlapi from {args.path}")
+    namespace["_noop"] = _noop
+    baseline = allocated("_noop(t2)", namespace, 10_000) # the loop itself
+    failed = []
+    for stmt in CALLS:
+        peak = allocated(stmt, namespace, 10_000) - baseline
+        print(f"  {stmt:<12} {per_call(stmt, namespace, args.number):8.1f} ns   {peak:6d} B peak over 10000 calls")
+        if peak > 0:
+            failed.append(stmt)
+
+    if failed:
+        sys.exit("allocating in the steady state: " + ", ".join(failed))
+
+    # the lines cross at (5, 5): raylib writes it through the pointer, which must not be the struct cached for (0, 0)
+    origin = tuple(core._vec2((0.0, 0.0)))
+    rl.check_collision_lines((0, 0), (10, 10), (0, 10), (10, 0), (0.0, 0.0))
+    if tuple(core._vec2((0.0, 0.0))) != origin:
+        sys.exit(f"check_collision_lines wrote its collision point into the cached (0, 0): now {tuple(core._vec2((0.0, 0.0)))}")
+    point = rl.Vector2()
+    if not rl.check_collision_lines((0, 0), (10, 10), (0, 10), (10, 0), point) or tuple(point) != (5, 5):
+        sys.exit(f"check_collision_lines did not write its collision point into the caller's Vector2: {tuple(point)}")
+    print("  check_collision_lines leaves the cached structs alone")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Microbenchmark: render-state context managers, tracked vs. generator-based.
+
+Times entering and leaving `rl.blend_mode` and `rl.scissor_mode`, alone and
+nested inside the same state, against `@contextmanager` equivalents that always
+emit their Begin/End pair, and prints the elision counters of `rl.render_state`.
+Runs on the null backend, so only the Python overhead is measured:
+
+    python benchmarks/contexts.py
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from contextlib import contextmanager
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STMTS = {
+    "blend":            ("with blend: pass", "with gen_blend(rl.BLEND_ADDITIVE): pass"),
+    "blend, nested":    ("with blend:\n with blend: pass",
+                         "with gen_blend(rl.BLEND_ADDITIVE):\n with gen_blend(rl.BLEND_ADDITIVE): pass"),
+    "scissor":          ("with rl.scissor_mode(0, 0, 64, 64): pass", "with gen_scissor(0, 0, 64, 64): pass"),
+}
+
+def per_use(stmt: str, namespace: dict, number: int) -> float:
+    timer = timeit.Timer(stmt, globals=namespace)
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default=os.path.join(ROOT, "game"), help="directory containing the tph package")
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    os.environ["TPH_RLAPI_BACKEND"] = "null"
+    sys.path.insert(0, args.path)
+    from tph import rlapi as rl
+
+    @contextmanager
+    def gen_blend(mode):
+        rl.begin_blend_mode(mode)
+        yield
+        rl.end_blend_mode()
+
+    @contextmanager
+    def gen_scissor(x, y, width, height):
+        rl.begin_scissor_mode(x, y, width, height)
+        yield
+        rl.end_scissor_mode()
+
+    namespace = {"rl": rl, "blend": rl.blend_mode(rl.BLEND_ADDITIVE), "gen_blend": gen_blend, "gen_scissor": gen_scissor}
+    print(f"tph.rlapi from {args.path}")
+    print(f"  {'':<16} {'tracked':>10} {'generator':>10}")
+    for title, (tracked, generator) in STMTS.items():
+        print(f"  {title:<16} {per_use(tracked, namespace, args.number):7.1f} ns {per_use(generator, namespace, args.number):7.1f} ns")
+
+    rl.render_state.end_frame()
+    with rl.blend_mode(rl.BLEND_ADDITIVE):
+        for _ in range(10):
+            with rl.blend_mode(rl.BLEND_ADDITIVE):
+                pass
+    rl.render_state.end_frame()
+    print(f"  10 nested re-sets of the same blend mode: {rl.render_state.last_frame}")
+
+if __name__ == "__main__":
+    main()
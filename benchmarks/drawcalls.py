@@ -0,0 +1,70 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Draw-call check: records the game loop headless and reports per-frame render stats.
+
+Runs `tph.__main__.main` on the null backend with draw-command recording on and
+the space key scripted, then prints the draw calls, state changes and argument
+bytes per frame. `--save` keeps the recording; `--compare` diffs against a saved
+one and exits non-zero if any frame's commands changed:
+
+    python benchmarks/drawcalls.py --save before.tphrec
+    python benchmarks/drawcalls.py --compare before.tphrec
+"""
+
+import argparse
+import os
+import statistics
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default=os.path.join(ROOT, "game"), help="directory containing the tph package")
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--save", metavar="FILE", help="write the recording to FILE")
+    parser.add_argument("--compare", metavar="FILE", help="diff against the recording in FILE")
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.path)
+    from tph import rlapi as rl
+    rl.use_backend("null")
+    rl.use_recording()
+    from tph import __main__ as game
+    from tph.rlapi import null, record
+    record.recording.keep(None) # every frame of the run, for comparing
+
+    null.state.max_frames = args.frames
+    null.state.script = lambda frame: (rl.KEY_SPACE,) if frame // 30 % 2 else ()
+    game.main()
+
+    recording = record.recording
+    stats = [recording.stats(index) for index in range(len(recording.frames))]
+    print(f"{len(stats)} frames recorded")
+    for field in ("draw_calls", "state_changes", "arg_bytes"):
+        values = [getattr(frame, field) for frame in stats]
+        print(f"  {field:<14} mean {statistics.mean(values):8.1f}   max {max(values):6d}")
+
+    if args.save:
+        recording.save(args.save)
+    if args.compare:
+        changed = record.Recording.load(args.compare).diff(recording)
+        for index, before, after in changed[:10]:
+            print(f"  frame {index}: {before} -> {after}")
+        if changed:
+            sys.exit(f"{len(changed)} frames differ from {args.compare}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Check and benchmark: `Env` and `VectorEnv` steps per second by worker count.
+
+Steps `--count` envs with random actions, once in this process through plain
+`Env`s and once through a `VectorEnv` for each of `--workers`: the
+observations and rewards out of shared memory must match the in-process ones
+step for step. Prints the aggregate steps per second of each (the envs are
+independent, so it can scale up to the cores there are):
+
+    python benchmarks/env.py
+    python benchmarks/env.py --count 64 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from array import array
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default=os.path.join(ROOT, "game"), help="directory containing the tph package")
+    parser.add_argument("--count", type=int, default=16, help="envs stepped together")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--steps", type=int, default=300)
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.path)
+    from tph import rlapi as rl
+    rl.use_backend("null")
+    from tph import env
+
+    rng = random.Random(0)
+    actions = [[rng.randrange(env.ACTION_COUNT) for _ in range(args.count)] for _ in range(args.steps)]
+
+    envs = [env.Env(i) for i in range(args.count)]
+    for single in envs:
+        single.reset()
+    expected = []
+    start = time.perf_counter()
+    for step in actions:
+        results = [single.step(action) for single, action in zip(envs, step)]
+        expected.append(([list(result[0]) for result in results], [result[1] for result in results]))
+    elapsed = time.perf_counter() - start
+    print(f"{args.count} envs, {args.steps} steps each, {os.cpu_count()} cores")
+    print(f"  {'in process':<12} {args.count * args.steps / elapsed:9.0f} steps/s")
+
+    for workers in args.workers:
+        with env.VectorEnv(args.count, workers) as vector:
+            vector.reset()
+            start = time.perf_counter()
+            results = []
+            for step in actions:
+                vector.step(step)
+                results.append((vector.observations.tolist(), vector.rewards.tolist()))
+            elapsed = time.perf_counter() - start
+        for index, (result, (observations, rewards)) in enumerate(zip(results, expected)):
+            if result[0] != observations or result[1] != _float32(rewards):
+                sys.exit(f"{workers} workers: step {index} differs from stepping the envs in process")
+        print(f"  {f'{workers} workers':<12} {args.count * args.steps / elapsed:9.0f} steps/s")
+
+def _float32(values: list) -> list:
+    "Rounds to what float32 holds, like the shared rewards do."
+    return array('f', values).tolist()
+
+if __name__ == "__main__":
+    main()
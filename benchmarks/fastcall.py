@@ -0,0 +1,87 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Microbenchmark: checked rlapi wrappers vs. `rl.fast` for common calls.
+
+Times the 20 drawing and input calls a game like this one makes most often,
+once through the regular wrapper and once through `rl.fast` with ctypes-ready
+arguments (the same structs in both cases). Run it with a real raylib, or with
+any library exporting the symbols, since no window is opened:
+
+    python benchmarks/fastcall.py
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SETUP = """
+rec = rl.Rectangle(10, 20, 60, 80)
+pos = rl.Vector2(10, 20)
+end = rl.Vector2(30, 40)
+third = rl.Vector2(50, 10)
+color = rl.Color(190, 33, 55, 255)
+tex = rl.Texture()
+"""
+
+# (wrapper arguments, fast arguments)
+CALLS = {
+    "clear_background":      ("color", "color"),
+    "draw_fps":              ("20, 20", "20, 20"),
+    "draw_text":             ("'Hop!', 20, 20, 20, color", "b'Hop!', 20, 20, 20, color"),
+    "draw_rectangle":        ("10, 20, 60, 80, color", "10, 20, 60, 80, color"),
+    "draw_rectangle_rec":    ("rec, color", "rec, color"),
+    "draw_rectangle_v":      ("pos, end, color", "pos, end, color"),
+    "draw_rectangle_lines":  ("10, 20, 60, 80, color", "10, 20, 60, 80, color"),
+    "draw_circle":           ("10, 20, 5.0, color", "10, 20, 5.0, color"),
+    "draw_circle_v":         ("pos, 5.0, color", "pos, 5.0, color"),
+    "draw_line":             ("10, 20, 30, 40, color", "10, 20, 30, 40, color"),
+    "draw_line_v":           ("pos, end, color", "pos, end, color"),
+    "draw_triangle":         ("pos, end, third, color", "pos, end, third, color"),
+    "draw_texture":          ("tex, 10, 20, color", "tex, 10, 20, color"),
+    "draw_texture_v":        ("tex, pos, color", "tex, pos, color"),
+    "is_key_down":           ("rl.KEY_SPACE", "rl.KEY_SPACE"),
+    "is_key_pressed":        ("rl.KEY_SPACE", "rl.KEY_SPACE"),
+    "is_key_released":       ("rl.KEY_SPACE", "rl.KEY_SPACE"),
+    "is_mouse_button_down":  ("rl.MOUSE_BUTTON_LEFT", "rl.MOUSE_BUTTON_LEFT"),
+    "get_mouse_position":    ("", ""),
+    "get_frame_time":        ("", ""),
+}
+
+def per_call(stmt: str, namespace: dict, number: int) -> float:
+    timer = timeit.Timer(stmt, SETUP, globals=namespace)
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default=os.path.join(ROOT, "game"), help="directory containing the tph package")
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.path)
+    from tph import rlapi as rl
+
+    namespace = {"rl": rl, "fast": rl.fast}
+    print(f"tph.rlapi from {args.path}")
+    print(f"  {'call':<22} {'checked':>10} {'fast':>10} {'speedup':>8}")
+    for name, (checked_args, fast_args) in CALLS.items():
+        checked = per_call(f"rl.{name}({checked_args})", namespace, args.number)
+        fast = per_call(f"fast.{name}({fast_args})", namespace, args.number)
+        print(f"  {name:<22} {checked:7.1f} ns {fast:7.1f} ns {checked / fast:7.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Benchmark: input calls into raylib per frame, with `--count` players reading the keyboard.
+
+Runs frames of refreshing every player on the null backend with scripted keys,
+counting the Is*Down/Is*Released/IsGamepad* calls that reach the library and
+timing the input part of the frame. Then checks that a key released on a frame
+running no tick still reaches the next tick, and only that one. Works with checkouts from before
+`tph.controls` too (where every player asks raylib about each of its keys), to
+compare:
+
+    python benchmarks/input.py
+    python benchmarks/input.py --path /tmp/old-checkout/game
+"""
+
+import argparse
+import collections
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default=os.path.join(ROOT, "game"), help="directory containing the tph package")
+    parser.add_argument("--count", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.path)
+    from tph import rlapi as rl
+    rl.use_backend("null")
+    from tph.rlapi import null
+
+    # count the input functions before the library binds them
+    calls = collections.Counter()
+    for name in ("IsKeyDown", "IsKeyReleased", "IsKeyPressed", "IsGamepadAvailable", "IsGamepadButtonDown"):
+        impl = getattr(null.NullState, name, None)
+
+        def counted(self, *args, name=name, impl=impl):
+            calls[name] += 1
+            return impl(self, *args) if impl is not None else False
+        setattr(null.NullState, name, counted)
+
+    from tph.sprites.player import Player
+    try:
+        from tph import controls
+    except ImportError: # older checkout, players poll raylib themselves
+        controls = None
+
+    null.state.script = lambda frame: (rl.KEY_RIGHT, rl.KEY_SPACE) if frame % 40 < 20 else (rl.KEY_LEFT,)
+    print(f"tph from {args.path}{'' if controls is not None else ' (no tph.controls)'}")
+    for count in args.count:
+        players = [Player(i % 540, 820) for i in range(count)]
+        calls.clear()
+        elapsed = 0.0
+        for frame in range(args.frames):
+            with rl.drawing():
+                pass
+            start = time.perf_counter()
+            if controls is not None:
+                controls.poll()
+            for player in players:
+                player._kb_input()
+            if controls is not None:
+                controls.consume()
+            elapsed += time.perf_counter() - start
+        total = sum(calls.values()) / args.frames
+        print(f"  {count:>5} players: {total:7.1f} input calls into raylib, input {elapsed / args.frames * 1e6:8.1f} us per frame")
+    null.state.script = None
+
+    if controls is not None and hasattr(controls, "consume"):
+        jump = controls.Action.JUMP
+        controls.inject(1 << jump)
+        controls.consume() # a tick ran with jump held
+        controls.inject(0) # released on a frame that runs no tick (above 60 Hz)...
+        controls.inject(0)
+        if not controls.snapshot.is_released(jump):
+            sys.exit("a release on a frame without a tick got lost")
+        controls.consume() # ...seen by the next tick, and not by the one after it in the same frame
+        if controls.snapshot.is_released(jump):
+            sys.exit("the second tick of a frame saw the release again")
+        print("  edges of frames without a tick reach the next tick, once")
+
+if __name__ == "__main__":
+    main()
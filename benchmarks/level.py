@@ -0,0 +1,97 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Check and benchmark: the chunk-streamed `Level`.
+
+Climbs a camera band through `--chunks` chunks of a seeded level and prints the
+cost of `Level.update` per tick (mean and worst), the most platforms and chunks
+alive at once, and the pool's counters. Then checks that chunks are
+byte-identical for the same seed: generated in a different order, and in a
+second interpreter with another PYTHONHASHSEED:
+
+    python benchmarks/level.py
+    python benchmarks/level.py --chunks 10000 --speed 30
+"""
+
+import argparse
+import hashlib
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def digest(level, seed: int, indices) -> str:
+    chunks = {index: level.generate_chunk(seed, index).tobytes() for index in indices}
+    sha = hashlib.sha256()
+    for index in sorted(chunks):
+        sha.update(chunks[index])
+    return sha.hexdigest()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default=os.path.join(ROOT, "game"), help="directory containing the tph package")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--chunks", type=int, default=1000, help="how far to climb")
+    parser.add_argument("--speed", type=float, default=15, help="camera speed in px per tick")
+    parser.add_argument("--digest", action="store_true", help="only print the digest of the first chunks (used for the cross-process check)")
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.path)
+    from tph import rlapi as rl
+    rl.use_backend("null")
+    from tph import sprites, level
+    from tph.sprites.platform import Platform
+
+    indices = range(64)
+    if args.digest:
+        print(digest(level, args.seed, indices))
+        return
+
+    pool = sprites.Pool(lambda: Platform(0, 0), size=64)
+    group = sprites.PlatformGroup(pool=pool)
+    world = level.Level(args.seed, group)
+    top, bottom = group.visible_band
+    goal = level.chunk_bounds(args.chunks)[0]
+    times = []
+    most_platforms = most_chunks = 0
+    while top > goal:
+        start = time.perf_counter()
+        world.update(top, bottom)
+        times.append(time.perf_counter() - start)
+        group.visible_band = top, bottom = top - args.speed, bottom - args.speed
+        most_platforms = max(most_platforms, len(group))
+        most_chunks = max(most_chunks, len(world.chunks))
+    print(f"seed {args.seed}, {args.chunks} chunks climbed in {len(times)} ticks at {args.speed:g} px/tick")
+    print(f"  update:  first {times[0] * 1e6:7.1f} us (the chunks on screen), then mean {sum(times[1:]) / len(times[1:]) * 1e6:7.1f} us, "
+          f"worst {max(times[1:]) * 1e6:7.1f} us")
+    print(f"  alive:   at most {most_platforms} platforms in {most_chunks} chunks")
+    print(f"  pool:    {pool.hits} hits, {pool.misses} misses, high water {pool.high_water}")
+
+    reference = digest(level, args.seed, indices)
+    if digest(level, args.seed, reversed(indices)) != reference:
+        sys.exit("chunks depend on the order they are generated in")
+    if digest(level, args.seed + 1, indices) == reference:
+        sys.exit("different seeds gave the same chunks")
+    other = subprocess.run(
+        [sys.executable, __file__, "--path", args.path, "--seed", str(args.seed), "--digest"],
+        env={**os.environ, "PYTHONHASHSEED": "12345"}, capture_output=True, text=True, check=True,
+    ).stdout.strip()
+    if other != reference:
+        sys.exit(f"another process made different chunks: {other} != {reference}")
+    print(f"  chunks {indices.start}-{indices.stop - 1}: sha256 {reference[:16]}, identical in order, reversed and in another process")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Parity check and benchmark: batched `physics.step` vs. the scalar `Player` code.
+
+Runs two groups of identical players side by side on the null backend with a
+scripted input sequence (walking both ways across the screen edges, jumping,
+releasing mid-jump), standing on floors at different heights: one group refreshes each `Player` on its own, the other
+keeps them in an `EntityStore` and integrates them with `physics.step`. Every
+frame, every hitbox and velocity must be bit-identical, otherwise the script
+exits non-zero. Then times the physics part of a frame both ways (the
+contact pass of `EntityGroup.refresh` is left out, it is the same for both):
+
+    python benchmarks/physics.py
+    python benchmarks/physics.py --count 10000 --frames 60
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default=os.path.join(ROOT, "game"), help="directory containing the tph package")
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument("--frames", type=int, default=600, help="frames of the parity run")
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.path)
+    from tph import rlapi as rl
+    rl.use_backend("null")
+    from tph import sprites, controls
+    from tph.sprites.player import Player
+    from tph.rlapi import null
+
+    def keys(frame: int) -> tuple:
+        held = []
+        phase = frame % 240
+        if phase < 70:
+            held.append(rl.KEY_RIGHT)
+        elif 120 <= phase < 200:
+            held.append(rl.KEY_LEFT)
+        if frame % 90 < 25 or 150 <= phase < 152:
+            held.append(rl.KEY_SPACE)
+        return tuple(held)
+
+    null.state.script = keys
+    random.seed(0)
+    starts = [(random.uniform(-30, 600), random.uniform(0, 900)) for _ in range(args.count)]
+    floors = [random.choice((sprites.physics.FLOOR_HEIGHT, 700, 1100)) for _ in range(args.count)] # the default and others
+
+    scalar = sprites.EntityGroup(*(Player(x, y) for x, y in starts))
+    batched = sprites.EntityGroup(*(Player(x, y) for x, y in starts), store=sprites.EntityStore())
+    for group in (scalar, batched):
+        for player, floor in zip(group, floors):
+            player.floor_height = floor
+    for player in batched:
+        batched.simulate(player)
+
+    def state(group: sprites.EntityGroup) -> list:
+        return [(bytes(player.hitbox), bytes(player.velocity)) for player in group]
+
+    for frame in range(args.frames):
+        with rl.drawing():
+            pass
+        controls.poll()
+        scalar.refresh(frame, None)
+        batched.refresh(frame, None)
+        controls.consume()
+        if state(scalar) != state(batched):
+            first = next(i for i, (a, b) in enumerate(zip(state(scalar), state(batched))) if a != b)
+            a, b = list(scalar)[first], list(batched)[first]
+            sys.exit(f"frame {frame}: player {first} differs: scalar {a.hitbox} {a.velocity}, batched {b.hitbox} {b.velocity}")
+    print(f"{args.count} players, {args.frames} frames: batched trajectories identical to the scalar ones")
+
+    for title, group in (("scalar Player.refresh", scalar), ("batched physics.step", batched)):
+        start = time.perf_counter()
+        for frame in range(60):
+            for player in group:
+                player.refresh(None, frame)
+            if group.store is not None:
+                sprites.physics.step(group.store)
+        print(f"  {title:<22} {(time.perf_counter() - start) / 60 * 1e3:7.2f} ms per frame")
+
+    start = time.perf_counter()
+    for _ in range(60):
+        sprites.physics.step(batched.store)
+    print(f"  {'physics.step alone':<22} {(time.perf_counter() - start) / 60 * 1e3:7.2f} ms per frame")
+
+if __name__ == "__main__":
+    main()
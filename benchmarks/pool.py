@@ -0,0 +1,91 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Benchmark: spawning platforms from a `Pool` vs. constructing new `Entity`s.
+
+Scrolls a `PlatformGroup` of `--count` platforms upwards at 60 FPS, and every
+frame flags the ones that fell off the bottom `should_delete`, sweeps them and
+spawns as many new ones above the camera, at `--rate` platforms per second:
+once constructing a fresh `Entity` (and its ctypes `Rectangle`) per spawn, once
+acquiring them from a preallocated pool. Prints the time per frame, the gen-0
+collections the run caused and the pool's counters:
+
+    python benchmarks/pool.py
+    python benchmarks/pool.py --rate 10000 --count 5000
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default=os.path.join(ROOT, "game"), help="directory containing the tph package")
+    parser.add_argument("--count", type=int, default=1000, help="platforms alive at any time")
+    parser.add_argument("--rate", type=int, default=3000, help="platforms recycled per second")
+    parser.add_argument("--frames", type=int, default=600)
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.path)
+    from tph import rlapi as rl
+    rl.use_backend("null")
+    from tph import sprites
+
+    spacing = 900 / args.count
+    scroll = args.rate / 60 * spacing # px per frame, so that `rate` platforms leave the bottom every second
+
+    print(f"tph.sprites from {args.path}: {args.count} platforms, {args.rate} recycled per second")
+    for pooled in (False, True):
+        random.seed(0)
+        pool = sprites.Pool(lambda: sprites.Entity(0, 0, 0, 0), size=args.count * 2) if pooled else None
+        group = sprites.PlatformGroup(pool=pool)
+        new = (lambda x, y: group.acquire(x, y, 60, 16)) if pooled else \
+              (lambda x, y: group.register_item(sprites.Entity(x, y, 60, 16)))
+        for i in range(args.count):
+            new(random.uniform(0, 540), i * spacing)
+        if pooled:
+            pool.reset_counters()
+
+        top, bottom = 0.0, 900.0
+        collections = gc.get_stats()[0]["collections"]
+        start = time.perf_counter()
+        for frame in range(args.frames):
+            top, bottom = top - scroll, bottom - scroll
+            group.visible_band = top, bottom
+            spawned = 0
+            for platform in group.heights.band(bottom, float("inf")):
+                platform.should_delete = True
+                spawned += 1
+            group.sweep()
+            for i in range(spawned):
+                new(random.uniform(0, 540), top - i * spacing / spawned)
+        elapsed = time.perf_counter() - start
+        collections = gc.get_stats()[0]["collections"] - collections
+
+        if len(group) != args.count:
+            sys.exit(f"{len(group)} platforms alive instead of {args.count}")
+        title = "pool.acquire" if pooled else "new Entity"
+        print(f"  {title:<13} {elapsed / args.frames * 1e6:8.1f} us per frame, {collections:>4} gen-0 collections")
+        if pooled:
+            if len(pool) != len(group):
+                sys.exit(f"{len(pool)} pooled entities in use, {len(group)} in the group")
+            print(f"  {'':<13} {pool.hits} hits, {pool.misses} misses, high water {pool.high_water}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Check and benchmark: the cached jump reachability table vs. simulating the jump.
+
+Builds the table into a fresh cache directory, loads it again from there, and
+then answers "can the player get from A to B" for `--pairs` random platform
+pairs twice: with `ReachTable.reachable`, and by simulating the real `Player`
+through every jump towards B (walking only as far as needed) until its feet come
+down through B's top. Both answers must agree, otherwise the script exits non-zero:
+
+    python benchmarks/reach.py
+    python benchmarks/reach.py --pairs 200
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default=os.path.join(ROOT, "game"), help="directory containing the tph package")
+    parser.add_argument("--pairs", type=int, default=40)
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.path)
+    from tph import rlapi as rl
+    rl.use_backend("null")
+    from tph import reach, controls
+    from tph.rlapi import null
+    from tph.sprites.player import Player
+
+    with tempfile.TemporaryDirectory() as cache:
+        start = time.perf_counter()
+        reach.load(cache)
+        cold = time.perf_counter() - start
+        start = time.perf_counter()
+        table = reach.load(cache)
+        warm = time.perf_counter() - start
+    print(f"{table}: computed and cached in {cold * 1e3:.0f} ms, loaded from the cache in {warm * 1e3:.1f} ms")
+
+    def overlapping(player: rl.Rectangle, platform: rl.Rectangle) -> bool:
+        "Horizontally, with the screen wrapping around."
+        return any(player.x < x + platform.width and x < player.x + player.width
+                   for x in (platform.x - reach.SCREEN_WIDTH, platform.x, platform.x + reach.SCREEN_WIDTH))
+
+    def simulate(a: rl.Rectangle, b: rl.Rectangle) -> bool:
+        "Whether some jump from a comes down through the top of b while overlapping it."
+        for phase in range(6):
+            for hold in range(reach.MAX_HOLD + 1):
+                player = Player(0, 0)
+                # standing on the edge of a nearest to b (the short way around the screen), hanging over it as far as it can
+                right = (b.x - a.x) % reach.SCREEN_WIDTH < reach.SCREEN_WIDTH / 2
+                player.hitbox.x = a.x + a.width - 0.01 if right else a.x - player.hitbox.width + 0.01
+                half = player.hitbox.width / 2
+                player.hitbox.x = (player.hitbox.x + half) % reach.SCREEN_WIDTH - half # the same spot, on screen
+                floor = a.y
+                player.floor_height = floor
+                player.hitbox.y = floor - player.hitbox.height
+
+                def keys(frame: int) -> tuple:
+                    held = [rl.KEY_SPACE] if frame - first < hold else []
+                    if not overlapping(player.hitbox, b):
+                        held.append(rl.KEY_RIGHT if right else rl.KEY_LEFT)
+                    return tuple(held)
+
+                null.state.script = keys
+                first = null.state.frame
+                feet = a.y
+                for tick in range(reach.MAX_TICKS):
+                    with rl.drawing():
+                        pass
+                    controls.poll()
+                    player.refresh(None, phase + tick)
+                    controls.consume()
+                    if tick == 0:
+                        player.floor_height = floor + reach.MAX_DROP + player.hitbox.height
+                    previous, feet = feet, player.hitbox.y + player.hitbox.height
+                    if overlapping(player.hitbox, b) and previous <= b.y <= feet:
+                        return True
+                    if feet > b.y + reach.BUCKET:
+                        break
+        return False
+
+    random.seed(0)
+    pairs = []
+    for _ in range(args.pairs):
+        a = rl.Rectangle(random.uniform(0, 540), 700, 60, 16)
+        dy = random.uniform(-40, 300)
+        distance = random.uniform(0, max(table.reach_at(-dy), 0) + table.player_width + 80)
+        x = (a.x + random.choice((-1, 1)) * (a.width + distance)) % reach.SCREEN_WIDTH
+        pairs.append((a, rl.Rectangle(x, a.y + dy, 60, 16)))
+
+    start = time.perf_counter()
+    answers = [table.reachable(a, b) for a, b in pairs]
+    lookup = (time.perf_counter() - start) / len(pairs)
+    start = time.perf_counter()
+    simulated = [simulate(a, b) for a, b in pairs]
+    simulation = (time.perf_counter() - start) / len(pairs)
+    null.state.script = None
+
+    # the table rounds heights to buckets, so pairs a bucket away from a change of the reach may go either way
+    def certain(a: rl.Rectangle, b: rl.Rectangle) -> bool:
+        dy = a.y - b.y
+        return table.reach_at(dy - reach.BUCKET) == table.reach_at(dy) == table.reach_at(dy + reach.BUCKET)
+
+    def wrapping(a: rl.Rectangle, b: rl.Rectangle) -> bool:
+        return abs(a.x - b.x) > reach.SCREEN_WIDTH / 2
+
+    # across the screen edge the table is allowed to be conservative: never reachable when it isn't, sometimes not when it is
+    wrong = [(a, b) for (a, b), answer, truth in zip(pairs, answers, simulated)
+             if answer != truth and certain(a, b) and not (truth and wrapping(a, b))]
+    if wrong:
+        sys.exit(f"{len(wrong)} of {len(pairs)} pairs answered differently by the table, first {wrong[0]}")
+    missed = sum(truth and not answer for answer, truth in zip(answers, simulated))
+    print(f"{len(pairs)} pairs, {sum(simulated)} reachable, {missed} of them missed by the table across the screen edge")
+    print(f"  lookup {lookup * 1e6:.1f} us, simulation {simulation * 1e3:.1f} ms per pair")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Benchmark: headless frame loop (`MainScreen.render` + `MainScreen.refresh`).
+
+Runs on the null backend, so no raylib, window or GPU is needed, with a group of
+`--count` players and the space key scripted to be held every other second.
+Prints the time per frame; `--profile` shows where it goes instead:
+
+    python benchmarks/refresh.py --count 10000
+    python benchmarks/refresh.py --count 10000 --profile
+"""
+
+import argparse
+import cProfile
+import os
+import pstats
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default=os.path.join(ROOT, "game"), help="directory containing the tph package")
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--profile", action="store_true", help="print a cProfile report of the frame loop")
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.path)
+    from tph import rlapi as rl
+    rl.use_backend("null")
+    from tph import screens, sprites
+    from tph.sprites.player import Player
+    from tph.rlapi import null
+
+    rl.init_window(600, 900, "benchmark")
+    rl.set_target_fps(60)
+    null.state.max_frames = args.frames
+    null.state.script = lambda frame: (rl.KEY_SPACE,) if frame // 60 % 2 else ()
+
+    screen = screens.MainScreen()
+    group = sprites.EntityGroup(*(Player(random.uniform(0, 600), random.uniform(0, 900)) for _ in range(args.count)))
+
+    def loop() -> None:
+        while not rl.window_should_close():
+            with rl.drawing():
+                screen.render([group])
+            screen.refresh([], [group])
+
+    if args.profile:
+        profiler = cProfile.Profile()
+        profiler.runcall(loop)
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(20)
+        return
+
+    start = time.perf_counter()
+    loop()
+    elapsed = time.perf_counter() - start
+    print(f"{args.count} entities, {args.frames} frames: {elapsed / args.frames * 1e3:.2f} ms per frame")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Benchmark: `Screen.refresh` and `Screen.render` over a library of recorded sessions.
+
+Plays every replay in `benchmarks/replays/` (or the ones given) headlessly at
+full speed, twice, checking that both runs end in the same state hash, and
+prints the time per frame spent in the screen's refresh and render. Sessions
+are recorded from the game with `TPH_RECORD=file.tphr python -m tph`, or with
+scripted input here, which also checks that playing the recording back ends in
+the state the recorded run did:
+
+    python benchmarks/replay.py
+    python benchmarks/replay.py --record benchmarks/replays/climb.tphr --seed 7 --frames 1800
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default=os.path.join(ROOT, "game"), help="directory containing the tph package")
+    parser.add_argument("replays", nargs="*", metavar="FILE",
+                        default=sorted(glob.glob(os.path.join(ROOT, "benchmarks", "replays", "*.tphr"))))
+    parser.add_argument("--record", metavar="FILE", help="record a scripted session into FILE instead")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--frames", type=int, default=1800)
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.path)
+    from tph import rlapi as rl
+    rl.use_backend("null")
+    from tph import controls, game, replay, screens
+    from tph.rlapi import null
+
+    if args.record:
+        # walk right and jump in bursts, at 60 FPS with a hitch (a frame running 2 ticks) now and then
+        null.state.script = lambda frame: (rl.KEY_RIGHT, rl.KEY_SPACE) if frame % 90 < 30 else (rl.KEY_LEFT,) if frame % 90 < 50 else ()
+        session = game.Game(args.seed)
+        recording = replay.Replay(args.seed)
+        for frame in range(args.frames):
+            controls.poll()
+            ticks = session.clock.advance((2.5 if frame % 97 == 0 else 1) / 60)
+            recording.record(controls.snapshot.down, ticks)
+            session.run(ticks)
+            with rl.drawing():
+                session.render()
+        null.state.script = None
+        recording.save(args.record)
+        played = replay.play(replay.Replay.load(args.record))
+        if replay.state_hash(played) != replay.state_hash(session):
+            sys.exit(f"playing {args.record} back did not end in the recorded state")
+        print(f"{args.record}: {recording}, {os.path.getsize(args.record)} bytes, plays back to state {replay.state_hash(session)[:16]}")
+        return
+
+    # time the screen's refresh and render from the outside
+    timings = {"refresh": 0.0, "render": 0.0}
+    for name in timings:
+        method = getattr(screens.MainScreen, name)
+
+        def timed(self, *args, name=name, method=method):
+            start = time.perf_counter()
+            method(self, *args)
+            timings[name] += time.perf_counter() - start
+        setattr(screens.MainScreen, name, timed)
+
+    for path in args.replays:
+        recording = replay.Replay.load(path)
+        hashes = []
+        for _ in range(2):
+            for name in timings:
+                timings[name] = 0.0
+            start = time.perf_counter()
+            session = replay.play(recording, render=True)
+            elapsed = time.perf_counter() - start
+            hashes.append(replay.state_hash(session))
+        if hashes[0] != hashes[1]:
+            sys.exit(f"{path}: two playbacks ended in different states")
+        frames = len(recording)
+        print(f"{os.path.basename(path)}: {frames} frames, {session.clock.ticks} ticks, state {hashes[0][:16]}")
+        print(f"  refresh {timings['refresh'] / frames * 1e6:7.1f} us, render {timings['render'] / frames * 1e6:7.1f} us, "
+              f"whole frame {elapsed / frames * 1e6:7.1f} us")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Check and benchmark: the `Rewind` history of per-frame snapshots.
+
+Runs a session with `--count` players on scripted input for `--seconds` of
+history plus a bit, recording a snapshot every frame, with the state hash of
+each frame on the side; at 60 FPS and at 30 (two ticks a frame), which must
+keep the same seconds of history. Then steps back through the whole history
+and forward again: every frame restored must hash like the frame it was taken
+on. Prints the memory a second of history costs, keyframes and deltas next to
+whole snapshots, the time to record a frame and to step, and checks that
+shortening the history keeps the frames left as they were, and that a saved
+history loads back:
+
+    python benchmarks/rewind.py
+    python benchmarks/rewind.py --count 1000 --seconds 10
+"""
+
+import argparse
+import itertools
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default=os.path.join(ROOT, "game"), help="directory containing the tph package")
+    parser.add_argument("--count", type=int, nargs="+", default=[1, 1000])
+    parser.add_argument("--seconds", type=float, default=5)
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.path)
+    from tph import rlapi as rl
+    rl.use_backend("null")
+    from tph import controls, game, loop, replay, rewind, snapshot
+    from tph.sprites.player import Player
+
+    def keys(frame: int) -> int:
+        held = 1 << controls.Action.RIGHT if frame % 80 < 40 else 1 << controls.Action.LEFT
+        return held | (1 << controls.Action.JUMP if frame % 45 < 10 else 0)
+
+    for count, ticks in itertools.product(args.count, (1, 2)): # at 60 FPS, and at 30
+        session = game.Game(7)
+        for i in range(count - 1):
+            session.main_group.register_item(Player(i * 37 % 540, 100 + i * 53 % 700))
+        history = rewind.Rewind(args.seconds)
+        hashes = []
+        whole = 0
+        record = 0.0
+        for frame in range(round((args.seconds + 1) * loop.TICK_RATE / ticks)):
+            controls.inject(keys(frame))
+            session.clock.ticks += ticks
+            session.run(ticks)
+            blob = snapshot.take(session)
+            start = time.perf_counter()
+            history.record(blob, ticks)
+            record += time.perf_counter() - start
+            whole += len(blob)
+            hashes.append(replay.state_hash(session))
+        newest = blob
+        frames = frame + 1
+        hashes = hashes[-len(history):]
+
+        start = time.perf_counter()
+        back = [history.step_back() for _ in range(len(history) - 1)]
+        stepped = time.perf_counter() - start
+        if history.step_back() is not None:
+            sys.exit(f"{count} players: stepped back past the oldest frame")
+        for index, blob in enumerate(reversed(back)):
+            snapshot.restore(session, blob)
+            if replay.state_hash(session) != hashes[index]:
+                sys.exit(f"{count} players: frame {index} of the history restores to a different state")
+        for index in range(1, len(history)):
+            snapshot.restore(session, history.step_forward())
+            if replay.state_hash(session) != hashes[index]:
+                sys.exit(f"{count} players: stepping forward to frame {index} restores to a different state")
+
+        kept = history.ticks / loop.TICK_RATE
+        if not history.seconds <= kept < history.seconds + 2 * rewind.KEYFRAME_INTERVAL * ticks / loop.TICK_RATE:
+            sys.exit(f"{count} players, {ticks} ticks a frame: {kept:.1f} s of history kept for {history.seconds:.1f} s asked for")
+        keyframes = sum(1 for keyframe, _, _ in history.frames if keyframe)
+        print(f"{count:>6} players at {loop.TICK_RATE // ticks} FPS: {len(history)} frames, {kept:.1f} s kept "
+              f"({history.seconds:.1f} s asked for), {keyframes} keyframes, "
+              f"{history.bytes_per_second() / 1024:7.1f} KiB per second of history "
+              f"({whole / (frames * ticks) * loop.TICK_RATE / 1024:7.1f} KiB/s as whole snapshots)")
+        print(f"        record {record / frames * 1e6:7.1f} us per frame, "
+              f"step back {stepped / (len(history) - 1) * 1e6:7.1f} us per frame")
+
+        history.seconds = args.seconds / 2
+        if history.ticks < history.seconds * loop.TICK_RATE or history.blob_at(-1) != newest:
+            sys.exit(f"{count} players: shortening the history lost frames it should have kept")
+        print(f"        shortened to {history.seconds:.1f} s: {len(history)} frames, {history.stored / 1024:.1f} KiB")
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "history.tphrwd")
+            history.save_in_background(path).join()
+            loaded = rewind.Rewind.load(path)
+        if loaded.ticks != history.ticks or [loaded.blob_at(i) for i in (0, -1)] != [history.blob_at(i) for i in (0, -1)]:
+            sys.exit(f"{count} players: the saved history loads back different")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Check and benchmark: `snapshot.take` / `snapshot.restore` throughput.
+
+Runs a session with `--count` players in its main group (plus the level's
+platforms) on scripted input, takes a snapshot, runs on, restores it and runs
+the same frames again: both runs must end in the same state hash. Then times
+taking and restoring a snapshot of that session:
+
+    python benchmarks/snapshot.py
+    python benchmarks/snapshot.py --count 10000
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default=os.path.join(ROOT, "game"), help="directory containing the tph package")
+    parser.add_argument("--count", type=int, nargs="+", default=[1, 1000])
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.path)
+    from tph import rlapi as rl
+    rl.use_backend("null")
+    from tph import controls, game, replay, snapshot
+    from tph.sprites.player import Player
+
+    def keys(frame: int) -> int:
+        held = 1 << controls.Action.RIGHT if frame % 80 < 40 else 1 << controls.Action.LEFT
+        return held | (1 << controls.Action.JUMP if frame % 45 < 10 else 0)
+
+    def run(session: game.Game, frames: range) -> None:
+        for frame in frames:
+            controls.inject(keys(frame))
+            session.clock.ticks += 1
+            session.run(1)
+
+    for count in args.count:
+        session = game.Game(7)
+        for i in range(count - 1):
+            session.main_group.register_item(Player(i * 37 % 540, 100 + i * 53 % 700))
+        run(session, range(120))
+        blob = snapshot.take(session)
+        run(session, range(120, 240))
+        after = replay.state_hash(session)
+        snapshot.restore(session, blob)
+        run(session, range(120, 240))
+        if replay.state_hash(session) != after:
+            sys.exit(f"{count} players: the run after restore() ended somewhere else")
+
+        # the level moved on in the meantime? restoring regenerates chunks: time the common case, same chunks
+        take = min(timeit.repeat(lambda: snapshot.take(session), number=args.number, repeat=3)) / args.number
+        blob = snapshot.take(session)
+        restore = min(timeit.repeat(lambda: snapshot.restore(session, blob), number=args.number, repeat=3)) / args.number
+        entities = len(session.main_group) + len(session.platforms)
+        print(f"{count:>6} players + {len(session.platforms)} platforms: {len(blob):>7} bytes, "
+              f"take {take * 1e6:7.1f} us ({len(blob) / take / 1e6:6.1f} MB/s), "
+              f"restore {restore * 1e6:7.1f} us ({len(blob) / restore / 1e6:6.1f} MB/s), "
+              f"{(take + restore) / entities * 1e9:5.0f} ns per entity both ways")
+
+if __name__ == "__main__":
+    main()
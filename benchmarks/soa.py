@@ -0,0 +1,113 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Benchmark: entity storage, one object per entity vs. an `EntityStore`.
+
+Builds `--count` entities three ways: plain `Entity` objects, `Entity` objects
+adopted into a store (their hitboxes become views into its columns), and
+`EntityView` rows in a store. Prints the memory per entity, alone and once in
+an `EntityGroup` (which adds its slots and spatial hash), and the time to move
+every entity down by its velocity, per object and on the store's columns.
+Then checks that a deleted `EntityView` can't be registered again once its
+row went to another entity (still in use, or released again since):
+
+    python benchmarks/soa.py --count 10000
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+import typing
+from array import array
+from operator import add
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default=os.path.join(ROOT, "game"), help="directory containing the tph package")
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--frames", type=int, default=20)
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.path)
+    from tph import rlapi as rl
+    rl.use_backend("null")
+    from tph import sprites
+
+    def plain() -> tuple[list, typing.Callable[[list], sprites.EntityGroup]]:
+        entities = [sprites.Entity(i % 540, i * 9, 60, 16) for i in range(args.count)]
+        return entities, lambda entities: sprites.EntityGroup(*entities)
+
+    def adopted() -> tuple[list, typing.Callable[[list], sprites.EntityGroup]]:
+        entities = [sprites.Entity(i % 540, i * 9, 60, 16) for i in range(args.count)]
+        return entities, lambda entities: sprites.EntityGroup(*entities, store=sprites.EntityStore())
+
+    def views() -> tuple[list, typing.Callable[[list], sprites.EntityGroup]]:
+        store = sprites.EntityStore()
+        entities = [sprites.EntityView(store, store.allocate(i % 540, i * 9, 60, 16)) for i in range(args.count)]
+        return entities, lambda entities: sprites.EntityGroup(*entities, store=store)
+
+    print(f"tph.sprites from {args.path}, {args.count} entities, bytes per entity:")
+    print(f"  {'':<18} {'entity':>8} {'in a group':>11}")
+    groups = {}
+    for title, build in (("Entity objects", plain), ("adopted Entities", adopted), ("EntityViews", views)):
+        gc.collect()
+        tracemalloc.start()
+        entities, group = build()
+        alone, _ = tracemalloc.get_traced_memory()
+        groups[title] = group(entities)
+        grouped, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"  {title:<18} {alone / args.count:8.0f} {grouped / args.count:11.0f}")
+
+    velocities = {id(entity): rl.Vector2(0, 2) for entity in groups["Entity objects"]}
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        for entity in groups["Entity objects"]:
+            entity.hitbox.y += velocities[id(entity)].y
+    per_object = (time.perf_counter() - start) / args.frames
+
+    store = groups["EntityViews"].store
+    for rects, velocities_column, _, rows in store.columns():
+        velocities_column[1:rows * 2:2] = array('f', [2.0]) * rows
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        for rects, velocities_column, _, rows in store.columns():
+            rects[1:rows * 4:4] = array('f', map(add, rects[1:rows * 4:4], velocities_column[1:rows * 2:2]))
+    columns = (time.perf_counter() - start) / args.frames
+
+    print(f"  y += velocity.y     per object {per_object * 1e3:6.2f} ms, on the columns {columns * 1e3:6.2f} ms"
+          f" ({per_object / columns:.0f}x)")
+
+    for release_again in (False, True):
+        group = sprites.EntityGroup(store=sprites.EntityStore())
+        a = group.spawn(0, 0, 8, 8)
+        group.delete_item(group.handle_of(a))
+        b = group.spawn(10, 0, 8, 8) # gets a's row
+        if release_again:
+            group.delete_item(group.handle_of(b))
+        try:
+            group.register_item(a)
+        except ValueError:
+            continue
+        sys.exit(f"registering a deleted EntityView again after its row was {'reused and released' if release_again else 'reused'} "
+                 f"went through: {len(group)} entities on {len(group.store)} live rows")
+    print("  stale EntityViews are refused once their row was handed out again")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Startup benchmark: import time and resident memory of the game package.
+
+Every run happens in a fresh interpreter so nothing is cached between runs.
+To compare two versions, point `--path` at the `game` directory of each checkout:
+
+    python benchmarks/startup.py
+    python benchmarks/startup.py --path /tmp/old-checkout/game
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PROBE = """
+import time, resource
+rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print('@@', elapsed, rss_before, rss_after)
+"""
+
+def run_once(module: str, path: str, cwd: str) -> tuple[float, int, int]:
+    env = dict(os.environ, PYTHONPATH=path)
+    env.pop("PYTHONDONTWRITEBYTECODE", None) # measure with a warm bytecode cache
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        cwd=cwd, env=env, capture_output=True, text=True, check=True,
+    ).stdout
+
+    line = next(line for line in out.splitlines() if line.startswith("@@"))
+    _, elapsed, rss_before, rss_after = line.split()
+    return float(elapsed), int(rss_before), int(rss_after)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="tph.__main__", help="module to import (default: tph.__main__)")
+    parser.add_argument("--path", default=os.path.join(ROOT, "game"), help="directory containing the tph package")
+    parser.add_argument("--cwd", default=ROOT, help="working directory (rlapi looks for .raylib here)")
+    parser.add_argument("--runs", type=int, default=15)
+    args = parser.parse_args()
+
+    run_once(args.module, args.path, args.cwd) # warm up the bytecode cache
+    results = [run_once(args.module, args.path, args.cwd) for _ in range(args.runs)]
+
+    times = [elapsed * 1000 for elapsed, _, _ in results]
+    rss = [after for _, _, after in results]
+    rss_delta = [after - before for _, before, after in results]
+
+    print(f"import {args.module} from {args.path} ({args.runs} runs)")
+    print(f"  import time:  median {statistics.median(times):.2f} ms, min {min(times):.2f} ms")
+    print(f"  max rss:      median {statistics.median(rss) / 1024:.2f} MiB")
+    print(f"  rss growth:   median {statistics.median(rss_delta) / 1024:.2f} MiB")
+
+if __name__ == "__main__":
+    main()
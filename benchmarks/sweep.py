@@ -0,0 +1,74 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Benchmark: deferred removal with `sweep()`, and the store shrinking back after it.
+
+Spawns `--count` simulated `EntityView`s in a store-backed `EntityGroup`, flags
+all but `--keep` of them `should_delete` at random, then runs frames of
+`physics.step` + `sweep()`. With compaction the rows walked by `physics.step`
+come down to the live count within a few frames; without it (plain
+`SpriteGroup.sweep`) they stay at the peak:
+
+    python benchmarks/sweep.py
+    python benchmarks/sweep.py --count 100000 --keep 1000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default=os.path.join(ROOT, "game"), help="directory containing the tph package")
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--keep", type=int, default=1000)
+    parser.add_argument("--frames", type=int, default=8)
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.path)
+    from tph import rlapi as rl
+    rl.use_backend("null")
+    from tph import sprites
+
+    random.seed(0)
+    print(f"tph.sprites from {args.path}: {args.count} entities, all but {args.keep} deleted at once")
+    for compacting in (False, True):
+        group = sprites.EntityGroup(store=sprites.EntityStore())
+        for i in range(args.count):
+            group.simulate(group.spawn(random.uniform(0, 540), random.uniform(0, 820), 8, 8))
+        for entity in random.sample(list(group), args.count - args.keep):
+            entity.should_delete = True
+
+        print(f"  {'with' if compacting else 'without'} compaction:")
+        for frame in range(args.frames):
+            start = time.perf_counter()
+            sprites.physics.step(group.store)
+            stepped = time.perf_counter() - start
+            start = time.perf_counter()
+            group.sweep() if compacting else sprites.SpriteGroup.sweep(group)
+            swept = time.perf_counter() - start
+            print(f"    frame {frame}: {len(group):>6} live, {group.store.high_water:>6} rows walked, "
+                  f"physics.step {stepped * 1e3:6.2f} ms, sweep {swept * 1e3:6.2f} ms")
+
+        if any(entity.should_delete for entity in group) or len(group) != len(group.store):
+            sys.exit("sweep() left flagged entities or stray rows behind")
+        if compacting and any(group.store.index_of(entity) != entity.index for entity in group):
+            sys.exit("compaction moved a row without updating its EntityView")
+
+if __name__ == "__main__":
+    main()
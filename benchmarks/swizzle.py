@@ -0,0 +1,80 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Microbenchmark: per-access cost of struct fields and swizzles.
+
+Covers the accesses the game makes every frame (`hitbox.x += ...` in
+`Player.refresh`, `hitbox.xy = ...` in `Entity.move_to`) plus a few combination
+swizzles. Point `--path` at another checkout's `game` directory to compare:
+
+    python benchmarks/swizzle.py
+    python benchmarks/swizzle.py --path /tmp/old-checkout/game
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SETUP = """
+r = rl.Rectangle(10, 20, 60, 80)
+v2 = rl.Vector2(1, 2)
+v3 = rl.Vector3(1, 2, 3)
+c = rl.Color(1, 2, 3, 4)
+"""
+
+GETS = [
+    "r.x",
+    "r.xy",
+    "r.cm",
+    "r.xywh",
+    "v2.yx",
+    "v3.xyz",
+    "c.rgba",
+]
+
+SETS = [
+    "r.x = 5.0",
+    "r.x += 1.0",
+    "r.xy = 5.0, 6.0",
+    "r.cm = 50.0, 60.0",
+    "v2.y = 3.0",
+    "v3.xyz = 1.0, 2.0, 3.0",
+    "c.rgba = 1, 2, 3, 4",
+]
+
+def per_access(stmt: str, namespace: dict, number: int) -> float:
+    timer = timeit.Timer(stmt, SETUP, globals=namespace)
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default=os.path.join(ROOT, "game"), help="directory containing the tph package")
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.path)
+    from tph import rlapi as rl
+
+    namespace = {"rl": rl}
+    print(f"tph.rlapi from {args.path}")
+    for title, stmts in (("get", GETS), ("set", SETS)):
+        print(f"  {title}:")
+        for stmt in stmts:
+            print(f"    {stmt:<26} {per_access(stmt, namespace, args.number):8.1f} ns")
+
+if __name__ == "__main__":
+    main()
@@ -12,27 +12,57 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
-from . import sprites
-from .sprites import player
-from . import screens
+import os
+import random
+
+from . import game
+from . import controls
+from . import replay
+from . import rewind
+from . import snapshot
 from . import rlapi as rl
-from . import __version__
+
+HITCH_TIME = 0.05 # seconds
+HITCH_DUMP_INTERVAL = 10 # seconds, at least, between two hitch dumps
 
 def main() -> None:
     rl.init_window(600, 900, "test")
     rl.set_target_fps(60)
-    
-    # set up the screens
-    active_screen: screens.Screen = screens.MainScreen(f"tuxPlatformHop {__version__}")
-    rl.set_window_title(active_screen.title)
 
-    # sprites
-    main_group = sprites.EntityGroup()
-    main_group.register_item(player.Player(50, 50))
+    # TPH_SEED replays a level, TPH_RECORD saves the session's input to a replay file
+    session = game.Game(int(os.environ.get("TPH_SEED", random.randrange(2**32))))
+    rl.set_window_title(session.screen.title)
+    recorder = replay.Replay(session.seed) if "TPH_RECORD" in os.environ else None
+
+    # holding REWIND steps back through the last few seconds; not while recording, the replay would not follow
+    # TPH_HITCH_DUMP saves those seconds to a file whenever a frame takes longer than HITCH_TIME, from a thread
+    # and not again within HITCH_DUMP_INTERVAL, so that the dump doesn't make a hitch of its own
+    history = rewind.Rewind() if recorder is None else None
+    dump, dumped_at = None, -HITCH_DUMP_INTERVAL
 
     while not rl.window_should_close():
+        controls.poll()
+        if history is not None and controls.snapshot.is_down(controls.Action.REWIND):
+            blob = history.step_back()
+            if blob is not None:
+                snapshot.restore(session, blob)
+                session.main_group.remember_positions()
+                session.main_group.interpolate(1)
+        else:
+            frame_time = rl.get_frame_time()
+            ticks = session.clock.advance(frame_time)
+            if recorder is not None:
+                recorder.record(controls.snapshot.down, ticks)
+            session.run(ticks)
+            if history is not None and ticks != 0:
+                history.record(snapshot.take(session), ticks)
+                if (frame_time > HITCH_TIME and "TPH_HITCH_DUMP" in os.environ
+                        and rl.get_time() - dumped_at >= HITCH_DUMP_INTERVAL and (dump is None or not dump.is_alive())):
+                    dump, dumped_at = history.save_in_background(os.environ["TPH_HITCH_DUMP"]), rl.get_time()
+
         with rl.drawing():
-            active_screen.render([main_group])
-        active_screen.refresh([], [main_group])
-             
+            session.render()
+
+    if recorder is not None:
+        recorder.save(os.environ["TPH_RECORD"])
     rl.close_window()
\ No newline at end of file
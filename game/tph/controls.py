@@ -0,0 +1,122 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#   
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#    
+#      http://www.apache.org/licenses/LICENSE-2.0
+#    
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import enum
+
+from . import rlapi as rl
+
+class Action(enum.IntEnum):
+    "What input means to the game; bit positions in an InputSnapshot."
+    LEFT = 0
+    RIGHT = 1
+    JUMP = 2
+    REWIND = 3
+
+DEFAULT_KEYS: dict[Action, tuple[int, ...]] = {
+    Action.LEFT: (rl.KEY_LEFT,),
+    Action.RIGHT: (rl.KEY_RIGHT,),
+    Action.JUMP: (rl.KEY_SPACE,),
+    Action.REWIND: (rl.KEY_R,),
+}
+DEFAULT_BUTTONS: dict[Action, tuple[int, ...]] = {
+    Action.LEFT: (rl.GAMEPAD_BUTTON_LEFT_FACE_LEFT,),
+    Action.RIGHT: (rl.GAMEPAD_BUTTON_LEFT_FACE_RIGHT,),
+    Action.JUMP: (rl.GAMEPAD_BUTTON_RIGHT_FACE_DOWN,),
+    Action.REWIND: (rl.GAMEPAD_BUTTON_LEFT_TRIGGER_1,),
+}
+
+# Class Definitions
+class InputSnapshot():
+    "The actions held, just pressed and just released on one frame, as bitsets over Action."
+    __slots__ = ('down', 'pressed', 'released')
+
+    def __init__(self, down: int = 0, previous: int = 0) -> None:
+        self.down: int = down
+        self.pressed: int = down & ~previous
+        self.released: int = previous & ~down
+
+    def __repr__(self) -> str:
+        return f"InputSnapshot ({', '.join(action.name for action in Action if self.down >> action & 1) or 'nothing'} held)"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, InputSnapshot):
+            return NotImplemented
+        return (self.down, self.pressed, self.released) == (other.down, other.pressed, other.released)
+
+    def is_down(self, action: Action) -> bool:
+        return bool(self.down >> action & 1)
+
+    def is_pressed(self, action: Action) -> bool:
+        return bool(self.pressed >> action & 1)
+
+    def is_released(self, action: Action) -> bool:
+        return bool(self.released >> action & 1)
+
+class ActionMap():
+    "Binds actions to keys and gamepad buttons, and samples them: one call into raylib per bound key or button."
+
+    def __init__(self, keys: dict[Action, tuple[int, ...]] = DEFAULT_KEYS,
+                 buttons: dict[Action, tuple[int, ...]] = DEFAULT_BUTTONS, gamepad: int = 0) -> None:
+        self.gamepad: int = gamepad
+        self._keys: list[tuple[int, int]] = [] # (key, action bit), flattened for sample()
+        self._buttons: list[tuple[int, int]] = []
+        for action, bound in keys.items():
+            self._keys.extend((int(key), 1 << action) for key in bound)
+        for action, bound in buttons.items():
+            self._buttons.extend((int(button), 1 << action) for button in bound)
+
+    def bind_key(self, action: Action, key: int) -> None:
+        self._keys.append((int(key), 1 << action))
+
+    def bind_button(self, action: Action, button: int) -> None:
+        self._buttons.append((int(button), 1 << action))
+
+    def sample(self, previous: int = 0) -> InputSnapshot:
+        "Reads the bound keys and buttons, `previous` being the actions held on the frame before."
+        down = 0
+        is_key_down = rl.fast.is_key_down
+        for key, bit in self._keys:
+            if is_key_down(key):
+                down |= bit
+        if self._buttons and rl.fast.is_gamepad_available(self.gamepad):
+            is_button_down = rl.fast.is_gamepad_button_down
+            for button, bit in self._buttons:
+                if is_button_down(self.gamepad, button):
+                    down |= bit
+        return InputSnapshot(down, previous)
+
+actions = ActionMap()
+snapshot = InputSnapshot() # of the current frame, what entities read their input from
+
+# A frame runs 0 or more ticks (tph.loop.FixedTimestep): the pressed and released edges of a frame stay in the snapshot
+# until a tick has seen them, then consume() clears them. Frames sampled before that add their edges to the pending ones.
+
+def _carry(sampled: InputSnapshot) -> InputSnapshot:
+    global snapshot
+    sampled.pressed |= snapshot.pressed
+    sampled.released |= snapshot.released
+    snapshot = sampled
+    return snapshot
+
+def poll() -> InputSnapshot:
+    "Samples the input for the frame about to be simulated; once per frame, after raylib polled its events in EndDrawing."
+    return _carry(actions.sample(snapshot.down))
+
+def inject(down: int) -> InputSnapshot:
+    "Sets the actions held on this frame without asking raylib, for headless runs and replays."
+    return _carry(InputSnapshot(down, snapshot.down))
+
+def consume() -> None:
+    "Clears the edges once a tick has run with them, so the ticks after it in the frame don't see them again."
+    snapshot.pressed = snapshot.released = 0
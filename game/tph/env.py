@@ -0,0 +1,223 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#   
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#    
+#      http://www.apache.org/licenses/LICENSE-2.0
+#    
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import multiprocessing
+import os
+import random
+import typing
+from multiprocessing import shared_memory
+from struct import Struct
+
+from . import controls
+from . import rlapi as rl
+
+if typing.TYPE_CHECKING:
+    from .game import Game
+    from .sprites.player import Player
+
+OBSERVED_PLATFORMS = 8 # the nearest ones on screen go into an observation
+OBSERVATION_SIZE = 5 + 2 * OBSERVED_PLATFORMS # floats: player x, y, velocity x, y, jump ticker, then dx, dy to each platform
+ACTION_COUNT = 1 << (controls.Action.JUMP + 1) # actions are bitsets over LEFT, RIGHT and JUMP
+MAX_STEPS = 3600 # a minute of ticks, then the episode is truncated
+
+_OBSERVATION = Struct(f'<{OBSERVATION_SIZE}f')
+_FLOAT_SIZE = 4
+
+# Class Definitions
+class Env():
+    """One session of the game without a window, behind the gym-style `reset()` and `step(action)`.
+
+    An action is a bitset over controls.Action (held for `ticks_per_step` ticks), the reward the height climbed
+    past the best one so far. The observation is written in place into `buffer` at `offset` (its own buffer if none is
+    given), so a VectorEnv can point it into shared memory; the current rules have no way to lose, episodes only get
+    truncated after `max_steps`. Needs the null backend, like replays.
+    """
+
+    def __init__(self, seed: int | None = None, max_steps: int = MAX_STEPS, ticks_per_step: int = 1,
+                 buffer: typing.Any = None, offset: int = 0) -> None:
+        self.max_steps: int = max_steps
+        self.ticks_per_step: int = ticks_per_step
+        self.observation: memoryview = memoryview(buffer if buffer is not None else bytearray(_OBSERVATION.size))[
+            offset:offset + _OBSERVATION.size].cast('f')
+        self.session: 'Game | None' = None
+        self.steps: int = 0
+        self._random: random.Random = random.Random(seed)
+        self._player: 'Player | None' = None
+        self._input: controls.InputSnapshot = controls.InputSnapshot() # this env's own, controls.snapshot is per process
+        self._best: float = 0 # lowest player y so far; the level grows upwards
+
+    def __repr__(self) -> str:
+        return f"Env ({self.session!r}, step {self.steps})" if self.session is not None else "Env (not reset)"
+
+    def _observe(self) -> None:
+        hitbox, velocity = self._player.hitbox, self._player.velocity
+        x, y = hitbox.x + hitbox.width / 2, hitbox.y + hitbox.height
+        offsets = sorted(((platform.hitbox.x + platform.hitbox.width / 2 - x, platform.hitbox.y - y)
+                          for platform in self.session.platforms.visible()), key=lambda d: d[0] * d[0] + d[1] * d[1])
+        offsets = offsets[:OBSERVED_PLATFORMS] + [(0, 0)] * (OBSERVED_PLATFORMS - len(offsets)) # zeros when fewer on screen
+        _OBSERVATION.pack_into(self.observation, 0, hitbox.x, hitbox.y, velocity.x, velocity.y, self._player.jump_ticker,
+                               *(value for offset in offsets for value in offset))
+
+    def reset(self, seed: int | None = None) -> tuple[memoryview, dict]:
+        "Starts an episode on a new level (the one of `seed` if given) and returns the first observation."
+        from .game import Game
+        from .sprites.player import Player
+
+        if seed is not None:
+            self._random.seed(seed)
+        self.session = Game(self._random.randrange(2**32))
+        self.session.clock.alpha = 1
+        self._player = next(entity for entity in self.session.main_group if isinstance(entity, Player))
+        self.steps = 0
+        self._input = controls.InputSnapshot()
+        self._best = self._player.hitbox.y
+        self._observe()
+        return self.observation, {'seed': self.session.seed}
+
+    def step(self, action: int) -> tuple[memoryview, float, bool, bool, dict]:
+        "Holds `action` for a step: (observation, reward, terminated, truncated, info)."
+        if not 0 <= action < ACTION_COUNT:
+            raise ValueError(f"action {action} is not a bitset over LEFT, RIGHT and JUMP")
+        if self.session is None:
+            raise RuntimeError("step() before reset()")
+
+        # controls.snapshot is shared by every Env of the process: swap this one's in, like inject() it keeps the
+        # edges for the first tick only (Game.tick() consumes them)
+        controls.snapshot = self._input = controls.InputSnapshot(action, self._input.down)
+        for _ in range(self.ticks_per_step):
+            self.session.clock.ticks += 1
+            self.session.tick()
+        self.steps += 1
+
+        y = self._player.hitbox.y
+        reward = max(self._best - y, 0.0)
+        self._best = min(self._best, y)
+        self._observe()
+        return self.observation, reward, False, self.steps >= self.max_steps, {'ticks': self.session.clock.ticks}
+
+def _work(connection: typing.Any, name: str, count: int, start: int, stop: int, seed: int,
+          max_steps: int, ticks_per_step: int) -> None:
+    "Worker process of a VectorEnv: steps envs [start, stop) whenever told to, in and out of shared memory."
+    rl.use_backend("null")
+    memory = shared_memory.SharedMemory(name)
+    _serve(connection, memory.buf, count, range(start, stop), seed, max_steps, ticks_per_step)
+    memory.close() # every view of it went with _serve()
+
+def _serve(connection: typing.Any, buffer: typing.Any, count: int, indices: range, seed: int,
+           max_steps: int, ticks_per_step: int) -> None:
+    _, rewards, actions, terminated, truncated = _layout(buffer, count)
+    envs = [(index, Env(seed + index, max_steps, ticks_per_step, buffer, index * _OBSERVATION.size)) for index in indices]
+    while (command := connection.recv()) is not None:
+        for index, env in envs:
+            if command == 'reset':
+                env.reset()
+                rewards[index], terminated[index], truncated[index] = 0, False, False
+                continue
+            _, rewards[index], terminated[index], truncated[index], _ = env.step(actions[index])
+            if terminated[index] or truncated[index]: # autoreset, the observation is the new episode's first one
+                env.reset()
+        connection.send(None)
+
+def _layout(buffer: typing.Any, count: int) -> tuple[memoryview, ...]:
+    "Observations, rewards, actions, terminated and truncated flags of `count` envs, one block after the other."
+    view = memoryview(buffer)
+    observations_end = count * _OBSERVATION.size
+    rewards_end = observations_end + count * _FLOAT_SIZE
+    return (
+        view[:observations_end].cast('f', (count, OBSERVATION_SIZE)),
+        view[observations_end:rewards_end].cast('f'),
+        view[rewards_end:rewards_end + count],
+        view[rewards_end + count:rewards_end + 2 * count].cast('?'),
+        view[rewards_end + 2 * count:rewards_end + 3 * count].cast('?'),
+    )
+
+class VectorEnv():
+    """`count` Envs stepped together by a pool of worker processes.
+
+    Observations, rewards, actions and done flags live in one block of shared memory, so nothing gets pickled per
+    step but the command to the workers; the arrays returned are views of it and change with the next step.
+    Envs that finish are reset straight away, gym style. Env `i` plays the levels of seed `seed + i`.
+    Drop the views before close(), the shared memory can't be unmapped under them.
+    """
+
+    def __init__(self, count: int, workers: int | None = None, seed: int = 0,
+                 max_steps: int = MAX_STEPS, ticks_per_step: int = 1) -> None:
+        self.count: int = count
+        self._memory = shared_memory.SharedMemory(create=True, size=count * (_OBSERVATION.size + _FLOAT_SIZE + 3))
+        self.observations, self.rewards, self.actions, self.terminated, self.truncated = _layout(self._memory.buf, count)
+
+        # spawned, not forked, and told through the environment to pick the null backend: unpickling their target
+        # imports tph, which would load raylib
+        context = multiprocessing.get_context('spawn')
+        backend = os.environ.get("TPH_RLAPI_BACKEND")
+        os.environ["TPH_RLAPI_BACKEND"] = "null"
+        workers = max(min(workers or os.cpu_count() or 1, count), 1)
+        bounds = [count * worker // workers for worker in range(workers + 1)]
+        self._connections = []
+        self._processes = []
+        for start, stop in zip(bounds, bounds[1:]):
+            parent, child = context.Pipe()
+            process = context.Process(target=_work, daemon=True, args=(
+                child, self._memory.name, count, start, stop, seed, max_steps, ticks_per_step))
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+        if backend is None:
+            del os.environ["TPH_RLAPI_BACKEND"]
+        else:
+            os.environ["TPH_RLAPI_BACKEND"] = backend
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return f"VectorEnv ({self.count} envs on {len(self._processes)} workers)"
+
+    def __enter__(self) -> 'VectorEnv':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def _run(self, command: str) -> None:
+        for connection in self._connections:
+            connection.send(command)
+        for connection in self._connections:
+            connection.recv()
+
+    def reset(self) -> memoryview:
+        self._run('reset')
+        return self.observations
+
+    def step(self, actions: typing.Iterable[int]) -> tuple[memoryview, memoryview, memoryview, memoryview]:
+        "Steps every env with its action: (observations, rewards, terminated, truncated), views of the shared memory."
+        self.actions[:] = bytes(actions)
+        self._run('step')
+        return self.observations, self.rewards, self.terminated, self.truncated
+
+    def close(self) -> None:
+        if self._memory is None:
+            return
+        memory, self._memory = self._memory, None
+        try:
+            for connection, process in zip(self._connections, self._processes):
+                if process.is_alive():
+                    connection.send(None)
+                process.join()
+                connection.close()
+        finally:
+            del self.observations, self.rewards, self.actions, self.terminated, self.truncated
+            memory.unlink()
+            memory.close()
@@ -0,0 +1,60 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#   
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#    
+#      http://www.apache.org/licenses/LICENSE-2.0
+#    
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from . import controls
+from . import sprites
+from .sprites import player, platform
+from . import screens
+from . import loop
+from . import level
+from . import __version__
+
+# Class Definitions
+class Game():
+    "Everything a session of the game simulates, apart from the window: screens, sprites, the level and the clock."
+
+    def __init__(self, seed: int) -> None:
+        self.seed: int = seed
+
+        # set up the screens
+        self.screen: screens.MainScreen = screens.MainScreen(f"tuxPlatformHop {__version__}")
+
+        # sprites
+        self.main_group = sprites.EntityGroup(store=sprites.EntityStore()) # hitboxes and velocities in columns, for snapshots
+        self.main_group.register_item(player.Player(50, 50))
+
+        # the level, streamed in chunks around the visible band
+        self.platforms = sprites.PlatformGroup(pool=sprites.Pool(lambda: platform.Platform(0, 0), size=64))
+        self.world = level.Level(seed, self.platforms)
+
+        # the simulation ticks at a fixed rate, rendering shows it interpolated between the last two ticks
+        self.clock = loop.FixedTimestep()
+
+    def __repr__(self) -> str:
+        return f"Game (seed {self.seed}, {self.clock.ticks} ticks)"
+
+    def tick(self) -> None:
+        self.world.update(*self.platforms.visible_band)
+        self.main_group.remember_positions()
+        self.screen.refresh([], [self.platforms, self.main_group])
+        controls.consume()
+
+    def run(self, ticks: int) -> None:
+        "Runs the ticks of one frame and interpolates for rendering it."
+        for _ in range(ticks):
+            self.tick()
+        self.main_group.interpolate(self.clock.alpha)
+
+    def render(self) -> None:
+        self.screen.render([self.platforms, self.main_group])
@@ -0,0 +1,108 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#   
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#    
+#      http://www.apache.org/licenses/LICENSE-2.0
+#    
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import math
+import random
+from array import array
+
+from . import sprites
+from .sprites.platform import Platform, PLATFORM_WIDTH, PLATFORM_HEIGHT
+
+CHUNK_HEIGHT = 900 # one screen
+LEVEL_WIDTH = 600
+FLOOR = 900 # bottom of chunk 0, chunks are numbered upwards from there
+ROW_SPACING = 75 # vertical distance between rows of platforms
+ROW_JITTER = 20 # rows are moved up or down by up to this much, less than half the spacing so they stay in their chunk
+AHEAD = 2 # chunks kept generated above the camera
+BEHIND = 1 # chunks kept below the camera before being retired
+
+def chunk_bounds(index: int, chunk_height: float = CHUNK_HEIGHT) -> tuple[float, float]:
+    "Top and bottom y of a chunk."
+    bottom = FLOOR - index * chunk_height
+    return bottom - chunk_height, bottom
+
+def chunk_of(y: float, chunk_height: float = CHUNK_HEIGHT) -> int:
+    "The chunk a y coordinate lies in."
+    return math.floor((FLOOR - y) / chunk_height)
+
+def generate_chunk(seed: int, index: int, chunk_height: float = CHUNK_HEIGHT) -> array:
+    """The platforms of one chunk, as rows of x, y, width, height floats.
+
+    Depends on nothing but the seed and the index (not on which chunks were made before, nor on PYTHONHASHSEED),
+    so the same seed gives byte-identical chunks in any order, in any run.
+    """
+    rng = random.Random(f"{seed}:{index}") # str seeds are hashed with sha512, stable across runs and versions
+    bottom = chunk_bounds(index, chunk_height)[1]
+    rows = array('f')
+    for row in range(int(chunk_height // ROW_SPACING)):
+        y = bottom - (row + 0.5) * ROW_SPACING + rng.uniform(-ROW_JITTER, ROW_JITTER)
+        for _ in range(rng.choice((1, 1, 2))):
+            rows.extend((rng.uniform(0, LEVEL_WIDTH - PLATFORM_WIDTH), y, PLATFORM_WIDTH, PLATFORM_HEIGHT))
+    return rows
+
+# Class Definitions
+class Level():
+    """Streams the chunks of an endless level into a PlatformGroup around a camera band: generates them ahead of it and
+    retires them behind it, so only `ahead + behind` chunks more than what is on screen are ever alive, however high the player climbs.
+    """
+
+    def __init__(self, seed: int, group: sprites.PlatformGroup, chunk_height: float = CHUNK_HEIGHT,
+                 ahead: int = AHEAD, behind: int = BEHIND, budget: int = 1) -> None:
+        self.seed: int = seed
+        self.group: sprites.PlatformGroup = group
+        self.chunk_height: float = chunk_height
+        self.ahead: int = ahead
+        self.behind: int = behind
+        self.budget: int = budget # chunks generated per update() besides the ones on screen, to bound the cost of a frame
+        self.chunks: dict[int, list[sprites.Entity]] = {} # index -> its platforms
+
+    def __repr__(self) -> str:
+        return f"Level (seed {self.seed}, chunks {sorted(self.chunks)})"
+
+    def _spawn(self, x: float, y: float, width: float, height: float) -> sprites.Entity:
+        if self.group.pool is not None:
+            return self.group.acquire(x, y, width, height)
+        platform = Platform(x, y, width, height)
+        self.group.register_item(platform)
+        return platform
+
+    def load(self, index: int) -> None:
+        rows = generate_chunk(self.seed, index, self.chunk_height)
+        self.chunks[index] = [self._spawn(*rows[i:i + 4]) for i in range(0, len(rows), 4)]
+
+    def retire(self, index: int) -> None:
+        group = self.group
+        for platform in self.chunks.pop(index):
+            if platform in group: # not already deleted by something else
+                group.delete_item(group.handle_of(platform))
+
+    def update(self, top: float, bottom: float) -> int:
+        "Brings the chunks in line with a camera band, returns how many were generated."
+        on_screen = range(max(chunk_of(bottom, self.chunk_height), 0), chunk_of(top, self.chunk_height) + 1)
+        wanted = range(max(on_screen.start - self.behind, 0), on_screen.stop + self.ahead)
+        for index in [index for index in self.chunks if index not in wanted]:
+            self.retire(index)
+
+        # what is on screen has to be there now, whatever it costs; then ahead of the camera, then behind it, within the budget
+        generated = spare = 0
+        for index in [*on_screen, *range(on_screen.stop, wanted.stop), *range(wanted.start, on_screen.start)]:
+            if index in self.chunks:
+                continue
+            if index not in on_screen:
+                if spare >= self.budget:
+                    break
+                spare += 1
+            self.load(index)
+            generated += 1
+        return generated
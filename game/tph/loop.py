@@ -0,0 +1,42 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#   
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#    
+#      http://www.apache.org/licenses/LICENSE-2.0
+#    
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+TICK_RATE = 60 # simulation ticks per second, what all the "per tick" physics constants are tuned for
+MAX_FRAME_TIME = 0.25 # longer frames (breakpoints, window drags) are cut down to this, not caught up on
+
+# Class Definitions
+class FixedTimestep():
+    "Accumulator for running the simulation at a constant tick rate, whatever rate frames get rendered at."
+
+    def __init__(self, tick_rate: float = TICK_RATE, max_frame_time: float = MAX_FRAME_TIME) -> None:
+        self.tick_rate: float = tick_rate
+        self.dt: float = 1 / tick_rate
+        self.max_frame_time: float = max_frame_time
+        self.accumulator: float = 0
+        self.alpha: float = 0 # how far the rendered frame is between the last two ticks, 0 to 1
+        self.ticks: int = 0
+
+    def advance(self, frame_time: float) -> int:
+        "Adds the time the last frame took and returns how many ticks to run for it; alpha is set for rendering after them."
+        self.accumulator += min(frame_time, self.max_frame_time)
+        ticks = 0
+        while self.accumulator >= self.dt:
+            self.accumulator -= self.dt
+            ticks += 1
+        self.ticks += ticks
+        self.alpha = self.accumulator / self.dt
+        return ticks
+
+    def __repr__(self) -> str:
+        return f"FixedTimestep at {self.tick_rate} ticks/s ({self.ticks} ticks, alpha {self.alpha:.2f})"
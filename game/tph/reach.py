@@ -0,0 +1,178 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#   
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#    
+#      http://www.apache.org/licenses/LICENSE-2.0
+#    
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import hashlib
+import inspect
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+from array import array
+
+from . import loop
+from .sprites import physics
+
+BUCKET = 4 # px of height per entry of the table
+MAX_DROP = 900 # how far below the launch height the table goes
+MAX_HOLD = 30 # longest space press tried, in ticks
+MAX_TICKS = 180 # ticks simulated per jump
+SCREEN_WIDTH = 600
+CACHE_DIR = os.environ.get("TPH_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "tph"))
+VERSION = 1 # of the table format
+
+def physics_key() -> dict:
+    """Everything the table depends on: the physics constants, and the source of the rules themselves: Player and every
+    class of tph it inherits from (move_to, the screen wrap, the defaults set in __init__), and the input it reads."""
+    from . import controls
+    from .sprites.player import Player
+    package = Player.__module__.partition('.')[0] # tph; this module may be running as __main__
+    rules = hashlib.sha256()
+    for source in [cls for cls in Player.__mro__ if cls.__module__.partition('.')[0] == package] + [controls]:
+        rules.update(inspect.getsource(source).encode())
+    defaults = {name: parameter.default for name, parameter in inspect.signature(physics.step).parameters.items()
+                if parameter.default is not inspect.Parameter.empty}
+    return {
+        "version": VERSION,
+        "tick_rate": loop.TICK_RATE,
+        "bucket": BUCKET,
+        "max_drop": MAX_DROP,
+        "max_hold": MAX_HOLD,
+        "max_ticks": MAX_TICKS,
+        **defaults,
+        "rules": rules.hexdigest(),
+    }
+
+def compute() -> tuple[float, array, float, float]:
+    """Runs the real Player through every jump (each space press length, at each phase of the jump timer, walking
+    sideways all along) and returns its highest point, its width, its step sideways per tick and, per BUCKET of height
+    from -MAX_DROP up to it, how far sideways it can be when its feet come down through that height.
+    Needs the null backend, for scripted input.
+    """
+    from . import rlapi as rl
+    from . import controls
+    from .rlapi import null
+    from .sprites.player import Player
+
+    heights: list[float] = []
+    landings: list[tuple[float, float, float]] = [] # (feet before, feet after, sideways distance) of every tick coming down
+    for phase in range(6):
+        for hold in range(MAX_HOLD + 1):
+            player = Player(0, 0)
+            floor = player.floor_height
+            player.hitbox.y = floor - player.hitbox.height # standing on the launch surface
+            null.state.script = lambda frame: (rl.KEY_RIGHT, rl.KEY_SPACE) if frame - start < hold else (rl.KEY_RIGHT,)
+            start = null.state.frame
+            feet = 0.0
+            for tick in range(MAX_TICKS):
+                with rl.drawing():
+                    pass
+                controls.poll()
+                player.refresh(None, phase + tick)
+                controls.consume()
+                if tick == 0: # launched, from here on it is over thin air
+                    player.floor_height = floor + MAX_DROP + player.hitbox.height
+                    step = player.hitbox.x
+                previous, feet = feet, floor - player.hitbox.y - player.hitbox.height
+                heights.append(feet)
+                if feet <= previous:
+                    landings.append((previous, feet, abs(player.hitbox.x)))
+                if feet < -MAX_DROP:
+                    break
+    null.state.script = None
+
+    max_height = max(heights)
+    reach = array('f', [-1.0] * (math.floor((max_height + MAX_DROP) / BUCKET) + 1))
+    for top, bottom, distance in landings:
+        for bucket in range(max(math.floor((bottom + MAX_DROP) / BUCKET), 0), min(math.floor((top + MAX_DROP) / BUCKET), len(reach) - 1) + 1):
+            reach[bucket] = max(reach[bucket], distance)
+    return max_height, reach, player.hitbox.width, step
+
+# Class Definitions
+class ReachTable():
+    "How high and how far sideways the Player can get in one jump, so that \"can it get from A to B\" is a table lookup."
+
+    def __init__(self, max_height: float, reach: array, player_width: float, step: float,
+                 bucket: float = BUCKET, max_drop: float = MAX_DROP) -> None:
+        self.max_height: float = max_height # highest the feet get above the launch surface
+        self.reach: array = reach # per bucket of height, from -max_drop up: sideways reach, -1 if it can't land there
+        self.player_width: float = player_width
+        self.step: float = step # sideways per tick
+        self.bucket: float = bucket
+        self.max_drop: float = max_drop
+
+    def __repr__(self) -> str:
+        return f"ReachTable (max height {self.max_height}, {len(self.reach)} buckets of {self.bucket} px)"
+
+    def reach_at(self, dy: float) -> float:
+        "How far sideways the Player can land `dy` above where it jumped from (below for negative dy), -1 if not at all."
+        bucket = math.floor((dy + self.max_drop) / self.bucket)
+        if bucket < 0 or bucket >= len(self.reach):
+            return -1
+        return self.reach[bucket]
+
+    def reachable(self, a: 'rl.Rectangle', b: 'rl.Rectangle', screen_width: float | None = SCREEN_WIDTH) -> bool:
+        "Whether the Player standing anywhere on platform a can land on platform b; across the screen edge too unless screen_width is None."
+        reach = self.reach_at(a.y - b.y)
+        if reach < 0:
+            return False
+        distance = abs((a.x + a.width / 2) - (b.x + b.width / 2))
+        if screen_width is not None and distance > screen_width / 2:
+            # the other way around is shorter; the wrap puts the player at a fixed x, which can cost up to a step
+            distance = screen_width - distance
+            reach -= self.step
+        # it can hang over the edge of a when jumping and over the edge of b when landing: the gap minus its width
+        return distance - (a.width + b.width) / 2 - self.player_width < reach
+
+def cache_path(key: dict, cache_dir: str = CACHE_DIR) -> str:
+    digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()[:16]
+    return os.path.join(cache_dir, f"reach-{digest}.json")
+
+def load(cache_dir: str = CACHE_DIR) -> ReachTable:
+    "The table for the current physics, from the cache if it has been computed before, otherwise computed and cached."
+    key = physics_key()
+    path = cache_path(key, cache_dir)
+    if not os.path.exists(path):
+        # the simulation needs the null backend, which can't be switched to once raylib is loaded: run it on its own
+        package = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = {**os.environ, "TPH_RLAPI_BACKEND": "null",
+               "PYTHONPATH": os.pathsep.join(filter(None, [package, os.environ.get("PYTHONPATH")]))}
+        subprocess.run([sys.executable, "-m", "tph.reach", cache_dir], env=env, check=True)
+
+    with open(path) as file:
+        data = json.load(file)
+    if data["key"] != key:
+        raise ValueError(f"{path} was computed for other physics")
+    return ReachTable(data["max_height"], array('f', data["reach"]), data["player_width"], data["step"], key["bucket"], key["max_drop"])
+
+def save(cache_dir: str = CACHE_DIR) -> str:
+    "Computes the table and writes it into the cache, returns its path."
+    key = physics_key()
+    path = cache_path(key, cache_dir)
+    max_height, reach, player_width, step = compute()
+    os.makedirs(cache_dir, exist_ok=True)
+    # a temporary file of its own per process, moved into place whole: two games starting at once both write one
+    descriptor, temporary = tempfile.mkstemp(suffix=".tmp", dir=cache_dir)
+    try:
+        with os.fdopen(descriptor, "w") as file:
+            json.dump({"key": key, "max_height": max_height, "player_width": player_width, "step": step, "reach": reach.tolist()}, file)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+    return path
+
+if __name__ == "__main__":
+    save(*sys.argv[1:2])
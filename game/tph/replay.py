@@ -0,0 +1,124 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#   
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#    
+#      http://www.apache.org/licenses/LICENSE-2.0
+#    
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import argparse
+import hashlib
+import sys
+import time
+import typing
+from struct import Struct
+
+from . import rlapi as rl
+
+if typing.TYPE_CHECKING:
+    from .game import Game
+
+_MAGIC = b'TPHRPL1\0'
+_HEADER = Struct('<QI') # level seed, runs
+_RUN = Struct('<BBH') # actions held, ticks run, frames in a row like that
+_MAX_RUN = 0xFFFF
+
+def state_hash(session: 'Game') -> str:
+    "sha256 over everything the simulation decides: the tick count, the chunks loaded and every hitbox and velocity."
+    sha = hashlib.sha256(session.clock.ticks.to_bytes(8, 'little'))
+    sha.update(repr(sorted(session.world.chunks)).encode())
+    for group in (session.platforms, session.main_group):
+        for entity in group:
+            sha.update(bytes(entity.hitbox))
+            velocity = getattr(entity, 'velocity', None)
+            if velocity is not None:
+                sha.update(bytes(velocity))
+    return sha.hexdigest()
+
+# Class Definitions
+class Replay():
+    "The input of a session, frame by frame, and the seed of its level: all it takes to simulate it again."
+
+    def __init__(self, seed: int, runs: list[list[int]] | None = None) -> None:
+        self.seed: int = seed
+        self.runs: list[list[int]] = runs if runs is not None else [] # [actions held, ticks, frames]
+
+    def __len__(self) -> int:
+        return sum(run[2] for run in self.runs)
+
+    def __repr__(self) -> str:
+        return f"Replay (seed {self.seed}, {len(self)} frames in {len(self.runs)} runs)"
+
+    def record(self, down: int, ticks: int) -> None:
+        "Appends a frame: the actions held on it (InputSnapshot.down) and the ticks it ran."
+        runs = self.runs
+        if runs and runs[-1][0] == down and runs[-1][1] == ticks and runs[-1][2] < _MAX_RUN:
+            runs[-1][2] += 1
+        else:
+            runs.append([down, ticks, 1])
+
+    def frames(self) -> typing.Iterator[tuple[int, int]]:
+        "(actions held, ticks) of every frame."
+        for down, ticks, count in self.runs:
+            for _ in range(count):
+                yield down, ticks
+
+    def save(self, path: str) -> None:
+        with open(path, 'wb') as fp:
+            fp.write(_MAGIC)
+            fp.write(_HEADER.pack(self.seed, len(self.runs)))
+            for run in self.runs:
+                fp.write(_RUN.pack(*run))
+
+    @classmethod
+    def load(cls, path: str) -> 'Replay':
+        with open(path, 'rb') as fp:
+            data = memoryview(fp.read())
+        if data[:len(_MAGIC)] != _MAGIC:
+            raise ValueError(f"{path} is not a tph replay")
+        seed, count = _HEADER.unpack_from(data, len(_MAGIC))
+        offset = len(_MAGIC) + _HEADER.size
+        return cls(seed, [list(_RUN.unpack_from(data, offset + index * _RUN.size)) for index in range(count)])
+
+def play(replay: Replay, render: bool = False,
+         on_frame: typing.Callable[['Game'], None] | None = None) -> 'Game':
+    "Simulates a replay as fast as it goes (rendering it too if asked to, at the last tick) and returns the finished session."
+    from . import controls
+    from .game import Game
+
+    session = Game(replay.seed)
+    controls.snapshot = controls.InputSnapshot() # no keys held before the first frame, like at startup
+    session.clock.alpha = 1
+    for down, ticks in replay.frames():
+        controls.inject(down)
+        session.clock.ticks += ticks
+        session.run(ticks)
+        if render:
+            with rl.drawing():
+                session.render()
+        if on_frame is not None:
+            on_frame(session)
+    return session
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Plays tph replays headlessly at full speed and prints their final state hashes.")
+    parser.add_argument("replays", nargs="+", metavar="FILE")
+    parser.add_argument("--render", action="store_true", help="render every frame too (to the null backend)")
+    args = parser.parse_args()
+
+    rl.use_backend("null")
+    for path in args.replays:
+        replay = Replay.load(path)
+        start = time.perf_counter()
+        session = play(replay, args.render)
+        elapsed = time.perf_counter() - start
+        print(f"{path}: {len(replay)} frames, {session.clock.ticks} ticks in {elapsed:.2f} s, state {state_hash(session)}")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#   
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#    
+#      http://www.apache.org/licenses/LICENSE-2.0
+#    
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import bisect
+import collections
+import threading
+import zlib
+from struct import Struct
+
+from . import loop
+
+REWIND_SECONDS = 5
+KEYFRAME_INTERVAL = 60 # frames between full snapshots, the rest are stored as deltas to the frame before
+
+_MAGIC = b'TPHRWD2\0'
+_FRAME = Struct('<?HI') # keyframe, ticks, compressed bytes
+
+def _xor(a: bytes, b: bytes) -> bytes:
+    "Bytewise xor of two blobs of the same length: zero wherever the field did not change."
+    return (int.from_bytes(a, 'little') ^ int.from_bytes(b, 'little')).to_bytes(len(a), 'little')
+
+def _write(path: str, frames: list[tuple[bool, int, bytes]]) -> None:
+    with open(path, 'wb') as fp:
+        fp.write(_MAGIC)
+        for keyframe, ticks, data in frames:
+            fp.write(_FRAME.pack(keyframe, ticks, len(data)) + data)
+
+# Class Definitions
+class Rewind():
+    """The last `seconds` of a session as world snapshots (tph.snapshot), in a ring.
+
+    Every KEYFRAME_INTERVAL-th frame (and any frame whose layout changed, e.g. a chunk loaded) is kept whole; the others
+    as the xor with the frame before, compressed, which leaves next to nothing but the fields that changed.
+    A delta works both ways, so stepping back and forth from the cursor costs one delta each.
+    Frames are recorded once per rendered frame, with the ticks it ran: the history is measured in ticks, whatever the frame rate.
+    """
+
+    def __init__(self, seconds: float = REWIND_SECONDS, tick_rate: float = loop.TICK_RATE,
+                 keyframe_interval: int = KEYFRAME_INTERVAL) -> None:
+        self.tick_rate: float = tick_rate
+        self.keyframe_interval: int = keyframe_interval
+        self.frames: collections.deque[tuple[bool, int, bytes]] = collections.deque() # (keyframe, ticks, compressed blob or delta)
+        self.stored: int = 0 # compressed bytes held
+        self.ticks: int = 0 # ticks the frames held cover
+        self._capacity: int = 0 # in ticks
+        # positions of the keyframes, counted from the first frame ever recorded, and the ticks from each to the next one
+        self._keyframes: collections.deque[int] = collections.deque()
+        self._run_ticks: collections.deque[int] = collections.deque()
+        self._dropped: int = 0 # frames dropped off the front, what the positions are offset by
+        self._latest: bytes | None = None # the newest frame, whole
+        self._cursor: int = -1 # index of the frame last stepped to, -1 for the newest
+        self._current: bytes | None = None # that frame, whole
+        self.seconds = seconds
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def __repr__(self) -> str:
+        return f"Rewind ({len(self)} frames, {self.stored / 1024:.1f} KiB, {self.bytes_per_second() / 1024:.1f} KiB/s)"
+
+    @property
+    def seconds(self) -> float:
+        return self._capacity / self.tick_rate
+
+    @seconds.setter
+    def seconds(self, seconds: float) -> None:
+        "Resizes the history; nothing gets re-encoded, older frames are just dropped a keyframe interval at a time."
+        self._capacity = max(round(seconds * self.tick_rate), 1)
+        self._trim()
+
+    def bytes_per_second(self) -> float:
+        "Memory the history costs per second of it."
+        return self.stored / self.ticks * self.tick_rate if self.ticks else 0.0
+
+    def _append(self, keyframe: bool, ticks: int, data: bytes) -> None:
+        if keyframe:
+            self._keyframes.append(self._dropped + len(self.frames))
+            self._run_ticks.append(0)
+        self._run_ticks[-1] += ticks
+        self.frames.append((keyframe, ticks, data))
+        self.stored += len(data)
+        self.ticks += ticks
+
+    def _pop(self) -> None:
+        keyframe, ticks, data = self.frames.pop()
+        self._run_ticks[-1] -= ticks
+        if keyframe:
+            self._keyframes.pop()
+            self._run_ticks.pop()
+        self.stored -= len(data)
+        self.ticks -= ticks
+
+    def _trim(self) -> None:
+        # only whole runs of frames from a keyframe to the next one can go, so the history is a bit longer than asked for
+        frames, keyframes, run_ticks = self.frames, self._keyframes, self._run_ticks
+        while len(keyframes) > 1 and self.ticks - run_ticks[0] >= self._capacity:
+            run = keyframes[1] - keyframes[0]
+            for _ in range(run):
+                self.stored -= len(frames.popleft()[2])
+            self.ticks -= run_ticks.popleft()
+            keyframes.popleft()
+            self._dropped += run
+            if self._cursor >= 0:
+                self._cursor = max(self._cursor - run, 0)
+
+    def record(self, blob: bytes, ticks: int = 1) -> None:
+        "Appends the snapshot of a new frame that ran `ticks` ticks; after stepping back, the frames ahead of the cursor are dropped first."
+        if self._cursor >= 0:
+            self.truncate()
+        keyframe = (self._latest is None or len(blob) != len(self._latest)
+                    or self._dropped + len(self.frames) - self._keyframes[-1] >= self.keyframe_interval)
+        self._append(keyframe, ticks, zlib.compress(blob if keyframe else _xor(self._latest, blob), 1))
+        self._latest = blob
+        self._trim()
+
+    def truncate(self) -> None:
+        "Forgets the frames after the cursor, making the one stepped to the newest."
+        if self._cursor < 0:
+            return
+        while len(self.frames) > self._cursor + 1:
+            self._pop()
+        self._latest = self._current
+        self._cursor, self._current = -1, None
+
+    def blob_at(self, index: int) -> bytes:
+        "The whole snapshot of frame `index` (0 the oldest, -1 the newest), rebuilt from the keyframe before it."
+        if index < 0:
+            index += len(self.frames)
+        keyframes = self._keyframes
+        start = keyframes[bisect.bisect_right(keyframes, self._dropped + index) - 1] - self._dropped
+        blob = zlib.decompress(self.frames[start][2])
+        for position in range(start + 1, index + 1):
+            blob = _xor(blob, zlib.decompress(self.frames[position][2]))
+        return blob
+
+    @property
+    def cursor(self) -> int:
+        return self._cursor if self._cursor >= 0 else len(self.frames) - 1
+
+    def step_back(self) -> bytes | None:
+        "Moves the cursor one frame back and returns that frame's snapshot, None at the oldest one."
+        cursor = self.cursor
+        if cursor <= 0:
+            return None
+        current = self._current if self._current is not None else self._latest
+        keyframe, _, data = self.frames[cursor]
+        self._current = self.blob_at(cursor - 1) if keyframe else _xor(current, zlib.decompress(data))
+        self._cursor = cursor - 1
+        return self._current
+
+    def step_forward(self) -> bytes | None:
+        "Moves the cursor one frame forward again and returns that frame's snapshot, None at the newest one."
+        if self._cursor < 0 or self._cursor >= len(self.frames) - 1:
+            return None
+        keyframe, _, data = self.frames[self._cursor + 1]
+        self._current = zlib.decompress(data) if keyframe else _xor(self._current, zlib.decompress(data))
+        self._cursor += 1
+        return self._current
+
+    def save(self, path: str) -> None:
+        "Writes the history as it is to a file, for looking into a hitch after the fact."
+        _write(path, list(self.frames))
+
+    def save_in_background(self, path: str) -> threading.Thread:
+        "Like save(), but writes from a thread, for saving from the frame loop without making the frame longer."
+        thread = threading.Thread(target=_write, args=(path, list(self.frames)), name="tph rewind save")
+        thread.start()
+        return thread
+
+    @classmethod
+    def load(cls, path: str, tick_rate: float = loop.TICK_RATE) -> 'Rewind':
+        with open(path, 'rb') as fp:
+            data = memoryview(fp.read())
+        if data[:len(_MAGIC)] != _MAGIC:
+            raise ValueError(f"{path} is not a tph rewind history")
+        frames = []
+        offset = len(_MAGIC)
+        while offset < len(data):
+            keyframe, ticks, length = _FRAME.unpack_from(data, offset)
+            offset += _FRAME.size
+            frames.append((keyframe, ticks, bytes(data[offset:offset + length])))
+            offset += length
+        history = cls(sum(frame[1] for frame in frames) / tick_rate, tick_rate)
+        for frame in frames:
+            history._append(*frame)
+        if frames:
+            history._latest = history.blob_at(-1)
+        return history
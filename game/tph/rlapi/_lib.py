@@ -0,0 +1,220 @@
+"""Shared library loading and lazy symbol binding for the rlapi submodules"""
+
+import sys
+import os
+import platform
+import ctypes
+from ctypes import CDLL, wintypes
+
+from . import BACKENDS, _backend, _record
+
+if _backend not in BACKENDS:
+    raise ValueError("unknown backend {!r} in TPH_RLAPI_BACKEND, expected one of {}".format(_backend, ', '.join(BACKENDS)))
+
+# region LIBRARY LOADING
+
+# region CDLLEX
+
+if sys.platform == 'win32':
+    DONT_RESOLVE_DLL_REFERENCES = 0x00000001
+    LOAD_LIBRARY_AS_DATAFILE = 0x00000002
+    LOAD_WITH_ALTERED_SEARCH_PATH = 0x00000008
+    LOAD_IGNORE_CODE_AUTHZ_LEVEL = 0x00000010  # NT 6.1
+    LOAD_LIBRARY_AS_IMAGE_RESOURCE = 0x00000020  # NT 6.0
+    LOAD_LIBRARY_AS_DATAFILE_EXCLUSIVE = 0x00000040  # NT 6.0
+
+    # These cannot be combined with LOAD_WITH_ALTERED_SEARCH_PATH.
+    # Install update KB2533623 for NT 6.0 & 6.1.
+    LOAD_LIBRARY_SEARCH_DLL_LOAD_DIR = 0x00000100
+    LOAD_LIBRARY_SEARCH_APPLICATION_DIR = 0x00000200
+    LOAD_LIBRARY_SEARCH_USER_DIRS = 0x00000400
+    LOAD_LIBRARY_SEARCH_SYSTEM32 = 0x00000800
+    LOAD_LIBRARY_SEARCH_DEFAULT_DIRS = 0x00001000
+
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+
+
+    def check_bool(result, func, args):
+        if not result:
+            raise ctypes.WinError(ctypes.get_last_error())
+        return args
+
+
+    kernel32.LoadLibraryExW.errcheck = check_bool
+    kernel32.LoadLibraryExW.restype = wintypes.HMODULE
+    kernel32.LoadLibraryExW.argtypes = (wintypes.LPCWSTR,
+                                        wintypes.HANDLE,
+                                        wintypes.DWORD)
+
+
+    class CDLLEx(ctypes.CDLL):
+        def __init__(self, name, mode=0, handle=None,
+                    use_errno=True, use_last_error=False):
+            if handle is None:
+                handle = kernel32.LoadLibraryExW(name, None, mode)
+            super(CDLLEx, self).__init__(name, mode, handle,
+                                        use_errno, use_last_error)
+
+
+    class WinDLLEx(ctypes.WinDLL):
+        def __init__(self, name, mode=0, handle=None,
+                    use_errno=False, use_last_error=True):
+            if handle is None:
+                handle = kernel32.LoadLibraryExW(name, None, mode)
+            super(WinDLLEx, self).__init__(name, mode, handle,
+                                        use_errno, use_last_error)
+
+
+# endregion (cdllex)
+
+# check for .raylib file in CWD
+
+#
+# example of .raylib file contents:
+# ```json
+# { 
+#     "win32": {
+#         "32bit": "path/to/raylib/filename.dll",
+#         "64bit": "path/to/raylib/filename.dll",
+#     },
+#     "linux": {
+#         "32bit": "path/to/raylib/filename.so",
+#         "64bit": "path/to/raylib/filename.so",
+#     },
+#     "darwin": {
+#         "64bit": "path/to/raylib/filename.dylib",
+#     },
+# }
+# ```
+#
+
+_dotraylib_used = False
+_dotraylib_loadinfo = None
+_dotraylib = os.path.join(os.getcwd(), '.raylib')
+_dotraylib_config = {}
+if os.path.exists(_dotraylib) and os.path.isfile(_dotraylib):
+    _dotraylib_used = True
+    import json
+    with open(_dotraylib, 'r', encoding='utf8') as fp:
+        try:
+            _dotraylib_config = json.load(fp)
+        except json.JSONDecodeError:
+            _dotraylib_loadinfo = "Could not decode .raylib file"
+            _dotraylib_used = False
+
+    del json
+
+_lib_fname = {
+    'win32': 'raylib.dll',
+    'linux': '../libraylib.so.4.2.0',
+    'darwin': 'libraylib.4.2.0.dylib'
+}
+
+_lib_platform = sys.platform
+
+if _lib_platform == 'win32':
+    _bitness = platform.architecture()[0]
+elif _lib_platform == 'darwin':
+    _bitness = '64bit'
+else:
+    _bitness = '64bit' if sys.maxsize > 2 ** 32 else '32bit'
+
+_lib_default = os.path.join('/usr/local/lib', _bitness, _lib_fname[_lib_platform])
+
+if _dotraylib_used:
+    try:
+        _lib_default = os.path.abspath(_dotraylib_config[_lib_platform][_bitness])
+
+    except (KeyError, ValueError):
+        _dotraylib_loadinfo = "Platform ({}) and bitness ({}) not specified in .raylib file".format(_lib_platform, _bitness)
+
+_lib_fname_abspath = os.path.normcase(os.path.normpath(_lib_default))
+
+_cwd_info = "\n    current working dir: {}".format(os.getcwd()) if _dotraylib_used else ""
+_load_info = "\n    .raylib load info: {}".format(_dotraylib_loadinfo) if _dotraylib_loadinfo else ""
+
+if _backend == 'raylib':
+    print(
+        """Library loading info:
+    platform: {}
+    bitness: {}{}{}
+    absolute path: {}
+    using .raylib file: {}
+    exists: {}
+    is file: {}
+    """.format(
+            _lib_platform,
+            _bitness,
+            _cwd_info,
+            _load_info,
+            _lib_fname_abspath,
+            'yes' if _dotraylib_used else 'no',
+            'yes' if os.path.exists(_lib_fname_abspath) else 'no',
+            'yes' if os.path.isfile(_lib_fname_abspath) else 'no'
+        )
+    )
+
+rlapi = None
+if _backend == 'null':
+    from .null import NullLibrary, state
+    rlapi = NullLibrary(state)
+elif _lib_platform == 'win32':
+
+    try:
+        rlapi = CDLLEx(_lib_fname_abspath, LOAD_WITH_ALTERED_SEARCH_PATH)
+    except OSError:
+        print("Unable to load {}.".format(_lib_fname[_lib_platform]))
+        rlapi = None
+else:
+    rlapi = CDLL(_lib_fname_abspath)
+
+if rlapi is None:
+    print("Failed to load shared library.")
+    exit()
+elif _backend == 'raylib':
+    print("Shared library loaded succesfully.", rlapi)
+
+if _record:
+    from .record import RecordingLibrary, recording
+    rlapi = RecordingLibrary(rlapi, recording)
+
+# every bound symbol by raylib name, filled in as the binding modules get imported
+_SYMBOLS = {}
+
+
+class _LazySymbol:
+    '''Placeholder for a raylib function, resolved and prototyped on its first call'''
+    __slots__ = ('name', 'argtypes', 'restype', 'func', 'namespace')
+
+    def __init__(self, name, argtypes, restype, namespace):
+        self.name = name
+        self.argtypes = argtypes
+        self.restype = restype
+        self.func = None
+        self.namespace = namespace
+
+    def resolve(self):
+        '''Looks up the symbol in the shared library and caches the prototyped function'''
+        if self.func is None:
+            api = getattr(rlapi, self.name)
+            api.argtypes = self.argtypes
+            api.restype = self.restype
+            self.func = api
+            # later calls go straight to the ctypes function
+            self.namespace['_' + self.name] = api
+        return self.func
+
+    def __call__(self, *args):
+        return self.resolve()(*args)
+
+    def __repr__(self):
+        state = 'resolved' if self.func is not None else 'unresolved'
+        return "<{} symbol {}>".format(state, self.name)
+
+
+def binder(namespace):
+    '''Returns the `_wrap` function for a binding module, `namespace` being its globals()'''
+    def _wrap(name, argtypes, restype):
+        symbol = _SYMBOLS[name] = _LazySymbol(name, argtypes, restype, namespace)
+        return symbol
+    return _wrap
@@ -0,0 +1,723 @@
+"""raylib bindings for the audio device, waves, sounds, music and audio streams"""
+
+from typing import Sequence as Seq, Union
+from ctypes import Structure, POINTER, CFUNCTYPE, byref
+
+from ._lib import binder
+from .core import (
+    Bool, CharPtr, Float, FloatPtr, Int, UCharPtr, UInt, VoidPtr, _ptr_out, _str_in
+)
+
+_wrap = binder(globals())
+
+
+# Struct not exposed in raylib.h
+class rAudioBufferPtr(Structure):
+    pass
+
+# Struct not exposed in raylib.h
+class rAudioProcessorPtr(Structure):
+    pass
+
+class Wave(Structure):
+    '''Wave, audio wave data'''
+    _fields_ = [
+        ('frame_count', UInt),
+        ('sample_rate', UInt),
+        ('sample_size', UInt),
+        ('channels', UInt),
+        ('data', VoidPtr),
+    ]
+
+
+    @classmethod
+    def array_of(cls, wave_sequence):
+        '''Creates and returns an array of Waves'''
+        arr = cls * len(wave_sequence)
+        return arr(*wave_sequence)
+
+
+    def __init__(self, frame_count: int = None,
+                 sample_rate: int = None,
+                 sample_size: int = None,
+                 channels: int = None,
+                 data: bytes = None):
+        '''Initializes this Wave struct'''
+        super(Wave, self).__init__(
+            frame_count or 0,
+            sample_rate or 0,
+            sample_size or 0,
+            channels or 0,
+            data
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this Wave instance'''
+        return byref(self)
+
+
+    def __str__(self):
+        return "[{} at {}]".format(self.__class__.__name__, id(self))
+
+    def __repr__(self):
+        return self.__str__()
+
+    def copy(self) -> 'Wave':
+        """Copy a wave to a new wave"""
+        result = _WaveCopy(self)
+        return result
+
+    def crop(self, init_sample: 'int', final_sample: 'int') -> 'None':
+        """Crop a wave to defined samples range"""
+        _WaveCrop(self.byref, int(init_sample), int(final_sample))
+
+    def format(self, sample_rate: 'int', sample_size: 'int', channels: 'int') -> 'None':
+        """Convert wave data to desired format"""
+        _WaveFormat(self.byref, int(sample_rate), int(sample_size), int(channels))
+
+    def format(self) -> 'Union[Seq[float], FloatPtr]':
+        """Load samples data from wave as a 32bit float data array"""
+        result = _ptr_out(_LoadWaveSamples(self.byref))
+        return result
+
+    def export(self, file_name: 'Union[str, CharPtr]') -> 'bool':
+        """Export wave data to file, returns true on success"""
+        result = _ExportWave(self, _str_in(file_name))
+        return result
+
+    def export_as_code(self, file_name: 'Union[str, CharPtr]') -> 'bool':
+        """Export wave sample data to code (.h), returns true on success"""
+        result = _ExportWaveAsCode(self, _str_in(file_name))
+        return result
+
+    def unload(self) -> 'None':
+        """Unload wave data"""
+        _UnloadWave(self)
+
+    def unload_samples(self) -> 'None':
+        """Unload samples data loaded with LoadWaveSamples()"""
+        _UnloadWaveSamples(self)
+
+
+# Pointer type to Waves
+WavePtr = POINTER(Wave)
+
+class AudioStream(Structure):
+    '''AudioStream, custom audio stream'''
+    _fields_ = [
+        ('buffer', rAudioBufferPtr),
+        ('processor', rAudioProcessorPtr),
+        ('sample_rate', UInt),
+        ('sample_size', UInt),
+        ('channels', UInt),
+    ]
+
+
+    @classmethod
+    def array_of(cls, audio_stream_sequence):
+        '''Creates and returns an array of AudioStreams'''
+        arr = cls * len(audio_stream_sequence)
+        return arr(*audio_stream_sequence)
+
+
+    def __init__(self, buffer: rAudioBufferPtr = None,
+                 processor: rAudioProcessorPtr = None,
+                 sample_rate: int = None,
+                 sample_size: int = None,
+                 channels: int = None):
+        '''Initializes this AudioStream struct'''
+        super(AudioStream, self).__init__(
+            buffer,
+            processor,
+            sample_rate or 0,
+            sample_size or 0,
+            channels or 0
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this AudioStream instance'''
+        return byref(self)
+
+
+    def __str__(self):
+        return "[{} Playing: {}]".format(self.__class__.__name__, _IsAudioStreamPlaying(self))
+
+    def __repr__(self):
+        return self.__str__()
+
+    def unload(self) -> 'None':
+        """Unload audio stream and free memory"""
+        _UnloadAudioStream(self)
+
+    def update(self, data: 'bytes', frame_count: 'int') -> 'None':
+        """Update audio stream buffers with data"""
+        _UpdateAudioStream(self, data, int(frame_count))
+
+    def is_processed(self) -> 'bool':
+        """Check if any audio stream buffers requires refill"""
+        result = _IsAudioStreamProcessed(self)
+        return result
+
+    def play(self) -> 'None':
+        """Play audio stream"""
+        _PlayAudioStream(self)
+
+    def pause(self) -> 'None':
+        """Pause audio stream"""
+        _PauseAudioStream(self)
+
+    def resume(self) -> 'None':
+        """Resume audio stream"""
+        _ResumeAudioStream(self)
+
+    def is_playing(self) -> 'bool':
+        """Check if audio stream is playing"""
+        result = _IsAudioStreamPlaying(self)
+        return result
+
+    def stop(self) -> 'None':
+        """Stop audio stream"""
+        _StopAudioStream(self)
+
+    def set_volume(self, volume: 'float') -> 'None':
+        """Set volume for audio stream (1.0 is max level)"""
+        _SetAudioStreamVolume(self, float(volume))
+
+    def set_pitch(self, pitch: 'float') -> 'None':
+        """Set pitch for audio stream (1.0 is base level)"""
+        _SetAudioStreamPitch(self, float(pitch))
+
+    def set_pan(self, pan: 'float') -> 'None':
+        """Set pan for audio stream (0.5 is centered)"""
+        _SetAudioStreamPan(self, float(pan))
+
+    def set_buffer_size_default(self) -> 'None':
+        """Default size for new audio streams"""
+        _SetAudioStreamBufferSizeDefault(self)
+
+    def set_callback(self, callback: 'AudioCallback') -> 'None':
+        """Audio thread callback to request new data"""
+        _SetAudioStreamCallback(self, callback)
+
+    def attach_processor(self, processor: 'AudioCallback') -> 'None':
+        """"""
+        _AttachAudioStreamProcessor(self, processor)
+
+    def detach_processor(self, processor: 'AudioCallback') -> 'None':
+        """"""
+        _DetachAudioStreamProcessor(self, processor)
+
+
+# Pointer type to AudioStreams
+AudioStreamPtr = POINTER(AudioStream)
+
+class Sound(Structure):
+    '''Sound'''
+    _fields_ = [
+        ('stream', AudioStream),
+        ('frame_count', UInt),
+    ]
+
+
+    @classmethod
+    def array_of(cls, sound_sequence):
+        '''Creates and returns an array of Sounds'''
+        arr = cls * len(sound_sequence)
+        return arr(*sound_sequence)
+
+
+    def __init__(self, stream: AudioStream = None, frame_count: int = None):
+        '''Initializes this Sound struct'''
+        super(Sound, self).__init__(
+            stream or AudioStream(),
+            frame_count or 0
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this Sound instance'''
+        return byref(self)
+
+
+    def __str__(self):
+        return "[{} Playing: {}]".format(self.__class__.__name__, _IsSoundPlaying(self))
+
+    def __repr__(self):
+        return self.__str__()
+
+    def play(self) -> 'None':
+        """Play a sound"""
+        _PlaySound(self)
+
+    def stop(self) -> 'None':
+        """Stop playing a sound"""
+        _StopSound(self)
+
+    def pause(self) -> 'None':
+        """Pause a sound"""
+        _PauseSound(self)
+
+    def resume(self) -> 'None':
+        """Resume a paused sound"""
+        _ResumeSound(self)
+
+    def play_multi(self) -> 'None':
+        """Play a sound (using multichannel buffer pool)"""
+        _PlaySoundMulti(self)
+
+    def is_playing(self) -> 'bool':
+        """Check if a sound is currently playing"""
+        result = _IsSoundPlaying(self)
+        return result
+
+    def set_volume(self, volume: 'float') -> 'None':
+        """Set volume for a sound (1.0 is max level)"""
+        _SetSoundVolume(self, float(volume))
+
+    def set_pitch(self, pitch: 'float') -> 'None':
+        """Set pitch for a sound (1.0 is base level)"""
+        _SetSoundPitch(self, float(pitch))
+
+    def set_pan(self, pan: 'float') -> 'None':
+        """Set pan for a sound (0.5 is center)"""
+        _SetSoundPan(self, float(pan))
+
+    def unload(self) -> 'None':
+        """Unload sound"""
+        _UnloadSound(self)
+
+    def update(self, data: 'bytes', sample_count: 'int') -> 'None':
+        """Update sound buffer with new data"""
+        _UpdateSound(self, data, int(sample_count))
+
+
+# Pointer type to Sounds
+SoundPtr = POINTER(Sound)
+
+class Music(Structure):
+    '''Music, audio stream, anything longer than ~10 seconds should be streamed'''
+    _fields_ = [
+        ('stream', AudioStream),
+        ('frame_count', UInt),
+        ('looping', Bool),
+        ('ctx_type', Int),
+        ('ctx_data', VoidPtr),
+    ]
+
+
+    @classmethod
+    def array_of(cls, music_sequence):
+        '''Creates and returns an array of Musics'''
+        arr = cls * len(music_sequence)
+        return arr(*music_sequence)
+
+
+    def __init__(self, stream: AudioStream = None,
+                 frame_count: int = None,
+                 looping: bool = None,
+                 ctx_type: int = None,
+                 ctx_data: bytes = None):
+        '''Initializes this Music struct'''
+        super(Music, self).__init__(
+            stream or AudioStream(),
+            frame_count or 0,
+            looping or False,
+            ctx_type or 0,
+            ctx_data
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this Music instance'''
+        return byref(self)
+
+
+    def __str__(self):
+        return "[{} at {}]".format(self.__class__.__name__, id(self))
+
+    def __repr__(self):
+        return self.__str__()
+
+    def play(self) -> 'None':
+        """Start music playing"""
+        _PlayMusicStream(self)
+
+    def is_playing(self) -> 'bool':
+        """Check if music is playing"""
+        result = _IsMusicStreamPlaying(self)
+        return result
+
+    def update(self) -> 'None':
+        """Updates buffers for music streaming"""
+        _UpdateMusicStream(self)
+
+    def stop(self) -> 'None':
+        """Stop music playing"""
+        _StopMusicStream(self)
+
+    def pause(self) -> 'None':
+        """Pause music playing"""
+        _PauseMusicStream(self)
+
+    def resume(self) -> 'None':
+        """Resume playing paused music"""
+        _ResumeMusicStream(self)
+
+    def seek(self, position: 'float') -> 'None':
+        """Seek music to a position (in seconds)"""
+        _SeekMusicStream(self, float(position))
+
+    def set_volume(self, volume: 'float') -> 'None':
+        """Set volume for music (1.0 is max level)"""
+        _SetMusicVolume(self, float(volume))
+
+    def set_pitch(self, pitch: 'float') -> 'None':
+        """Set pitch for a music (1.0 is base level)"""
+        _SetMusicPitch(self, float(pitch))
+
+    def set_pan(self, pan: 'float') -> 'None':
+        """Set pan for a music (0.5 is center)"""
+        _SetMusicPan(self, float(pan))
+
+    def get_time_length(self) -> 'float':
+        """Get music time length (in seconds)"""
+        result = _GetMusicTimeLength(self)
+        return result
+
+    def get_time_played(self) -> 'float':
+        """Get current music time played (in seconds)"""
+        result = _GetMusicTimePlayed(self)
+        return result
+
+
+# Pointer type to Musics
+MusicPtr = POINTER(Music)
+
+# Audio thread callback, also used for stream processors
+AudioCallback = CFUNCTYPE(None, VoidPtr, UInt)
+
+_InitAudioDevice = _wrap('InitAudioDevice', [], None)
+_CloseAudioDevice = _wrap('CloseAudioDevice', [], None)
+_IsAudioDeviceReady = _wrap('IsAudioDeviceReady', [], Bool)
+_SetMasterVolume = _wrap('SetMasterVolume', [Float], None)
+_LoadWave = _wrap('LoadWave', [CharPtr], Wave)
+_LoadWaveFromMemory = _wrap('LoadWaveFromMemory', [CharPtr, UCharPtr, Int], Wave)
+_LoadSound = _wrap('LoadSound', [CharPtr], Sound)
+_LoadSoundFromWave = _wrap('LoadSoundFromWave', [Wave], Sound)
+_UpdateSound = _wrap('UpdateSound', [Sound, VoidPtr, Int], None)
+_UnloadWave = _wrap('UnloadWave', [Wave], None)
+_UnloadSound = _wrap('UnloadSound', [Sound], None)
+_ExportWave = _wrap('ExportWave', [Wave, CharPtr], Bool)
+_ExportWaveAsCode = _wrap('ExportWaveAsCode', [Wave, CharPtr], Bool)
+_PlaySound = _wrap('PlaySound', [Sound], None)
+_StopSound = _wrap('StopSound', [Sound], None)
+_PauseSound = _wrap('PauseSound', [Sound], None)
+_ResumeSound = _wrap('ResumeSound', [Sound], None)
+_PlaySoundMulti = _wrap('PlaySoundMulti', [Sound], None)
+_StopSoundMulti = _wrap('StopSoundMulti', [], None)
+_GetSoundsPlaying = _wrap('GetSoundsPlaying', [], Int)
+_IsSoundPlaying = _wrap('IsSoundPlaying', [Sound], Bool)
+_SetSoundVolume = _wrap('SetSoundVolume', [Sound, Float], None)
+_SetSoundPitch = _wrap('SetSoundPitch', [Sound, Float], None)
+_SetSoundPan = _wrap('SetSoundPan', [Sound, Float], None)
+_WaveCopy = _wrap('WaveCopy', [Wave], Wave)
+_WaveCrop = _wrap('WaveCrop', [WavePtr, Int, Int], None)
+_WaveFormat = _wrap('WaveFormat', [WavePtr, Int, Int, Int], None)
+_LoadWaveSamples = _wrap('LoadWaveSamples', [Wave], FloatPtr)
+_UnloadWaveSamples = _wrap('UnloadWaveSamples', [FloatPtr], None)
+_LoadMusicStream = _wrap('LoadMusicStream', [CharPtr], Music)
+_LoadMusicStreamFromMemory = _wrap('LoadMusicStreamFromMemory', [CharPtr, UCharPtr, Int], Music)
+_UnloadMusicStream = _wrap('UnloadMusicStream', [Music], None)
+_PlayMusicStream = _wrap('PlayMusicStream', [Music], None)
+_IsMusicStreamPlaying = _wrap('IsMusicStreamPlaying', [Music], Bool)
+_UpdateMusicStream = _wrap('UpdateMusicStream', [Music], None)
+_StopMusicStream = _wrap('StopMusicStream', [Music], None)
+_PauseMusicStream = _wrap('PauseMusicStream', [Music], None)
+_ResumeMusicStream = _wrap('ResumeMusicStream', [Music], None)
+_SeekMusicStream = _wrap('SeekMusicStream', [Music, Float], None)
+_SetMusicVolume = _wrap('SetMusicVolume', [Music, Float], None)
+_SetMusicPitch = _wrap('SetMusicPitch', [Music, Float], None)
+_SetMusicPan = _wrap('SetMusicPan', [Music, Float], None)
+_GetMusicTimeLength = _wrap('GetMusicTimeLength', [Music], Float)
+_GetMusicTimePlayed = _wrap('GetMusicTimePlayed', [Music], Float)
+_LoadAudioStream = _wrap('LoadAudioStream', [UInt, UInt, UInt], AudioStream)
+_UnloadAudioStream = _wrap('UnloadAudioStream', [AudioStream], None)
+_UpdateAudioStream = _wrap('UpdateAudioStream', [AudioStream, VoidPtr, Int], None)
+_IsAudioStreamProcessed = _wrap('IsAudioStreamProcessed', [AudioStream], Bool)
+_PlayAudioStream = _wrap('PlayAudioStream', [AudioStream], None)
+_PauseAudioStream = _wrap('PauseAudioStream', [AudioStream], None)
+_ResumeAudioStream = _wrap('ResumeAudioStream', [AudioStream], None)
+_IsAudioStreamPlaying = _wrap('IsAudioStreamPlaying', [AudioStream], Bool)
+_StopAudioStream = _wrap('StopAudioStream', [AudioStream], None)
+_SetAudioStreamVolume = _wrap('SetAudioStreamVolume', [AudioStream, Float], None)
+_SetAudioStreamPitch = _wrap('SetAudioStreamPitch', [AudioStream, Float], None)
+_SetAudioStreamPan = _wrap('SetAudioStreamPan', [AudioStream, Float], None)
+_SetAudioStreamBufferSizeDefault = _wrap('SetAudioStreamBufferSizeDefault', [Int], None)
+_SetAudioStreamCallback = _wrap('SetAudioStreamCallback', [AudioStream, AudioCallback], None)
+_AttachAudioStreamProcessor = _wrap('AttachAudioStreamProcessor', [AudioStream, AudioCallback], None)
+_DetachAudioStreamProcessor = _wrap('DetachAudioStreamProcessor', [AudioStream, AudioCallback], None)
+
+def init_audio_device() -> 'None':
+    """Initialize audio device and context"""
+    _InitAudioDevice()
+
+def close_audio_device() -> 'None':
+    """Close the audio device and context"""
+    _CloseAudioDevice()
+
+def is_audio_device_ready() -> 'bool':
+    """Check if audio device has been initialized successfully"""
+    result = _IsAudioDeviceReady()
+    return result
+
+def set_master_volume(volume: 'float') -> 'None':
+    """Set master volume (listener)"""
+    _SetMasterVolume(float(volume))
+
+def load_wave(file_name: 'Union[str, CharPtr]') -> 'Wave':
+    """Load wave data from file"""
+    result = _LoadWave(_str_in(file_name))
+    return result
+
+def load_wave_from_memory(file_type: 'Union[str, CharPtr]', file_data: 'Union[Seq[int], UCharPtr]', data_size: 'int') -> 'Wave':
+    """Load wave from memory buffer, fileType refers to extension: i.e. '.wav'"""
+    result = _LoadWaveFromMemory(_str_in(file_type), _str_in(file_data), int(data_size))
+    return result
+
+def load_sound(file_name: 'Union[str, CharPtr]') -> 'Sound':
+    """Load sound from file"""
+    result = _LoadSound(_str_in(file_name))
+    return result
+
+def load_sound_from_wave(wave: 'Wave') -> 'Sound':
+    """Load sound from wave data"""
+    result = _LoadSoundFromWave(wave)
+    return result
+
+def update_sound(sound: 'Sound', data: 'bytes', sample_count: 'int') -> 'None':
+    """Update sound buffer with new data"""
+    _UpdateSound(sound, data, int(sample_count))
+
+def unload_wave(wave: 'Wave') -> 'None':
+    """Unload wave data"""
+    _UnloadWave(wave)
+
+def unload_sound(sound: 'Sound') -> 'None':
+    """Unload sound"""
+    _UnloadSound(sound)
+
+def export_wave(wave: 'Wave', file_name: 'Union[str, CharPtr]') -> 'bool':
+    """Export wave data to file, returns true on success"""
+    result = _ExportWave(wave, _str_in(file_name))
+    return result
+
+def export_wave_as_code(wave: 'Wave', file_name: 'Union[str, CharPtr]') -> 'bool':
+    """Export wave sample data to code (.h), returns true on success"""
+    result = _ExportWaveAsCode(wave, _str_in(file_name))
+    return result
+
+def play_sound(sound: 'Sound') -> 'None':
+    """Play a sound"""
+    _PlaySound(sound)
+
+def stop_sound(sound: 'Sound') -> 'None':
+    """Stop playing a sound"""
+    _StopSound(sound)
+
+def pause_sound(sound: 'Sound') -> 'None':
+    """Pause a sound"""
+    _PauseSound(sound)
+
+def resume_sound(sound: 'Sound') -> 'None':
+    """Resume a paused sound"""
+    _ResumeSound(sound)
+
+def play_sound_multi(sound: 'Sound') -> 'None':
+    """Play a sound (using multichannel buffer pool)"""
+    _PlaySoundMulti(sound)
+
+def stop_sound_multi() -> 'None':
+    """Stop any sound playing (using multichannel buffer pool)"""
+    _StopSoundMulti()
+
+def get_sounds_playing() -> 'int':
+    """Get number of sounds playing in the multichannel"""
+    result = _GetSoundsPlaying()
+    return result
+
+def is_sound_playing(sound: 'Sound') -> 'bool':
+    """Check if a sound is currently playing"""
+    result = _IsSoundPlaying(sound)
+    return result
+
+def set_sound_volume(sound: 'Sound', volume: 'float') -> 'None':
+    """Set volume for a sound (1.0 is max level)"""
+    _SetSoundVolume(sound, float(volume))
+
+def set_sound_pitch(sound: 'Sound', pitch: 'float') -> 'None':
+    """Set pitch for a sound (1.0 is base level)"""
+    _SetSoundPitch(sound, float(pitch))
+
+def set_sound_pan(sound: 'Sound', pan: 'float') -> 'None':
+    """Set pan for a sound (0.5 is center)"""
+    _SetSoundPan(sound, float(pan))
+
+def wave_copy(wave: 'Wave') -> 'Wave':
+    """Copy a wave to a new wave"""
+    result = _WaveCopy(wave)
+    return result
+
+def wave_crop(wave: 'WavePtr', init_sample: 'int', final_sample: 'int') -> 'None':
+    """Crop a wave to defined samples range"""
+    _WaveCrop(wave, int(init_sample), int(final_sample))
+
+def wave_format(wave: 'WavePtr', sample_rate: 'int', sample_size: 'int', channels: 'int') -> 'None':
+    """Convert wave data to desired format"""
+    _WaveFormat(wave, int(sample_rate), int(sample_size), int(channels))
+
+def load_wave_samples(wave: 'Wave') -> 'Union[Seq[float], FloatPtr]':
+    """Load samples data from wave as a 32bit float data array"""
+    result = _ptr_out(_LoadWaveSamples(wave))
+    return result
+
+def unload_wave_samples(samples: 'Union[Seq[float], FloatPtr]') -> 'None':
+    """Unload samples data loaded with LoadWaveSamples()"""
+    _UnloadWaveSamples(samples)
+
+def load_music_stream(file_name: 'Union[str, CharPtr]') -> 'Music':
+    """Load music stream from file"""
+    result = _LoadMusicStream(_str_in(file_name))
+    return result
+
+def load_music_stream_from_memory(file_type: 'Union[str, CharPtr]', data: 'Union[Seq[int], UCharPtr]', data_size: 'int') -> 'Music':
+    """Load music stream from data"""
+    result = _LoadMusicStreamFromMemory(_str_in(file_type), _str_in(data), int(data_size))
+    return result
+
+def unload_music_stream(music: 'Music') -> 'None':
+    """Unload music stream"""
+    _UnloadMusicStream(music)
+
+def play_music_stream(music: 'Music') -> 'None':
+    """Start music playing"""
+    _PlayMusicStream(music)
+
+def is_music_stream_playing(music: 'Music') -> 'bool':
+    """Check if music is playing"""
+    result = _IsMusicStreamPlaying(music)
+    return result
+
+def update_music_stream(music: 'Music') -> 'None':
+    """Updates buffers for music streaming"""
+    _UpdateMusicStream(music)
+
+def stop_music_stream(music: 'Music') -> 'None':
+    """Stop music playing"""
+    _StopMusicStream(music)
+
+def pause_music_stream(music: 'Music') -> 'None':
+    """Pause music playing"""
+    _PauseMusicStream(music)
+
+def resume_music_stream(music: 'Music') -> 'None':
+    """Resume playing paused music"""
+    _ResumeMusicStream(music)
+
+def seek_music_stream(music: 'Music', position: 'float') -> 'None':
+    """Seek music to a position (in seconds)"""
+    _SeekMusicStream(music, float(position))
+
+def set_music_volume(music: 'Music', volume: 'float') -> 'None':
+    """Set volume for music (1.0 is max level)"""
+    _SetMusicVolume(music, float(volume))
+
+def set_music_pitch(music: 'Music', pitch: 'float') -> 'None':
+    """Set pitch for a music (1.0 is base level)"""
+    _SetMusicPitch(music, float(pitch))
+
+def set_music_pan(music: 'Music', pan: 'float') -> 'None':
+    """Set pan for a music (0.5 is center)"""
+    _SetMusicPan(music, float(pan))
+
+def get_music_time_length(music: 'Music') -> 'float':
+    """Get music time length (in seconds)"""
+    result = _GetMusicTimeLength(music)
+    return result
+
+def get_music_time_played(music: 'Music') -> 'float':
+    """Get current music time played (in seconds)"""
+    result = _GetMusicTimePlayed(music)
+    return result
+
+def load_audio_stream(sample_rate: 'int', sample_size: 'int', channels: 'int') -> 'AudioStream':
+    """Load audio stream (to stream raw audio pcm data)"""
+    result = _LoadAudioStream(sample_rate, sample_size, channels)
+    return result
+
+def unload_audio_stream(stream: 'AudioStream') -> 'None':
+    """Unload audio stream and free memory"""
+    _UnloadAudioStream(stream)
+
+def update_audio_stream(stream: 'AudioStream', data: 'bytes', frame_count: 'int') -> 'None':
+    """Update audio stream buffers with data"""
+    _UpdateAudioStream(stream, data, int(frame_count))
+
+def is_audio_stream_processed(stream: 'AudioStream') -> 'bool':
+    """Check if any audio stream buffers requires refill"""
+    result = _IsAudioStreamProcessed(stream)
+    return result
+
+def play_audio_stream(stream: 'AudioStream') -> 'None':
+    """Play audio stream"""
+    _PlayAudioStream(stream)
+
+def pause_audio_stream(stream: 'AudioStream') -> 'None':
+    """Pause audio stream"""
+    _PauseAudioStream(stream)
+
+def resume_audio_stream(stream: 'AudioStream') -> 'None':
+    """Resume audio stream"""
+    _ResumeAudioStream(stream)
+
+def is_audio_stream_playing(stream: 'AudioStream') -> 'bool':
+    """Check if audio stream is playing"""
+    result = _IsAudioStreamPlaying(stream)
+    return result
+
+def stop_audio_stream(stream: 'AudioStream') -> 'None':
+    """Stop audio stream"""
+    _StopAudioStream(stream)
+
+def set_audio_stream_volume(stream: 'AudioStream', volume: 'float') -> 'None':
+    """Set volume for audio stream (1.0 is max level)"""
+    _SetAudioStreamVolume(stream, float(volume))
+
+def set_audio_stream_pitch(stream: 'AudioStream', pitch: 'float') -> 'None':
+    """Set pitch for audio stream (1.0 is base level)"""
+    _SetAudioStreamPitch(stream, float(pitch))
+
+def set_audio_stream_pan(stream: 'AudioStream', pan: 'float') -> 'None':
+    """Set pan for audio stream (0.5 is centered)"""
+    _SetAudioStreamPan(stream, float(pan))
+
+def set_audio_stream_buffer_size_default(size: 'int') -> 'None':
+    """Default size for new audio streams"""
+    _SetAudioStreamBufferSizeDefault(int(size))
+
+def set_audio_stream_callback(stream: 'AudioStream', callback: 'AudioCallback') -> 'None':
+    """Audio thread callback to request new data"""
+    _SetAudioStreamCallback(stream, callback)
+
+def attach_audio_stream_processor(stream: 'AudioStream', processor: 'AudioCallback') -> 'None':
+    """"""
+    _AttachAudioStreamProcessor(stream, processor)
+
+def detach_audio_stream_processor(stream: 'AudioStream', processor: 'AudioCallback') -> 'None':
+    """"""
+    _DetachAudioStreamProcessor(stream, processor)
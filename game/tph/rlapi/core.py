@@ -0,0 +1,4044 @@
+"""Core raylib bindings: base types and structs, enums, colors, window, input, timing, drawing modes, shaders and cameras"""
+
+import dataclasses
+from enum import IntEnum
+from functools import lru_cache
+from itertools import cycle
+from threading import local
+from typing import Sequence as Seq, Union
+from operator import attrgetter
+from struct import Struct, error as StructError
+from ctypes import (
+    c_bool, c_char, c_byte, c_short, c_long, c_longlong, c_ubyte, c_ushort, c_ulong, c_ulonglong, c_float, c_double, c_char_p, c_void_p,
+    Structure, POINTER, CFUNCTYPE, byref, cast
+)
+
+from ._lib import binder
+
+_wrap = binder(globals())
+
+
+Bool = c_bool
+BoolPtr = POINTER(c_bool)
+Byte = c_byte
+BytePtr = POINTER(c_byte)
+Char = c_char
+CharPtr = POINTER(c_char)
+Short = c_short
+ShortPtr = POINTER(c_short)
+Int = c_long
+IntPtr = POINTER(c_long)
+Long = c_long
+LongPtr = POINTER(c_long)
+LongLong = c_longlong
+LongLongPtr = POINTER(c_longlong)
+UChar = c_ubyte
+UCharPtr = POINTER(c_ubyte)
+UByte = c_ubyte
+UBytePtr = POINTER(c_ubyte)
+UShort = c_ushort
+UShortPtr = POINTER(c_ushort)
+UInt = c_ulong
+UIntPtr = POINTER(c_ulong)
+ULong = c_ulong
+ULongPtr = POINTER(c_ulong)
+ULongLong = c_ulonglong
+ULongLongPtr = POINTER(c_ulonglong)
+Float = c_float
+FloatPtr = POINTER(c_float)
+Double = c_double
+DoublePtr = POINTER(c_double)
+VoidPtr = c_void_p
+VoidPtrPtr = POINTER(c_void_p)
+CharPtr = c_char_p
+CharPtrPtr = POINTER(c_char_p)
+
+
+# Vector component swizzling helpers
+class _Swizzles(dict):
+    '''Swizzle lookup table of one struct type: attribute name -> accessor.
+
+    Accessors are built by `build` the first time a name is used, so every
+    later access is a single dict hit. Names that are not swizzles of
+    `letters` look up as None and are not stored. Getter tables also install
+    each getter on the struct as a property, so a swizzle read only goes
+    through `__getattr__` once per name.'''
+
+    def __init__(self, cls, letters, lengths, build, install=False, **fixed):
+        super().__init__(fixed)
+        self.cls = cls
+        self.letters = frozenset(letters)
+        self.lengths = lengths
+        self.build = build
+        self.install = install
+
+    def __missing__(self, attr):
+        if len(attr) not in self.lengths or not self.letters.issuperset(attr):
+            return None
+        accessor = self[attr] = self.build(self.cls, attr)
+        if self.install:
+            setattr(self.cls, attr, property(accessor))
+        return accessor
+
+
+# swizzle results are built straight from packed components, skipping __init__
+_PACK_FLOATS = {n: Struct('{}f'.format(n)).pack for n in (2, 3, 4)}
+_PACK_RGBA = Struct('4B').pack
+_PACK_FLOATS_INTO = {n: Struct('{}f'.format(n)).pack_into for n in (2, 3, 4)}
+_PACK_RGBA_INTO = Struct('4B').pack_into
+
+
+def _vector_getter(cls, attr):
+    fetch = attrgetter(*attr)
+    if len(attr) == 1:
+        return lambda vec: float(fetch(vec))
+    result = (Vector2, Vector3, Vector4)[len(attr) - 2].from_buffer_copy
+    pack = _PACK_FLOATS[len(attr)]
+    return lambda vec: result(pack(*fetch(vec)))
+
+
+def _vector_setter(cls, attr):
+    if len(attr) == 1:
+        # plain field, float() first like the swizzles: the ctypes descriptor alone refuses strings and such
+        set_field = getattr(cls, attr).__set__
+        return lambda vec, value: set_field(vec, float(value))
+
+    sets = tuple(getattr(cls, ch).__set__ for ch in attr)
+
+    def setter(vec, value):
+        for i, set_component in enumerate(sets):
+            set_component(vec, float(value[i]))
+    return setter
+
+
+def _rgba_getter(cls, attr):
+    fetch = attrgetter(*attr)
+    if len(attr) == 1:
+        return lambda color: int(fetch(color))
+    result = Color.from_buffer_copy
+    return lambda color: result(_PACK_RGBA(*fetch(color)))
+
+
+def _rgba_setter(cls, attr):
+    sets = tuple(getattr(cls, ch).__set__ for ch in attr)
+    if len(attr) == 1:
+        set_component = sets[0]
+        return lambda color, value: set_component(color, int(value))
+
+    def setter(color, value):
+        for i, set_component in enumerate(sets):
+            set_component(color, int(value[i]))
+    return setter
+
+
+_RECT_COMPONENTS = {
+    'x': attrgetter('x'),
+    'y': attrgetter('y'),
+    'w': attrgetter('width'),
+    'h': attrgetter('height'),
+    'c': lambda rec: rec.x + rec.width * 0.5,
+    'm': lambda rec: rec.y + rec.height * 0.5,
+    'r': lambda rec: rec.x + rec.width,
+    'b': lambda rec: rec.y + rec.height,
+}
+
+# component -> (field it writes, size it is offset by (0: width, 1: height), offset factor)
+_RECT_TARGETS = {
+    'x': ('x', 0, 0.0),
+    'y': ('y', 1, 0.0),
+    'w': ('width', 0, 0.0),
+    'h': ('height', 1, 0.0),
+    'c': ('x', 0, 0.5),
+    'm': ('y', 1, 0.5),
+    'r': ('x', 0, 1.0),
+    'b': ('y', 1, 1.0),
+}
+
+
+def _rect_getter(cls, attr):
+    parts = tuple(_RECT_COMPONENTS[ch] for ch in attr)
+    if len(attr) == 1:
+        part = parts[0]
+        return lambda rec: float(part(rec))
+    result = (Vector2, Vector3, Rectangle)[len(attr) - 2].from_buffer_copy
+    pack = _PACK_FLOATS[len(attr)]
+    return lambda rec: result(pack(*[part(rec) for part in parts]))
+
+
+def _rect_setter(cls, attr):
+    targets = tuple((getattr(cls, field).__set__, size, factor)
+                    for field, size, factor in (_RECT_TARGETS[ch] for ch in attr))
+    if len(attr) == 1:
+        set_field, size, factor = targets[0]
+        if not factor:
+            return lambda rec, value: set_field(rec, float(value))
+        size_of = _RECT_COMPONENTS['wh'[size]]
+        return lambda rec, value: set_field(rec, float(value) - size_of(rec) * factor)
+
+    def setter(rec, value):
+        sizes = rec.width, rec.height
+        for i, (set_field, size, factor) in enumerate(targets):
+            set_field(rec, float(value[i] - sizes[size] * factor))
+    return setter
+
+
+# region FUNCTIONS
+
+
+def _clsname(obj):
+    return obj.__class__.__name__
+
+
+def is_number(obj):
+    return isinstance(obj, (int, float))
+
+
+def is_component(value):
+    return isinstance(value, int) and 0 <= value <= 255
+
+
+def _clamp_rgba(*args):
+    return tuple(value & 255 for value in args)
+
+
+def _str_in(value):
+    return value.encode('utf-8', 'ignore') if isinstance(value, str) else value
+
+
+def _str_in2(values):
+    return _arr_in(CharPtr, tuple(_str_in(value) for value in values))
+
+
+def _str_out(value):
+    return value.decode('utf-8', 'ignore') if isinstance(value, bytes) else value
+
+
+def _arr_in(typ, data):
+    if isinstance(data, POINTER(typ)):
+        return data
+    return (typ * len(data))(*data)
+
+
+def _arr2_in(typ, data):
+    arr = typ * len(data[0])
+    return (arr * len(data))(*data)
+
+
+def _arr_out(data):
+    return data.values
+
+
+def _ptr_out(ptr, length=0):
+    [ptr.contents] if length == 1 else ([] if not length else ptr[:length])
+
+# region TYPE CAST FUNCS
+
+
+def _float(value):
+    return float(value)
+
+
+def _int(value, ranged=None):
+    if ranged:
+        return max(ranged[0], min(int(value), ranged[1]))
+    return int(value)
+
+
+# By-value struct arguments are copied into the C call, so the struct handed to
+# ctypes can be reused afterwards: tuples are converted once and kept in a small
+# LRU cache, any other sequence is packed into one of a ring of per-thread scratch
+# structs. Nothing gets allocated per call once the program is warmed up.
+_COERCE_CACHE_SIZE = 256
+_SCRATCH_SIZE = 8 # more structs of one type than any single call takes
+
+
+class _Scratch(local):
+    '''Per-thread rings of reusable structs, one ring per struct type'''
+
+    def __init__(self):
+        self.vec2, self.vec3, self.vec4, self.rect, self.color = (
+            cycle(tuple(cls() for _ in range(_SCRATCH_SIZE)))
+            for cls in (Vector2, Vector3, Vector4, Rectangle, Color)
+        )
+
+
+@lru_cache(maxsize=_COERCE_CACHE_SIZE)
+def _cached_vec2(seq):
+    x, y = seq
+    return Vector2(_float(x), _float(y))
+
+
+@lru_cache(maxsize=_COERCE_CACHE_SIZE)
+def _cached_vec3(seq):
+    x, y, z = seq
+    return Vector3(float(x), float(y), float(z))
+
+
+@lru_cache(maxsize=_COERCE_CACHE_SIZE)
+def _cached_vec4(seq):
+    x, y, z, w = seq
+    return Vector4(float(x), float(y), float(z), float(w))
+
+
+@lru_cache(maxsize=_COERCE_CACHE_SIZE)
+def _cached_rect(seq):
+    x, y, w, h = seq
+    return Rectangle(float(x), float(y), float(w), float(h))
+
+
+@lru_cache(maxsize=_COERCE_CACHE_SIZE)
+def _cached_color(seq):
+    r, g, b, q = seq
+    rng = 0, 255
+    return Color(_int(r, rng), _int(g, rng), _int(b, rng), _int(q, rng))
+
+
+def _vec2(seq):
+    if type(seq) is tuple:
+        try:
+            return _cached_vec2(seq)
+        except TypeError: # unhashable items, fall back to a scratch struct
+            pass
+    # isinstance() on a struct type allocates unless the type matches exactly
+    elif type(seq) is not list and isinstance(seq, Vector2):
+        return seq
+    x, y = seq
+    vec = next(_SCRATCH.vec2)
+    _PACK_FLOATS_INTO[2](vec, 0, float(x), float(y))
+    return vec
+
+
+def _vec3(seq):
+    if type(seq) is tuple:
+        try:
+            return _cached_vec3(seq)
+        except TypeError:
+            pass
+    elif type(seq) is not list and isinstance(seq, Vector3):
+        return seq
+    x, y, z = seq
+    vec = next(_SCRATCH.vec3)
+    _PACK_FLOATS_INTO[3](vec, 0, float(x), float(y), float(z))
+    return vec
+
+
+def _vec4(seq):
+    if type(seq) is tuple:
+        try:
+            return _cached_vec4(seq)
+        except TypeError:
+            pass
+    elif type(seq) is not list and isinstance(seq, Vector4):
+        return seq
+    x, y, z, w = seq
+    vec = next(_SCRATCH.vec4)
+    _PACK_FLOATS_INTO[4](vec, 0, float(x), float(y), float(z), float(w))
+    return vec
+
+
+def _rect(seq):
+    if type(seq) is tuple:
+        try:
+            return _cached_rect(seq)
+        except TypeError:
+            pass
+    elif type(seq) is not list and isinstance(seq, Rectangle):
+        return seq
+    x, y, w, h = seq
+    rect = next(_SCRATCH.rect)
+    _PACK_FLOATS_INTO[4](rect, 0, float(x), float(y), float(w), float(h))
+    return rect
+
+
+def _color(seq):
+    if type(seq) is tuple:
+        try:
+            return _cached_color(seq)
+        except TypeError:
+            pass
+    elif type(seq) is not list and isinstance(seq, Color):
+        return seq
+    r, g, b, q = seq
+    color = next(_SCRATCH.color)
+    try:
+        _PACK_RGBA_INTO(color, 0, int(r), int(g), int(b), int(q))
+    except StructError: # some channel is out of range
+        rng = 0, 255
+        _PACK_RGBA_INTO(color, 0, _int(r, rng), _int(g, rng), _int(b, rng), _int(q, rng))
+    return color
+
+# endregion (type cast funcs)
+
+
+# endregion (functions)
+
+class Vector2(Structure):
+    '''Vector2, 2 components'''
+    _fields_ = [
+        ('x', Float),
+        ('y', Float),
+    ]
+
+
+    @classmethod
+    def array_of(cls, vector2_sequence):
+        '''Creates and returns an array of Vector2s'''
+        arr = cls * len(vector2_sequence)
+        return arr(*vector2_sequence)
+
+
+    def __init__(self, x: float = None, y: float = None):
+        '''Initializes this Vector2 struct'''
+        super(Vector2, self).__init__(
+            x or 0.0,
+            y or 0.0
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this Vector2 instance'''
+        return byref(self)
+
+
+    def __len__(self):
+        return 2
+
+    def __getitem__(self, key):
+        return (self.x, self.y).__getitem__(key)
+
+    def __getattr__(self, attr):
+        getter = _VEC2_GET[attr]
+        if getter is None:
+            raise AttributeError("Vector2 object does not have attribute '{}'.".format(attr))
+        return getter(self)
+
+    def __setattr__(self, attr, value):
+        setter = _VEC2_SET[attr]
+        if setter is None:
+            raise AttributeError("Vector2 object does not have attribute '{}'.".format(attr))
+        setter(self, value)
+
+    def todict(self):
+        '''Returns a dict mapping this Vector2's components'''
+        return {'x': self.x, 'y': self.y}
+
+    def fromdict(self, d):
+        '''Apply the mapping `d` to this Vector2's components'''
+        self.x = float(d.get('x', self.x))
+        self.y = float(d.get('y', self.y))
+
+
+    def __str__(self):
+        return "({}, {})".format(self.x, self.y)
+
+    def __repr__(self):
+        return "Vector2{}".format(self.__str__())
+
+
+# Pointer type to Vector2s
+Vector2Ptr = POINTER(Vector2)
+
+class Vector3(Structure):
+    '''Vector3, 3 components'''
+    _fields_ = [
+        ('x', Float),
+        ('y', Float),
+        ('z', Float),
+    ]
+
+
+    @classmethod
+    def array_of(cls, vector3_sequence):
+        '''Creates and returns an array of Vector3s'''
+        arr = cls * len(vector3_sequence)
+        return arr(*vector3_sequence)
+
+
+    def __init__(self, x: float = None, y: float = None, z: float = None):
+        '''Initializes this Vector3 struct'''
+        super(Vector3, self).__init__(
+            x or 0.0,
+            y or 0.0,
+            z or 0.0
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this Vector3 instance'''
+        return byref(self)
+
+
+    def __len__(self):
+        return 3
+
+    def __getitem__(self, key):
+        return (self.x, self.y, self.z).__getitem__(key)
+
+    def __getattr__(self, attr):
+        getter = _VEC3_GET[attr]
+        if getter is None:
+            raise AttributeError("Vector3 object does not have attribute '{}'.".format(attr))
+        return getter(self)
+
+    def __setattr__(self, attr, value):
+        setter = _VEC3_SET[attr]
+        if setter is None:
+            raise AttributeError("Vector3 object does not have attribute '{}'.".format(attr))
+        setter(self, value)
+
+    def todict(self):
+        '''Returns a dict mapping this Vector3's components'''
+        return {'x': self.x, 'y': self.y, 'z': self.z}
+
+    def fromdict(self, d):
+        '''Apply the mapping `d` to this Vector3's components'''
+        self.x = float(d.get('x', self.x))
+        self.y = float(d.get('y', self.y))
+        self.z = float(d.get('z', self.z))
+
+    def __str__(self):
+        return "({}, {}, {})".format(self.x, self.y, self.z)
+
+    def __repr__(self):
+        return "Vector3{}".format(self.__str__())
+
+
+# Pointer type to Vector3s
+Vector3Ptr = POINTER(Vector3)
+
+class Vector4(Structure):
+    '''Vector4, 4 components'''
+    _fields_ = [
+        ('x', Float),
+        ('y', Float),
+        ('z', Float),
+        ('w', Float),
+    ]
+
+
+    @classmethod
+    def array_of(cls, vector4_sequence):
+        '''Creates and returns an array of Vector4s'''
+        arr = cls * len(vector4_sequence)
+        return arr(*vector4_sequence)
+
+
+    def __init__(self, x: float = None, y: float = None, z: float = None, w: float = None):
+        '''Initializes this Vector4 struct'''
+        super(Vector4, self).__init__(
+            x or 0.0,
+            y or 0.0,
+            z or 0.0,
+            w or 0.0
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this Vector4 instance'''
+        return byref(self)
+
+
+    def __len__(self):
+        return 4
+
+    def __getitem__(self, key):
+        return (self.x, self.y. self.z, self.w).__getitem__(key)
+
+    def __getattr__(self, attr):
+        getter = _VEC4_GET[attr]
+        if getter is None:
+            raise AttributeError("Vector4 object does not have attribute '{}'.".format(attr))
+        return getter(self)
+
+    def __setattr__(self, attr, value):
+        setter = _VEC4_SET[attr]
+        if setter is None:
+            raise AttributeError("Vector4 object does not have attribute '{}'.".format(attr))
+        setter(self, value)
+
+    def todict(self):
+        '''Returns a dict mapping this Vector4's components'''
+        return {'x': self.x, 'y': self.y, 'z': self.z, 'w': self.w}
+
+    def fromdict(self, d):
+        '''Apply the mapping `d` to this Vector4's components'''
+        self.x = float(d.get('x', self.x))
+        self.y = float(d.get('y', self.y))
+        self.z = float(d.get('z', self.z))
+        self.w = float(d.get('w', self.w))
+
+
+    def __str__(self):
+        return "({}, {}, {}, {})".format(self.x, self.y, self.z, self.w)
+
+    def __repr__(self):
+        return "Vector4{}".format(self.__str__())
+
+
+# Pointer type to Vector4s
+Vector4Ptr = POINTER(Vector4)
+
+
+# Quaternion, 4 components (Vector4 alias)
+Quaternion = Vector4
+QuaternionPtr = Vector4Ptr
+
+class Matrix(Structure):
+    '''Matrix, 4x4 components, column major, OpenGL style, right handed'''
+    _fields_ = [
+        ('m0', Float),
+        ('m4', Float),
+        ('m8', Float),
+        ('m12', Float),
+        ('m1', Float),
+        ('m5', Float),
+        ('m9', Float),
+        ('m13', Float),
+        ('m2', Float),
+        ('m6', Float),
+        ('m10', Float),
+        ('m14', Float),
+        ('m3', Float),
+        ('m7', Float),
+        ('m11', Float),
+        ('m15', Float),
+    ]
+
+
+    @classmethod
+    def array_of(cls, matrix_sequence):
+        '''Creates and returns an array of Matrixs'''
+        arr = cls * len(matrix_sequence)
+        return arr(*matrix_sequence)
+
+
+    def __init__(self, m0: float = None,
+                 m4: float = None,
+                 m8: float = None,
+                 m12: float = None,
+                 m1: float = None,
+                 m5: float = None,
+                 m9: float = None,
+                 m13: float = None,
+                 m2: float = None,
+                 m6: float = None,
+                 m10: float = None,
+                 m14: float = None,
+                 m3: float = None,
+                 m7: float = None,
+                 m11: float = None,
+                 m15: float = None):
+        '''Initializes this Matrix struct'''
+        super(Matrix, self).__init__(
+            m0 or 0.0,
+            m4 or 0.0,
+            m8 or 0.0,
+            m12 or 0.0,
+            m1 or 0.0,
+            m5 or 0.0,
+            m9 or 0.0,
+            m13 or 0.0,
+            m2 or 0.0,
+            m6 or 0.0,
+            m10 or 0.0,
+            m14 or 0.0,
+            m3 or 0.0,
+            m7 or 0.0,
+            m11 or 0.0,
+            m15 or 0.0
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this Matrix instance'''
+        return byref(self)
+
+
+    def __str__(self):
+        return "[{} at {}]".format(self.__class__.__name__, id(self))
+
+    def __repr__(self):
+        return self.__str__()
+
+
+# Pointer type to Matrixs
+MatrixPtr = POINTER(Matrix)
+
+class Color(Structure):
+    '''Color, 4 components, R8G8B8A8 (32bit)'''
+    _fields_ = [
+        ('r', UChar),
+        ('g', UChar),
+        ('b', UChar),
+        ('a', UChar),
+    ]
+
+
+    @classmethod
+    def array_of(cls, color_sequence):
+        '''Creates and returns an array of Colors'''
+        arr = cls * len(color_sequence)
+        return arr(*color_sequence)
+
+
+    def __init__(self, r: int = None, g: int = None, b: int = None, a: int = None):
+        '''Initializes this Color struct'''
+        super(Color, self).__init__(
+            r or 0,
+            g or 0,
+            b or 0,
+            a or 0
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this Color instance'''
+        return byref(self)
+
+
+    def __len__(self):
+        return 4
+
+    def __getitem__(self, key):
+        return (self.r, self.g, self.b, self.a).__getitem__(key)
+
+    def __getattr__(self, attr):
+        getter = _RGBA_GET[attr]
+        if getter is None:
+            raise AttributeError("Color object does not have attribute '{}'.".format(attr))
+        return getter(self)
+
+    def __setattr__(self, attr, value):
+        setter = _RGBA_SET[attr]
+        if setter is None:
+            raise AttributeError("Color object does not have attribute '{}'.".format(attr))
+        setter(self, value)
+
+    def todict(self):
+        '''Returns a dict mapping this Color's components'''
+        return {'r': self.r, 'g': self.g, 'b': self.b, 'a': self.a}
+
+    def fromdict(self, d):
+        '''Apply the mapping `d` to this Color's components'''
+        self.r = int(d.get('r', self.r))
+        self.g = int(d.get('g', self.g))
+        self.b = int(d.get('b', self.b))
+        self.a = int(d.get('a', self.a))
+
+
+    def __str__(self):
+        return "({: 3}, {: 3}, {: 3}, {: 3})".format(self.r, self.g, self.b, self.a)
+
+    def __repr__(self):
+        return "Color{}".format(self.__str__())
+
+    def fade(self, alpha: 'float') -> 'Color':
+        """Get color with alpha applied, alpha goes from 0.0f to 1.0f"""
+        from .textures import _Fade
+        result = _Fade(self, float(alpha))
+        return result
+
+    def to_int(self) -> 'int':
+        """Get hexadecimal value for a Color"""
+        from .textures import _ColorToInt
+        result = _ColorToInt(self)
+        return result
+
+    def to_hsv(self) -> 'Vector3':
+        """Get HSV values for a Color, hue [0..360], saturation/value [0..1]"""
+        from .textures import _ColorToHSV
+        result = _ColorToHSV(self)
+        return result
+
+    def from_hsv(self, saturation: 'float', value: 'float') -> 'Color':
+        """Get a Color from HSV values, hue [0..360], saturation/value [0..1]"""
+        from .textures import _ColorFromHSV
+        result = _ColorFromHSV(self, float(saturation), float(value))
+        return result
+
+    def alpha(self, alpha: 'float') -> 'Color':
+        """Get color with alpha applied, alpha goes from 0.0f to 1.0f"""
+        from .textures import _ColorAlpha
+        result = _ColorAlpha(self, float(alpha))
+        return result
+
+    def alpha_blend(self, src: 'Color', tint: 'Color') -> 'Color':
+        """Get src alpha-blended into dst color with tint"""
+        from .textures import _ColorAlphaBlend
+        result = _ColorAlphaBlend(self, _color(src), _color(tint))
+        return result
+
+
+# Pointer type to Colors
+ColorPtr = POINTER(Color)
+
+class Rectangle(Structure):
+    '''Rectangle, 4 components'''
+    _fields_ = [
+        ('x', Float),
+        ('y', Float),
+        ('width', Float),
+        ('height', Float),
+    ]
+
+
+    @classmethod
+    def array_of(cls, rectangle_sequence):
+        '''Creates and returns an array of Rectangles'''
+        arr = cls * len(rectangle_sequence)
+        return arr(*rectangle_sequence)
+
+
+    def __init__(self, x: float = None, y: float = None, width: float = None, height: float = None):
+        '''Initializes this Rectangle struct'''
+        super(Rectangle, self).__init__(
+            x or 0.0,
+            y or 0.0,
+            width or 0.0,
+            height or 0.0
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this Rectangle instance'''
+        return byref(self)
+
+
+    def __len__(self):
+        return 4
+
+    def __getitem__(self, key):
+        return (self.x, self.y, self.width, self.height).__getitem__(key)
+
+    def __getattr__(self, attr):
+        getter = _RECT_GET[attr]
+        if getter is None:
+            raise AttributeError("Rectangle object does not have attribute '{}'.".format(attr))
+        return getter(self)
+
+    def __setattr__(self, attr, value):
+        setter = _RECT_SET[attr]
+        if setter is None:
+            raise AttributeError("Rectangle object does not have attribute '{}'.".format(attr))
+        setter(self, value)
+
+    def todict(self):
+        '''Returns a dict mapping this Rectangle's components'''
+        return {'x': self.x, 'y': self.y, 'w': self.width, 'h': self.height,
+                'c': self.x + self.width * 0.5, 'm': self.y + self.height * 0.5,
+                'r': self.x + self.width, 'b': self.y + self.height}
+
+    def fromdict(self, d):
+        '''Apply the mapping `d` to this Rectangle's components'''
+        self.x = float(d.get('x', self.x))
+        self.y = float(d.get('y', self.y))
+        self.width = float(d.get('w', self.width))
+        self.height = float(d.get('h', self.height))
+
+
+    def __str__(self):
+        return "({}, {}, {}, {})".format(self.x, self.y, self.width, self.height)
+
+    def __repr__(self):
+        return "Rectangle{}".format(self.__str__())
+
+
+# Pointer type to Rectangles
+RectanglePtr = POINTER(Rectangle)
+
+
+# Swizzle tables of the vector-like structs above
+_VEC2_GET = _Swizzles(Vector2, 'xy', (1, 2, 3, 4), _vector_getter, install=True)
+_VEC3_GET = _Swizzles(Vector3, 'xyz', (1, 2, 3, 4), _vector_getter, install=True)
+_VEC4_GET = _Swizzles(Vector4, 'xyzw', (1, 2, 3, 4), _vector_getter, install=True)
+_RGBA_GET = _Swizzles(Color, 'rgba', (1, 4), _rgba_getter, install=True)
+_RECT_GET = _Swizzles(Rectangle, 'xywhcmrb', (1, 2, 3, 4), _rect_getter, install=True)
+
+_VEC2_SET = _Swizzles(Vector2, 'xy', (1, 2), _vector_setter)
+_VEC3_SET = _Swizzles(Vector3, 'xyz', (1, 2, 3), _vector_setter)
+_VEC4_SET = _Swizzles(Vector4, 'xyzw', (1, 2, 3, 4), _vector_setter)
+_RGBA_SET = _Swizzles(Color, 'rgba', (1, 2, 3, 4), _rgba_setter)
+_RECT_SET = _Swizzles(Rectangle, 'xywhcmrb', (1, 2, 3, 4), _rect_setter,
+                      width=_rect_setter(Rectangle, 'w'),
+                      height=_rect_setter(Rectangle, 'h'))
+
+# Scratch structs for _vec2() & co.
+_SCRATCH = _Scratch()
+
+
+
+class Image(Structure):
+    '''Image, pixel data stored in CPU memory (RAM)'''
+    _fields_ = [
+        ('data', VoidPtr),
+        ('width', Int),
+        ('height', Int),
+        ('mipmaps', Int),
+        ('format', Int),
+    ]
+
+
+    @classmethod
+    def array_of(cls, image_sequence):
+        '''Creates and returns an array of Images'''
+        arr = cls * len(image_sequence)
+        return arr(*image_sequence)
+
+
+    def __init__(self, data: bytes = None,
+                 width: int = None,
+                 height: int = None,
+                 mipmaps: int = None,
+                 format: int = None):
+        '''Initializes this Image struct'''
+        super(Image, self).__init__(
+            data,
+            width or 0,
+            height or 0,
+            mipmaps or 0,
+            format or 0
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this Image instance'''
+        return byref(self)
+
+
+    def unload(self) -> 'None':
+        """Unload image from CPU memory (RAM)"""
+        from .textures import _UnloadImage
+        _UnloadImage(self)
+
+    def export(self, file_name: 'Union[str, CharPtr]') -> 'bool':
+        """Export image data to file, returns true on success"""
+        from .textures import _ExportImage
+        result = _ExportImage(self, _str_in(file_name))
+        return result
+
+    def export_as_code(self, file_name: 'Union[str, CharPtr]') -> 'bool':
+        """Export image as code file defining an array of bytes, returns true on success"""
+        from .textures import _ExportImageAsCode
+        result = _ExportImageAsCode(self, _str_in(file_name))
+        return result
+
+    def copy(self) -> 'Image':
+        """Create an image duplicate (useful for transformations)"""
+        from .textures import _ImageCopy
+        result = _ImageCopy(self)
+        return result
+
+    def format(self, new_format: 'int') -> 'None':
+        """Convert image data to desired format"""
+        from .textures import _ImageFormat
+        _ImageFormat(self.byref, int(new_format))
+
+    def to_pot(self, fill: 'Color') -> 'None':
+        """Convert image to POT (power-of-two)"""
+        from .textures import _ImageToPOT
+        _ImageToPOT(self.byref, _color(fill))
+
+    def crop(self, crop: 'Rectangle') -> 'None':
+        """Crop an image to a defined rectangle"""
+        from .textures import _ImageCrop
+        _ImageCrop(self.byref, _rect(crop))
+
+    def alpha_crop(self, threshold: 'float') -> 'None':
+        """Crop image depending on alpha value"""
+        from .textures import _ImageAlphaCrop
+        _ImageAlphaCrop(self.byref, float(threshold))
+
+    def alpha_clear(self, color: 'Color', threshold: 'float') -> 'None':
+        """Clear alpha channel to desired color"""
+        from .textures import _ImageAlphaClear
+        _ImageAlphaClear(self.byref, _color(color), float(threshold))
+
+    def alpha_mask(self, alpha_mask: 'Image') -> 'None':
+        """Apply alpha mask to image"""
+        from .textures import _ImageAlphaMask
+        _ImageAlphaMask(self.byref, alpha_mask)
+
+    def alpha_premultiply(self) -> 'None':
+        """Premultiply alpha channel"""
+        from .textures import _ImageAlphaPremultiply
+        _ImageAlphaPremultiply(self.byref)
+
+    def resize(self, new_width: 'int', new_height: 'int') -> 'None':
+        """Resize image (Bicubic scaling algorithm)"""
+        from .textures import _ImageResize
+        _ImageResize(self.byref, int(new_width), int(new_height))
+
+    def resize_nn(self, new_width: 'int', new_height: 'int') -> 'None':
+        """Resize image (Nearest-Neighbor scaling algorithm)"""
+        from .textures import _ImageResizeNN
+        _ImageResizeNN(self.byref, int(new_width), int(new_height))
+
+    def resize_canvas(self, new_width: 'int', new_height: 'int', offset_x: 'int', offset_y: 'int', fill: 'Color') -> 'None':
+        """Resize canvas and fill with color"""
+        from .textures import _ImageResizeCanvas
+        _ImageResizeCanvas(self.byref, int(new_width), int(new_height), int(offset_x), int(offset_y), _color(fill))
+
+    def mipmaps(self) -> 'None':
+        """Compute all mipmap levels for a provided image"""
+        from .textures import _ImageMipmaps
+        _ImageMipmaps(self.byref)
+
+    def dither(self, r_bpp: 'int', g_bpp: 'int', b_bpp: 'int', a_bpp: 'int') -> 'None':
+        """Dither image data to 16bpp or lower (Floyd-Steinberg dithering)"""
+        from .textures import _ImageDither
+        _ImageDither(self.byref, int(r_bpp), int(g_bpp), int(b_bpp), int(a_bpp))
+
+    def flip_vertical(self) -> 'None':
+        """Flip image vertically"""
+        from .textures import _ImageFlipVertical
+        _ImageFlipVertical(self.byref)
+
+    def flip_horizontal(self) -> 'None':
+        """Flip image horizontally"""
+        from .textures import _ImageFlipHorizontal
+        _ImageFlipHorizontal(self.byref)
+
+    def rotate_cw(self) -> 'None':
+        """Rotate image clockwise 90deg"""
+        from .textures import _ImageRotateCW
+        _ImageRotateCW(self.byref)
+
+    def rotate_ccw(self) -> 'None':
+        """Rotate image counter-clockwise 90deg"""
+        from .textures import _ImageRotateCCW
+        _ImageRotateCCW(self.byref)
+
+    def color_tint(self, color: 'Color') -> 'None':
+        """Modify image color: tint"""
+        from .textures import _ImageColorTint
+        _ImageColorTint(self.byref, _color(color))
+
+    def color_invert(self) -> 'None':
+        """Modify image color: invert"""
+        from .textures import _ImageColorInvert
+        _ImageColorInvert(self.byref)
+
+    def color_grayscale(self) -> 'None':
+        """Modify image color: grayscale"""
+        from .textures import _ImageColorGrayscale
+        _ImageColorGrayscale(self.byref)
+
+    def color_contrast(self, contrast: 'float') -> 'None':
+        """Modify image color: contrast (-100 to 100)"""
+        from .textures import _ImageColorContrast
+        _ImageColorContrast(self.byref, float(contrast))
+
+    def color_brightness(self, brightness: 'int') -> 'None':
+        """Modify image color: brightness (-255 to 255)"""
+        from .textures import _ImageColorBrightness
+        _ImageColorBrightness(self.byref, int(brightness))
+
+    def color_replace(self, color: 'Color', replace: 'Color') -> 'None':
+        """Modify image color: replace color"""
+        from .textures import _ImageColorReplace
+        _ImageColorReplace(self.byref, _color(color), _color(replace))
+
+    def clear_background(self, color: 'Color') -> 'None':
+        """Clear image background with given color"""
+        from .textures import _ImageClearBackground
+        _ImageClearBackground(self.byref, _color(color))
+
+    def draw_pixel(self, pos_x: 'int', pos_y: 'int', color: 'Color') -> 'None':
+        """Draw pixel within an image"""
+        from .textures import _ImageDrawPixel
+        _ImageDrawPixel(self.byref, int(pos_x), int(pos_y), _color(color))
+
+    def draw_pixel_v(self, position: 'Vector2', color: 'Color') -> 'None':
+        """Draw pixel within an image (Vector version)"""
+        from .textures import _ImageDrawPixelV
+        _ImageDrawPixelV(self.byref, _vec2(position), _color(color))
+
+    def draw_line(self, start_pos_x: 'int', start_pos_y: 'int', end_pos_x: 'int', end_pos_y: 'int', color: 'Color') -> 'None':
+        """Draw line within an image"""
+        from .textures import _ImageDrawLine
+        _ImageDrawLine(self.byref, int(start_pos_x), int(start_pos_y), int(end_pos_x), int(end_pos_y), _color(color))
+
+    def draw_line_v(self, start: 'Vector2', end: 'Vector2', color: 'Color') -> 'None':
+        """Draw line within an image (Vector version)"""
+        from .textures import _ImageDrawLineV
+        _ImageDrawLineV(self.byref, _vec2(start), _vec2(end), _color(color))
+
+    def draw_circle(self, center_x: 'int', center_y: 'int', radius: 'int', color: 'Color') -> 'None':
+        """Draw circle within an image"""
+        from .textures import _ImageDrawCircle
+        _ImageDrawCircle(self.byref, int(center_x), int(center_y), int(radius), _color(color))
+
+    def draw_circle_v(self, center: 'Vector2', radius: 'int', color: 'Color') -> 'None':
+        """Draw circle within an image (Vector version)"""
+        from .textures import _ImageDrawCircleV
+        _ImageDrawCircleV(self.byref, _vec2(center), int(radius), _color(color))
+
+    def draw_rectangle(self, pos_x: 'int', pos_y: 'int', width: 'int', height: 'int', color: 'Color') -> 'None':
+        """Draw rectangle within an image"""
+        from .textures import _ImageDrawRectangle
+        _ImageDrawRectangle(self.byref, int(pos_x), int(pos_y), int(width), int(height), _color(color))
+
+    def draw_rectangle_v(self, position: 'Vector2', size: 'Vector2', color: 'Color') -> 'None':
+        """Draw rectangle within an image (Vector version)"""
+        from .textures import _ImageDrawRectangleV
+        _ImageDrawRectangleV(self.byref, _vec2(position), _vec2(size), _color(color))
+
+    def draw_rectangle_rec(self, rec: 'Rectangle', color: 'Color') -> 'None':
+        """Draw rectangle within an image"""
+        from .textures import _ImageDrawRectangleRec
+        _ImageDrawRectangleRec(self.byref, _rect(rec), _color(color))
+
+    def draw_rectangle_lines(self, rec: 'Rectangle', thick: 'int', color: 'Color') -> 'None':
+        """Draw rectangle lines within an image"""
+        from .textures import _ImageDrawRectangleLines
+        _ImageDrawRectangleLines(self.byref, _rect(rec), int(thick), _color(color))
+
+    def draw(self, src: 'Image', src_rec: 'Rectangle', dst_rec: 'Rectangle', tint: 'Color') -> 'None':
+        """Draw a source image within a destination image (tint applied to source)"""
+        from .textures import _ImageDraw
+        _ImageDraw(self.byref, src, _rect(src_rec), _rect(dst_rec), _color(tint))
+
+    def draw_text(self, text: 'Union[str, CharPtr]', pos_x: 'int', pos_y: 'int', font_size: 'int', color: 'Color') -> 'None':
+        """Draw text (using default font) within an image (destination)"""
+        from .textures import _ImageDrawText
+        _ImageDrawText(self.byref, _str_in(text), int(pos_x), int(pos_y), int(font_size), _color(color))
+
+    def draw_text_ex(self, font: 'Font', text: 'Union[str, CharPtr]', position: 'Vector2', font_size: 'float', spacing: 'float', tint: 'Color') -> 'None':
+        """Draw text (custom sprite font) within an image (destination)"""
+        from .textures import _ImageDrawTextEx
+        _ImageDrawTextEx(self.byref, font, _str_in(text), _vec2(position), float(font_size), float(spacing), _color(tint))
+
+    def load_colors(self) -> 'ColorPtr':
+        """Load color data from image as a Color array (RGBA - 32bit)"""
+        from .textures import _LoadImageColors
+        result = _ptr_out(_LoadImageColors(self))
+        return result
+
+    def load_palette(self, max_palette_size: 'int') -> 'ColorPtr':
+        """Load colors palette from image as a Color array (RGBA - 32bit)"""
+        from .textures import _LoadImagePalette
+        color_count = Int(0)
+        result = _ptr_out(_LoadImagePalette(self, int(max_palette_size), byref(color_count)), color_count.value)
+        return result
+
+    def get_alpha_border(self, threshold: 'float') -> 'Rectangle':
+        """Get image alpha border rectangle"""
+        from .textures import _GetImageAlphaBorder
+        result = _GetImageAlphaBorder(self, float(threshold))
+        return result
+
+    def get_color(self, x: 'int', y: 'int') -> 'Color':
+        """Get image pixel color at (x, y) position"""
+        from .textures import _GetImageColor
+        result = _GetImageColor(self, int(x), int(y))
+        return result
+
+
+# Pointer type to Images
+ImagePtr = POINTER(Image)
+
+class Texture(Structure):
+    '''Texture, tex data stored in GPU memory (VRAM)'''
+    _fields_ = [
+        ('id', UInt),
+        ('width', Int),
+        ('height', Int),
+        ('mipmaps', Int),
+        ('format', Int),
+    ]
+
+
+    @classmethod
+    def array_of(cls, texture_sequence):
+        '''Creates and returns an array of Textures'''
+        arr = cls * len(texture_sequence)
+        return arr(*texture_sequence)
+
+
+    def __init__(self, id: int = None,
+                 width: int = None,
+                 height: int = None,
+                 mipmaps: int = None,
+                 format: int = None):
+        '''Initializes this Texture struct'''
+        super(Texture, self).__init__(
+            id or 0,
+            width or 0,
+            height or 0,
+            mipmaps or 0,
+            format or 0
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this Texture instance'''
+        return byref(self)
+
+
+    def __str__(self):
+        return "[{} at {}]".format(self.__class__.__name__, id(self))
+
+    def __repr__(self):
+        return self.__str__()
+
+    def unload(self) -> 'None':
+        """Unload texture from GPU memory (VRAM)"""
+        from .textures import _UnloadTexture
+        _UnloadTexture(self)
+
+    def gen_mip_maps(self) -> 'None':
+        """Generate GPU mipmaps for a texture"""
+        from .textures import _GenTextureMipmaps
+        _GenTextureMipmaps(self.byref)
+
+    def set_filter(self, filter: 'int') -> 'None':
+        """Set texture scaling filter mode"""
+        from .textures import _SetTextureFilter
+        _SetTextureFilter(self, int(filter))
+
+    def set_wrap(self, wrap: 'int') -> 'None':
+        """Set texture wrapping mode"""
+        from .textures import _SetTextureWrap
+        _SetTextureWrap(self, int(wrap))
+
+    def draw(self, pos_x: 'int', pos_y: 'int', tint: 'Color') -> 'None':
+        """Draw a Texture2D"""
+        from .textures import _DrawTexture
+        _DrawTexture(self, int(pos_x), int(pos_y), _color(tint))
+
+    def draw_v(self, position: 'Vector2', tint: 'Color') -> 'None':
+        """Draw a Texture2D with position defined as Vector2"""
+        from .textures import _DrawTextureV
+        _DrawTextureV(self, _vec2(position), _color(tint))
+
+    def draw_ex(self, position: 'Vector2', rotation: 'float', scale: 'float', tint: 'Color') -> 'None':
+        """Draw a Texture2D with extended parameters"""
+        from .textures import _DrawTextureEx
+        _DrawTextureEx(self, _vec2(position), float(rotation), float(scale), _color(tint))
+
+    def draw_rec(self, source: 'Rectangle', position: 'Vector2', tint: 'Color') -> 'None':
+        """Draw a part of a texture defined by a rectangle"""
+        from .textures import _DrawTextureRec
+        _DrawTextureRec(self, _rect(source), _vec2(position), _color(tint))
+
+    def draw_quad(self, tiling: 'Vector2', offset: 'Vector2', quad: 'Rectangle', tint: 'Color') -> 'None':
+        """Draw texture quad with tiling and offset parameters"""
+        from .textures import _DrawTextureQuad
+        _DrawTextureQuad(self, _vec2(tiling), _vec2(offset), _rect(quad), _color(tint))
+
+    def draw_tiled(self, source: 'Rectangle', dest: 'Rectangle', origin: 'Vector2', rotation: 'float', scale: 'float', tint: 'Color') -> 'None':
+        """Draw part of a texture (defined by a rectangle) with rotation and scale tiled into dest."""
+        from .textures import _DrawTextureTiled
+        _DrawTextureTiled(self, _rect(source), _rect(dest), _vec2(origin), float(rotation), float(scale), _color(tint))
+
+    def draw_pro(self, source: 'Rectangle', dest: 'Rectangle', origin: 'Vector2', rotation: 'float', tint: 'Color') -> 'None':
+        """Draw a part of a texture defined by a rectangle with 'pro' parameters"""
+        from .textures import _DrawTexturePro
+        _DrawTexturePro(self, _rect(source), _rect(dest), _vec2(origin), float(rotation), _color(tint))
+
+    def draw_npatch(self, n_patch_info: 'NPatchInfo', dest: 'Rectangle', origin: 'Vector2', rotation: 'float', tint: 'Color') -> 'None':
+        """Draws a texture (or part of it) that stretches or shrinks nicely"""
+        from .textures import _DrawTextureNPatch
+        _DrawTextureNPatch(self, n_patch_info, _rect(dest), _vec2(origin), float(rotation), _color(tint))
+
+    def draw_poly(self, center: 'Vector2', points: 'Vector2Ptr', texcoords: 'Vector2Ptr', tint: 'Color') -> 'None':
+        """Draw a textured polygon"""
+        from .textures import _DrawTexturePoly
+        _DrawTexturePoly(self, _vec2(center), _arr_in(Vector2, points), _vec2(texcoords), len(points), _color(tint))
+
+
+# Pointer type to Textures
+TexturePtr = POINTER(Texture)
+
+
+# Texture2D, same as Texture
+Texture2D = Texture
+Texture2DPtr = TexturePtr
+# TextureCubemap, same as Texture
+TextureCubemap = Texture
+TextureCubemapPtr = TexturePtr
+
+class RenderTexture(Structure):
+    '''RenderTexture, fbo for texture rendering'''
+    _fields_ = [
+        ('id', UInt),
+        ('texture', Texture),
+        ('depth', Texture),
+    ]
+
+
+    @classmethod
+    def array_of(cls, render_texture_sequence):
+        '''Creates and returns an array of RenderTextures'''
+        arr = cls * len(render_texture_sequence)
+        return arr(*render_texture_sequence)
+
+
+    def __init__(self, id: int = None, texture: Texture = None, depth: Texture = None):
+        '''Initializes this RenderTexture struct'''
+        super(RenderTexture, self).__init__(
+            id or 0,
+            texture or Texture(),
+            depth or Texture()
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this RenderTexture instance'''
+        return byref(self)
+
+
+
+# Pointer type to RenderTextures
+RenderTexturePtr = POINTER(RenderTexture)
+
+
+# RenderTexture2D, same as RenderTexture
+RenderTexture2D = RenderTexture
+RenderTexture2DPtr = RenderTexturePtr
+
+class Camera3D(Structure):
+    '''Camera, defines position/orientation in 3d space'''
+    _fields_ = [
+        ('position', Vector3),
+        ('target', Vector3),
+        ('up', Vector3),
+        ('fovy', Float),
+        ('projection', Int),
+    ]
+
+
+    @classmethod
+    def array_of(cls, camera3d_sequence):
+        '''Creates and returns an array of Camera3Ds'''
+        arr = cls * len(camera3d_sequence)
+        return arr(*camera3d_sequence)
+
+
+    def __init__(self, position: Vector3 = None,
+                 target: Vector3 = None,
+                 up: Vector3 = None,
+                 fovy: float = None,
+                 projection: int = None):
+        '''Initializes this Camera3D struct'''
+        super(Camera3D, self).__init__(
+            position or Vector3(),
+            target or Vector3(),
+            up or Vector3(),
+            fovy or 0.0,
+            projection or 0
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this Camera3D instance'''
+        return byref(self)
+
+
+    def __enter__(self):
+        _BeginMode3D(self)
+
+    def __leave__(self, exc_type, exc_value, traceback):
+        _EndMode3D()
+
+    def set_mode(self, mode: 'int') -> 'None':
+        """Set camera mode (multiple camera modes available)"""
+        _SetCameraMode(self, int(mode))
+
+
+# Pointer type to Camera3Ds
+Camera3DPtr = POINTER(Camera3D)
+
+
+# Camera type fallback, defaults to Camera3D
+Camera = Camera3D
+CameraPtr = Camera3DPtr
+
+class Camera2D(Structure):
+    '''Camera2D, defines position/orientation in 2d space'''
+    _fields_ = [
+        ('offset', Vector2),
+        ('target', Vector2),
+        ('rotation', Float),
+        ('zoom', Float),
+    ]
+
+
+    @classmethod
+    def array_of(cls, camera2d_sequence):
+        '''Creates and returns an array of Camera2Ds'''
+        arr = cls * len(camera2d_sequence)
+        return arr(*camera2d_sequence)
+
+
+    def __init__(self, offset: Vector2 = None, target: Vector2 = None, rotation: float = None, zoom: float = None):
+        '''Initializes this Camera2D struct'''
+        super(Camera2D, self).__init__(
+            offset or Vector2(),
+            target or Vector2(),
+            rotation or 0.0,
+            zoom or 0.0
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this Camera2D instance'''
+        return byref(self)
+
+
+    def __enter__(self):
+        _BeginMode2D(self)
+
+    def __leave__(self, exc_type, exc_value, traceback):
+        _EndMode2D()
+
+
+# Pointer type to Camera2Ds
+Camera2DPtr = POINTER(Camera2D)
+
+class Shader(Structure):
+    '''Shader'''
+    _fields_ = [
+        ('id', UInt),
+        ('locs', IntPtr),
+    ]
+
+
+    @classmethod
+    def array_of(cls, shader_sequence):
+        '''Creates and returns an array of Shaders'''
+        arr = cls * len(shader_sequence)
+        return arr(*shader_sequence)
+
+
+    def __init__(self, id: int = None, locs: Union[Seq[int], IntPtr] = None):
+        '''Initializes this Shader struct'''
+        super(Shader, self).__init__(
+            id or 0,
+            locs
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this Shader instance'''
+        return byref(self)
+
+
+    def __str__(self):
+        return "[{} at {}]".format(self.__class__.__name__, id(self))
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __enter__(self):
+        _BeginShaderMode(self)
+
+    def __leave__(self, exc_type, exc_value, traceback):
+        _EndShaderMode()
+
+    def get_location(self, uniform_name: 'Union[str, CharPtr]') -> 'int':
+        """Get shader uniform location"""
+        result = _GetShaderLocation(self, _str_in(uniform_name))
+        return result
+
+    def get_location_attrib(self, attrib_name: 'Union[str, CharPtr]') -> 'int':
+        """Get shader attribute location"""
+        result = _GetShaderLocationAttrib(self, _str_in(attrib_name))
+        return result
+
+    def set_value(self, loc_index: 'int', value: 'bytes', uniform_type: 'int') -> 'None':
+        """Set shader uniform value"""
+        _SetShaderValue(self, int(loc_index), value, int(uniform_type))
+
+    def set_value_v(self, loc_index: 'int', value: 'bytes', uniform_type: 'int', count: 'int') -> 'None':
+        """Set shader uniform value vector"""
+        _SetShaderValueV(self, int(loc_index), value, int(uniform_type), int(count))
+
+    def set_value_matrix(self, loc_index: 'int', mat: 'Matrix') -> 'None':
+        """Set shader uniform value (matrix 4x4)"""
+        _SetShaderValueMatrix(self, int(loc_index), mat)
+
+    def set_value_texture(self, loc_index: 'int', texture: 'Texture2D') -> 'None':
+        """Set shader uniform value for texture (sampler2d)"""
+        _SetShaderValueTexture(self, int(loc_index), texture)
+
+    def unload(self) -> 'None':
+        """Unload shader from GPU memory (VRAM)"""
+        _UnloadShader(self)
+
+
+# Pointer type to Shaders
+ShaderPtr = POINTER(Shader)
+
+class Ray(Structure):
+    '''Ray, ray for raycasting'''
+    _fields_ = [
+        ('position', Vector3),
+        ('direction', Vector3),
+    ]
+
+
+    @classmethod
+    def array_of(cls, ray_sequence):
+        '''Creates and returns an array of Rays'''
+        arr = cls * len(ray_sequence)
+        return arr(*ray_sequence)
+
+
+    def __init__(self, position: Vector3 = None, direction: Vector3 = None):
+        '''Initializes this Ray struct'''
+        super(Ray, self).__init__(
+            position or Vector3(),
+            direction or Vector3()
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this Ray instance'''
+        return byref(self)
+
+
+
+# Pointer type to Rays
+RayPtr = POINTER(Ray)
+
+class VrDeviceInfo(Structure):
+    '''VrDeviceInfo, Head-Mounted-Display device parameters'''
+    _fields_ = [
+        ('h_resolution', Int),
+        ('v_resolution', Int),
+        ('h_screen_size', Float),
+        ('v_screen_size', Float),
+        ('v_screen_center', Float),
+        ('eye_to_screen_distance', Float),
+        ('lens_separation_distance', Float),
+        ('interpupillary_distance', Float),
+        ('lens_distortion_values', Float * 4),
+        ('chroma_ab_correction', Float * 4),
+    ]
+
+
+    @classmethod
+    def array_of(cls, vr_device_info_sequence):
+        '''Creates and returns an array of VrDeviceInfos'''
+        arr = cls * len(vr_device_info_sequence)
+        return arr(*vr_device_info_sequence)
+
+
+    def __init__(self, h_resolution: int = None,
+                 v_resolution: int = None,
+                 h_screen_size: float = None,
+                 v_screen_size: float = None,
+                 v_screen_center: float = None,
+                 eye_to_screen_distance: float = None,
+                 lens_separation_distance: float = None,
+                 interpupillary_distance: float = None,
+                 lens_distortion_values: Seq[float] = None,
+                 chroma_ab_correction: Seq[float] = None):
+        '''Initializes this VrDeviceInfo struct'''
+        super(VrDeviceInfo, self).__init__(
+            h_resolution or 0,
+            v_resolution or 0,
+            h_screen_size or 0.0,
+            v_screen_size or 0.0,
+            v_screen_center or 0.0,
+            eye_to_screen_distance or 0.0,
+            lens_separation_distance or 0.0,
+            interpupillary_distance or 0.0,
+            lens_distortion_values,
+            chroma_ab_correction
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this VrDeviceInfo instance'''
+        return byref(self)
+
+
+
+# Pointer type to VrDeviceInfos
+VrDeviceInfoPtr = POINTER(VrDeviceInfo)
+
+class VrStereoConfig(Structure):
+    '''VrStereoConfig, VR stereo rendering configuration for simulator'''
+    _fields_ = [
+        ('projection', Matrix * 2),
+        ('view_offset', Matrix * 2),
+        ('left_lens_center', Float * 2),
+        ('right_lens_center', Float * 2),
+        ('left_screen_center', Float * 2),
+        ('right_screen_center', Float * 2),
+        ('scale', Float * 2),
+        ('scale_in', Float * 2),
+    ]
+
+
+    @classmethod
+    def array_of(cls, vr_stereo_config_sequence):
+        '''Creates and returns an array of VrStereoConfigs'''
+        arr = cls * len(vr_stereo_config_sequence)
+        return arr(*vr_stereo_config_sequence)
+
+
+    def __init__(self, projection: Seq[Matrix] = None,
+                 view_offset: Seq[Matrix] = None,
+                 left_lens_center: Seq[float] = None,
+                 right_lens_center: Seq[float] = None,
+                 left_screen_center: Seq[float] = None,
+                 right_screen_center: Seq[float] = None,
+                 scale: Seq[float] = None,
+                 scale_in: Seq[float] = None):
+        '''Initializes this VrStereoConfig struct'''
+        super(VrStereoConfig, self).__init__(
+            projection,
+            view_offset,
+            left_lens_center,
+            right_lens_center,
+            left_screen_center,
+            right_screen_center,
+            scale,
+            scale_in
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this VrStereoConfig instance'''
+        return byref(self)
+
+
+    def __enter__(self):
+        _BeginVrStereoMode(self)
+
+    def __leave__(self, exc_type, exc_value, traceback):
+        _EndVrStereoMode()
+
+
+# Pointer type to VrStereoConfigs
+VrStereoConfigPtr = POINTER(VrStereoConfig)
+
+class FilePathList(Structure):
+    '''File path list'''
+    _fields_ = [
+        ('capacity', UInt),
+        ('count', UInt),
+        ('paths', CharPtrPtr),
+    ]
+
+
+    @classmethod
+    def array_of(cls, file_path_list_sequence):
+        '''Creates and returns an array of FilePathLists'''
+        arr = cls * len(file_path_list_sequence)
+        return arr(*file_path_list_sequence)
+
+
+    def __init__(self, capacity: int = None, count: int = None, paths: Seq[Union[str, CharPtr]] = None):
+        '''Initializes this FilePathList struct'''
+        super(FilePathList, self).__init__(
+            capacity or 0,
+            count or 0,
+            paths
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this FilePathList instance'''
+        return byref(self)
+
+
+
+# Pointer type to FilePathLists
+FilePathListPtr = POINTER(FilePathList)
+
+class ConfigFlags(IntEnum):
+    """System/Window config flags"""
+
+    FLAG_VSYNC_HINT = 64
+    """Set to try enabling V-Sync on GPU"""
+
+    FLAG_FULLSCREEN_MODE = 2
+    """Set to run program in fullscreen"""
+
+    FLAG_WINDOW_RESIZABLE = 4
+    """Set to allow resizable window"""
+
+    FLAG_WINDOW_UNDECORATED = 8
+    """Set to disable window decoration (frame and buttons)"""
+
+    FLAG_WINDOW_HIDDEN = 128
+    """Set to hide window"""
+
+    FLAG_WINDOW_MINIMIZED = 512
+    """Set to minimize window (iconify)"""
+
+    FLAG_WINDOW_MAXIMIZED = 1024
+    """Set to maximize window (expanded to monitor)"""
+
+    FLAG_WINDOW_UNFOCUSED = 2048
+    """Set to window non focused"""
+
+    FLAG_WINDOW_TOPMOST = 4096
+    """Set to window always on top"""
+
+    FLAG_WINDOW_ALWAYS_RUN = 256
+    """Set to allow windows running while minimized"""
+
+    FLAG_WINDOW_TRANSPARENT = 16
+    """Set to allow transparent framebuffer"""
+
+    FLAG_WINDOW_HIGHDPI = 8192
+    """Set to support HighDPI"""
+
+    FLAG_WINDOW_MOUSE_PASSTHROUGH = 16384
+    """Set to support mouse passthrough, only supported when FLAG_WINDOW_UNDECORATED"""
+
+    FLAG_MSAA_4X_HINT = 32
+    """Set to try enabling MSAA 4X"""
+
+    FLAG_INTERLACED_HINT = 65536
+    """Set to try enabling interlaced video format (for V3D)"""
+
+
+
+FLAG_VSYNC_HINT = ConfigFlags.FLAG_VSYNC_HINT
+FLAG_FULLSCREEN_MODE = ConfigFlags.FLAG_FULLSCREEN_MODE
+FLAG_WINDOW_RESIZABLE = ConfigFlags.FLAG_WINDOW_RESIZABLE
+FLAG_WINDOW_UNDECORATED = ConfigFlags.FLAG_WINDOW_UNDECORATED
+FLAG_WINDOW_HIDDEN = ConfigFlags.FLAG_WINDOW_HIDDEN
+FLAG_WINDOW_MINIMIZED = ConfigFlags.FLAG_WINDOW_MINIMIZED
+FLAG_WINDOW_MAXIMIZED = ConfigFlags.FLAG_WINDOW_MAXIMIZED
+FLAG_WINDOW_UNFOCUSED = ConfigFlags.FLAG_WINDOW_UNFOCUSED
+FLAG_WINDOW_TOPMOST = ConfigFlags.FLAG_WINDOW_TOPMOST
+FLAG_WINDOW_ALWAYS_RUN = ConfigFlags.FLAG_WINDOW_ALWAYS_RUN
+FLAG_WINDOW_TRANSPARENT = ConfigFlags.FLAG_WINDOW_TRANSPARENT
+FLAG_WINDOW_HIGHDPI = ConfigFlags.FLAG_WINDOW_HIGHDPI
+FLAG_WINDOW_MOUSE_PASSTHROUGH = ConfigFlags.FLAG_WINDOW_MOUSE_PASSTHROUGH
+FLAG_MSAA_4X_HINT = ConfigFlags.FLAG_MSAA_4X_HINT
+FLAG_INTERLACED_HINT = ConfigFlags.FLAG_INTERLACED_HINT
+
+class TraceLogLevel(IntEnum):
+    """Trace log level"""
+
+    LOG_ALL = 0
+    """Display all logs"""
+
+    LOG_TRACE = 1
+    """Trace logging, intended for internal use only"""
+
+    LOG_DEBUG = 2
+    """Debug logging, used for internal debugging, it should be disabled on release builds"""
+
+    LOG_INFO = 3
+    """Info logging, used for program execution info"""
+
+    LOG_WARNING = 4
+    """Warning logging, used on recoverable failures"""
+
+    LOG_ERROR = 5
+    """Error logging, used on unrecoverable failures"""
+
+    LOG_FATAL = 6
+    """Fatal logging, used to abort program: exit(EXIT_FAILURE)"""
+
+    LOG_NONE = 7
+    """Disable logging"""
+
+
+
+LOG_ALL = TraceLogLevel.LOG_ALL
+LOG_TRACE = TraceLogLevel.LOG_TRACE
+LOG_DEBUG = TraceLogLevel.LOG_DEBUG
+LOG_INFO = TraceLogLevel.LOG_INFO
+LOG_WARNING = TraceLogLevel.LOG_WARNING
+LOG_ERROR = TraceLogLevel.LOG_ERROR
+LOG_FATAL = TraceLogLevel.LOG_FATAL
+LOG_NONE = TraceLogLevel.LOG_NONE
+
+class KeyboardKey(IntEnum):
+    """Keyboard keys (US keyboard layout)"""
+
+    KEY_NULL = 0
+    """Key: NULL, used for no key pressed"""
+
+    KEY_APOSTROPHE = 39
+    """Key: '"""
+
+    KEY_COMMA = 44
+    """Key: ,"""
+
+    KEY_MINUS = 45
+    """Key: -"""
+
+    KEY_PERIOD = 46
+    """Key: ."""
+
+    KEY_SLASH = 47
+    """Key: /"""
+
+    KEY_ZERO = 48
+    """Key: 0"""
+
+    KEY_ONE = 49
+    """Key: 1"""
+
+    KEY_TWO = 50
+    """Key: 2"""
+
+    KEY_THREE = 51
+    """Key: 3"""
+
+    KEY_FOUR = 52
+    """Key: 4"""
+
+    KEY_FIVE = 53
+    """Key: 5"""
+
+    KEY_SIX = 54
+    """Key: 6"""
+
+    KEY_SEVEN = 55
+    """Key: 7"""
+
+    KEY_EIGHT = 56
+    """Key: 8"""
+
+    KEY_NINE = 57
+    """Key: 9"""
+
+    KEY_SEMICOLON = 59
+    """Key: ;"""
+
+    KEY_EQUAL = 61
+    """Key: ="""
+
+    KEY_A = 65
+    """Key: A | a"""
+
+    KEY_B = 66
+    """Key: B | b"""
+
+    KEY_C = 67
+    """Key: C | c"""
+
+    KEY_D = 68
+    """Key: D | d"""
+
+    KEY_E = 69
+    """Key: E | e"""
+
+    KEY_F = 70
+    """Key: F | f"""
+
+    KEY_G = 71
+    """Key: G | g"""
+
+    KEY_H = 72
+    """Key: H | h"""
+
+    KEY_I = 73
+    """Key: I | i"""
+
+    KEY_J = 74
+    """Key: J | j"""
+
+    KEY_K = 75
+    """Key: K | k"""
+
+    KEY_L = 76
+    """Key: L | l"""
+
+    KEY_M = 77
+    """Key: M | m"""
+
+    KEY_N = 78
+    """Key: N | n"""
+
+    KEY_O = 79
+    """Key: O | o"""
+
+    KEY_P = 80
+    """Key: P | p"""
+
+    KEY_Q = 81
+    """Key: Q | q"""
+
+    KEY_R = 82
+    """Key: R | r"""
+
+    KEY_S = 83
+    """Key: S | s"""
+
+    KEY_T = 84
+    """Key: T | t"""
+
+    KEY_U = 85
+    """Key: U | u"""
+
+    KEY_V = 86
+    """Key: V | v"""
+
+    KEY_W = 87
+    """Key: W | w"""
+
+    KEY_X = 88
+    """Key: X | x"""
+
+    KEY_Y = 89
+    """Key: Y | y"""
+
+    KEY_Z = 90
+    """Key: Z | z"""
+
+    KEY_LEFT_BRACKET = 91
+    """Key: ["""
+
+    KEY_BACKSLASH = 92
+    """Key: '\'"""
+
+    KEY_RIGHT_BRACKET = 93
+    """Key: ]"""
+
+    KEY_GRAVE = 96
+    """Key: `"""
+
+    KEY_SPACE = 32
+    """Key: Space"""
+
+    KEY_ESCAPE = 256
+    """Key: Esc"""
+
+    KEY_ENTER = 257
+    """Key: Enter"""
+
+    KEY_TAB = 258
+    """Key: Tab"""
+
+    KEY_BACKSPACE = 259
+    """Key: Backspace"""
+
+    KEY_INSERT = 260
+    """Key: Ins"""
+
+    KEY_DELETE = 261
+    """Key: Del"""
+
+    KEY_RIGHT = 262
+    """Key: Cursor right"""
+
+    KEY_LEFT = 263
+    """Key: Cursor left"""
+
+    KEY_DOWN = 264
+    """Key: Cursor down"""
+
+    KEY_UP = 265
+    """Key: Cursor up"""
+
+    KEY_PAGE_UP = 266
+    """Key: Page up"""
+
+    KEY_PAGE_DOWN = 267
+    """Key: Page down"""
+
+    KEY_HOME = 268
+    """Key: Home"""
+
+    KEY_END = 269
+    """Key: End"""
+
+    KEY_CAPS_LOCK = 280
+    """Key: Caps lock"""
+
+    KEY_SCROLL_LOCK = 281
+    """Key: Scroll down"""
+
+    KEY_NUM_LOCK = 282
+    """Key: Num lock"""
+
+    KEY_PRINT_SCREEN = 283
+    """Key: Print screen"""
+
+    KEY_PAUSE = 284
+    """Key: Pause"""
+
+    KEY_F1 = 290
+    """Key: F1"""
+
+    KEY_F2 = 291
+    """Key: F2"""
+
+    KEY_F3 = 292
+    """Key: F3"""
+
+    KEY_F4 = 293
+    """Key: F4"""
+
+    KEY_F5 = 294
+    """Key: F5"""
+
+    KEY_F6 = 295
+    """Key: F6"""
+
+    KEY_F7 = 296
+    """Key: F7"""
+
+    KEY_F8 = 297
+    """Key: F8"""
+
+    KEY_F9 = 298
+    """Key: F9"""
+
+    KEY_F10 = 299
+    """Key: F10"""
+
+    KEY_F11 = 300
+    """Key: F11"""
+
+    KEY_F12 = 301
+    """Key: F12"""
+
+    KEY_LEFT_SHIFT = 340
+    """Key: Shift left"""
+
+    KEY_LEFT_CONTROL = 341
+    """Key: Control left"""
+
+    KEY_LEFT_ALT = 342
+    """Key: Alt left"""
+
+    KEY_LEFT_SUPER = 343
+    """Key: Super left"""
+
+    KEY_RIGHT_SHIFT = 344
+    """Key: Shift right"""
+
+    KEY_RIGHT_CONTROL = 345
+    """Key: Control right"""
+
+    KEY_RIGHT_ALT = 346
+    """Key: Alt right"""
+
+    KEY_RIGHT_SUPER = 347
+    """Key: Super right"""
+
+    KEY_KB_MENU = 348
+    """Key: KB menu"""
+
+    KEY_KP_0 = 320
+    """Key: Keypad 0"""
+
+    KEY_KP_1 = 321
+    """Key: Keypad 1"""
+
+    KEY_KP_2 = 322
+    """Key: Keypad 2"""
+
+    KEY_KP_3 = 323
+    """Key: Keypad 3"""
+
+    KEY_KP_4 = 324
+    """Key: Keypad 4"""
+
+    KEY_KP_5 = 325
+    """Key: Keypad 5"""
+
+    KEY_KP_6 = 326
+    """Key: Keypad 6"""
+
+    KEY_KP_7 = 327
+    """Key: Keypad 7"""
+
+    KEY_KP_8 = 328
+    """Key: Keypad 8"""
+
+    KEY_KP_9 = 329
+    """Key: Keypad 9"""
+
+    KEY_KP_DECIMAL = 330
+    """Key: Keypad ."""
+
+    KEY_KP_DIVIDE = 331
+    """Key: Keypad /"""
+
+    KEY_KP_MULTIPLY = 332
+    """Key: Keypad *"""
+
+    KEY_KP_SUBTRACT = 333
+    """Key: Keypad -"""
+
+    KEY_KP_ADD = 334
+    """Key: Keypad +"""
+
+    KEY_KP_ENTER = 335
+    """Key: Keypad Enter"""
+
+    KEY_KP_EQUAL = 336
+    """Key: Keypad ="""
+
+    KEY_BACK = 4
+    """Key: Android back button"""
+
+    KEY_MENU = 82
+    """Key: Android menu button"""
+
+    KEY_VOLUME_UP = 24
+    """Key: Android volume up button"""
+
+    KEY_VOLUME_DOWN = 25
+    """Key: Android volume down button"""
+
+
+
+KEY_NULL = KeyboardKey.KEY_NULL
+KEY_APOSTROPHE = KeyboardKey.KEY_APOSTROPHE
+KEY_COMMA = KeyboardKey.KEY_COMMA
+KEY_MINUS = KeyboardKey.KEY_MINUS
+KEY_PERIOD = KeyboardKey.KEY_PERIOD
+KEY_SLASH = KeyboardKey.KEY_SLASH
+KEY_ZERO = KeyboardKey.KEY_ZERO
+KEY_ONE = KeyboardKey.KEY_ONE
+KEY_TWO = KeyboardKey.KEY_TWO
+KEY_THREE = KeyboardKey.KEY_THREE
+KEY_FOUR = KeyboardKey.KEY_FOUR
+KEY_FIVE = KeyboardKey.KEY_FIVE
+KEY_SIX = KeyboardKey.KEY_SIX
+KEY_SEVEN = KeyboardKey.KEY_SEVEN
+KEY_EIGHT = KeyboardKey.KEY_EIGHT
+KEY_NINE = KeyboardKey.KEY_NINE
+KEY_SEMICOLON = KeyboardKey.KEY_SEMICOLON
+KEY_EQUAL = KeyboardKey.KEY_EQUAL
+KEY_A = KeyboardKey.KEY_A
+KEY_B = KeyboardKey.KEY_B
+KEY_C = KeyboardKey.KEY_C
+KEY_D = KeyboardKey.KEY_D
+KEY_E = KeyboardKey.KEY_E
+KEY_F = KeyboardKey.KEY_F
+KEY_G = KeyboardKey.KEY_G
+KEY_H = KeyboardKey.KEY_H
+KEY_I = KeyboardKey.KEY_I
+KEY_J = KeyboardKey.KEY_J
+KEY_K = KeyboardKey.KEY_K
+KEY_L = KeyboardKey.KEY_L
+KEY_M = KeyboardKey.KEY_M
+KEY_N = KeyboardKey.KEY_N
+KEY_O = KeyboardKey.KEY_O
+KEY_P = KeyboardKey.KEY_P
+KEY_Q = KeyboardKey.KEY_Q
+KEY_R = KeyboardKey.KEY_R
+KEY_S = KeyboardKey.KEY_S
+KEY_T = KeyboardKey.KEY_T
+KEY_U = KeyboardKey.KEY_U
+KEY_V = KeyboardKey.KEY_V
+KEY_W = KeyboardKey.KEY_W
+KEY_X = KeyboardKey.KEY_X
+KEY_Y = KeyboardKey.KEY_Y
+KEY_Z = KeyboardKey.KEY_Z
+KEY_LEFT_BRACKET = KeyboardKey.KEY_LEFT_BRACKET
+KEY_BACKSLASH = KeyboardKey.KEY_BACKSLASH
+KEY_RIGHT_BRACKET = KeyboardKey.KEY_RIGHT_BRACKET
+KEY_GRAVE = KeyboardKey.KEY_GRAVE
+KEY_SPACE = KeyboardKey.KEY_SPACE
+KEY_ESCAPE = KeyboardKey.KEY_ESCAPE
+KEY_ENTER = KeyboardKey.KEY_ENTER
+KEY_TAB = KeyboardKey.KEY_TAB
+KEY_BACKSPACE = KeyboardKey.KEY_BACKSPACE
+KEY_INSERT = KeyboardKey.KEY_INSERT
+KEY_DELETE = KeyboardKey.KEY_DELETE
+KEY_RIGHT = KeyboardKey.KEY_RIGHT
+KEY_LEFT = KeyboardKey.KEY_LEFT
+KEY_DOWN = KeyboardKey.KEY_DOWN
+KEY_UP = KeyboardKey.KEY_UP
+KEY_PAGE_UP = KeyboardKey.KEY_PAGE_UP
+KEY_PAGE_DOWN = KeyboardKey.KEY_PAGE_DOWN
+KEY_HOME = KeyboardKey.KEY_HOME
+KEY_END = KeyboardKey.KEY_END
+KEY_CAPS_LOCK = KeyboardKey.KEY_CAPS_LOCK
+KEY_SCROLL_LOCK = KeyboardKey.KEY_SCROLL_LOCK
+KEY_NUM_LOCK = KeyboardKey.KEY_NUM_LOCK
+KEY_PRINT_SCREEN = KeyboardKey.KEY_PRINT_SCREEN
+KEY_PAUSE = KeyboardKey.KEY_PAUSE
+KEY_F1 = KeyboardKey.KEY_F1
+KEY_F2 = KeyboardKey.KEY_F2
+KEY_F3 = KeyboardKey.KEY_F3
+KEY_F4 = KeyboardKey.KEY_F4
+KEY_F5 = KeyboardKey.KEY_F5
+KEY_F6 = KeyboardKey.KEY_F6
+KEY_F7 = KeyboardKey.KEY_F7
+KEY_F8 = KeyboardKey.KEY_F8
+KEY_F9 = KeyboardKey.KEY_F9
+KEY_F10 = KeyboardKey.KEY_F10
+KEY_F11 = KeyboardKey.KEY_F11
+KEY_F12 = KeyboardKey.KEY_F12
+KEY_LEFT_SHIFT = KeyboardKey.KEY_LEFT_SHIFT
+KEY_LEFT_CONTROL = KeyboardKey.KEY_LEFT_CONTROL
+KEY_LEFT_ALT = KeyboardKey.KEY_LEFT_ALT
+KEY_LEFT_SUPER = KeyboardKey.KEY_LEFT_SUPER
+KEY_RIGHT_SHIFT = KeyboardKey.KEY_RIGHT_SHIFT
+KEY_RIGHT_CONTROL = KeyboardKey.KEY_RIGHT_CONTROL
+KEY_RIGHT_ALT = KeyboardKey.KEY_RIGHT_ALT
+KEY_RIGHT_SUPER = KeyboardKey.KEY_RIGHT_SUPER
+KEY_KB_MENU = KeyboardKey.KEY_KB_MENU
+KEY_KP_0 = KeyboardKey.KEY_KP_0
+KEY_KP_1 = KeyboardKey.KEY_KP_1
+KEY_KP_2 = KeyboardKey.KEY_KP_2
+KEY_KP_3 = KeyboardKey.KEY_KP_3
+KEY_KP_4 = KeyboardKey.KEY_KP_4
+KEY_KP_5 = KeyboardKey.KEY_KP_5
+KEY_KP_6 = KeyboardKey.KEY_KP_6
+KEY_KP_7 = KeyboardKey.KEY_KP_7
+KEY_KP_8 = KeyboardKey.KEY_KP_8
+KEY_KP_9 = KeyboardKey.KEY_KP_9
+KEY_KP_DECIMAL = KeyboardKey.KEY_KP_DECIMAL
+KEY_KP_DIVIDE = KeyboardKey.KEY_KP_DIVIDE
+KEY_KP_MULTIPLY = KeyboardKey.KEY_KP_MULTIPLY
+KEY_KP_SUBTRACT = KeyboardKey.KEY_KP_SUBTRACT
+KEY_KP_ADD = KeyboardKey.KEY_KP_ADD
+KEY_KP_ENTER = KeyboardKey.KEY_KP_ENTER
+KEY_KP_EQUAL = KeyboardKey.KEY_KP_EQUAL
+KEY_BACK = KeyboardKey.KEY_BACK
+KEY_MENU = KeyboardKey.KEY_MENU
+KEY_VOLUME_UP = KeyboardKey.KEY_VOLUME_UP
+KEY_VOLUME_DOWN = KeyboardKey.KEY_VOLUME_DOWN
+
+class MouseButton(IntEnum):
+    """Mouse buttons"""
+
+    MOUSE_BUTTON_LEFT = 0
+    """Mouse button left"""
+
+    MOUSE_BUTTON_RIGHT = 1
+    """Mouse button right"""
+
+    MOUSE_BUTTON_MIDDLE = 2
+    """Mouse button middle (pressed wheel)"""
+
+    MOUSE_BUTTON_SIDE = 3
+    """Mouse button side (advanced mouse device)"""
+
+    MOUSE_BUTTON_EXTRA = 4
+    """Mouse button extra (advanced mouse device)"""
+
+    MOUSE_BUTTON_FORWARD = 5
+    """Mouse button fordward (advanced mouse device)"""
+
+    MOUSE_BUTTON_BACK = 6
+    """Mouse button back (advanced mouse device)"""
+
+
+
+MOUSE_BUTTON_LEFT = MouseButton.MOUSE_BUTTON_LEFT
+MOUSE_BUTTON_RIGHT = MouseButton.MOUSE_BUTTON_RIGHT
+MOUSE_BUTTON_MIDDLE = MouseButton.MOUSE_BUTTON_MIDDLE
+MOUSE_BUTTON_SIDE = MouseButton.MOUSE_BUTTON_SIDE
+MOUSE_BUTTON_EXTRA = MouseButton.MOUSE_BUTTON_EXTRA
+MOUSE_BUTTON_FORWARD = MouseButton.MOUSE_BUTTON_FORWARD
+MOUSE_BUTTON_BACK = MouseButton.MOUSE_BUTTON_BACK
+
+class MouseCursor(IntEnum):
+    """Mouse cursor"""
+
+    MOUSE_CURSOR_DEFAULT = 0
+    """Default pointer shape"""
+
+    MOUSE_CURSOR_ARROW = 1
+    """Arrow shape"""
+
+    MOUSE_CURSOR_IBEAM = 2
+    """Text writing cursor shape"""
+
+    MOUSE_CURSOR_CROSSHAIR = 3
+    """Cross shape"""
+
+    MOUSE_CURSOR_POINTING_HAND = 4
+    """Pointing hand cursor"""
+
+    MOUSE_CURSOR_RESIZE_EW = 5
+    """Horizontal resize/move arrow shape"""
+
+    MOUSE_CURSOR_RESIZE_NS = 6
+    """Vertical resize/move arrow shape"""
+
+    MOUSE_CURSOR_RESIZE_NWSE = 7
+    """Top-left to bottom-right diagonal resize/move arrow shape"""
+
+    MOUSE_CURSOR_RESIZE_NESW = 8
+    """The top-right to bottom-left diagonal resize/move arrow shape"""
+
+    MOUSE_CURSOR_RESIZE_ALL = 9
+    """The omni-directional resize/move cursor shape"""
+
+    MOUSE_CURSOR_NOT_ALLOWED = 10
+    """The operation-not-allowed shape"""
+
+
+
+MOUSE_CURSOR_DEFAULT = MouseCursor.MOUSE_CURSOR_DEFAULT
+MOUSE_CURSOR_ARROW = MouseCursor.MOUSE_CURSOR_ARROW
+MOUSE_CURSOR_IBEAM = MouseCursor.MOUSE_CURSOR_IBEAM
+MOUSE_CURSOR_CROSSHAIR = MouseCursor.MOUSE_CURSOR_CROSSHAIR
+MOUSE_CURSOR_POINTING_HAND = MouseCursor.MOUSE_CURSOR_POINTING_HAND
+MOUSE_CURSOR_RESIZE_EW = MouseCursor.MOUSE_CURSOR_RESIZE_EW
+MOUSE_CURSOR_RESIZE_NS = MouseCursor.MOUSE_CURSOR_RESIZE_NS
+MOUSE_CURSOR_RESIZE_NWSE = MouseCursor.MOUSE_CURSOR_RESIZE_NWSE
+MOUSE_CURSOR_RESIZE_NESW = MouseCursor.MOUSE_CURSOR_RESIZE_NESW
+MOUSE_CURSOR_RESIZE_ALL = MouseCursor.MOUSE_CURSOR_RESIZE_ALL
+MOUSE_CURSOR_NOT_ALLOWED = MouseCursor.MOUSE_CURSOR_NOT_ALLOWED
+
+class GamepadButton(IntEnum):
+    """Gamepad buttons"""
+
+    GAMEPAD_BUTTON_UNKNOWN = 0
+    """Unknown button, just for error checking"""
+
+    GAMEPAD_BUTTON_LEFT_FACE_UP = 1
+    """Gamepad left DPAD up button"""
+
+    GAMEPAD_BUTTON_LEFT_FACE_RIGHT = 2
+    """Gamepad left DPAD right button"""
+
+    GAMEPAD_BUTTON_LEFT_FACE_DOWN = 3
+    """Gamepad left DPAD down button"""
+
+    GAMEPAD_BUTTON_LEFT_FACE_LEFT = 4
+    """Gamepad left DPAD left button"""
+
+    GAMEPAD_BUTTON_RIGHT_FACE_UP = 5
+    """Gamepad right button up (i.e. PS3: Triangle, Xbox: Y)"""
+
+    GAMEPAD_BUTTON_RIGHT_FACE_RIGHT = 6
+    """Gamepad right button right (i.e. PS3: Square, Xbox: X)"""
+
+    GAMEPAD_BUTTON_RIGHT_FACE_DOWN = 7
+    """Gamepad right button down (i.e. PS3: Cross, Xbox: A)"""
+
+    GAMEPAD_BUTTON_RIGHT_FACE_LEFT = 8
+    """Gamepad right button left (i.e. PS3: Circle, Xbox: B)"""
+
+    GAMEPAD_BUTTON_LEFT_TRIGGER_1 = 9
+    """Gamepad top/back trigger left (first), it could be a trailing button"""
+
+    GAMEPAD_BUTTON_LEFT_TRIGGER_2 = 10
+    """Gamepad top/back trigger left (second), it could be a trailing button"""
+
+    GAMEPAD_BUTTON_RIGHT_TRIGGER_1 = 11
+    """Gamepad top/back trigger right (one), it could be a trailing button"""
+
+    GAMEPAD_BUTTON_RIGHT_TRIGGER_2 = 12
+    """Gamepad top/back trigger right (second), it could be a trailing button"""
+
+    GAMEPAD_BUTTON_MIDDLE_LEFT = 13
+    """Gamepad center buttons, left one (i.e. PS3: Select)"""
+
+    GAMEPAD_BUTTON_MIDDLE = 14
+    """Gamepad center buttons, middle one (i.e. PS3: PS, Xbox: XBOX)"""
+
+    GAMEPAD_BUTTON_MIDDLE_RIGHT = 15
+    """Gamepad center buttons, right one (i.e. PS3: Start)"""
+
+    GAMEPAD_BUTTON_LEFT_THUMB = 16
+    """Gamepad joystick pressed button left"""
+
+    GAMEPAD_BUTTON_RIGHT_THUMB = 17
+    """Gamepad joystick pressed button right"""
+
+
+
+GAMEPAD_BUTTON_UNKNOWN = GamepadButton.GAMEPAD_BUTTON_UNKNOWN
+GAMEPAD_BUTTON_LEFT_FACE_UP = GamepadButton.GAMEPAD_BUTTON_LEFT_FACE_UP
+GAMEPAD_BUTTON_LEFT_FACE_RIGHT = GamepadButton.GAMEPAD_BUTTON_LEFT_FACE_RIGHT
+GAMEPAD_BUTTON_LEFT_FACE_DOWN = GamepadButton.GAMEPAD_BUTTON_LEFT_FACE_DOWN
+GAMEPAD_BUTTON_LEFT_FACE_LEFT = GamepadButton.GAMEPAD_BUTTON_LEFT_FACE_LEFT
+GAMEPAD_BUTTON_RIGHT_FACE_UP = GamepadButton.GAMEPAD_BUTTON_RIGHT_FACE_UP
+GAMEPAD_BUTTON_RIGHT_FACE_RIGHT = GamepadButton.GAMEPAD_BUTTON_RIGHT_FACE_RIGHT
+GAMEPAD_BUTTON_RIGHT_FACE_DOWN = GamepadButton.GAMEPAD_BUTTON_RIGHT_FACE_DOWN
+GAMEPAD_BUTTON_RIGHT_FACE_LEFT = GamepadButton.GAMEPAD_BUTTON_RIGHT_FACE_LEFT
+GAMEPAD_BUTTON_LEFT_TRIGGER_1 = GamepadButton.GAMEPAD_BUTTON_LEFT_TRIGGER_1
+GAMEPAD_BUTTON_LEFT_TRIGGER_2 = GamepadButton.GAMEPAD_BUTTON_LEFT_TRIGGER_2
+GAMEPAD_BUTTON_RIGHT_TRIGGER_1 = GamepadButton.GAMEPAD_BUTTON_RIGHT_TRIGGER_1
+GAMEPAD_BUTTON_RIGHT_TRIGGER_2 = GamepadButton.GAMEPAD_BUTTON_RIGHT_TRIGGER_2
+GAMEPAD_BUTTON_MIDDLE_LEFT = GamepadButton.GAMEPAD_BUTTON_MIDDLE_LEFT
+GAMEPAD_BUTTON_MIDDLE = GamepadButton.GAMEPAD_BUTTON_MIDDLE
+GAMEPAD_BUTTON_MIDDLE_RIGHT = GamepadButton.GAMEPAD_BUTTON_MIDDLE_RIGHT
+GAMEPAD_BUTTON_LEFT_THUMB = GamepadButton.GAMEPAD_BUTTON_LEFT_THUMB
+GAMEPAD_BUTTON_RIGHT_THUMB = GamepadButton.GAMEPAD_BUTTON_RIGHT_THUMB
+
+class GamepadAxis(IntEnum):
+    """Gamepad axis"""
+
+    GAMEPAD_AXIS_LEFT_X = 0
+    """Gamepad left stick X axis"""
+
+    GAMEPAD_AXIS_LEFT_Y = 1
+    """Gamepad left stick Y axis"""
+
+    GAMEPAD_AXIS_RIGHT_X = 2
+    """Gamepad right stick X axis"""
+
+    GAMEPAD_AXIS_RIGHT_Y = 3
+    """Gamepad right stick Y axis"""
+
+    GAMEPAD_AXIS_LEFT_TRIGGER = 4
+    """Gamepad back trigger left, pressure level: [1..-1]"""
+
+    GAMEPAD_AXIS_RIGHT_TRIGGER = 5
+    """Gamepad back trigger right, pressure level: [1..-1]"""
+
+
+
+GAMEPAD_AXIS_LEFT_X = GamepadAxis.GAMEPAD_AXIS_LEFT_X
+GAMEPAD_AXIS_LEFT_Y = GamepadAxis.GAMEPAD_AXIS_LEFT_Y
+GAMEPAD_AXIS_RIGHT_X = GamepadAxis.GAMEPAD_AXIS_RIGHT_X
+GAMEPAD_AXIS_RIGHT_Y = GamepadAxis.GAMEPAD_AXIS_RIGHT_Y
+GAMEPAD_AXIS_LEFT_TRIGGER = GamepadAxis.GAMEPAD_AXIS_LEFT_TRIGGER
+GAMEPAD_AXIS_RIGHT_TRIGGER = GamepadAxis.GAMEPAD_AXIS_RIGHT_TRIGGER
+
+class ShaderLocationIndex(IntEnum):
+    """Shader location index"""
+
+    SHADER_LOC_VERTEX_POSITION = 0
+    """Shader location: vertex attribute: position"""
+
+    SHADER_LOC_VERTEX_TEXCOORD01 = 1
+    """Shader location: vertex attribute: texcoord01"""
+
+    SHADER_LOC_VERTEX_TEXCOORD02 = 2
+    """Shader location: vertex attribute: texcoord02"""
+
+    SHADER_LOC_VERTEX_NORMAL = 3
+    """Shader location: vertex attribute: normal"""
+
+    SHADER_LOC_VERTEX_TANGENT = 4
+    """Shader location: vertex attribute: tangent"""
+
+    SHADER_LOC_VERTEX_COLOR = 5
+    """Shader location: vertex attribute: color"""
+
+    SHADER_LOC_MATRIX_MVP = 6
+    """Shader location: matrix uniform: model-view-projection"""
+
+    SHADER_LOC_MATRIX_VIEW = 7
+    """Shader location: matrix uniform: view (camera transform)"""
+
+    SHADER_LOC_MATRIX_PROJECTION = 8
+    """Shader location: matrix uniform: projection"""
+
+    SHADER_LOC_MATRIX_MODEL = 9
+    """Shader location: matrix uniform: model (transform)"""
+
+    SHADER_LOC_MATRIX_NORMAL = 10
+    """Shader location: matrix uniform: normal"""
+
+    SHADER_LOC_VECTOR_VIEW = 11
+    """Shader location: vector uniform: view"""
+
+    SHADER_LOC_COLOR_DIFFUSE = 12
+    """Shader location: vector uniform: diffuse color"""
+
+    SHADER_LOC_COLOR_SPECULAR = 13
+    """Shader location: vector uniform: specular color"""
+
+    SHADER_LOC_COLOR_AMBIENT = 14
+    """Shader location: vector uniform: ambient color"""
+
+    SHADER_LOC_MAP_ALBEDO = 15
+    """Shader location: sampler2d texture: albedo (same as: SHADER_LOC_MAP_DIFFUSE)"""
+
+    SHADER_LOC_MAP_METALNESS = 16
+    """Shader location: sampler2d texture: metalness (same as: SHADER_LOC_MAP_SPECULAR)"""
+
+    SHADER_LOC_MAP_NORMAL = 17
+    """Shader location: sampler2d texture: normal"""
+
+    SHADER_LOC_MAP_ROUGHNESS = 18
+    """Shader location: sampler2d texture: roughness"""
+
+    SHADER_LOC_MAP_OCCLUSION = 19
+    """Shader location: sampler2d texture: occlusion"""
+
+    SHADER_LOC_MAP_EMISSION = 20
+    """Shader location: sampler2d texture: emission"""
+
+    SHADER_LOC_MAP_HEIGHT = 21
+    """Shader location: sampler2d texture: height"""
+
+    SHADER_LOC_MAP_CUBEMAP = 22
+    """Shader location: samplerCube texture: cubemap"""
+
+    SHADER_LOC_MAP_IRRADIANCE = 23
+    """Shader location: samplerCube texture: irradiance"""
+
+    SHADER_LOC_MAP_PREFILTER = 24
+    """Shader location: samplerCube texture: prefilter"""
+
+    SHADER_LOC_MAP_BRDF = 25
+    """Shader location: sampler2d texture: brdf"""
+
+
+
+SHADER_LOC_VERTEX_POSITION = ShaderLocationIndex.SHADER_LOC_VERTEX_POSITION
+SHADER_LOC_VERTEX_TEXCOORD01 = ShaderLocationIndex.SHADER_LOC_VERTEX_TEXCOORD01
+SHADER_LOC_VERTEX_TEXCOORD02 = ShaderLocationIndex.SHADER_LOC_VERTEX_TEXCOORD02
+SHADER_LOC_VERTEX_NORMAL = ShaderLocationIndex.SHADER_LOC_VERTEX_NORMAL
+SHADER_LOC_VERTEX_TANGENT = ShaderLocationIndex.SHADER_LOC_VERTEX_TANGENT
+SHADER_LOC_VERTEX_COLOR = ShaderLocationIndex.SHADER_LOC_VERTEX_COLOR
+SHADER_LOC_MATRIX_MVP = ShaderLocationIndex.SHADER_LOC_MATRIX_MVP
+SHADER_LOC_MATRIX_VIEW = ShaderLocationIndex.SHADER_LOC_MATRIX_VIEW
+SHADER_LOC_MATRIX_PROJECTION = ShaderLocationIndex.SHADER_LOC_MATRIX_PROJECTION
+SHADER_LOC_MATRIX_MODEL = ShaderLocationIndex.SHADER_LOC_MATRIX_MODEL
+SHADER_LOC_MATRIX_NORMAL = ShaderLocationIndex.SHADER_LOC_MATRIX_NORMAL
+SHADER_LOC_VECTOR_VIEW = ShaderLocationIndex.SHADER_LOC_VECTOR_VIEW
+SHADER_LOC_COLOR_DIFFUSE = ShaderLocationIndex.SHADER_LOC_COLOR_DIFFUSE
+SHADER_LOC_COLOR_SPECULAR = ShaderLocationIndex.SHADER_LOC_COLOR_SPECULAR
+SHADER_LOC_COLOR_AMBIENT = ShaderLocationIndex.SHADER_LOC_COLOR_AMBIENT
+SHADER_LOC_MAP_ALBEDO = ShaderLocationIndex.SHADER_LOC_MAP_ALBEDO
+SHADER_LOC_MAP_METALNESS = ShaderLocationIndex.SHADER_LOC_MAP_METALNESS
+SHADER_LOC_MAP_NORMAL = ShaderLocationIndex.SHADER_LOC_MAP_NORMAL
+SHADER_LOC_MAP_ROUGHNESS = ShaderLocationIndex.SHADER_LOC_MAP_ROUGHNESS
+SHADER_LOC_MAP_OCCLUSION = ShaderLocationIndex.SHADER_LOC_MAP_OCCLUSION
+SHADER_LOC_MAP_EMISSION = ShaderLocationIndex.SHADER_LOC_MAP_EMISSION
+SHADER_LOC_MAP_HEIGHT = ShaderLocationIndex.SHADER_LOC_MAP_HEIGHT
+SHADER_LOC_MAP_CUBEMAP = ShaderLocationIndex.SHADER_LOC_MAP_CUBEMAP
+SHADER_LOC_MAP_IRRADIANCE = ShaderLocationIndex.SHADER_LOC_MAP_IRRADIANCE
+SHADER_LOC_MAP_PREFILTER = ShaderLocationIndex.SHADER_LOC_MAP_PREFILTER
+SHADER_LOC_MAP_BRDF = ShaderLocationIndex.SHADER_LOC_MAP_BRDF
+
+class ShaderUniformDataType(IntEnum):
+    """Shader uniform data type"""
+
+    SHADER_UNIFORM_FLOAT = 0
+    """Shader uniform type: float"""
+
+    SHADER_UNIFORM_VEC2 = 1
+    """Shader uniform type: vec2 (2 float)"""
+
+    SHADER_UNIFORM_VEC3 = 2
+    """Shader uniform type: vec3 (3 float)"""
+
+    SHADER_UNIFORM_VEC4 = 3
+    """Shader uniform type: vec4 (4 float)"""
+
+    SHADER_UNIFORM_INT = 4
+    """Shader uniform type: int"""
+
+    SHADER_UNIFORM_IVEC2 = 5
+    """Shader uniform type: ivec2 (2 int)"""
+
+    SHADER_UNIFORM_IVEC3 = 6
+    """Shader uniform type: ivec3 (3 int)"""
+
+    SHADER_UNIFORM_IVEC4 = 7
+    """Shader uniform type: ivec4 (4 int)"""
+
+    SHADER_UNIFORM_SAMPLER2D = 8
+    """Shader uniform type: sampler2d"""
+
+
+
+SHADER_UNIFORM_FLOAT = ShaderUniformDataType.SHADER_UNIFORM_FLOAT
+SHADER_UNIFORM_VEC2 = ShaderUniformDataType.SHADER_UNIFORM_VEC2
+SHADER_UNIFORM_VEC3 = ShaderUniformDataType.SHADER_UNIFORM_VEC3
+SHADER_UNIFORM_VEC4 = ShaderUniformDataType.SHADER_UNIFORM_VEC4
+SHADER_UNIFORM_INT = ShaderUniformDataType.SHADER_UNIFORM_INT
+SHADER_UNIFORM_IVEC2 = ShaderUniformDataType.SHADER_UNIFORM_IVEC2
+SHADER_UNIFORM_IVEC3 = ShaderUniformDataType.SHADER_UNIFORM_IVEC3
+SHADER_UNIFORM_IVEC4 = ShaderUniformDataType.SHADER_UNIFORM_IVEC4
+SHADER_UNIFORM_SAMPLER2D = ShaderUniformDataType.SHADER_UNIFORM_SAMPLER2D
+
+class ShaderAttributeDataType(IntEnum):
+    """Shader attribute data types"""
+
+    SHADER_ATTRIB_FLOAT = 0
+    """Shader attribute type: float"""
+
+    SHADER_ATTRIB_VEC2 = 1
+    """Shader attribute type: vec2 (2 float)"""
+
+    SHADER_ATTRIB_VEC3 = 2
+    """Shader attribute type: vec3 (3 float)"""
+
+    SHADER_ATTRIB_VEC4 = 3
+    """Shader attribute type: vec4 (4 float)"""
+
+
+
+SHADER_ATTRIB_FLOAT = ShaderAttributeDataType.SHADER_ATTRIB_FLOAT
+SHADER_ATTRIB_VEC2 = ShaderAttributeDataType.SHADER_ATTRIB_VEC2
+SHADER_ATTRIB_VEC3 = ShaderAttributeDataType.SHADER_ATTRIB_VEC3
+SHADER_ATTRIB_VEC4 = ShaderAttributeDataType.SHADER_ATTRIB_VEC4
+
+class BlendMode(IntEnum):
+    """Color blending modes (pre-defined)"""
+
+    BLEND_ALPHA = 0
+    """Blend textures considering alpha (default)"""
+
+    BLEND_ADDITIVE = 1
+    """Blend textures adding colors"""
+
+    BLEND_MULTIPLIED = 2
+    """Blend textures multiplying colors"""
+
+    BLEND_ADD_COLORS = 3
+    """Blend textures adding colors (alternative)"""
+
+    BLEND_SUBTRACT_COLORS = 4
+    """Blend textures subtracting colors (alternative)"""
+
+    BLEND_ALPHA_PREMULTIPLY = 5
+    """Blend premultiplied textures considering alpha"""
+
+    BLEND_CUSTOM = 6
+    """Blend textures using custom src/dst factors (use rlSetBlendMode())"""
+
+
+
+BLEND_ALPHA = BlendMode.BLEND_ALPHA
+BLEND_ADDITIVE = BlendMode.BLEND_ADDITIVE
+BLEND_MULTIPLIED = BlendMode.BLEND_MULTIPLIED
+BLEND_ADD_COLORS = BlendMode.BLEND_ADD_COLORS
+BLEND_SUBTRACT_COLORS = BlendMode.BLEND_SUBTRACT_COLORS
+BLEND_ALPHA_PREMULTIPLY = BlendMode.BLEND_ALPHA_PREMULTIPLY
+BLEND_CUSTOM = BlendMode.BLEND_CUSTOM
+
+class Gesture(IntEnum):
+    """Gesture"""
+
+    GESTURE_NONE = 0
+    """No gesture"""
+
+    GESTURE_TAP = 1
+    """Tap gesture"""
+
+    GESTURE_DOUBLETAP = 2
+    """Double tap gesture"""
+
+    GESTURE_HOLD = 4
+    """Hold gesture"""
+
+    GESTURE_DRAG = 8
+    """Drag gesture"""
+
+    GESTURE_SWIPE_RIGHT = 16
+    """Swipe right gesture"""
+
+    GESTURE_SWIPE_LEFT = 32
+    """Swipe left gesture"""
+
+    GESTURE_SWIPE_UP = 64
+    """Swipe up gesture"""
+
+    GESTURE_SWIPE_DOWN = 128
+    """Swipe down gesture"""
+
+    GESTURE_PINCH_IN = 256
+    """Pinch in gesture"""
+
+    GESTURE_PINCH_OUT = 512
+    """Pinch out gesture"""
+
+
+
+GESTURE_NONE = Gesture.GESTURE_NONE
+GESTURE_TAP = Gesture.GESTURE_TAP
+GESTURE_DOUBLETAP = Gesture.GESTURE_DOUBLETAP
+GESTURE_HOLD = Gesture.GESTURE_HOLD
+GESTURE_DRAG = Gesture.GESTURE_DRAG
+GESTURE_SWIPE_RIGHT = Gesture.GESTURE_SWIPE_RIGHT
+GESTURE_SWIPE_LEFT = Gesture.GESTURE_SWIPE_LEFT
+GESTURE_SWIPE_UP = Gesture.GESTURE_SWIPE_UP
+GESTURE_SWIPE_DOWN = Gesture.GESTURE_SWIPE_DOWN
+GESTURE_PINCH_IN = Gesture.GESTURE_PINCH_IN
+GESTURE_PINCH_OUT = Gesture.GESTURE_PINCH_OUT
+
+class CameraMode(IntEnum):
+    """Camera system modes"""
+
+    CAMERA_CUSTOM = 0
+    """Custom camera"""
+
+    CAMERA_FREE = 1
+    """Free camera"""
+
+    CAMERA_ORBITAL = 2
+    """Orbital camera"""
+
+    CAMERA_FIRST_PERSON = 3
+    """First person camera"""
+
+    CAMERA_THIRD_PERSON = 4
+    """Third person camera"""
+
+
+
+CAMERA_CUSTOM = CameraMode.CAMERA_CUSTOM
+CAMERA_FREE = CameraMode.CAMERA_FREE
+CAMERA_ORBITAL = CameraMode.CAMERA_ORBITAL
+CAMERA_FIRST_PERSON = CameraMode.CAMERA_FIRST_PERSON
+CAMERA_THIRD_PERSON = CameraMode.CAMERA_THIRD_PERSON
+
+class CameraProjection(IntEnum):
+    """Camera projection"""
+
+    CAMERA_PERSPECTIVE = 0
+    """Perspective projection"""
+
+    CAMERA_ORTHOGRAPHIC = 1
+    """Orthographic projection"""
+
+
+
+CAMERA_PERSPECTIVE = CameraProjection.CAMERA_PERSPECTIVE
+CAMERA_ORTHOGRAPHIC = CameraProjection.CAMERA_ORTHOGRAPHIC
+
+RAYLIB_VERSION = '4.2'
+
+PI = 3.141592653589793
+
+DEG2RAD = (PI / 180.0)
+
+RAD2DEG = (180.0 / PI)
+# Light Gray
+LIGHTGRAY = Color( 200, 200, 200, 255 )
+# Gray
+GRAY = Color( 130, 130, 130, 255 )
+# Dark Gray
+DARKGRAY = Color( 80, 80, 80, 255 )
+# Yellow
+YELLOW = Color( 253, 249, 0, 255 )
+# Gold
+GOLD = Color( 255, 203, 0, 255 )
+# Orange
+ORANGE = Color( 255, 161, 0, 255 )
+# Pink
+PINK = Color( 255, 109, 194, 255 )
+# Red
+RED = Color( 230, 41, 55, 255 )
+# Maroon
+MAROON = Color( 190, 33, 55, 255 )
+# Green
+GREEN = Color( 0, 228, 48, 255 )
+# Lime
+LIME = Color( 0, 158, 47, 255 )
+# Dark Green
+DARKGREEN = Color( 0, 117, 44, 255 )
+# Sky Blue
+SKYBLUE = Color( 102, 191, 255, 255 )
+# Blue
+BLUE = Color( 0, 121, 241, 255 )
+# Dark Blue
+DARKBLUE = Color( 0, 82, 172, 255 )
+# Purple
+PURPLE = Color( 200, 122, 255, 255 )
+# Violet
+VIOLET = Color( 135, 60, 190, 255 )
+# Dark Purple
+DARKPURPLE = Color( 112, 31, 126, 255 )
+# Beige
+BEIGE = Color( 211, 176, 131, 255 )
+# Brown
+BROWN = Color( 127, 106, 79, 255 )
+# Dark Brown
+DARKBROWN = Color( 76, 63, 47, 255 )
+# White
+WHITE = Color( 255, 255, 255, 255 )
+# Black
+BLACK = Color( 0, 0, 0, 255 )
+# Blank (Transparent)
+BLANK = Color( 0, 0, 0, 0 )
+# Magenta
+MAGENTA = Color( 255, 0, 255, 255 )
+# My own White (raylib logo)
+RAYWHITE = Color( 245, 245, 245, 255 )
+
+# Logging: Redirect trace log messages
+TraceLogCallback = CFUNCTYPE(None, Int, CharPtr, VoidPtr)
+
+# FileIO: Load binary data
+LoadFileDataCallback = CFUNCTYPE(UCharPtr, CharPtr, UIntPtr)
+
+# FileIO: Save binary data
+SaveFileDataCallback = CFUNCTYPE(Bool, CharPtr, VoidPtr, UInt)
+
+# FileIO: Load text data
+LoadFileTextCallback = CFUNCTYPE(CharPtr, CharPtr)
+
+# FileIO: Save text data
+SaveFileTextCallback = CFUNCTYPE(Bool, CharPtr, CharPtr)
+
+_InitWindow = _wrap('InitWindow', [Int, Int, CharPtr], None)
+_WindowShouldClose = _wrap('WindowShouldClose', [], Bool)
+_CloseWindow = _wrap('CloseWindow', [], None)
+_IsWindowReady = _wrap('IsWindowReady', [], Bool)
+_IsWindowFullscreen = _wrap('IsWindowFullscreen', [], Bool)
+_IsWindowHidden = _wrap('IsWindowHidden', [], Bool)
+_IsWindowMinimized = _wrap('IsWindowMinimized', [], Bool)
+_IsWindowMaximized = _wrap('IsWindowMaximized', [], Bool)
+_IsWindowFocused = _wrap('IsWindowFocused', [], Bool)
+_IsWindowResized = _wrap('IsWindowResized', [], Bool)
+_IsWindowState = _wrap('IsWindowState', [UInt], Bool)
+_SetWindowState = _wrap('SetWindowState', [UInt], None)
+_ClearWindowState = _wrap('ClearWindowState', [UInt], None)
+_ToggleFullscreen = _wrap('ToggleFullscreen', [], None)
+_MaximizeWindow = _wrap('MaximizeWindow', [], None)
+_MinimizeWindow = _wrap('MinimizeWindow', [], None)
+_RestoreWindow = _wrap('RestoreWindow', [], None)
+_SetWindowIcon = _wrap('SetWindowIcon', [Image], None)
+_SetWindowTitle = _wrap('SetWindowTitle', [CharPtr], None)
+_SetWindowPosition = _wrap('SetWindowPosition', [Int, Int], None)
+_SetWindowMonitor = _wrap('SetWindowMonitor', [Int], None)
+_SetWindowMinSize = _wrap('SetWindowMinSize', [Int, Int], None)
+_SetWindowSize = _wrap('SetWindowSize', [Int, Int], None)
+_SetWindowOpacity = _wrap('SetWindowOpacity', [Float], None)
+_GetWindowHandle = _wrap('GetWindowHandle', [], VoidPtr)
+_GetScreenWidth = _wrap('GetScreenWidth', [], Int)
+_GetScreenHeight = _wrap('GetScreenHeight', [], Int)
+_GetRenderWidth = _wrap('GetRenderWidth', [], Int)
+_GetRenderHeight = _wrap('GetRenderHeight', [], Int)
+_GetMonitorCount = _wrap('GetMonitorCount', [], Int)
+_GetCurrentMonitor = _wrap('GetCurrentMonitor', [], Int)
+_GetMonitorPosition = _wrap('GetMonitorPosition', [Int], Vector2)
+_GetMonitorWidth = _wrap('GetMonitorWidth', [Int], Int)
+_GetMonitorHeight = _wrap('GetMonitorHeight', [Int], Int)
+_GetMonitorPhysicalWidth = _wrap('GetMonitorPhysicalWidth', [Int], Int)
+_GetMonitorPhysicalHeight = _wrap('GetMonitorPhysicalHeight', [Int], Int)
+_GetMonitorRefreshRate = _wrap('GetMonitorRefreshRate', [Int], Int)
+_GetWindowPosition = _wrap('GetWindowPosition', [], Vector2)
+_GetWindowScaleDPI = _wrap('GetWindowScaleDPI', [], Vector2)
+_GetMonitorName = _wrap('GetMonitorName', [Int], CharPtr)
+_SetClipboardText = _wrap('SetClipboardText', [CharPtr], None)
+_GetClipboardText = _wrap('GetClipboardText', [], CharPtr)
+_EnableEventWaiting = _wrap('EnableEventWaiting', [], None)
+_DisableEventWaiting = _wrap('DisableEventWaiting', [], None)
+_SwapScreenBuffer = _wrap('SwapScreenBuffer', [], None)
+_PollInputEvents = _wrap('PollInputEvents', [], None)
+_WaitTime = _wrap('WaitTime', [Double], None)
+_ShowCursor = _wrap('ShowCursor', [], None)
+_HideCursor = _wrap('HideCursor', [], None)
+_IsCursorHidden = _wrap('IsCursorHidden', [], Bool)
+_EnableCursor = _wrap('EnableCursor', [], None)
+_DisableCursor = _wrap('DisableCursor', [], None)
+_IsCursorOnScreen = _wrap('IsCursorOnScreen', [], Bool)
+_ClearBackground = _wrap('ClearBackground', [Color], None)
+_BeginDrawing = _wrap('BeginDrawing', [], None)
+_EndDrawing = _wrap('EndDrawing', [], None)
+_BeginMode2D = _wrap('BeginMode2D', [Camera2D], None)
+_EndMode2D = _wrap('EndMode2D', [], None)
+_BeginMode3D = _wrap('BeginMode3D', [Camera3D], None)
+_EndMode3D = _wrap('EndMode3D', [], None)
+_BeginTextureMode = _wrap('BeginTextureMode', [RenderTexture2D], None)
+_EndTextureMode = _wrap('EndTextureMode', [], None)
+_BeginShaderMode = _wrap('BeginShaderMode', [Shader], None)
+_EndShaderMode = _wrap('EndShaderMode', [], None)
+_BeginBlendMode = _wrap('BeginBlendMode', [Int], None)
+_EndBlendMode = _wrap('EndBlendMode', [], None)
+_BeginScissorMode = _wrap('BeginScissorMode', [Int, Int, Int, Int], None)
+_EndScissorMode = _wrap('EndScissorMode', [], None)
+_BeginVrStereoMode = _wrap('BeginVrStereoMode', [VrStereoConfig], None)
+_EndVrStereoMode = _wrap('EndVrStereoMode', [], None)
+_LoadVrStereoConfig = _wrap('LoadVrStereoConfig', [VrDeviceInfo], VrStereoConfig)
+_UnloadVrStereoConfig = _wrap('UnloadVrStereoConfig', [VrStereoConfig], None)
+_LoadShader = _wrap('LoadShader', [CharPtr, CharPtr], Shader)
+_LoadShaderFromMemory = _wrap('LoadShaderFromMemory', [CharPtr, CharPtr], Shader)
+_GetShaderLocation = _wrap('GetShaderLocation', [Shader, CharPtr], Int)
+_GetShaderLocationAttrib = _wrap('GetShaderLocationAttrib', [Shader, CharPtr], Int)
+_SetShaderValue = _wrap('SetShaderValue', [Shader, Int, VoidPtr, Int], None)
+_SetShaderValueV = _wrap('SetShaderValueV', [Shader, Int, VoidPtr, Int, Int], None)
+_SetShaderValueMatrix = _wrap('SetShaderValueMatrix', [Shader, Int, Matrix], None)
+_SetShaderValueTexture = _wrap('SetShaderValueTexture', [Shader, Int, Texture2D], None)
+_UnloadShader = _wrap('UnloadShader', [Shader], None)
+_GetMouseRay = _wrap('GetMouseRay', [Vector2, Camera], Ray)
+_GetCameraMatrix = _wrap('GetCameraMatrix', [Camera], Matrix)
+_GetCameraMatrix2D = _wrap('GetCameraMatrix2D', [Camera2D], Matrix)
+_GetWorldToScreen = _wrap('GetWorldToScreen', [Vector3, Camera], Vector2)
+_GetScreenToWorld2D = _wrap('GetScreenToWorld2D', [Vector2, Camera2D], Vector2)
+_GetWorldToScreenEx = _wrap('GetWorldToScreenEx', [Vector3, Camera, Int, Int], Vector2)
+_GetWorldToScreen2D = _wrap('GetWorldToScreen2D', [Vector2, Camera2D], Vector2)
+_SetTargetFPS = _wrap('SetTargetFPS', [Int], None)
+_GetFPS = _wrap('GetFPS', [], Int)
+_GetFrameTime = _wrap('GetFrameTime', [], Float)
+_GetTime = _wrap('GetTime', [], Double)
+_GetRandomValue = _wrap('GetRandomValue', [Int, Int], Int)
+_SetRandomSeed = _wrap('SetRandomSeed', [UInt], None)
+_TakeScreenshot = _wrap('TakeScreenshot', [CharPtr], None)
+_SetConfigFlags = _wrap('SetConfigFlags', [UInt], None)
+_TraceLog = _wrap('TraceLog', [Int, CharPtr, VoidPtr], None)
+_SetTraceLogLevel = _wrap('SetTraceLogLevel', [Int], None)
+_MemAlloc = _wrap('MemAlloc', [Int], VoidPtr)
+_MemRealloc = _wrap('MemRealloc', [VoidPtr, Int], VoidPtr)
+_MemFree = _wrap('MemFree', [VoidPtr], None)
+_OpenURL = _wrap('OpenURL', [CharPtr], None)
+_SetTraceLogCallback = _wrap('SetTraceLogCallback', [TraceLogCallback], None)
+_SetLoadFileDataCallback = _wrap('SetLoadFileDataCallback', [LoadFileDataCallback], None)
+_SetSaveFileDataCallback = _wrap('SetSaveFileDataCallback', [SaveFileDataCallback], None)
+_SetLoadFileTextCallback = _wrap('SetLoadFileTextCallback', [LoadFileTextCallback], None)
+_SetSaveFileTextCallback = _wrap('SetSaveFileTextCallback', [SaveFileTextCallback], None)
+_LoadFileData = _wrap('LoadFileData', [CharPtr, UIntPtr], UCharPtr)
+_UnloadFileData = _wrap('UnloadFileData', [UCharPtr], None)
+_SaveFileData = _wrap('SaveFileData', [CharPtr, VoidPtr, UInt], Bool)
+_ExportDataAsCode = _wrap('ExportDataAsCode', [CharPtr, UInt, CharPtr], Bool)
+_LoadFileText = _wrap('LoadFileText', [CharPtr], CharPtr)
+_UnloadFileText = _wrap('UnloadFileText', [CharPtr], None)
+_SaveFileText = _wrap('SaveFileText', [CharPtr, CharPtr], Bool)
+_FileExists = _wrap('FileExists', [CharPtr], Bool)
+_DirectoryExists = _wrap('DirectoryExists', [CharPtr], Bool)
+_IsFileExtension = _wrap('IsFileExtension', [CharPtr, CharPtr], Bool)
+_GetFileLength = _wrap('GetFileLength', [CharPtr], Int)
+_GetFileExtension = _wrap('GetFileExtension', [CharPtr], CharPtr)
+_GetFileName = _wrap('GetFileName', [CharPtr], CharPtr)
+_GetFileNameWithoutExt = _wrap('GetFileNameWithoutExt', [CharPtr], CharPtr)
+_GetDirectoryPath = _wrap('GetDirectoryPath', [CharPtr], CharPtr)
+_GetPrevDirectoryPath = _wrap('GetPrevDirectoryPath', [CharPtr], CharPtr)
+_GetWorkingDirectory = _wrap('GetWorkingDirectory', [], CharPtr)
+_GetApplicationDirectory = _wrap('GetApplicationDirectory', [], CharPtr)
+_ChangeDirectory = _wrap('ChangeDirectory', [CharPtr], Bool)
+_IsPathFile = _wrap('IsPathFile', [CharPtr], Bool)
+_LoadDirectoryFiles = _wrap('LoadDirectoryFiles', [CharPtr], FilePathList)
+_LoadDirectoryFilesEx = _wrap('LoadDirectoryFilesEx', [CharPtr, CharPtr, Bool], FilePathList)
+_UnloadDirectoryFiles = _wrap('UnloadDirectoryFiles', [FilePathList], None)
+_IsFileDropped = _wrap('IsFileDropped', [], Bool)
+_LoadDroppedFiles = _wrap('LoadDroppedFiles', [], FilePathList)
+_UnloadDroppedFiles = _wrap('UnloadDroppedFiles', [FilePathList], None)
+_GetFileModTime = _wrap('GetFileModTime', [CharPtr], Long)
+_CompressData = _wrap('CompressData', [UCharPtr, Int, IntPtr], UCharPtr)
+_DecompressData = _wrap('DecompressData', [UCharPtr, Int, IntPtr], UCharPtr)
+_EncodeDataBase64 = _wrap('EncodeDataBase64', [UCharPtr, Int, IntPtr], CharPtr)
+_DecodeDataBase64 = _wrap('DecodeDataBase64', [UCharPtr, IntPtr], UCharPtr)
+_IsKeyPressed = _wrap('IsKeyPressed', [Int], Bool)
+_IsKeyDown = _wrap('IsKeyDown', [Int], Bool)
+_IsKeyReleased = _wrap('IsKeyReleased', [Int], Bool)
+_IsKeyUp = _wrap('IsKeyUp', [Int], Bool)
+_SetExitKey = _wrap('SetExitKey', [Int], None)
+_GetKeyPressed = _wrap('GetKeyPressed', [], Int)
+_GetCharPressed = _wrap('GetCharPressed', [], Int)
+_IsGamepadAvailable = _wrap('IsGamepadAvailable', [Int], Bool)
+_GetGamepadName = _wrap('GetGamepadName', [Int], CharPtr)
+_IsGamepadButtonPressed = _wrap('IsGamepadButtonPressed', [Int, Int], Bool)
+_IsGamepadButtonDown = _wrap('IsGamepadButtonDown', [Int, Int], Bool)
+_IsGamepadButtonReleased = _wrap('IsGamepadButtonReleased', [Int, Int], Bool)
+_IsGamepadButtonUp = _wrap('IsGamepadButtonUp', [Int, Int], Bool)
+_GetGamepadButtonPressed = _wrap('GetGamepadButtonPressed', [], Int)
+_GetGamepadAxisCount = _wrap('GetGamepadAxisCount', [Int], Int)
+_GetGamepadAxisMovement = _wrap('GetGamepadAxisMovement', [Int, Int], Float)
+_SetGamepadMappings = _wrap('SetGamepadMappings', [CharPtr], Int)
+_IsMouseButtonPressed = _wrap('IsMouseButtonPressed', [Int], Bool)
+_IsMouseButtonDown = _wrap('IsMouseButtonDown', [Int], Bool)
+_IsMouseButtonReleased = _wrap('IsMouseButtonReleased', [Int], Bool)
+_IsMouseButtonUp = _wrap('IsMouseButtonUp', [Int], Bool)
+_GetMouseX = _wrap('GetMouseX', [], Int)
+_GetMouseY = _wrap('GetMouseY', [], Int)
+_GetMousePosition = _wrap('GetMousePosition', [], Vector2)
+_GetMouseDelta = _wrap('GetMouseDelta', [], Vector2)
+_SetMousePosition = _wrap('SetMousePosition', [Int, Int], None)
+_SetMouseOffset = _wrap('SetMouseOffset', [Int, Int], None)
+_SetMouseScale = _wrap('SetMouseScale', [Float, Float], None)
+_GetMouseWheelMove = _wrap('GetMouseWheelMove', [], Float)
+_GetMouseWheelMoveV = _wrap('GetMouseWheelMoveV', [], Vector2)
+_SetMouseCursor = _wrap('SetMouseCursor', [Int], None)
+_GetTouchX = _wrap('GetTouchX', [], Int)
+_GetTouchY = _wrap('GetTouchY', [], Int)
+_GetTouchPosition = _wrap('GetTouchPosition', [Int], Vector2)
+_GetTouchPointId = _wrap('GetTouchPointId', [Int], Int)
+_GetTouchPointCount = _wrap('GetTouchPointCount', [], Int)
+_SetGesturesEnabled = _wrap('SetGesturesEnabled', [UInt], None)
+_IsGestureDetected = _wrap('IsGestureDetected', [Int], Bool)
+_GetGestureDetected = _wrap('GetGestureDetected', [], Int)
+_GetGestureHoldDuration = _wrap('GetGestureHoldDuration', [], Float)
+_GetGestureDragVector = _wrap('GetGestureDragVector', [], Vector2)
+_GetGestureDragAngle = _wrap('GetGestureDragAngle', [], Float)
+_GetGesturePinchVector = _wrap('GetGesturePinchVector', [], Vector2)
+_GetGesturePinchAngle = _wrap('GetGesturePinchAngle', [], Float)
+_SetCameraMode = _wrap('SetCameraMode', [Camera, Int], None)
+_UpdateCamera = _wrap('UpdateCamera', [CameraPtr], None)
+_SetCameraPanControl = _wrap('SetCameraPanControl', [Int], None)
+_SetCameraAltControl = _wrap('SetCameraAltControl', [Int], None)
+_SetCameraSmoothZoomControl = _wrap('SetCameraSmoothZoomControl', [Int], None)
+_SetCameraMoveControls = _wrap('SetCameraMoveControls', [Int, Int, Int, Int, Int, Int], None)
+
+def init_window(width: 'int', height: 'int', title: 'Union[str, CharPtr]') -> 'None':
+    """Initialize window and OpenGL context"""
+    _InitWindow(int(width), int(height), _str_in(title))
+
+def window_should_close() -> 'bool':
+    """Check if KEY_ESCAPE pressed or Close icon pressed"""
+    result = _WindowShouldClose()
+    return result
+
+def close_window() -> 'None':
+    """Close window and unload OpenGL context"""
+    _CloseWindow()
+
+def is_window_ready() -> 'bool':
+    """Check if window has been initialized successfully"""
+    result = _IsWindowReady()
+    return result
+
+def is_window_fullscreen() -> 'bool':
+    """Check if window is currently fullscreen"""
+    result = _IsWindowFullscreen()
+    return result
+
+def is_window_hidden() -> 'bool':
+    """Check if window is currently hidden (only PLATFORM_DESKTOP)"""
+    result = _IsWindowHidden()
+    return result
+
+def is_window_minimized() -> 'bool':
+    """Check if window is currently minimized (only PLATFORM_DESKTOP)"""
+    result = _IsWindowMinimized()
+    return result
+
+def is_window_maximized() -> 'bool':
+    """Check if window is currently maximized (only PLATFORM_DESKTOP)"""
+    result = _IsWindowMaximized()
+    return result
+
+def is_window_focused() -> 'bool':
+    """Check if window is currently focused (only PLATFORM_DESKTOP)"""
+    result = _IsWindowFocused()
+    return result
+
+def is_window_resized() -> 'bool':
+    """Check if window has been resized last frame"""
+    result = _IsWindowResized()
+    return result
+
+def is_window_state(flag: 'int') -> 'bool':
+    """Check if one specific window flag is enabled"""
+    result = _IsWindowState(flag)
+    return result
+
+def set_window_state(flags: 'int') -> 'None':
+    """Set window configuration state using flags (only PLATFORM_DESKTOP)"""
+    _SetWindowState(flags)
+
+def clear_window_state(flags: 'int') -> 'None':
+    """Clear window configuration state flags"""
+    _ClearWindowState(flags)
+
+def toggle_fullscreen() -> 'None':
+    """Toggle window state: fullscreen/windowed (only PLATFORM_DESKTOP)"""
+    _ToggleFullscreen()
+
+def maximize_window() -> 'None':
+    """Set window state: maximized, if resizable (only PLATFORM_DESKTOP)"""
+    _MaximizeWindow()
+
+def minimize_window() -> 'None':
+    """Set window state: minimized, if resizable (only PLATFORM_DESKTOP)"""
+    _MinimizeWindow()
+
+def restore_window() -> 'None':
+    """Set window state: not minimized/maximized (only PLATFORM_DESKTOP)"""
+    _RestoreWindow()
+
+def set_window_icon(image: 'Image') -> 'None':
+    """Set icon for window (only PLATFORM_DESKTOP)"""
+    _SetWindowIcon(image)
+
+def set_window_title(title: 'Union[str, CharPtr]') -> 'None':
+    """Set title for window (only PLATFORM_DESKTOP)"""
+    _SetWindowTitle(_str_in(title))
+
+def set_window_position(x: 'int', y: 'int') -> 'None':
+    """Set window position on screen (only PLATFORM_DESKTOP)"""
+    _SetWindowPosition(int(x), int(y))
+
+def set_window_monitor(monitor: 'int') -> 'None':
+    """Set monitor for the current window (fullscreen mode)"""
+    _SetWindowMonitor(int(monitor))
+
+def set_window_min_size(width: 'int', height: 'int') -> 'None':
+    """Set window minimum dimensions (for FLAG_WINDOW_RESIZABLE)"""
+    _SetWindowMinSize(int(width), int(height))
+
+def set_window_size(width: 'int', height: 'int') -> 'None':
+    """Set window dimensions"""
+    _SetWindowSize(int(width), int(height))
+
+def set_window_opacity(opacity: 'float') -> 'None':
+    """Set window opacity [0.0f..1.0f] (only PLATFORM_DESKTOP)"""
+    _SetWindowOpacity(float(opacity))
+
+def get_window_handle() -> 'bytes':
+    """Get native window handle"""
+    _GetWindowHandle()
+
+def get_screen_width() -> 'int':
+    """Get current screen width"""
+    result = _GetScreenWidth()
+    return result
+
+def get_screen_height() -> 'int':
+    """Get current screen height"""
+    result = _GetScreenHeight()
+    return result
+
+def get_render_width() -> 'int':
+    """Get current render width (it considers HiDPI)"""
+    result = _GetRenderWidth()
+    return result
+
+def get_render_height() -> 'int':
+    """Get current render height (it considers HiDPI)"""
+    result = _GetRenderHeight()
+    return result
+
+def get_monitor_count() -> 'int':
+    """Get number of connected monitors"""
+    result = _GetMonitorCount()
+    return result
+
+def get_current_monitor() -> 'int':
+    """Get current connected monitor"""
+    result = _GetCurrentMonitor()
+    return result
+
+def get_monitor_position(monitor: 'int') -> 'Vector2':
+    """Get specified monitor position"""
+    result = _GetMonitorPosition(int(monitor))
+    return result
+
+def get_monitor_width(monitor: 'int') -> 'int':
+    """Get specified monitor width (current video mode used by monitor)"""
+    result = _GetMonitorWidth(int(monitor))
+    return result
+
+def get_monitor_height(monitor: 'int') -> 'int':
+    """Get specified monitor height (current video mode used by monitor)"""
+    result = _GetMonitorHeight(int(monitor))
+    return result
+
+def get_monitor_physical_width(monitor: 'int') -> 'int':
+    """Get specified monitor physical width in millimetres"""
+    result = _GetMonitorPhysicalWidth(int(monitor))
+    return result
+
+def get_monitor_physical_height(monitor: 'int') -> 'int':
+    """Get specified monitor physical height in millimetres"""
+    result = _GetMonitorPhysicalHeight(int(monitor))
+    return result
+
+def get_monitor_refresh_rate(monitor: 'int') -> 'int':
+    """Get specified monitor refresh rate"""
+    result = _GetMonitorRefreshRate(int(monitor))
+    return result
+
+def get_window_position() -> 'Vector2':
+    """Get window position XY on monitor"""
+    result = _GetWindowPosition()
+    return result
+
+def get_window_scale_dpi() -> 'Vector2':
+    """Get window scale DPI factor"""
+    result = _GetWindowScaleDPI()
+    return result
+
+def get_monitor_name(monitor: 'int') -> 'Union[str, CharPtr]':
+    """Get the human-readable, UTF-8 encoded name of the primary monitor"""
+    result = _ptr_out(_GetMonitorName(int(monitor)))
+    return result
+
+def set_clipboard_text(text: 'Union[str, CharPtr]') -> 'None':
+    """Set clipboard text content"""
+    _SetClipboardText(_str_in(text))
+
+def get_clipboard_text() -> 'Union[str, CharPtr]':
+    """Get clipboard text content"""
+    result = _ptr_out(_GetClipboardText())
+    return result
+
+def enable_event_waiting() -> 'None':
+    """Enable waiting for events on EndDrawing(), no automatic event polling"""
+    _EnableEventWaiting()
+
+def disable_event_waiting() -> 'None':
+    """Disable waiting for events on EndDrawing(), automatic events polling"""
+    _DisableEventWaiting()
+
+def swap_screen_buffer() -> 'None':
+    """Swap back buffer with front buffer (screen drawing)"""
+    _SwapScreenBuffer()
+
+def poll_input_events() -> 'None':
+    """Register all input events"""
+    _PollInputEvents()
+
+def wait_time(seconds: 'float') -> 'None':
+    """Wait for some time (halt program execution)"""
+    _WaitTime(float(seconds))
+
+def show_cursor() -> 'None':
+    """Shows cursor"""
+    _ShowCursor()
+
+def hide_cursor() -> 'None':
+    """Hides cursor"""
+    _HideCursor()
+
+def is_cursor_hidden() -> 'bool':
+    """Check if cursor is not visible"""
+    result = _IsCursorHidden()
+    return result
+
+def enable_cursor() -> 'None':
+    """Enables cursor (unlock cursor)"""
+    _EnableCursor()
+
+def disable_cursor() -> 'None':
+    """Disables cursor (lock cursor)"""
+    _DisableCursor()
+
+def is_cursor_on_screen() -> 'bool':
+    """Check if cursor is on the screen"""
+    result = _IsCursorOnScreen()
+    return result
+
+def clear_background(color: 'Color') -> 'None':
+    """Set background color (framebuffer clear color)"""
+    _ClearBackground(_color(color))
+
+def begin_drawing() -> 'None':
+    """Setup canvas (framebuffer) to start drawing"""
+    render_state.begin_frame()
+    _BeginDrawing()
+
+def end_drawing() -> 'None':
+    """End canvas drawing and swap buffers (double buffering)"""
+    for hook in _END_OF_FRAME:
+        hook()
+    _EndDrawing()
+    render_state.end_frame()
+
+def begin_mode2d(camera: 'Camera2D') -> 'None':
+    """Begin 2D mode with custom camera (2D)"""
+    _BeginMode2D(camera)
+
+def end_mode2d() -> 'None':
+    """Ends 2D mode with custom camera"""
+    _EndMode2D()
+
+def begin_mode3d(camera: 'Camera3D') -> 'None':
+    """Begin 3D mode with custom camera (3D)"""
+    _BeginMode3D(camera)
+
+def end_mode3d() -> 'None':
+    """Ends 3D mode and returns to default 2D orthographic mode"""
+    _EndMode3D()
+
+def begin_texture_mode(target: 'RenderTexture2D') -> 'None':
+    """Begin drawing to render texture"""
+    _BeginTextureMode(target)
+
+def end_texture_mode() -> 'None':
+    """Ends drawing to render texture"""
+    _EndTextureMode()
+
+def begin_shader_mode(shader: 'Shader') -> 'None':
+    """Begin custom shader drawing"""
+    _BeginShaderMode(shader)
+
+def end_shader_mode() -> 'None':
+    """End custom shader drawing (use default shader)"""
+    _EndShaderMode()
+
+def begin_blend_mode(mode: 'int') -> 'None':
+    """Begin blending mode (alpha, additive, multiplied, subtract, custom)"""
+    _BeginBlendMode(int(mode))
+
+def end_blend_mode() -> 'None':
+    """End blending mode (reset to default: alpha blending)"""
+    _EndBlendMode()
+
+def begin_scissor_mode(x: 'int', y: 'int', width: 'int', height: 'int') -> 'None':
+    """Begin scissor mode (define screen area for following drawing)"""
+    _BeginScissorMode(int(x), int(y), int(width), int(height))
+
+def end_scissor_mode() -> 'None':
+    """End scissor mode"""
+    _EndScissorMode()
+
+def begin_vr_stereo_mode(config: 'VrStereoConfig') -> 'None':
+    """Begin stereo rendering (requires VR simulator)"""
+    _BeginVrStereoMode(config)
+
+def end_vr_stereo_mode() -> 'None':
+    """End stereo rendering (requires VR simulator)"""
+    _EndVrStereoMode()
+
+def load_vr_stereo_config(device: 'VrDeviceInfo') -> 'VrStereoConfig':
+    """Load VR stereo config for VR simulator device parameters"""
+    result = _LoadVrStereoConfig(device)
+    return result
+
+def unload_vr_stereo_config(config: 'VrStereoConfig') -> 'None':
+    """Unload VR stereo config"""
+    _UnloadVrStereoConfig(config)
+
+def load_shader(vs_file_name: 'Union[str, CharPtr]', fs_file_name: 'Union[str, CharPtr]') -> 'Shader':
+    """Load shader from files and bind default locations"""
+    result = _LoadShader(_str_in(vs_file_name), _str_in(fs_file_name))
+    return result
+
+def load_shader_from_memory(vs_code: 'Union[str, CharPtr]', fs_code: 'Union[str, CharPtr]') -> 'Shader':
+    """Load shader from code strings and bind default locations"""
+    result = _LoadShaderFromMemory(_str_in(vs_code), _str_in(fs_code))
+    return result
+
+def get_shader_location(shader: 'Shader', uniform_name: 'Union[str, CharPtr]') -> 'int':
+    """Get shader uniform location"""
+    result = _GetShaderLocation(shader, _str_in(uniform_name))
+    return result
+
+def get_shader_location_attrib(shader: 'Shader', attrib_name: 'Union[str, CharPtr]') -> 'int':
+    """Get shader attribute location"""
+    result = _GetShaderLocationAttrib(shader, _str_in(attrib_name))
+    return result
+
+def set_shader_value(shader: 'Shader', loc_index: 'int', value: 'bytes', uniform_type: 'int') -> 'None':
+    """Set shader uniform value"""
+    _SetShaderValue(shader, int(loc_index), value, int(uniform_type))
+
+def set_shader_value_v(shader: 'Shader', loc_index: 'int', value: 'bytes', uniform_type: 'int', count: 'int') -> 'None':
+    """Set shader uniform value vector"""
+    _SetShaderValueV(shader, int(loc_index), value, int(uniform_type), int(count))
+
+def set_shader_value_matrix(shader: 'Shader', loc_index: 'int', mat: 'Matrix') -> 'None':
+    """Set shader uniform value (matrix 4x4)"""
+    _SetShaderValueMatrix(shader, int(loc_index), mat)
+
+def set_shader_value_texture(shader: 'Shader', loc_index: 'int', texture: 'Texture2D') -> 'None':
+    """Set shader uniform value for texture (sampler2d)"""
+    _SetShaderValueTexture(shader, int(loc_index), texture)
+
+def unload_shader(shader: 'Shader') -> 'None':
+    """Unload shader from GPU memory (VRAM)"""
+    _UnloadShader(shader)
+
+def get_mouse_ray(mouse_position: 'Vector2', camera: 'Camera') -> 'Ray':
+    """Get a ray trace from mouse position"""
+    result = _GetMouseRay(_vec2(mouse_position), camera)
+    return result
+
+def get_camera_matrix(camera: 'Camera') -> 'Matrix':
+    """Get camera transform matrix (view matrix)"""
+    result = _GetCameraMatrix(camera)
+    return result
+
+def get_camera_matrix2d(camera: 'Camera2D') -> 'Matrix':
+    """Get camera 2d transform matrix"""
+    result = _GetCameraMatrix2D(camera)
+    return result
+
+def get_world_to_screen(position: 'Vector3', camera: 'Camera') -> 'Vector2':
+    """Get the screen space position for a 3d world space position"""
+    result = _GetWorldToScreen(_vec3(position), camera)
+    return result
+
+def get_screen_to_world2d(position: 'Vector2', camera: 'Camera2D') -> 'Vector2':
+    """Get the world space position for a 2d camera screen space position"""
+    result = _GetScreenToWorld2D(_vec2(position), camera)
+    return result
+
+def get_world_to_screen_ex(position: 'Vector3', camera: 'Camera', width: 'int', height: 'int') -> 'Vector2':
+    """Get size position for a 3d world space position"""
+    result = _GetWorldToScreenEx(_vec3(position), camera, int(width), int(height))
+    return result
+
+def get_world_to_screen2d(position: 'Vector2', camera: 'Camera2D') -> 'Vector2':
+    """Get the screen space position for a 2d camera world space position"""
+    result = _GetWorldToScreen2D(_vec2(position), camera)
+    return result
+
+def set_target_fps(fps: 'int') -> 'None':
+    """Set target FPS (maximum)"""
+    _SetTargetFPS(int(fps))
+
+def get_fps() -> 'int':
+    """Get current FPS"""
+    result = _GetFPS()
+    return result
+
+def get_frame_time() -> 'float':
+    """Get time in seconds for last frame drawn (delta time)"""
+    result = _GetFrameTime()
+    return result
+
+def get_time() -> 'float':
+    """Get elapsed time in seconds since InitWindow()"""
+    result = _GetTime()
+    return result
+
+def get_random_value(min: 'int', max: 'int') -> 'int':
+    """Get a random value between min and max (both included)"""
+    result = _GetRandomValue(int(min), int(max))
+    return result
+
+def set_random_seed(seed: 'int') -> 'None':
+    """Set the seed for the random number generator"""
+    _SetRandomSeed(seed)
+
+def take_screenshot(file_name: 'Union[str, CharPtr]') -> 'None':
+    """Takes a screenshot of current screen (filename extension defines format)"""
+    _TakeScreenshot(_str_in(file_name))
+
+def set_config_flags(flags: 'int') -> 'None':
+    """Setup init configuration flags (view FLAGS)"""
+    _SetConfigFlags(flags)
+
+def trace_log(log_level: 'int', text: 'Union[str, CharPtr]', args: 'bytes') -> 'None':
+    """Show trace log messages (LOG_DEBUG, LOG_INFO, LOG_WARNING, LOG_ERROR...)"""
+    _TraceLog(int(log_level), _str_in(text), args)
+
+def set_trace_log_level(log_level: 'int') -> 'None':
+    """Set the current threshold (minimum) log level"""
+    _SetTraceLogLevel(int(log_level))
+
+def mem_alloc(size: 'int') -> 'bytes':
+    """Internal memory allocator"""
+    _MemAlloc(int(size))
+
+def mem_realloc(ptr: 'bytes', size: 'int') -> 'bytes':
+    """Internal memory reallocator"""
+    _MemRealloc(ptr, int(size))
+
+def mem_free(ptr: 'bytes') -> 'None':
+    """Internal memory free"""
+    _MemFree(ptr)
+
+def open_url(url: 'Union[str, CharPtr]') -> 'None':
+    """Open URL with default system browser (if available)"""
+    _OpenURL(_str_in(url))
+
+def set_trace_log_callback(callback: 'TraceLogCallback') -> 'None':
+    """Set custom trace log"""
+    _SetTraceLogCallback(callback)
+
+def set_load_file_data_callback(callback: 'LoadFileDataCallback') -> 'None':
+    """Set custom file binary data loader"""
+    _SetLoadFileDataCallback(callback)
+
+def set_save_file_data_callback(callback: 'SaveFileDataCallback') -> 'None':
+    """Set custom file binary data saver"""
+    _SetSaveFileDataCallback(callback)
+
+def set_load_file_text_callback(callback: 'LoadFileTextCallback') -> 'None':
+    """Set custom file text data loader"""
+    _SetLoadFileTextCallback(callback)
+
+def set_save_file_text_callback(callback: 'SaveFileTextCallback') -> 'None':
+    """Set custom file text data saver"""
+    _SetSaveFileTextCallback(callback)
+
+def load_file_data(file_name: 'Union[str, CharPtr]', bytes_read: 'Union[Seq[int], UIntPtr]') -> 'Union[Seq[int], UCharPtr]':
+    """Load file data as byte array (read)"""
+    result = _ptr_out(_LoadFileData(_str_in(file_name), bytes_read))
+    return result
+
+def unload_file_data(data: 'Union[Seq[int], UCharPtr]') -> 'None':
+    """Unload file data allocated by LoadFileData()"""
+    _UnloadFileData(_str_in(data))
+
+def save_file_data(file_name: 'Union[str, CharPtr]', data: 'bytes', bytes_to_write: 'int') -> 'bool':
+    """Save data to file from byte array (write), returns true on success"""
+    result = _SaveFileData(_str_in(file_name), data, bytes_to_write)
+    return result
+
+def export_data_as_code(data: 'Union[str, CharPtr]', size: 'int', file_name: 'Union[str, CharPtr]') -> 'bool':
+    """Export data to code (.h), returns true on success"""
+    result = _ExportDataAsCode(_str_in(data), size, _str_in(file_name))
+    return result
+
+def load_file_text(file_name: 'Union[str, CharPtr]') -> 'Union[str, CharPtr]':
+    """Load text data from file (read), returns a '\0' terminated string"""
+    result = _ptr_out(_LoadFileText(_str_in(file_name)))
+    return result
+
+def unload_file_text(text: 'Union[str, CharPtr]') -> 'None':
+    """Unload file text data allocated by LoadFileText()"""
+    _UnloadFileText(_str_in(text))
+
+def save_file_text(file_name: 'Union[str, CharPtr]', text: 'Union[str, CharPtr]') -> 'bool':
+    """Save text data to file (write), string must be '\0' terminated, returns true on success"""
+    result = _SaveFileText(_str_in(file_name), _str_in(text))
+    return result
+
+def file_exists(file_name: 'Union[str, CharPtr]') -> 'bool':
+    """Check if file exists"""
+    result = _FileExists(_str_in(file_name))
+    return result
+
+def directory_exists(dir_path: 'Union[str, CharPtr]') -> 'bool':
+    """Check if a directory path exists"""
+    result = _DirectoryExists(_str_in(dir_path))
+    return result
+
+def is_file_extension(file_name: 'Union[str, CharPtr]', ext: 'Union[str, CharPtr]') -> 'bool':
+    """Check file extension (including point: .png, .wav)"""
+    result = _IsFileExtension(_str_in(file_name), _str_in(ext))
+    return result
+
+def get_file_length(file_name: 'Union[str, CharPtr]') -> 'int':
+    """Get file length in bytes (NOTE: GetFileSize() conflicts with windows.h)"""
+    result = _GetFileLength(_str_in(file_name))
+    return result
+
+def get_file_extension(file_name: 'Union[str, CharPtr]') -> 'Union[str, CharPtr]':
+    """Get pointer to extension for a filename string (includes dot: '.png')"""
+    result = _ptr_out(_GetFileExtension(_str_in(file_name)))
+    return result
+
+def get_file_name(file_path: 'Union[str, CharPtr]') -> 'Union[str, CharPtr]':
+    """Get pointer to filename for a path string"""
+    result = _ptr_out(_GetFileName(_str_in(file_path)))
+    return result
+
+def get_file_name_without_ext(file_path: 'Union[str, CharPtr]') -> 'Union[str, CharPtr]':
+    """Get filename string without extension (uses static string)"""
+    result = _ptr_out(_GetFileNameWithoutExt(_str_in(file_path)))
+    return result
+
+def get_directory_path(file_path: 'Union[str, CharPtr]') -> 'Union[str, CharPtr]':
+    """Get full path for a given fileName with path (uses static string)"""
+    result = _ptr_out(_GetDirectoryPath(_str_in(file_path)))
+    return result
+
+def get_prev_directory_path(dir_path: 'Union[str, CharPtr]') -> 'Union[str, CharPtr]':
+    """Get previous directory path for a given path (uses static string)"""
+    result = _ptr_out(_GetPrevDirectoryPath(_str_in(dir_path)))
+    return result
+
+def get_working_directory() -> 'Union[str, CharPtr]':
+    """Get current working directory (uses static string)"""
+    result = _ptr_out(_GetWorkingDirectory())
+    return result
+
+def get_application_directory() -> 'Union[str, CharPtr]':
+    """Get the directory if the running application (uses static string)"""
+    result = _ptr_out(_GetApplicationDirectory())
+    return result
+
+def change_directory(dir: 'Union[str, CharPtr]') -> 'bool':
+    """Change working directory, return true on success"""
+    result = _ChangeDirectory(_str_in(dir))
+    return result
+
+def is_path_file(path: 'Union[str, CharPtr]') -> 'bool':
+    """Check if a given path is a file or a directory"""
+    result = _IsPathFile(_str_in(path))
+    return result
+
+def load_directory_files(dir_path: 'Union[str, CharPtr]') -> 'FilePathList':
+    """Load directory filepaths"""
+    result = _LoadDirectoryFiles(_str_in(dir_path))
+    return result
+
+def load_directory_files_ex(base_path: 'Union[str, CharPtr]', filter: 'Union[str, CharPtr]', scan_subdirs: 'bool') -> 'FilePathList':
+    """Load directory filepaths with extension filtering and recursive directory scan"""
+    result = _LoadDirectoryFilesEx(_str_in(base_path), _str_in(filter), bool(scan_subdirs))
+    return result
+
+def unload_directory_files(files: 'FilePathList') -> 'None':
+    """Unload filepaths"""
+    _UnloadDirectoryFiles(files)
+
+def is_file_dropped() -> 'bool':
+    """Check if a file has been dropped into window"""
+    result = _IsFileDropped()
+    return result
+
+def load_dropped_files() -> 'FilePathList':
+    """Load dropped filepaths"""
+    result = _LoadDroppedFiles()
+    return result
+
+def unload_dropped_files(files: 'FilePathList') -> 'None':
+    """Unload dropped filepaths"""
+    _UnloadDroppedFiles(files)
+
+def get_file_mod_time(file_name: 'Union[str, CharPtr]') -> 'int':
+    """Get file modification time (last write time)"""
+    result = _GetFileModTime(_str_in(file_name))
+    return result
+
+def compress_data(data: 'Union[Seq[int], UCharPtr]', data_size: 'int', comp_data_size: 'Union[Seq[int], IntPtr]') -> 'Union[Seq[int], UCharPtr]':
+    """Compress data (DEFLATE algorithm), memory must be MemFree()"""
+    result = _ptr_out(_CompressData(_str_in(data), int(data_size), comp_data_size))
+    return result
+
+def decompress_data(comp_data: 'Union[Seq[int], UCharPtr]', comp_data_size: 'int', data_size: 'Union[Seq[int], IntPtr]') -> 'Union[Seq[int], UCharPtr]':
+    """Decompress data (DEFLATE algorithm), memory must be MemFree()"""
+    result = _ptr_out(_DecompressData(_str_in(comp_data), int(comp_data_size), data_size))
+    return result
+
+def encode_data_base64(data: 'Union[Seq[int], UCharPtr]', data_size: 'int', output_size: 'Union[Seq[int], IntPtr]') -> 'Union[str, CharPtr]':
+    """Encode data to Base64 string, memory must be MemFree()"""
+    result = _ptr_out(_EncodeDataBase64(_str_in(data), int(data_size), output_size))
+    return result
+
+def decode_data_base64(data: 'Union[Seq[int], UCharPtr]', output_size: 'Union[Seq[int], IntPtr]') -> 'Union[Seq[int], UCharPtr]':
+    """Decode Base64 string data, memory must be MemFree()"""
+    result = _ptr_out(_DecodeDataBase64(_str_in(data), output_size))
+    return result
+
+def is_key_pressed(key: 'int') -> 'bool':
+    """Check if a key has been pressed once"""
+    result = _IsKeyPressed(int(key))
+    return result
+
+def is_key_down(key: 'int') -> 'bool':
+    """Check if a key is being pressed"""
+    result = _IsKeyDown(int(key))
+    return result
+
+def is_key_released(key: 'int') -> 'bool':
+    """Check if a key has been released once"""
+    result = _IsKeyReleased(int(key))
+    return result
+
+def is_key_up(key: 'int') -> 'bool':
+    """Check if a key is NOT being pressed"""
+    result = _IsKeyUp(int(key))
+    return result
+
+def set_exit_key(key: 'int') -> 'None':
+    """Set a custom key to exit program (default is ESC)"""
+    _SetExitKey(int(key))
+
+def get_key_pressed() -> 'int':
+    """Get key pressed (keycode), call it multiple times for keys queued, returns 0 when the queue is empty"""
+    result = _GetKeyPressed()
+    return result
+
+def get_char_pressed() -> 'int':
+    """Get char pressed (unicode), call it multiple times for chars queued, returns 0 when the queue is empty"""
+    result = _GetCharPressed()
+    return result
+
+def is_gamepad_available(gamepad: 'int') -> 'bool':
+    """Check if a gamepad is available"""
+    result = _IsGamepadAvailable(int(gamepad))
+    return result
+
+def get_gamepad_name(gamepad: 'int') -> 'Union[str, CharPtr]':
+    """Get gamepad internal name id"""
+    result = _ptr_out(_GetGamepadName(int(gamepad)))
+    return result
+
+def is_gamepad_button_pressed(gamepad: 'int', button: 'int') -> 'bool':
+    """Check if a gamepad button has been pressed once"""
+    result = _IsGamepadButtonPressed(int(gamepad), int(button))
+    return result
+
+def is_gamepad_button_down(gamepad: 'int', button: 'int') -> 'bool':
+    """Check if a gamepad button is being pressed"""
+    result = _IsGamepadButtonDown(int(gamepad), int(button))
+    return result
+
+def is_gamepad_button_released(gamepad: 'int', button: 'int') -> 'bool':
+    """Check if a gamepad button has been released once"""
+    result = _IsGamepadButtonReleased(int(gamepad), int(button))
+    return result
+
+def is_gamepad_button_up(gamepad: 'int', button: 'int') -> 'bool':
+    """Check if a gamepad button is NOT being pressed"""
+    result = _IsGamepadButtonUp(int(gamepad), int(button))
+    return result
+
+def get_gamepad_button_pressed() -> 'int':
+    """Get the last gamepad button pressed"""
+    result = _GetGamepadButtonPressed()
+    return result
+
+def get_gamepad_axis_count(gamepad: 'int') -> 'int':
+    """Get gamepad axis count for a gamepad"""
+    result = _GetGamepadAxisCount(int(gamepad))
+    return result
+
+def get_gamepad_axis_movement(gamepad: 'int', axis: 'int') -> 'float':
+    """Get axis movement value for a gamepad axis"""
+    result = _GetGamepadAxisMovement(int(gamepad), int(axis))
+    return result
+
+def set_gamepad_mappings(mappings: 'Union[str, CharPtr]') -> 'int':
+    """Set internal gamepad mappings (SDL_GameControllerDB)"""
+    result = _SetGamepadMappings(_str_in(mappings))
+    return result
+
+def is_mouse_button_pressed(button: 'int') -> 'bool':
+    """Check if a mouse button has been pressed once"""
+    result = _IsMouseButtonPressed(int(button))
+    return result
+
+def is_mouse_button_down(button: 'int') -> 'bool':
+    """Check if a mouse button is being pressed"""
+    result = _IsMouseButtonDown(int(button))
+    return result
+
+def is_mouse_button_released(button: 'int') -> 'bool':
+    """Check if a mouse button has been released once"""
+    result = _IsMouseButtonReleased(int(button))
+    return result
+
+def is_mouse_button_up(button: 'int') -> 'bool':
+    """Check if a mouse button is NOT being pressed"""
+    result = _IsMouseButtonUp(int(button))
+    return result
+
+def get_mouse_x() -> 'int':
+    """Get mouse position X"""
+    result = _GetMouseX()
+    return result
+
+def get_mouse_y() -> 'int':
+    """Get mouse position Y"""
+    result = _GetMouseY()
+    return result
+
+def get_mouse_position() -> 'Vector2':
+    """Get mouse position XY"""
+    result = _GetMousePosition()
+    return result
+
+def get_mouse_delta() -> 'Vector2':
+    """Get mouse delta between frames"""
+    result = _GetMouseDelta()
+    return result
+
+def set_mouse_position(x: 'int', y: 'int') -> 'None':
+    """Set mouse position XY"""
+    _SetMousePosition(int(x), int(y))
+
+def set_mouse_offset(offset_x: 'int', offset_y: 'int') -> 'None':
+    """Set mouse offset"""
+    _SetMouseOffset(int(offset_x), int(offset_y))
+
+def set_mouse_scale(scale_x: 'float', scale_y: 'float') -> 'None':
+    """Set mouse scaling"""
+    _SetMouseScale(float(scale_x), float(scale_y))
+
+def get_mouse_wheel_move() -> 'float':
+    """Get mouse wheel movement for X or Y, whichever is larger"""
+    result = _GetMouseWheelMove()
+    return result
+
+def get_mouse_wheel_move_v() -> 'Vector2':
+    """Get mouse wheel movement for both X and Y"""
+    result = _GetMouseWheelMoveV()
+    return result
+
+def set_mouse_cursor(cursor: 'int') -> 'None':
+    """Set mouse cursor"""
+    _SetMouseCursor(int(cursor))
+
+def get_touch_x() -> 'int':
+    """Get touch position X for touch point 0 (relative to screen size)"""
+    result = _GetTouchX()
+    return result
+
+def get_touch_y() -> 'int':
+    """Get touch position Y for touch point 0 (relative to screen size)"""
+    result = _GetTouchY()
+    return result
+
+def get_touch_position(index: 'int') -> 'Vector2':
+    """Get touch position XY for a touch point index (relative to screen size)"""
+    result = _GetTouchPosition(int(index))
+    return result
+
+def get_touch_point_id(index: 'int') -> 'int':
+    """Get touch point identifier for given index"""
+    result = _GetTouchPointId(int(index))
+    return result
+
+def get_touch_point_count() -> 'int':
+    """Get number of touch points"""
+    result = _GetTouchPointCount()
+    return result
+
+def set_gestures_enabled(flags: 'int') -> 'None':
+    """Enable a set of gestures using flags"""
+    _SetGesturesEnabled(flags)
+
+def is_gesture_detected(gesture: 'int') -> 'bool':
+    """Check if a gesture have been detected"""
+    result = _IsGestureDetected(int(gesture))
+    return result
+
+def get_gesture_detected() -> 'int':
+    """Get latest detected gesture"""
+    result = _GetGestureDetected()
+    return result
+
+def get_gesture_hold_duration() -> 'float':
+    """Get gesture hold time in milliseconds"""
+    result = _GetGestureHoldDuration()
+    return result
+
+def get_gesture_drag_vector() -> 'Vector2':
+    """Get gesture drag vector"""
+    result = _GetGestureDragVector()
+    return result
+
+def get_gesture_drag_angle() -> 'float':
+    """Get gesture drag angle"""
+    result = _GetGestureDragAngle()
+    return result
+
+def get_gesture_pinch_vector() -> 'Vector2':
+    """Get gesture pinch delta"""
+    result = _GetGesturePinchVector()
+    return result
+
+def get_gesture_pinch_angle() -> 'float':
+    """Get gesture pinch angle"""
+    result = _GetGesturePinchAngle()
+    return result
+
+def set_camera_mode(camera: 'Camera', mode: 'int') -> 'None':
+    """Set camera mode (multiple camera modes available)"""
+    _SetCameraMode(camera, int(mode))
+
+def update_camera(camera: 'CameraPtr') -> 'None':
+    """Update camera position for selected mode"""
+    _UpdateCamera(camera)
+
+def set_camera_pan_control(key_pan: 'int') -> 'None':
+    """Set camera pan key to combine with mouse movement (free camera)"""
+    _SetCameraPanControl(int(key_pan))
+
+def set_camera_alt_control(key_alt: 'int') -> 'None':
+    """Set camera alt key to combine with mouse movement (free camera)"""
+    _SetCameraAltControl(int(key_alt))
+
+def set_camera_smooth_zoom_control(key_smooth_zoom: 'int') -> 'None':
+    """Set camera smooth zoom key to combine with mouse (free camera)"""
+    _SetCameraSmoothZoomControl(int(key_smooth_zoom))
+
+def set_camera_move_controls(key_front: 'int', key_back: 'int', key_right: 'int', key_left: 'int', key_up: 'int', key_down: 'int') -> 'None':
+    """Set camera move controls (1st person and 3rd person cameras)"""
+    _SetCameraMoveControls(int(key_front), int(key_back), int(key_right), int(key_left), int(key_up), int(key_down))
+
+# region RENDER STATE
+
+@dataclasses.dataclass
+class RenderStateStats:
+    changes: int = 0 # Begin*/End* calls made
+    elided: int = 0 # transitions skipped because the state was already set
+
+
+class RenderState:
+    '''Stack per render-state kind, so nested contexts that set the state again cost nothing'''
+
+    KINDS = ('blend', 'shader', 'scissor', 'texture')
+
+    def __init__(self):
+        self.stacks = {kind: [] for kind in self.KINDS}
+        self.stats = RenderStateStats() # of the frame in progress
+        self.last_frame = RenderStateStats()
+        self.in_frame = False # between BeginDrawing and EndDrawing
+
+    def current(self, kind):
+        '''The innermost active context of `kind`, None if the state is raylib's default'''
+        stack = self.stacks[kind]
+        return stack[-1] if stack else None
+
+    def push(self, context):
+        stack = self.stacks[context.kind]
+        top = stack[-1] if stack else None
+        if (top.key if top is not None else context.default_key) == context.key:
+            self.stats.elided += 1
+        else:
+            if top is not None and context.restart:
+                top.end()
+            context.begin()
+            self.stats.changes += 1
+        stack.append(context)
+
+    def pop(self, kind):
+        stack = self.stacks[kind]
+        context = stack.pop()
+        below = stack[-1] if stack else None
+        if (below.key if below is not None else context.default_key) == context.key:
+            self.stats.elided += 1
+        elif below is None:
+            context.end()
+            self.stats.changes += 1
+        else:
+            if context.restart:
+                context.end()
+            below.begin()
+            self.stats.changes += 1
+
+    def begin_frame(self):
+        self.in_frame = True
+
+    def end_frame(self):
+        self.last_frame, self.stats = self.stats, RenderStateStats()
+        self.in_frame = False
+
+
+render_state = RenderState()
+
+# callables run at the end of every drawing() block (or end_drawing()), right before EndDrawing
+_END_OF_FRAME = []
+
+# endregion (render state)
+
+# region CONTEXT MANAGERS
+
+class _StateContext:
+    '''Base of the tracked context managers: entering pushes onto `render_state`, leaving pops'''
+    __slots__ = ('key',)
+    kind = None
+    default_key = None # the key of raylib's state outside of any context
+    restart = False # End* is needed before switching to another value
+
+    def __enter__(self):
+        render_state.push(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        render_state.pop(self.kind)
+
+
+class drawing:
+    """Context manager for drawing"""
+    __slots__ = ()
+
+    def __enter__(self):
+        render_state.begin_frame()
+        _BeginDrawing()
+        return self
+
+    def __exit__(self, *exc_info):
+        for hook in _END_OF_FRAME:
+            hook()
+        _EndDrawing()
+        render_state.end_frame()
+
+
+class scissor_mode(_StateContext):
+    """Context manager for scissor mode"""
+    __slots__ = ()
+    kind = 'scissor'
+
+    def __init__(self, x: 'int', y: 'int', width: 'int', height: 'int') -> 'None':
+        self.key = int(x), int(y), int(width), int(height)
+
+    def begin(self):
+        _BeginScissorMode(*self.key)
+
+    def end(self):
+        _EndScissorMode()
+
+
+class blend_mode(_StateContext):
+    """Context manager for blend mode"""
+    __slots__ = ()
+    kind = 'blend'
+    default_key = BLEND_ALPHA
+
+    def __init__(self, mode: 'int') -> 'None':
+        self.key = int(mode)
+
+    def begin(self):
+        _BeginBlendMode(self.key)
+
+    def end(self):
+        _EndBlendMode()
+
+
+class shader_mode(_StateContext):
+    """Context manager for shader mode"""
+    __slots__ = ('shader',)
+    kind = 'shader'
+
+    def __init__(self, shader: 'Shader') -> 'None':
+        self.shader = shader
+        self.key = shader.id
+
+    def begin(self):
+        _BeginShaderMode(self.shader)
+
+    def end(self):
+        _EndShaderMode()
+
+
+class texture_mode(_StateContext):
+    """Context manager for texture mode"""
+    __slots__ = ('target',)
+    kind = 'texture'
+    restart = True
+
+    def __init__(self, target: 'RenderTexture2D') -> 'None':
+        self.target = target
+        self.key = target.id
+
+    def begin(self):
+        _BeginTextureMode(self.target)
+
+    def end(self):
+        _EndTextureMode()
+
+
+class mode2d:
+    """Context manager for mode2d"""
+    __slots__ = ('camera',)
+
+    def __init__(self, camera: 'Camera2D') -> 'None':
+        self.camera = camera
+
+    def __enter__(self):
+        _BeginMode2D(self.camera)
+        return self
+
+    def __exit__(self, *exc_info):
+        _EndMode2D()
+
+
+class mode3d:
+    """Context manager for mode3d"""
+    __slots__ = ('camera',)
+
+    def __init__(self, camera: 'Camera3D') -> 'None':
+        self.camera = camera
+
+    def __enter__(self):
+        _BeginMode3D(self.camera)
+        return self
+
+    def __exit__(self, *exc_info):
+        _EndMode3D()
+
+
+class vr_stereo_mode:
+    """Context manager for vr stereo mode"""
+    __slots__ = ('config',)
+
+    def __init__(self, config: 'VrStereoConfig') -> 'None':
+        self.config = config
+
+    def __enter__(self):
+        _BeginVrStereoMode(self.config)
+        return self
+
+    def __exit__(self, *exc_info):
+        _EndVrStereoMode()
+
+# endregion (context managers)
@@ -0,0 +1,44 @@
+"""Trusted fast calls: the prototyped ctypes functions behind the rlapi wrappers.
+
+`rl.fast.draw_rectangle_rec(rec, color)` calls raylib's DrawRectangleRec right
+away, without the wrapper's Python frame and argument conversions. In exchange
+the caller promises that the arguments already are what ctypes expects: structs
+(`Rectangle`, `Color`, ...) instead of tuples, `bytes` instead of `str`, plain
+ints and floats for the rest. Results come back unconverted as well (`bytes`
+for strings, raw pointers).
+
+Meant for frame-loop code that passes the same structs every frame; everything
+else should stick to the checked wrappers.
+"""
+
+import importlib
+
+from . import _LOCATIONS
+from ._lib import _LazySymbol
+
+_SYMBOLS = {} # module name -> {symbol name, lowercased without underscores: symbol name}
+
+
+def _symbols(module):
+    try:
+        return _SYMBOLS[module.__name__]
+    except KeyError:
+        pass
+    symbols = _SYMBOLS[module.__name__] = {
+        name[1:].lower(): name for name, value in vars(module).items()
+        if name.startswith('_') and (isinstance(value, _LazySymbol) or hasattr(value, 'argtypes'))
+    }
+    return symbols
+
+
+def __getattr__(name):
+    try:
+        module = importlib.import_module('.' + _LOCATIONS[name], __package__)
+        symbol = _symbols(module)[name.replace('_', '').lower()]
+    except KeyError:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name)) from None
+    func = getattr(module, symbol)
+    if isinstance(func, _LazySymbol):
+        func = func.resolve()
+    globals()[name] = func # cache, later lookups skip __getattr__
+    return func
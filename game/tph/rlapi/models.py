@@ -0,0 +1,926 @@
+"""raylib bindings for 3D shapes, models, meshes, materials and animations"""
+
+from enum import IntEnum
+from typing import Sequence as Seq, Union
+from ctypes import Structure, POINTER, byref
+
+from ._lib import binder
+from .core import (
+    Bool, Camera, CharPtr, Color, Float, FloatPtr, Image, Int, IntPtr, Matrix, MatrixPtr,
+    Quaternion, Ray, Rectangle, Shader, Texture2D, UCharPtr, UInt, UIntPtr, UShortPtr, Vector2,
+    Vector3, Vector3Ptr, VoidPtr, _arr_in, _color, _ptr_out, _rect, _str_in, _vec2, _vec3
+)
+
+_wrap = binder(globals())
+
+
+class Mesh(Structure):
+    '''Mesh, vertex data and vao/vbo'''
+    _fields_ = [
+        ('vertex_count', Int),
+        ('triangle_count', Int),
+        ('vertices', FloatPtr),
+        ('texcoords', FloatPtr),
+        ('texcoords2', FloatPtr),
+        ('normals', FloatPtr),
+        ('tangents', FloatPtr),
+        ('colors', UCharPtr),
+        ('indices', UShortPtr),
+        ('anim_vertices', FloatPtr),
+        ('anim_normals', FloatPtr),
+        ('bone_ids', UCharPtr),
+        ('bone_weights', FloatPtr),
+        ('vao_id', UInt),
+        ('vbo_id', UIntPtr),
+    ]
+
+
+    @classmethod
+    def array_of(cls, mesh_sequence):
+        '''Creates and returns an array of Meshs'''
+        arr = cls * len(mesh_sequence)
+        return arr(*mesh_sequence)
+
+
+    def __init__(self, vertex_count: int = None,
+                 triangle_count: int = None,
+                 vertices: Union[Seq[float], FloatPtr] = None,
+                 texcoords: Union[Seq[float], FloatPtr] = None,
+                 texcoords2: Union[Seq[float], FloatPtr] = None,
+                 normals: Union[Seq[float], FloatPtr] = None,
+                 tangents: Union[Seq[float], FloatPtr] = None,
+                 colors: Union[Seq[int], UCharPtr] = None,
+                 indices: Union[Seq[int], UShortPtr] = None,
+                 anim_vertices: Union[Seq[float], FloatPtr] = None,
+                 anim_normals: Union[Seq[float], FloatPtr] = None,
+                 bone_ids: Union[Seq[int], UCharPtr] = None,
+                 bone_weights: Union[Seq[float], FloatPtr] = None,
+                 vao_id: int = None,
+                 vbo_id: Union[Seq[int], UIntPtr] = None):
+        '''Initializes this Mesh struct'''
+        super(Mesh, self).__init__(
+            vertex_count or 0,
+            triangle_count or 0,
+            vertices,
+            texcoords,
+            texcoords2,
+            normals,
+            tangents,
+            colors,
+            indices,
+            anim_vertices,
+            anim_normals,
+            bone_ids,
+            bone_weights,
+            vao_id or 0,
+            vbo_id
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this Mesh instance'''
+        return byref(self)
+
+
+    def __str__(self):
+        return "[{} at {}]".format(self.__class__.__name__, id(self))
+
+    def __repr__(self):
+        return self.__str__()
+
+    def upload(self, dynamic: 'bool') -> 'None':
+        """Upload mesh vertex data in GPU and provide VAO/VBO ids"""
+        _UploadMesh(self.byref, bool(dynamic))
+
+    def update_buffer(self, index: 'int', data: 'bytes', data_size: 'int', offset: 'int') -> 'None':
+        """Update mesh vertex data in GPU for a specific buffer index"""
+        _UpdateMeshBuffer(self, int(index), data, int(data_size), int(offset))
+
+    def unload(self) -> 'None':
+        """Unload mesh data from CPU and GPU"""
+        _UnloadMesh(self)
+
+    def draw(self, material: 'Material', transform: 'Matrix') -> 'None':
+        """Draw a 3d mesh with material and transform"""
+        _DrawMesh(self, material, transform)
+
+    def draw_instanced(self, material: 'Material', transforms: 'MatrixPtr', instances: 'int') -> 'None':
+        """Draw multiple mesh instances with material and different transforms"""
+        _DrawMeshInstanced(self, material, transforms, int(instances))
+
+    def export(self, file_name: 'Union[str, CharPtr]') -> 'bool':
+        """Export mesh data to file, returns true on success"""
+        result = _ExportMesh(self, _str_in(file_name))
+        return result
+
+    def get_bounding_box(self) -> 'BoundingBox':
+        """Compute mesh bounding box limits"""
+        result = _GetMeshBoundingBox(self)
+        return result
+
+    def gen_tangents(self) -> 'None':
+        """Compute mesh tangents"""
+        _GenMeshTangents(self.byref)
+
+
+# Pointer type to Meshs
+MeshPtr = POINTER(Mesh)
+
+class MaterialMap(Structure):
+    '''MaterialMap'''
+    _fields_ = [
+        ('texture', Texture2D),
+        ('color', Color),
+        ('value', Float),
+    ]
+
+
+    @classmethod
+    def array_of(cls, material_map_sequence):
+        '''Creates and returns an array of MaterialMaps'''
+        arr = cls * len(material_map_sequence)
+        return arr(*material_map_sequence)
+
+
+    def __init__(self, texture: Texture2D = None, color: Color = None, value: float = None):
+        '''Initializes this MaterialMap struct'''
+        super(MaterialMap, self).__init__(
+            texture or Texture2D(),
+            color or Color(),
+            value or 0.0
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this MaterialMap instance'''
+        return byref(self)
+
+
+
+# Pointer type to MaterialMaps
+MaterialMapPtr = POINTER(MaterialMap)
+
+class Material(Structure):
+    '''Material, includes shader and maps'''
+    _fields_ = [
+        ('shader', Shader),
+        ('maps', MaterialMapPtr),
+        ('params', Float * 4),
+    ]
+
+
+    @classmethod
+    def array_of(cls, material_sequence):
+        '''Creates and returns an array of Materials'''
+        arr = cls * len(material_sequence)
+        return arr(*material_sequence)
+
+
+    def __init__(self, shader: Shader = None, maps: MaterialMapPtr = None, params: Seq[float] = None):
+        '''Initializes this Material struct'''
+        super(Material, self).__init__(
+            shader or Shader(),
+            maps,
+            params
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this Material instance'''
+        return byref(self)
+
+
+    def __str__(self):
+        return "[{} at {}]".format(self.__class__.__name__, id(self))
+
+    def __repr__(self):
+        return self.__str__()
+
+    def unload(self) -> 'None':
+        """Unload material from GPU memory (VRAM)"""
+        _UnloadMaterial(self)
+
+    def set_texture(self, map_type: 'int', texture: 'Texture2D') -> 'None':
+        """Set texture for a material map type (MATERIAL_MAP_DIFFUSE, MATERIAL_MAP_SPECULAR...)"""
+        _SetMaterialTexture(self, int(map_type), texture)
+
+
+# Pointer type to Materials
+MaterialPtr = POINTER(Material)
+
+class Transform(Structure):
+    '''Transform, vectex transformation data'''
+    _fields_ = [
+        ('translation', Vector3),
+        ('rotation', Quaternion),
+        ('scale', Vector3),
+    ]
+
+
+    @classmethod
+    def array_of(cls, transform_sequence):
+        '''Creates and returns an array of Transforms'''
+        arr = cls * len(transform_sequence)
+        return arr(*transform_sequence)
+
+
+    def __init__(self, translation: Vector3 = None, rotation: Quaternion = None, scale: Vector3 = None):
+        '''Initializes this Transform struct'''
+        super(Transform, self).__init__(
+            translation or Vector3(),
+            rotation or Quaternion(),
+            scale or Vector3()
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this Transform instance'''
+        return byref(self)
+
+
+
+# Pointer type to Transforms
+TransformPtr = POINTER(Transform)
+
+class BoneInfo(Structure):
+    '''Bone, skeletal animation bone'''
+    _fields_ = [
+        ('name', CharPtr),
+        ('parent', Int),
+    ]
+
+
+    @classmethod
+    def array_of(cls, bone_info_sequence):
+        '''Creates and returns an array of BoneInfos'''
+        arr = cls * len(bone_info_sequence)
+        return arr(*bone_info_sequence)
+
+
+    def __init__(self, name: str = None, parent: int = None):
+        '''Initializes this BoneInfo struct'''
+        super(BoneInfo, self).__init__(
+            name,
+            parent or 0
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this BoneInfo instance'''
+        return byref(self)
+
+
+
+# Pointer type to BoneInfos
+BoneInfoPtr = POINTER(BoneInfo)
+
+class Model(Structure):
+    '''Model, meshes, materials and animation data'''
+    _fields_ = [
+        ('transform', Matrix),
+        ('mesh_count', Int),
+        ('material_count', Int),
+        ('meshes', MeshPtr),
+        ('materials', MaterialPtr),
+        ('mesh_material', IntPtr),
+        ('bone_count', Int),
+        ('bones', BoneInfoPtr),
+        ('bind_pose', TransformPtr),
+    ]
+
+
+    @classmethod
+    def array_of(cls, model_sequence):
+        '''Creates and returns an array of Models'''
+        arr = cls * len(model_sequence)
+        return arr(*model_sequence)
+
+
+    def __init__(self, transform: Matrix = None,
+                 mesh_count: int = None,
+                 material_count: int = None,
+                 meshes: MeshPtr = None,
+                 materials: MaterialPtr = None,
+                 mesh_material: Union[Seq[int], IntPtr] = None,
+                 bone_count: int = None,
+                 bones: BoneInfoPtr = None,
+                 bind_pose: TransformPtr = None):
+        '''Initializes this Model struct'''
+        super(Model, self).__init__(
+            transform or Matrix(),
+            mesh_count or 0,
+            material_count or 0,
+            meshes,
+            materials,
+            mesh_material,
+            bone_count or 0,
+            bones,
+            bind_pose
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this Model instance'''
+        return byref(self)
+
+
+    def __str__(self):
+        return "[{} at {}]".format(self.__class__.__name__, id(self))
+
+    def __repr__(self):
+        return self.__str__()
+
+    def is_animation_valid(self, anim: 'ModelAnimation') -> 'bool':
+        """Check model animation skeleton match"""
+        result = _IsModelAnimationValid(self, anim)
+        return result
+
+    def update_animation(self, anim: 'ModelAnimation', frame: 'int') -> 'None':
+        """Update model animation pose"""
+        _UpdateModelAnimation(self, anim, int(frame))
+
+    def set_mesh_material(self, mesh_id: 'int', material_id: 'int') -> 'None':
+        """Set material for a mesh"""
+        _SetModelMeshMaterial(self.byref, int(mesh_id), int(material_id))
+
+    def unload(self) -> 'None':
+        """Unload model (including meshes) from memory (RAM and/or VRAM)"""
+        _UnloadModel(self)
+
+    def unload_keep_meshes(self) -> 'None':
+        """Unload model (but not meshes) from memory (RAM and/or VRAM)"""
+        _UnloadModelKeepMeshes(self)
+
+    def get_bounding_box(self) -> 'BoundingBox':
+        """Compute model bounding box limits (considers all meshes)"""
+        result = _GetModelBoundingBox(self)
+        return result
+
+    def draw(self, position: 'Vector3', scale: 'float', tint: 'Color') -> 'None':
+        """Draw a model (with texture if set)"""
+        _DrawModel(self, _vec3(position), float(scale), _color(tint))
+
+    def draw_ex(self, position: 'Vector3', rotation_axis: 'Vector3', rotation_angle: 'float', scale: 'Vector3', tint: 'Color') -> 'None':
+        """Draw a model with extended parameters"""
+        _DrawModelEx(self, _vec3(position), _vec3(rotation_axis), float(rotation_angle), _vec3(scale), _color(tint))
+
+    def draw_wires(self, position: 'Vector3', scale: 'float', tint: 'Color') -> 'None':
+        """Draw a model wires (with texture if set)"""
+        _DrawModelWires(self, _vec3(position), float(scale), _color(tint))
+
+    def draw_wires_ex(self, position: 'Vector3', rotation_axis: 'Vector3', rotation_angle: 'float', scale: 'Vector3', tint: 'Color') -> 'None':
+        """Draw a model wires (with texture if set) with extended parameters"""
+        _DrawModelWiresEx(self, _vec3(position), _vec3(rotation_axis), float(rotation_angle), _vec3(scale), _color(tint))
+
+
+# Pointer type to Models
+ModelPtr = POINTER(Model)
+
+class ModelAnimation(Structure):
+    '''ModelAnimation'''
+    _fields_ = [
+        ('bone_count', Int),
+        ('frame_count', Int),
+        ('bones', BoneInfoPtr),
+        ('frame_poses', TransformPtr),
+    ]
+
+
+    @classmethod
+    def array_of(cls, model_animation_sequence):
+        '''Creates and returns an array of ModelAnimations'''
+        arr = cls * len(model_animation_sequence)
+        return arr(*model_animation_sequence)
+
+
+    def __init__(self, bone_count: int = None, frame_count: int = None, bones: BoneInfoPtr = None, frame_poses: TransformPtr = None):
+        '''Initializes this ModelAnimation struct'''
+        super(ModelAnimation, self).__init__(
+            bone_count or 0,
+            frame_count or 0,
+            bones,
+            frame_poses
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this ModelAnimation instance'''
+        return byref(self)
+
+
+
+# Pointer type to ModelAnimations
+ModelAnimationPtr = POINTER(ModelAnimation)
+
+class RayCollision(Structure):
+    '''RayCollision, ray hit information'''
+    _fields_ = [
+        ('hit', Bool),
+        ('distance', Float),
+        ('point', Vector3),
+        ('normal', Vector3),
+    ]
+
+
+    @classmethod
+    def array_of(cls, ray_collision_sequence):
+        '''Creates and returns an array of RayCollisions'''
+        arr = cls * len(ray_collision_sequence)
+        return arr(*ray_collision_sequence)
+
+
+    def __init__(self, hit: bool = None, distance: float = None, point: Vector3 = None, normal: Vector3 = None):
+        '''Initializes this RayCollision struct'''
+        super(RayCollision, self).__init__(
+            hit or False,
+            distance or 0.0,
+            point or Vector3(),
+            normal or Vector3()
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this RayCollision instance'''
+        return byref(self)
+
+
+
+# Pointer type to RayCollisions
+RayCollisionPtr = POINTER(RayCollision)
+
+class BoundingBox(Structure):
+    '''BoundingBox'''
+    _fields_ = [
+        ('min', Vector3),
+        ('max', Vector3),
+    ]
+
+
+    @classmethod
+    def array_of(cls, bounding_box_sequence):
+        '''Creates and returns an array of BoundingBoxs'''
+        arr = cls * len(bounding_box_sequence)
+        return arr(*bounding_box_sequence)
+
+
+    def __init__(self, min: Vector3 = None, max: Vector3 = None):
+        '''Initializes this BoundingBox struct'''
+        super(BoundingBox, self).__init__(
+            min or Vector3(),
+            max or Vector3()
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this BoundingBox instance'''
+        return byref(self)
+
+
+
+# Pointer type to BoundingBoxs
+BoundingBoxPtr = POINTER(BoundingBox)
+
+class MaterialMapIndex(IntEnum):
+    """Material map index"""
+
+    MATERIAL_MAP_ALBEDO = 0
+    """Albedo material (same as: MATERIAL_MAP_DIFFUSE)"""
+
+    MATERIAL_MAP_METALNESS = 1
+    """Metalness material (same as: MATERIAL_MAP_SPECULAR)"""
+
+    MATERIAL_MAP_NORMAL = 2
+    """Normal material"""
+
+    MATERIAL_MAP_ROUGHNESS = 3
+    """Roughness material"""
+
+    MATERIAL_MAP_OCCLUSION = 4
+    """Ambient occlusion material"""
+
+    MATERIAL_MAP_EMISSION = 5
+    """Emission material"""
+
+    MATERIAL_MAP_HEIGHT = 6
+    """Heightmap material"""
+
+    MATERIAL_MAP_CUBEMAP = 7
+    """Cubemap material (NOTE: Uses GL_TEXTURE_CUBE_MAP)"""
+
+    MATERIAL_MAP_IRRADIANCE = 8
+    """Irradiance material (NOTE: Uses GL_TEXTURE_CUBE_MAP)"""
+
+    MATERIAL_MAP_PREFILTER = 9
+    """Prefilter material (NOTE: Uses GL_TEXTURE_CUBE_MAP)"""
+
+    MATERIAL_MAP_BRDF = 10
+    """Brdf material"""
+
+
+
+MATERIAL_MAP_ALBEDO = MaterialMapIndex.MATERIAL_MAP_ALBEDO
+MATERIAL_MAP_METALNESS = MaterialMapIndex.MATERIAL_MAP_METALNESS
+MATERIAL_MAP_NORMAL = MaterialMapIndex.MATERIAL_MAP_NORMAL
+MATERIAL_MAP_ROUGHNESS = MaterialMapIndex.MATERIAL_MAP_ROUGHNESS
+MATERIAL_MAP_OCCLUSION = MaterialMapIndex.MATERIAL_MAP_OCCLUSION
+MATERIAL_MAP_EMISSION = MaterialMapIndex.MATERIAL_MAP_EMISSION
+MATERIAL_MAP_HEIGHT = MaterialMapIndex.MATERIAL_MAP_HEIGHT
+MATERIAL_MAP_CUBEMAP = MaterialMapIndex.MATERIAL_MAP_CUBEMAP
+MATERIAL_MAP_IRRADIANCE = MaterialMapIndex.MATERIAL_MAP_IRRADIANCE
+MATERIAL_MAP_PREFILTER = MaterialMapIndex.MATERIAL_MAP_PREFILTER
+MATERIAL_MAP_BRDF = MaterialMapIndex.MATERIAL_MAP_BRDF
+
+_DrawLine3D = _wrap('DrawLine3D', [Vector3, Vector3, Color], None)
+_DrawPoint3D = _wrap('DrawPoint3D', [Vector3, Color], None)
+_DrawCircle3D = _wrap('DrawCircle3D', [Vector3, Float, Vector3, Float, Color], None)
+_DrawTriangle3D = _wrap('DrawTriangle3D', [Vector3, Vector3, Vector3, Color], None)
+_DrawTriangleStrip3D = _wrap('DrawTriangleStrip3D', [Vector3Ptr, Int, Color], None)
+_DrawCube = _wrap('DrawCube', [Vector3, Float, Float, Float, Color], None)
+_DrawCubeV = _wrap('DrawCubeV', [Vector3, Vector3, Color], None)
+_DrawCubeWires = _wrap('DrawCubeWires', [Vector3, Float, Float, Float, Color], None)
+_DrawCubeWiresV = _wrap('DrawCubeWiresV', [Vector3, Vector3, Color], None)
+_DrawCubeTexture = _wrap('DrawCubeTexture', [Texture2D, Vector3, Float, Float, Float, Color], None)
+_DrawCubeTextureRec = _wrap('DrawCubeTextureRec', [Texture2D, Rectangle, Vector3, Float, Float, Float, Color], None)
+_DrawSphere = _wrap('DrawSphere', [Vector3, Float, Color], None)
+_DrawSphereEx = _wrap('DrawSphereEx', [Vector3, Float, Int, Int, Color], None)
+_DrawSphereWires = _wrap('DrawSphereWires', [Vector3, Float, Int, Int, Color], None)
+_DrawCylinder = _wrap('DrawCylinder', [Vector3, Float, Float, Float, Int, Color], None)
+_DrawCylinderEx = _wrap('DrawCylinderEx', [Vector3, Vector3, Float, Float, Int, Color], None)
+_DrawCylinderWires = _wrap('DrawCylinderWires', [Vector3, Float, Float, Float, Int, Color], None)
+_DrawCylinderWiresEx = _wrap('DrawCylinderWiresEx', [Vector3, Vector3, Float, Float, Int, Color], None)
+_DrawPlane = _wrap('DrawPlane', [Vector3, Vector2, Color], None)
+_DrawRay = _wrap('DrawRay', [Ray, Color], None)
+_DrawGrid = _wrap('DrawGrid', [Int, Float], None)
+_LoadModel = _wrap('LoadModel', [CharPtr], Model)
+_LoadModelFromMesh = _wrap('LoadModelFromMesh', [Mesh], Model)
+_UnloadModel = _wrap('UnloadModel', [Model], None)
+_UnloadModelKeepMeshes = _wrap('UnloadModelKeepMeshes', [Model], None)
+_GetModelBoundingBox = _wrap('GetModelBoundingBox', [Model], BoundingBox)
+_DrawModel = _wrap('DrawModel', [Model, Vector3, Float, Color], None)
+_DrawModelEx = _wrap('DrawModelEx', [Model, Vector3, Vector3, Float, Vector3, Color], None)
+_DrawModelWires = _wrap('DrawModelWires', [Model, Vector3, Float, Color], None)
+_DrawModelWiresEx = _wrap('DrawModelWiresEx', [Model, Vector3, Vector3, Float, Vector3, Color], None)
+_DrawBoundingBox = _wrap('DrawBoundingBox', [BoundingBox, Color], None)
+_DrawBillboard = _wrap('DrawBillboard', [Camera, Texture2D, Vector3, Float, Color], None)
+_DrawBillboardRec = _wrap('DrawBillboardRec', [Camera, Texture2D, Rectangle, Vector3, Vector2, Color], None)
+_DrawBillboardPro = _wrap('DrawBillboardPro', [Camera, Texture2D, Rectangle, Vector3, Vector3, Vector2, Vector2, Float, Color], None)
+_UploadMesh = _wrap('UploadMesh', [MeshPtr, Bool], None)
+_UpdateMeshBuffer = _wrap('UpdateMeshBuffer', [Mesh, Int, VoidPtr, Int, Int], None)
+_UnloadMesh = _wrap('UnloadMesh', [Mesh], None)
+_DrawMesh = _wrap('DrawMesh', [Mesh, Material, Matrix], None)
+_DrawMeshInstanced = _wrap('DrawMeshInstanced', [Mesh, Material, MatrixPtr, Int], None)
+_ExportMesh = _wrap('ExportMesh', [Mesh, CharPtr], Bool)
+_GetMeshBoundingBox = _wrap('GetMeshBoundingBox', [Mesh], BoundingBox)
+_GenMeshTangents = _wrap('GenMeshTangents', [MeshPtr], None)
+_GenMeshPoly = _wrap('GenMeshPoly', [Int, Float], Mesh)
+_GenMeshPlane = _wrap('GenMeshPlane', [Float, Float, Int, Int], Mesh)
+_GenMeshCube = _wrap('GenMeshCube', [Float, Float, Float], Mesh)
+_GenMeshSphere = _wrap('GenMeshSphere', [Float, Int, Int], Mesh)
+_GenMeshHemiSphere = _wrap('GenMeshHemiSphere', [Float, Int, Int], Mesh)
+_GenMeshCylinder = _wrap('GenMeshCylinder', [Float, Float, Int], Mesh)
+_GenMeshCone = _wrap('GenMeshCone', [Float, Float, Int], Mesh)
+_GenMeshTorus = _wrap('GenMeshTorus', [Float, Float, Int, Int], Mesh)
+_GenMeshKnot = _wrap('GenMeshKnot', [Float, Float, Int, Int], Mesh)
+_GenMeshHeightmap = _wrap('GenMeshHeightmap', [Image, Vector3], Mesh)
+_GenMeshCubicmap = _wrap('GenMeshCubicmap', [Image, Vector3], Mesh)
+_LoadMaterials = _wrap('LoadMaterials', [CharPtr, IntPtr], MaterialPtr)
+_LoadMaterialDefault = _wrap('LoadMaterialDefault', [], Material)
+_UnloadMaterial = _wrap('UnloadMaterial', [Material], None)
+_SetMaterialTexture = _wrap('SetMaterialTexture', [MaterialPtr, Int, Texture2D], None)
+_SetModelMeshMaterial = _wrap('SetModelMeshMaterial', [ModelPtr, Int, Int], None)
+_LoadModelAnimations = _wrap('LoadModelAnimations', [CharPtr, UIntPtr], ModelAnimationPtr)
+_UpdateModelAnimation = _wrap('UpdateModelAnimation', [Model, ModelAnimation, Int], None)
+_UnloadModelAnimation = _wrap('UnloadModelAnimation', [ModelAnimation], None)
+_UnloadModelAnimations = _wrap('UnloadModelAnimations', [ModelAnimationPtr, UInt], None)
+_IsModelAnimationValid = _wrap('IsModelAnimationValid', [Model, ModelAnimation], Bool)
+_CheckCollisionSpheres = _wrap('CheckCollisionSpheres', [Vector3, Float, Vector3, Float], Bool)
+_CheckCollisionBoxes = _wrap('CheckCollisionBoxes', [BoundingBox, BoundingBox], Bool)
+_CheckCollisionBoxSphere = _wrap('CheckCollisionBoxSphere', [BoundingBox, Vector3, Float], Bool)
+_GetRayCollisionSphere = _wrap('GetRayCollisionSphere', [Ray, Vector3, Float], RayCollision)
+_GetRayCollisionBox = _wrap('GetRayCollisionBox', [Ray, BoundingBox], RayCollision)
+_GetRayCollisionMesh = _wrap('GetRayCollisionMesh', [Ray, Mesh, Matrix], RayCollision)
+_GetRayCollisionTriangle = _wrap('GetRayCollisionTriangle', [Ray, Vector3, Vector3, Vector3], RayCollision)
+_GetRayCollisionQuad = _wrap('GetRayCollisionQuad', [Ray, Vector3, Vector3, Vector3, Vector3], RayCollision)
+
+def draw_line3d(start_pos: 'Vector3', end_pos: 'Vector3', color: 'Color') -> 'None':
+    """Draw a line in 3D world space"""
+    _DrawLine3D(_vec3(start_pos), _vec3(end_pos), _color(color))
+
+def draw_point3d(position: 'Vector3', color: 'Color') -> 'None':
+    """Draw a point in 3D space, actually a small line"""
+    _DrawPoint3D(_vec3(position), _color(color))
+
+def draw_circle3d(center: 'Vector3', radius: 'float', rotation_axis: 'Vector3', rotation_angle: 'float', color: 'Color') -> 'None':
+    """Draw a circle in 3D world space"""
+    _DrawCircle3D(_vec3(center), float(radius), _vec3(rotation_axis), float(rotation_angle), _color(color))
+
+def draw_triangle3d(v1: 'Vector3', v2: 'Vector3', v3: 'Vector3', color: 'Color') -> 'None':
+    """Draw a color-filled triangle (vertex in counter-clockwise order!)"""
+    _DrawTriangle3D(_vec3(v1), _vec3(v2), _vec3(v3), _color(color))
+
+def draw_triangle_strip3d(points: 'Vector3Ptr', color: 'Color') -> 'None':
+    """Draw a triangle strip defined by points"""
+    _DrawTriangleStrip3D(_arr_in(Vector3, points), len(points), _color(color))
+
+def draw_cube(position: 'Vector3', width: 'float', height: 'float', length: 'float', color: 'Color') -> 'None':
+    """Draw cube"""
+    _DrawCube(_vec3(position), float(width), float(height), float(length), _color(color))
+
+def draw_cube_v(position: 'Vector3', size: 'Vector3', color: 'Color') -> 'None':
+    """Draw cube (Vector version)"""
+    _DrawCubeV(_vec3(position), _vec3(size), _color(color))
+
+def draw_cube_wires(position: 'Vector3', width: 'float', height: 'float', length: 'float', color: 'Color') -> 'None':
+    """Draw cube wires"""
+    _DrawCubeWires(_vec3(position), float(width), float(height), float(length), _color(color))
+
+def draw_cube_wires_v(position: 'Vector3', size: 'Vector3', color: 'Color') -> 'None':
+    """Draw cube wires (Vector version)"""
+    _DrawCubeWiresV(_vec3(position), _vec3(size), _color(color))
+
+def draw_cube_texture(texture: 'Texture2D', position: 'Vector3', width: 'float', height: 'float', length: 'float', color: 'Color') -> 'None':
+    """Draw cube textured"""
+    _DrawCubeTexture(texture, _vec3(position), float(width), float(height), float(length), _color(color))
+
+def draw_cube_texture_rec(texture: 'Texture2D', source: 'Rectangle', position: 'Vector3', width: 'float', height: 'float', length: 'float', color: 'Color') -> 'None':
+    """Draw cube with a region of a texture"""
+    _DrawCubeTextureRec(texture, _rect(source), _vec3(position), float(width), float(height), float(length), _color(color))
+
+def draw_sphere(center_pos: 'Vector3', radius: 'float', color: 'Color') -> 'None':
+    """Draw sphere"""
+    _DrawSphere(_vec3(center_pos), float(radius), _color(color))
+
+def draw_sphere_ex(center_pos: 'Vector3', radius: 'float', rings: 'int', slices: 'int', color: 'Color') -> 'None':
+    """Draw sphere with extended parameters"""
+    _DrawSphereEx(_vec3(center_pos), float(radius), int(rings), int(slices), _color(color))
+
+def draw_sphere_wires(center_pos: 'Vector3', radius: 'float', rings: 'int', slices: 'int', color: 'Color') -> 'None':
+    """Draw sphere wires"""
+    _DrawSphereWires(_vec3(center_pos), float(radius), int(rings), int(slices), _color(color))
+
+def draw_cylinder(position: 'Vector3', radius_top: 'float', radius_bottom: 'float', height: 'float', slices: 'int', color: 'Color') -> 'None':
+    """Draw a cylinder/cone"""
+    _DrawCylinder(_vec3(position), float(radius_top), float(radius_bottom), float(height), int(slices), _color(color))
+
+def draw_cylinder_ex(start_pos: 'Vector3', end_pos: 'Vector3', start_radius: 'float', end_radius: 'float', sides: 'int', color: 'Color') -> 'None':
+    """Draw a cylinder with base at startPos and top at endPos"""
+    _DrawCylinderEx(_vec3(start_pos), _vec3(end_pos), float(start_radius), float(end_radius), int(sides), _color(color))
+
+def draw_cylinder_wires(position: 'Vector3', radius_top: 'float', radius_bottom: 'float', height: 'float', slices: 'int', color: 'Color') -> 'None':
+    """Draw a cylinder/cone wires"""
+    _DrawCylinderWires(_vec3(position), float(radius_top), float(radius_bottom), float(height), int(slices), _color(color))
+
+def draw_cylinder_wires_ex(start_pos: 'Vector3', end_pos: 'Vector3', start_radius: 'float', end_radius: 'float', sides: 'int', color: 'Color') -> 'None':
+    """Draw a cylinder wires with base at startPos and top at endPos"""
+    _DrawCylinderWiresEx(_vec3(start_pos), _vec3(end_pos), float(start_radius), float(end_radius), int(sides), _color(color))
+
+def draw_plane(center_pos: 'Vector3', size: 'Vector2', color: 'Color') -> 'None':
+    """Draw a plane XZ"""
+    _DrawPlane(_vec3(center_pos), _vec2(size), _color(color))
+
+def draw_ray(ray: 'Ray', color: 'Color') -> 'None':
+    """Draw a ray line"""
+    _DrawRay(ray, _color(color))
+
+def draw_grid(slices: 'int', spacing: 'float') -> 'None':
+    """Draw a grid (centered at (0, 0, 0))"""
+    _DrawGrid(int(slices), float(spacing))
+
+def load_model(file_name: 'Union[str, CharPtr]') -> 'Model':
+    """Load model from files (meshes and materials)"""
+    result = _LoadModel(_str_in(file_name))
+    return result
+
+def load_model_from_mesh(mesh: 'Mesh') -> 'Model':
+    """Load model from generated mesh (default material)"""
+    result = _LoadModelFromMesh(mesh)
+    return result
+
+def unload_model(model: 'Model') -> 'None':
+    """Unload model (including meshes) from memory (RAM and/or VRAM)"""
+    _UnloadModel(model)
+
+def unload_model_keep_meshes(model: 'Model') -> 'None':
+    """Unload model (but not meshes) from memory (RAM and/or VRAM)"""
+    _UnloadModelKeepMeshes(model)
+
+def get_model_bounding_box(model: 'Model') -> 'BoundingBox':
+    """Compute model bounding box limits (considers all meshes)"""
+    result = _GetModelBoundingBox(model)
+    return result
+
+def draw_model(model: 'Model', position: 'Vector3', scale: 'float', tint: 'Color') -> 'None':
+    """Draw a model (with texture if set)"""
+    _DrawModel(model, _vec3(position), float(scale), _color(tint))
+
+def draw_model_ex(model: 'Model', position: 'Vector3', rotation_axis: 'Vector3', rotation_angle: 'float', scale: 'Vector3', tint: 'Color') -> 'None':
+    """Draw a model with extended parameters"""
+    _DrawModelEx(model, _vec3(position), _vec3(rotation_axis), float(rotation_angle), _vec3(scale), _color(tint))
+
+def draw_model_wires(model: 'Model', position: 'Vector3', scale: 'float', tint: 'Color') -> 'None':
+    """Draw a model wires (with texture if set)"""
+    _DrawModelWires(model, _vec3(position), float(scale), _color(tint))
+
+def draw_model_wires_ex(model: 'Model', position: 'Vector3', rotation_axis: 'Vector3', rotation_angle: 'float', scale: 'Vector3', tint: 'Color') -> 'None':
+    """Draw a model wires (with texture if set) with extended parameters"""
+    _DrawModelWiresEx(model, _vec3(position), _vec3(rotation_axis), float(rotation_angle), _vec3(scale), _color(tint))
+
+def draw_bounding_box(box: 'BoundingBox', color: 'Color') -> 'None':
+    """Draw bounding box (wires)"""
+    _DrawBoundingBox(box, _color(color))
+
+def draw_billboard(camera: 'Camera', texture: 'Texture2D', position: 'Vector3', size: 'float', tint: 'Color') -> 'None':
+    """Draw a billboard texture"""
+    _DrawBillboard(camera, texture, _vec3(position), float(size), _color(tint))
+
+def draw_billboard_rec(camera: 'Camera', texture: 'Texture2D', source: 'Rectangle', position: 'Vector3', size: 'Vector2', tint: 'Color') -> 'None':
+    """Draw a billboard texture defined by source"""
+    _DrawBillboardRec(camera, texture, _rect(source), _vec3(position), _vec2(size), _color(tint))
+
+def draw_billboard_pro(camera: 'Camera', texture: 'Texture2D', source: 'Rectangle', position: 'Vector3', up: 'Vector3', size: 'Vector2', origin: 'Vector2', rotation: 'float', tint: 'Color') -> 'None':
+    """Draw a billboard texture defined by source and rotation"""
+    _DrawBillboardPro(camera, texture, _rect(source), _vec3(position), _vec3(up), _vec2(size), _vec2(origin), float(rotation), _color(tint))
+
+def upload_mesh(mesh: 'MeshPtr', dynamic: 'bool') -> 'None':
+    """Upload mesh vertex data in GPU and provide VAO/VBO ids"""
+    _UploadMesh(mesh, bool(dynamic))
+
+def update_mesh_buffer(mesh: 'Mesh', index: 'int', data: 'bytes', data_size: 'int', offset: 'int') -> 'None':
+    """Update mesh vertex data in GPU for a specific buffer index"""
+    _UpdateMeshBuffer(mesh, int(index), data, int(data_size), int(offset))
+
+def unload_mesh(mesh: 'Mesh') -> 'None':
+    """Unload mesh data from CPU and GPU"""
+    _UnloadMesh(mesh)
+
+def draw_mesh(mesh: 'Mesh', material: 'Material', transform: 'Matrix') -> 'None':
+    """Draw a 3d mesh with material and transform"""
+    _DrawMesh(mesh, material, transform)
+
+def draw_mesh_instanced(mesh: 'Mesh', material: 'Material', transforms: 'MatrixPtr', instances: 'int') -> 'None':
+    """Draw multiple mesh instances with material and different transforms"""
+    _DrawMeshInstanced(mesh, material, transforms, int(instances))
+
+def export_mesh(mesh: 'Mesh', file_name: 'Union[str, CharPtr]') -> 'bool':
+    """Export mesh data to file, returns true on success"""
+    result = _ExportMesh(mesh, _str_in(file_name))
+    return result
+
+def get_mesh_bounding_box(mesh: 'Mesh') -> 'BoundingBox':
+    """Compute mesh bounding box limits"""
+    result = _GetMeshBoundingBox(mesh)
+    return result
+
+def gen_mesh_tangents(mesh: 'MeshPtr') -> 'None':
+    """Compute mesh tangents"""
+    _GenMeshTangents(mesh)
+
+def gen_mesh_poly(sides: 'int', radius: 'float') -> 'Mesh':
+    """Generate polygonal mesh"""
+    result = _GenMeshPoly(int(sides), float(radius))
+    return result
+
+def gen_mesh_plane(width: 'float', length: 'float', res_x: 'int', res_z: 'int') -> 'Mesh':
+    """Generate plane mesh (with subdivisions)"""
+    result = _GenMeshPlane(float(width), float(length), int(res_x), int(res_z))
+    return result
+
+def gen_mesh_cube(width: 'float', height: 'float', length: 'float') -> 'Mesh':
+    """Generate cuboid mesh"""
+    result = _GenMeshCube(float(width), float(height), float(length))
+    return result
+
+def gen_mesh_sphere(radius: 'float', rings: 'int', slices: 'int') -> 'Mesh':
+    """Generate sphere mesh (standard sphere)"""
+    result = _GenMeshSphere(float(radius), int(rings), int(slices))
+    return result
+
+def gen_mesh_hemi_sphere(radius: 'float', rings: 'int', slices: 'int') -> 'Mesh':
+    """Generate half-sphere mesh (no bottom cap)"""
+    result = _GenMeshHemiSphere(float(radius), int(rings), int(slices))
+    return result
+
+def gen_mesh_cylinder(radius: 'float', height: 'float', slices: 'int') -> 'Mesh':
+    """Generate cylinder mesh"""
+    result = _GenMeshCylinder(float(radius), float(height), int(slices))
+    return result
+
+def gen_mesh_cone(radius: 'float', height: 'float', slices: 'int') -> 'Mesh':
+    """Generate cone/pyramid mesh"""
+    result = _GenMeshCone(float(radius), float(height), int(slices))
+    return result
+
+def gen_mesh_torus(radius: 'float', size: 'float', rad_seg: 'int', sides: 'int') -> 'Mesh':
+    """Generate torus mesh"""
+    result = _GenMeshTorus(float(radius), float(size), int(rad_seg), int(sides))
+    return result
+
+def gen_mesh_knot(radius: 'float', size: 'float', rad_seg: 'int', sides: 'int') -> 'Mesh':
+    """Generate trefoil knot mesh"""
+    result = _GenMeshKnot(float(radius), float(size), int(rad_seg), int(sides))
+    return result
+
+def gen_mesh_heightmap(heightmap: 'Image', size: 'Vector3') -> 'Mesh':
+    """Generate heightmap mesh from image data"""
+    result = _GenMeshHeightmap(heightmap, _vec3(size))
+    return result
+
+def gen_mesh_cubicmap(cubicmap: 'Image', cube_size: 'Vector3') -> 'Mesh':
+    """Generate cubes-based map mesh from image data"""
+    result = _GenMeshCubicmap(cubicmap, _vec3(cube_size))
+    return result
+
+def load_materials(file_name: 'Union[str, CharPtr]') -> 'MaterialPtr':
+    """Load materials from model file"""
+    material_count = Int(0)
+    result = _ptr_out(_LoadMaterials(_str_in(file_name), byref(material_count)), material_count.value)
+    return result
+
+def load_material_default() -> 'Material':
+    """Load default material (Supports: DIFFUSE, SPECULAR, NORMAL maps)"""
+    result = _LoadMaterialDefault()
+    return result
+
+def unload_material(material: 'Material') -> 'None':
+    """Unload material from GPU memory (VRAM)"""
+    _UnloadMaterial(material)
+
+def set_material_texture(material: 'MaterialPtr', map_type: 'int', texture: 'Texture2D') -> 'None':
+    """Set texture for a material map type (MATERIAL_MAP_DIFFUSE, MATERIAL_MAP_SPECULAR...)"""
+    _SetMaterialTexture(material, int(map_type), texture)
+
+def set_model_mesh_material(model: 'ModelPtr', mesh_id: 'int', material_id: 'int') -> 'None':
+    """Set material for a mesh"""
+    _SetModelMeshMaterial(model, int(mesh_id), int(material_id))
+
+def load_model_animations(file_name: 'Union[str, CharPtr]') -> 'ModelAnimationPtr':
+    """Load model animations from file"""
+    anim_count = UInt(0)
+    result = _ptr_out(_LoadModelAnimations(_str_in(file_name), byref(anim_count)), anim_count.value)
+    return result
+
+def update_model_animation(model: 'Model', anim: 'ModelAnimation', frame: 'int') -> 'None':
+    """Update model animation pose"""
+    _UpdateModelAnimation(model, anim, int(frame))
+
+def unload_model_animation(anim: 'ModelAnimation') -> 'None':
+    """Unload animation data"""
+    _UnloadModelAnimation(anim)
+
+def unload_model_animations(animations: 'ModelAnimationPtr', count: 'int') -> 'None':
+    """Unload animation array data"""
+    _UnloadModelAnimations(animations, count)
+
+def is_model_animation_valid(model: 'Model', anim: 'ModelAnimation') -> 'bool':
+    """Check model animation skeleton match"""
+    result = _IsModelAnimationValid(model, anim)
+    return result
+
+def check_collision_spheres(center1: 'Vector3', radius1: 'float', center2: 'Vector3', radius2: 'float') -> 'bool':
+    """Check collision between two spheres"""
+    result = _CheckCollisionSpheres(_vec3(center1), float(radius1), _vec3(center2), float(radius2))
+    return result
+
+def check_collision_boxes(box1: 'BoundingBox', box2: 'BoundingBox') -> 'bool':
+    """Check collision between two bounding boxes"""
+    result = _CheckCollisionBoxes(box1, box2)
+    return result
+
+def check_collision_box_sphere(box: 'BoundingBox', center: 'Vector3', radius: 'float') -> 'bool':
+    """Check collision between box and sphere"""
+    result = _CheckCollisionBoxSphere(box, _vec3(center), float(radius))
+    return result
+
+def get_ray_collision_sphere(ray: 'Ray', center: 'Vector3', radius: 'float') -> 'RayCollision':
+    """Get collision info between ray and sphere"""
+    result = _GetRayCollisionSphere(ray, _vec3(center), float(radius))
+    return result
+
+def get_ray_collision_box(ray: 'Ray', box: 'BoundingBox') -> 'RayCollision':
+    """Get collision info between ray and box"""
+    result = _GetRayCollisionBox(ray, box)
+    return result
+
+def get_ray_collision_mesh(ray: 'Ray', mesh: 'Mesh', transform: 'Matrix') -> 'RayCollision':
+    """Get collision info between ray and mesh"""
+    result = _GetRayCollisionMesh(ray, mesh, transform)
+    return result
+
+def get_ray_collision_triangle(ray: 'Ray', p1: 'Vector3', p2: 'Vector3', p3: 'Vector3') -> 'RayCollision':
+    """Get collision info between ray and triangle"""
+    result = _GetRayCollisionTriangle(ray, _vec3(p1), _vec3(p2), _vec3(p3))
+    return result
+
+def get_ray_collision_quad(ray: 'Ray', p1: 'Vector3', p2: 'Vector3', p3: 'Vector3', p4: 'Vector3') -> 'RayCollision':
+    """Get collision info between ray and quad"""
+    result = _GetRayCollisionQuad(ray, _vec3(p1), _vec3(p2), _vec3(p3), _vec3(p4))
+    return result
@@ -0,0 +1,175 @@
+"""Headless null backend: stands in for the raylib shared library without a window or GPU.
+
+Selected with `TPH_RLAPI_BACKEND=null` in the environment or `rl.use_backend('null')`
+before the first binding is used. Every raylib function then resolves to a pure
+Python stand-in that does nothing and returns a zero value of its return type,
+except for the window, timing and keyboard functions, which are emulated:
+
+ * `init_window` records the screen size, `set_target_fps` the frame time
+ * every `end_drawing` (so every `with rl.drawing():` block) counts as one frame,
+   and `get_frame_time`/`get_time` follow the target FPS instead of the clock
+ * keys are scripted through `state`: `state.press(rl.KEY_SPACE)`, `state.release(...)`,
+   or `state.script = lambda frame: {...}` returning the keys held on each frame
+ * `window_should_close` turns true after `state.max_frames` frames, which can
+   also be given with `TPH_NULL_FRAMES`, so `tph.__main__.main` terminates
+ * `check_collision_lines` computes the collision point like raylib and writes it
+   through its pointer argument, so out-parameters can be checked headlessly
+"""
+
+import os
+from ctypes import _Pointer, _SimpleCData, sizeof
+
+_EPSILON = 0.000001 # raylib's EPSILON
+
+
+class NullState:
+    '''Window, timing and input state emulated by the null backend'''
+
+    def __init__(self):
+        self.width = 0
+        self.height = 0
+        self.title = b''
+        self.ready = False
+        self.target_fps = 60
+        self.frame = 0
+        self.max_frames = int(os.environ.get('TPH_NULL_FRAMES', 0)) or None
+        self.script = None # frame -> iterable of the keys held down on it
+        self._held = set()
+        self._down = frozenset()
+        self._previous = frozenset()
+
+    def press(self, *keys):
+        '''Holds `keys` down until they are released'''
+        self._held.update(int(key) for key in keys)
+        self._poll()
+
+    def release(self, *keys):
+        self._held.difference_update(int(key) for key in keys)
+        self._poll()
+
+    def _poll(self):
+        scripted = self.script(self.frame) if self.script is not None else ()
+        self._down = frozenset(self._held.union(int(key) for key in scripted))
+
+    # region EMULATED FUNCTIONS
+
+    def InitWindow(self, width, height, title):
+        self.width, self.height, self.title = width, height, title
+        self.ready = True
+
+    def CloseWindow(self):
+        self.ready = False
+
+    def IsWindowReady(self):
+        return self.ready
+
+    def WindowShouldClose(self):
+        return self.max_frames is not None and self.frame >= self.max_frames
+
+    def SetWindowTitle(self, title):
+        self.title = title
+
+    def SetWindowSize(self, width, height):
+        self.width, self.height = width, height
+
+    def GetScreenWidth(self):
+        return self.width
+
+    def GetScreenHeight(self):
+        return self.height
+
+    GetRenderWidth = GetScreenWidth
+    GetRenderHeight = GetScreenHeight
+
+    def SetTargetFPS(self, fps):
+        self.target_fps = fps
+
+    def GetFPS(self):
+        return self.target_fps
+
+    def GetFrameTime(self):
+        return 1.0 / self.target_fps if self.target_fps > 0 else 0.0
+
+    def GetTime(self):
+        return self.frame * self.GetFrameTime()
+
+    def EndDrawing(self):
+        self.frame += 1
+        self._previous = self._down
+        self._poll()
+
+    def IsKeyDown(self, key):
+        return key in self._down
+
+    def IsKeyUp(self, key):
+        return key not in self._down
+
+    def IsKeyPressed(self, key):
+        return key in self._down and key not in self._previous
+
+    def IsKeyReleased(self, key):
+        return key in self._previous and key not in self._down
+
+    def CheckCollisionLines(self, start1, end1, start2, end2, point):
+        a = start1.x * end1.y - start1.y * end1.x
+        b = start2.x * end2.y - start2.y * end2.x
+        div = (end2.y - start2.y) * (end1.x - start1.x) - (end2.x - start2.x) * (end1.y - start1.y)
+        if abs(div) < _EPSILON:
+            return False
+        x = ((start2.x - end2.x) * a - (start1.x - end1.x) * b) / div
+        y = ((start2.y - end2.y) * a - (start1.y - end1.y) * b) / div
+        for low, high, value in ((start1.x, end1.x, x), (start2.x, end2.x, x), (start1.y, end1.y, y), (start2.y, end2.y, y)):
+            if abs(low - high) > _EPSILON and not min(low, high) <= value <= max(low, high):
+                return False
+        if point:
+            target = getattr(point, '_obj', point) # byref(), a pointer, or a struct ctypes would pass by reference
+            if isinstance(target, _Pointer):
+                target = target.contents
+            target.x, target.y = x, y
+        return True
+
+    # endregion (emulated functions)
+
+
+class _NullFunction:
+    '''A raylib function of the null backend, prototyped like a ctypes function'''
+    __slots__ = ('__name__', 'argtypes', 'restype', 'impl')
+
+    def __init__(self, name, impl=None):
+        self.__name__ = name
+        self.argtypes = None
+        self.restype = None
+        self.impl = impl
+
+    def __call__(self, *args):
+        if self.impl is not None:
+            return self.impl(*args)
+        restype = self.restype
+        if restype is None:
+            return None
+        if issubclass(restype, _SimpleCData):
+            return restype().value # ctypes hands back plain Python values for these
+        return restype.from_buffer_copy(bytes(sizeof(restype))) # zeroed struct, NULL pointer
+
+    def __repr__(self):
+        return "<null function {}>".format(self.__name__)
+
+
+class NullLibrary:
+    '''Drop-in for the raylib CDLL: attribute lookup gives a null function per symbol'''
+
+    def __init__(self, state):
+        self._state = state
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        func = _NullFunction(name, getattr(self._state, name, None) if name[:1].isupper() else None)
+        setattr(self, name, func) # like CDLL, one function object per symbol
+        return func
+
+    def __repr__(self):
+        return "<null raylib backend>"
+
+
+state = NullState()
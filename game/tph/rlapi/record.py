@@ -0,0 +1,359 @@
+"""Draw-command recording: every draw and render-state call of a frame, as a compact buffer.
+
+Enabled with `TPH_RLAPI_RECORD=1` in the environment or `rl.use_recording()`
+before the first binding is used; it works on top of either backend, so CI can
+record headless with `TPH_RLAPI_BACKEND=null`. Calls still go through to the
+backend, and `recording` collects one buffer per `begin_drawing`/`end_drawing`
+pair. Each command in a buffer is a function id plus the call's arguments packed
+the way ctypes passes them:
+
+    from tph.rlapi import record
+    record.recording.stats(-1)         # FrameStats(draw_calls=..., state_changes=..., arg_bytes=...)
+    record.recording.save('frames.tphrec')
+    before = record.Recording.load('frames.tphrec')
+    before.diff(record.recording)      # frames whose commands differ, with both stats
+    before.replay(0)                   # run frame 0 again on the current backend
+
+Only draw calls (`Draw*`, `ClearBackground`) and state changes (`Begin*`/`End*`
+modes, shader values, batch flushes) are recorded; loading, input and timing
+functions pass straight through.
+
+Only the last `MAX_FRAMES` frames are kept, so a long session doesn't grow without
+bound; `TPH_RLAPI_RECORD_FRAMES` sets another limit (0 for none), and so does
+`recording.keep(frames)`, e.g. `recording.keep(None)` for a CI capture of a whole run.
+"""
+
+import collections
+import dataclasses
+import importlib
+import os
+from struct import Struct
+from functools import lru_cache
+from ctypes import (
+    POINTER, Array, Structure, _CFuncPtr, _Pointer, c_char, c_char_p, c_void_p, cast, sizeof, string_at
+)
+
+_MAGIC = b'TPHREC1\0'
+_COMMAND = Struct('<HI') # function id, argument bytes
+_STRING = Struct('<I') # length of a string argument
+_NO_STRING = 0xFFFFFFFF
+_ADDRESS = Struct('<Q')
+_COUNT = Struct('<I')
+_NAME = Struct('<H')
+
+MAX_FRAMES = 3600 # a minute at 60 FPS
+
+_CharPtr = POINTER(c_char)
+
+DRAW, STATE = 'draw', 'state'
+_STATE_CALLS = {
+    'SetShaderValue', 'SetShaderValueV', 'SetShaderValueMatrix', 'SetShaderValueTexture',
+    'SetShapesTexture', 'rlDrawRenderBatchActive',
+}
+_BINDING_MODULES = ('core', 'shapes', 'textures', 'text', 'models', 'audio')
+
+
+def kind_of(name):
+    '''DRAW or STATE for the raylib functions that get recorded, None for the rest'''
+    if name in ('BeginDrawing', 'EndDrawing'):
+        return None
+    if name.startswith('Draw') or name == 'ClearBackground':
+        return DRAW
+    if name.startswith(('Begin', 'End')) or name in _STATE_CALLS:
+        return STATE
+    return None
+
+
+@dataclasses.dataclass
+class FrameStats:
+    draw_calls: int = 0
+    state_changes: int = 0
+    arg_bytes: int = 0
+
+
+# region ARGUMENT PACKING
+
+def _is_string(argtype):
+    return argtype is _CharPtr or argtype is c_char_p
+
+
+@lru_cache(maxsize=None)
+def _is_pointer(argtype):
+    '''Whether an argument of `argtype` is or holds an address, only meaningful in the recording process'''
+    if issubclass(argtype, (_Pointer, _CFuncPtr)) or argtype in (c_void_p, c_char_p):
+        return True
+    if issubclass(argtype, Structure):
+        return any(_is_pointer(field[1]) for field in argtype._fields_)
+    if issubclass(argtype, Array):
+        return _is_pointer(argtype._type_)
+    return False
+
+
+def _encoder(argtype):
+    if _is_string(argtype):
+        def encode(value):
+            if value is None:
+                return _STRING.pack(_NO_STRING)
+            if not isinstance(value, bytes):
+                value = string_at(cast(value, c_void_p))
+            return _STRING.pack(len(value)) + value
+    elif _is_pointer(argtype) and not issubclass(argtype, (Structure, Array)):
+        def encode(value):
+            address = cast(value, c_void_p).value if value is not None else 0
+            return _ADDRESS.pack(address or 0)
+    else:
+        def encode(value):
+            return bytes(value if isinstance(value, argtype) else argtype(value))
+    return encode
+
+
+def _decode(argtypes, payload):
+    '''Arguments packed by _encoder(), or None if one of them is a pointer, which cannot be replayed'''
+    args = []
+    offset = 0
+    for argtype in argtypes:
+        if _is_string(argtype):
+            length, = _STRING.unpack_from(payload, offset)
+            offset += _STRING.size
+            if length == _NO_STRING:
+                args.append(None)
+            else:
+                args.append(bytes(payload[offset:offset + length]))
+                offset += length
+        elif _is_pointer(argtype):
+            return None # addresses are only valid in the recording process
+        else:
+            args.append(argtype.from_buffer_copy(payload, offset))
+            offset += sizeof(argtype)
+    return args
+
+# endregion (argument packing)
+
+
+class Recording:
+    '''Recorded frames: a name table plus one command buffer per frame, the last `max_frames` of them (None for all)'''
+
+    def __init__(self, max_frames=None):
+        self.names = [] # function id -> raylib name
+        self.frames = collections.deque(maxlen=max_frames) # finished command buffers, the oldest dropped once full
+        self.dropped = 0 # frames dropped off the front, so frames[0] is frame `dropped` of the session
+        self.active = True
+        self._ids = {}
+        self._frame = None # command buffer of the frame in progress
+
+    def clear(self):
+        self.frames.clear()
+        self.dropped = 0
+
+    def keep(self, max_frames):
+        '''Keeps the last `max_frames` frames from now on, None for all of them'''
+        self.dropped += max(len(self.frames) - max_frames, 0) if max_frames is not None else 0
+        self.frames = collections.deque(self.frames, maxlen=max_frames)
+
+    def function_id(self, name):
+        try:
+            return self._ids[name]
+        except KeyError:
+            fid = self._ids[name] = len(self.names)
+            self.names.append(name)
+            return fid
+
+    # region RECORDING
+
+    def begin_frame(self):
+        self._frame = bytearray() if self.active else None
+
+    def end_frame(self):
+        if self._frame is not None:
+            if len(self.frames) == self.frames.maxlen:
+                self.dropped += 1
+            self.frames.append(bytes(self._frame))
+            self._frame = None
+
+    def add(self, fid, payload):
+        frame = self._frame
+        if frame is not None:
+            frame += _COMMAND.pack(fid, len(payload))
+            frame += payload
+
+    # endregion (recording)
+
+    # region INSPECTION
+
+    def commands(self, index):
+        '''(name, packed arguments) for every command of frame `index`'''
+        frame = memoryview(self.frames[index])
+        offset = 0
+        while offset < len(frame):
+            fid, size = _COMMAND.unpack_from(frame, offset)
+            offset += _COMMAND.size
+            yield self.names[fid], frame[offset:offset + size]
+            offset += size
+
+    def stats(self, index):
+        stats = FrameStats()
+        for name, payload in self.commands(index):
+            if kind_of(name) == DRAW:
+                stats.draw_calls += 1
+            else:
+                stats.state_changes += 1
+            stats.arg_bytes += len(payload)
+        return stats
+
+    def diff(self, other):
+        '''(index, own stats, other stats) for every frame whose commands differ from `other`'s'''
+        differing = []
+        for index in range(max(len(self.frames), len(other.frames))):
+            mine = list(self.commands(index)) if index < len(self.frames) else []
+            theirs = list(other.commands(index)) if index < len(other.frames) else []
+            if [(name, bytes(args)) for name, args in mine] != [(name, bytes(args)) for name, args in theirs]:
+                differing.append((
+                    index,
+                    self.stats(index) if index < len(self.frames) else None,
+                    other.stats(index) if index < len(other.frames) else None,
+                ))
+        return differing
+
+    # endregion (inspection)
+
+    def replay(self, index):
+        '''Issues frame `index` again on the current backend (within begin/end_drawing);
+        returns how many commands were skipped because they take pointers'''
+        from . import _lib
+        for module in _BINDING_MODULES:
+            importlib.import_module('.' + module, __package__)
+        skipped = 0
+        for name, payload in self.commands(index):
+            symbol = _lib._SYMBOLS[name]
+            args = _decode(symbol.argtypes, payload)
+            if args is None:
+                skipped += 1
+                continue
+            symbol.resolve()(*args)
+        return skipped
+
+    # region SERIALIZATION
+
+    def save(self, path):
+        with open(path, 'wb') as fp:
+            fp.write(_MAGIC)
+            fp.write(_COUNT.pack(len(self.names)))
+            for name in self.names:
+                encoded = name.encode('ascii')
+                fp.write(_NAME.pack(len(encoded)) + encoded)
+            fp.write(_COUNT.pack(len(self.frames)))
+            for frame in self.frames:
+                fp.write(_COUNT.pack(len(frame)) + frame)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as fp:
+            data = memoryview(fp.read())
+        if data[:len(_MAGIC)] != _MAGIC:
+            raise ValueError("{} is not a tph draw-command recording".format(path))
+        recording = cls()
+        offset = len(_MAGIC)
+
+        count, = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        for _ in range(count):
+            length, = _NAME.unpack_from(data, offset)
+            offset += _NAME.size
+            recording.function_id(bytes(data[offset:offset + length]).decode('ascii'))
+            offset += length
+
+        count, = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        for _ in range(count):
+            length, = _COUNT.unpack_from(data, offset)
+            offset += _COUNT.size
+            recording.frames.append(bytes(data[offset:offset + length]))
+            offset += length
+        return recording
+
+    # endregion (serialization)
+
+
+class _Forwarded:
+    '''A backend function behind a wrapper, with argtypes/restype passed through to it'''
+    __slots__ = ('func', 'recording')
+
+    def __init__(self, func, recording):
+        self.func = func
+        self.recording = recording
+
+    @property
+    def argtypes(self):
+        return self.func.argtypes
+
+    @argtypes.setter
+    def argtypes(self, argtypes):
+        self.func.argtypes = argtypes
+
+    @property
+    def restype(self):
+        return self.func.restype
+
+    @restype.setter
+    def restype(self, restype):
+        self.func.restype = restype
+
+
+class _RecordedFunction(_Forwarded):
+    '''A draw or state call, appended to the recording before it is made'''
+    __slots__ = ('fid', 'encoders')
+
+    def __init__(self, func, recording, name):
+        super().__init__(func, recording)
+        self.fid = recording.function_id(name)
+        self.encoders = ()
+
+    @_Forwarded.argtypes.setter
+    def argtypes(self, argtypes):
+        self.func.argtypes = argtypes
+        self.encoders = tuple(_encoder(argtype) for argtype in argtypes)
+
+    def __call__(self, *args):
+        self.recording.add(self.fid, b''.join([encode(arg) for encode, arg in zip(self.encoders, args)]))
+        return self.func(*args)
+
+
+class _BeginFrame(_Forwarded):
+    __slots__ = ()
+
+    def __call__(self, *args):
+        self.recording.begin_frame()
+        return self.func(*args)
+
+
+class _EndFrame(_Forwarded):
+    __slots__ = ()
+
+    def __call__(self, *args):
+        result = self.func(*args)
+        self.recording.end_frame()
+        return result
+
+
+class RecordingLibrary:
+    '''Wraps a backend library so that draw and state calls get recorded'''
+
+    def __init__(self, library, recording):
+        self._library = library
+        self._recording = recording
+
+    def __getattr__(self, name):
+        func = getattr(self._library, name)
+        if name == 'BeginDrawing':
+            return _BeginFrame(func, self._recording)
+        if name == 'EndDrawing':
+            return _EndFrame(func, self._recording)
+        if kind_of(name) is None:
+            return func
+        return _RecordedFunction(func, self._recording, name)
+
+    def __repr__(self):
+        return "<recording {!r}>".format(self._library)
+
+
+recording = Recording(int(os.environ.get('TPH_RLAPI_RECORD_FRAMES', MAX_FRAMES)) or None)
@@ -0,0 +1,110 @@
+"""Deferred render queue: draw calls sorted by render state before they reach raylib.
+
+Instead of drawing right away, `render` implementations submit their draw call
+with the state it needs:
+
+    from tph.rlapi.renderqueue import queue
+    queue.submit(rl.fast.draw_rectangle_rec, (self.hitbox, self._hitbox_color), layer=1)
+    queue.submit(rl.draw_texture_v, (tex, pos, rl.WHITE), layer=1, texture=tex, blend=rl.BLEND_ADDITIVE)
+
+At the end of `rl.drawing()` the queue is flushed: layers are drawn in ascending
+order, and within a layer the calls are grouped by shader, blend mode and
+texture, so raylib's batch only breaks when one of those really changes.
+Submission order is kept among calls with the same state. The arguments are
+used at flush time, so structs passed in must not change before the frame ends.
+
+Only calls submitted within a frame (between the start and the end of
+`rl.drawing()`, or `begin_drawing()`/`end_drawing()`) are queued; outside of one,
+e.g. a `render()` run headless, `submit` drops them with a warning, once, and
+counts them in `queue.dropped`, so the queue can't grow without bound.
+
+`queue.stats` holds the numbers of the last flush, including how many batch
+breaks the sorting saved compared to drawing in submission order.
+"""
+
+import dataclasses
+import warnings
+from operator import itemgetter
+
+from .core import BLEND_ALPHA, _END_OF_FRAME, blend_mode, render_state, shader_mode
+
+
+@dataclasses.dataclass
+class QueueStats:
+    commands: int = 0
+    batch_breaks: int = 0 # render state changes when flushed
+    breaks_saved: int = 0 # compared to drawing in submission order
+
+
+def _batch_breaks(states):
+    breaks = 0
+    previous = None
+    for state in states:
+        if state != previous:
+            breaks += 1
+            previous = state
+    return max(breaks - 1, 0)
+
+
+class RenderQueue:
+    '''Draw calls of one frame with their render state, flushed in state order'''
+
+    def __init__(self):
+        self.commands = []
+        self.stats = QueueStats()
+        self.dropped = 0 # calls submitted outside of a frame
+
+    def submit(self, draw, args=(), layer=0, texture=None, blend=BLEND_ALPHA, shader=None):
+        '''Queues `draw(*args)`, to run in `blend` mode and with `shader`; `texture` is only a key for grouping
+        the calls that draw from the same texture, `draw` has to use it itself'''
+        if not render_state.in_frame:
+            if self.dropped == 0:
+                warnings.warn("draw calls submitted to the render queue outside of a frame are dropped", RuntimeWarning, stacklevel=2)
+            self.dropped += 1
+            return
+        state = (
+            shader.id if shader is not None else 0,
+            int(blend),
+            texture.id if texture is not None else 0,
+        )
+        self.commands.append((layer, state, shader, draw, args))
+
+    def flush(self):
+        '''Runs the queued draw calls, sorted by layer and render state'''
+        commands = self.commands
+        if not commands:
+            self.stats = QueueStats()
+            return
+        unsorted_breaks = _batch_breaks([state for _, state, *_ in commands])
+        commands.sort(key=itemgetter(0, 1)) # stable, so equal states keep their order
+
+        # blend and shader contexts are pushed onto the render state tracker, so a
+        # flush inside e.g. `with rl.blend_mode(...)` restores that mode afterwards
+        shader = blend = current = None
+        for _, state, shader_struct, draw, args in commands:
+            if state != current:
+                current = state
+                if shader is None or state[0] != shader.key:
+                    if shader is not None:
+                        render_state.pop('shader')
+                    shader = shader_mode(shader_struct) if shader_struct is not None else None
+                    if shader is not None:
+                        render_state.push(shader)
+                if blend is None or state[1] != blend.key:
+                    if blend is not None:
+                        render_state.pop('blend')
+                    blend = blend_mode(state[1])
+                    render_state.push(blend)
+            draw(*args)
+
+        if blend is not None:
+            render_state.pop('blend')
+        if shader is not None:
+            render_state.pop('shader')
+        breaks = _batch_breaks([state for _, state, *_ in commands])
+        self.stats = QueueStats(len(commands), breaks, unsorted_breaks - breaks)
+        commands.clear()
+
+
+queue = RenderQueue()
+_END_OF_FRAME.append(queue.flush)
@@ -0,0 +1,379 @@
+"""raylib bindings for basic 2D shape drawing and collision checks"""
+
+from array import array
+from operator import add
+from typing import Sequence as Seq, Union
+from ctypes import byref, cast
+
+from ._lib import binder
+from .core import (
+    Bool, Color, Float, FloatPtr, Int, Matrix, Rectangle, Texture2D, UCharPtr, Vector2, Vector2Ptr,
+    _arr_in, _color, _rect, _vec2
+)
+
+_wrap = binder(globals())
+
+
+_SetShapesTexture = _wrap('SetShapesTexture', [Texture2D, Rectangle], None)
+_DrawPixel = _wrap('DrawPixel', [Int, Int, Color], None)
+_DrawPixelV = _wrap('DrawPixelV', [Vector2, Color], None)
+_DrawLine = _wrap('DrawLine', [Int, Int, Int, Int, Color], None)
+_DrawLineV = _wrap('DrawLineV', [Vector2, Vector2, Color], None)
+_DrawLineEx = _wrap('DrawLineEx', [Vector2, Vector2, Float, Color], None)
+_DrawLineBezier = _wrap('DrawLineBezier', [Vector2, Vector2, Float, Color], None)
+_DrawLineBezierQuad = _wrap('DrawLineBezierQuad', [Vector2, Vector2, Vector2, Float, Color], None)
+_DrawLineBezierCubic = _wrap('DrawLineBezierCubic', [Vector2, Vector2, Vector2, Vector2, Float, Color], None)
+_DrawLineStrip = _wrap('DrawLineStrip', [Vector2Ptr, Int, Color], None)
+_DrawCircle = _wrap('DrawCircle', [Int, Int, Float, Color], None)
+_DrawCircleSector = _wrap('DrawCircleSector', [Vector2, Float, Float, Float, Int, Color], None)
+_DrawCircleSectorLines = _wrap('DrawCircleSectorLines', [Vector2, Float, Float, Float, Int, Color], None)
+_DrawCircleGradient = _wrap('DrawCircleGradient', [Int, Int, Float, Color, Color], None)
+_DrawCircleV = _wrap('DrawCircleV', [Vector2, Float, Color], None)
+_DrawCircleLines = _wrap('DrawCircleLines', [Int, Int, Float, Color], None)
+_DrawEllipse = _wrap('DrawEllipse', [Int, Int, Float, Float, Color], None)
+_DrawEllipseLines = _wrap('DrawEllipseLines', [Int, Int, Float, Float, Color], None)
+_DrawRing = _wrap('DrawRing', [Vector2, Float, Float, Float, Float, Int, Color], None)
+_DrawRingLines = _wrap('DrawRingLines', [Vector2, Float, Float, Float, Float, Int, Color], None)
+_DrawRectangle = _wrap('DrawRectangle', [Int, Int, Int, Int, Color], None)
+_DrawRectangleV = _wrap('DrawRectangleV', [Vector2, Vector2, Color], None)
+_DrawRectangleRec = _wrap('DrawRectangleRec', [Rectangle, Color], None)
+_DrawRectanglePro = _wrap('DrawRectanglePro', [Rectangle, Vector2, Float, Color], None)
+_DrawRectangleGradientV = _wrap('DrawRectangleGradientV', [Int, Int, Int, Int, Color, Color], None)
+_DrawRectangleGradientH = _wrap('DrawRectangleGradientH', [Int, Int, Int, Int, Color, Color], None)
+_DrawRectangleGradientEx = _wrap('DrawRectangleGradientEx', [Rectangle, Color, Color, Color, Color], None)
+_DrawRectangleLines = _wrap('DrawRectangleLines', [Int, Int, Int, Int, Color], None)
+_DrawRectangleLinesEx = _wrap('DrawRectangleLinesEx', [Rectangle, Float, Color], None)
+_DrawRectangleRounded = _wrap('DrawRectangleRounded', [Rectangle, Float, Int, Color], None)
+_DrawRectangleRoundedLines = _wrap('DrawRectangleRoundedLines', [Rectangle, Float, Int, Float, Color], None)
+_DrawTriangle = _wrap('DrawTriangle', [Vector2, Vector2, Vector2, Color], None)
+_DrawTriangleLines = _wrap('DrawTriangleLines', [Vector2, Vector2, Vector2, Color], None)
+_DrawTriangleFan = _wrap('DrawTriangleFan', [Vector2Ptr, Int, Color], None)
+_DrawTriangleStrip = _wrap('DrawTriangleStrip', [Vector2Ptr, Int, Color], None)
+_DrawPoly = _wrap('DrawPoly', [Vector2, Int, Float, Float, Color], None)
+_DrawPolyLines = _wrap('DrawPolyLines', [Vector2, Int, Float, Float, Color], None)
+_DrawPolyLinesEx = _wrap('DrawPolyLinesEx', [Vector2, Int, Float, Float, Float, Color], None)
+_CheckCollisionRecs = _wrap('CheckCollisionRecs', [Rectangle, Rectangle], Bool)
+_CheckCollisionCircles = _wrap('CheckCollisionCircles', [Vector2, Float, Vector2, Float], Bool)
+_CheckCollisionCircleRec = _wrap('CheckCollisionCircleRec', [Vector2, Float, Rectangle], Bool)
+_CheckCollisionPointRec = _wrap('CheckCollisionPointRec', [Vector2, Rectangle], Bool)
+_CheckCollisionPointCircle = _wrap('CheckCollisionPointCircle', [Vector2, Vector2, Float], Bool)
+_CheckCollisionPointTriangle = _wrap('CheckCollisionPointTriangle', [Vector2, Vector2, Vector2, Vector2], Bool)
+_CheckCollisionLines = _wrap('CheckCollisionLines', [Vector2, Vector2, Vector2, Vector2, Vector2Ptr], Bool)
+_CheckCollisionPointLine = _wrap('CheckCollisionPointLine', [Vector2, Vector2, Vector2, Int], Bool)
+_GetCollisionRec = _wrap('GetCollisionRec', [Rectangle, Rectangle], Rectangle)
+_rlDrawRenderBatchActive = _wrap('rlDrawRenderBatchActive', [], None)
+
+def set_shapes_texture(texture: 'Texture2D', source: 'Rectangle') -> 'None':
+    """Set texture and rectangle to be used on shapes drawing"""
+    _SetShapesTexture(texture, _rect(source))
+
+def draw_pixel(pos_x: 'int', pos_y: 'int', color: 'Color') -> 'None':
+    """Draw a pixel"""
+    _DrawPixel(int(pos_x), int(pos_y), _color(color))
+
+def draw_pixel_v(position: 'Vector2', color: 'Color') -> 'None':
+    """Draw a pixel (Vector version)"""
+    _DrawPixelV(_vec2(position), _color(color))
+
+def draw_line(start_pos_x: 'int', start_pos_y: 'int', end_pos_x: 'int', end_pos_y: 'int', color: 'Color') -> 'None':
+    """Draw a line"""
+    _DrawLine(int(start_pos_x), int(start_pos_y), int(end_pos_x), int(end_pos_y), _color(color))
+
+def draw_line_v(start_pos: 'Vector2', end_pos: 'Vector2', color: 'Color') -> 'None':
+    """Draw a line (Vector version)"""
+    _DrawLineV(_vec2(start_pos), _vec2(end_pos), _color(color))
+
+def draw_line_ex(start_pos: 'Vector2', end_pos: 'Vector2', thick: 'float', color: 'Color') -> 'None':
+    """Draw a line defining thickness"""
+    _DrawLineEx(_vec2(start_pos), _vec2(end_pos), float(thick), _color(color))
+
+def draw_line_bezier(start_pos: 'Vector2', end_pos: 'Vector2', thick: 'float', color: 'Color') -> 'None':
+    """Draw a line using cubic-bezier curves in-out"""
+    _DrawLineBezier(_vec2(start_pos), _vec2(end_pos), float(thick), _color(color))
+
+def draw_line_bezier_quad(start_pos: 'Vector2', end_pos: 'Vector2', control_pos: 'Vector2', thick: 'float', color: 'Color') -> 'None':
+    """Draw line using quadratic bezier curves with a control point"""
+    _DrawLineBezierQuad(_vec2(start_pos), _vec2(end_pos), _vec2(control_pos), float(thick), _color(color))
+
+def draw_line_bezier_cubic(start_pos: 'Vector2', end_pos: 'Vector2', start_control_pos: 'Vector2', end_control_pos: 'Vector2', thick: 'float', color: 'Color') -> 'None':
+    """Draw line using cubic bezier curves with 2 control points"""
+    _DrawLineBezierCubic(_vec2(start_pos), _vec2(end_pos), _vec2(start_control_pos), _vec2(end_control_pos), float(thick), _color(color))
+
+def draw_line_strip(points: 'Vector2Ptr', color: 'Color') -> 'None':
+    """Draw lines sequence"""
+    _DrawLineStrip(_arr_in(Vector2, points), len(points), _color(color))
+
+def draw_circle(center_x: 'int', center_y: 'int', radius: 'float', color: 'Color') -> 'None':
+    """Draw a color-filled circle"""
+    _DrawCircle(int(center_x), int(center_y), float(radius), _color(color))
+
+def draw_circle_sector(center: 'Vector2', radius: 'float', start_angle: 'float', end_angle: 'float', segments: 'int', color: 'Color') -> 'None':
+    """Draw a piece of a circle"""
+    _DrawCircleSector(_vec2(center), float(radius), float(start_angle), float(end_angle), int(segments), _color(color))
+
+def draw_circle_sector_lines(center: 'Vector2', radius: 'float', start_angle: 'float', end_angle: 'float', segments: 'int', color: 'Color') -> 'None':
+    """Draw circle sector outline"""
+    _DrawCircleSectorLines(_vec2(center), float(radius), float(start_angle), float(end_angle), int(segments), _color(color))
+
+def draw_circle_gradient(center_x: 'int', center_y: 'int', radius: 'float', color1: 'Color', color2: 'Color') -> 'None':
+    """Draw a gradient-filled circle"""
+    _DrawCircleGradient(int(center_x), int(center_y), float(radius), _color(color1), _color(color2))
+
+def draw_circle_v(center: 'Vector2', radius: 'float', color: 'Color') -> 'None':
+    """Draw a color-filled circle (Vector version)"""
+    _DrawCircleV(_vec2(center), float(radius), _color(color))
+
+def draw_circle_lines(center_x: 'int', center_y: 'int', radius: 'float', color: 'Color') -> 'None':
+    """Draw circle outline"""
+    _DrawCircleLines(int(center_x), int(center_y), float(radius), _color(color))
+
+def draw_ellipse(center_x: 'int', center_y: 'int', radius_h: 'float', radius_v: 'float', color: 'Color') -> 'None':
+    """Draw ellipse"""
+    _DrawEllipse(int(center_x), int(center_y), float(radius_h), float(radius_v), _color(color))
+
+def draw_ellipse_lines(center_x: 'int', center_y: 'int', radius_h: 'float', radius_v: 'float', color: 'Color') -> 'None':
+    """Draw ellipse outline"""
+    _DrawEllipseLines(int(center_x), int(center_y), float(radius_h), float(radius_v), _color(color))
+
+def draw_ring(center: 'Vector2', inner_radius: 'float', outer_radius: 'float', start_angle: 'float', end_angle: 'float', segments: 'int', color: 'Color') -> 'None':
+    """Draw ring"""
+    _DrawRing(_vec2(center), float(inner_radius), float(outer_radius), float(start_angle), float(end_angle), int(segments), _color(color))
+
+def draw_ring_lines(center: 'Vector2', inner_radius: 'float', outer_radius: 'float', start_angle: 'float', end_angle: 'float', segments: 'int', color: 'Color') -> 'None':
+    """Draw ring outline"""
+    _DrawRingLines(_vec2(center), float(inner_radius), float(outer_radius), float(start_angle), float(end_angle), int(segments), _color(color))
+
+def draw_rectangle(pos_x: 'int', pos_y: 'int', width: 'int', height: 'int', color: 'Color') -> 'None':
+    """Draw a color-filled rectangle"""
+    _DrawRectangle(int(pos_x), int(pos_y), int(width), int(height), _color(color))
+
+def draw_rectangle_v(position: 'Vector2', size: 'Vector2', color: 'Color') -> 'None':
+    """Draw a color-filled rectangle (Vector version)"""
+    _DrawRectangleV(_vec2(position), _vec2(size), _color(color))
+
+def draw_rectangle_rec(rec: 'Rectangle', color: 'Color') -> 'None':
+    """Draw a color-filled rectangle"""
+    _DrawRectangleRec(_rect(rec), _color(color))
+
+def draw_rectangle_pro(rec: 'Rectangle', origin: 'Vector2', rotation: 'float', color: 'Color') -> 'None':
+    """Draw a color-filled rectangle with pro parameters"""
+    _DrawRectanglePro(_rect(rec), _vec2(origin), float(rotation), _color(color))
+
+def draw_rectangle_gradient_v(pos_x: 'int', pos_y: 'int', width: 'int', height: 'int', color1: 'Color', color2: 'Color') -> 'None':
+    """Draw a vertical-gradient-filled rectangle"""
+    _DrawRectangleGradientV(int(pos_x), int(pos_y), int(width), int(height), _color(color1), _color(color2))
+
+def draw_rectangle_gradient_h(pos_x: 'int', pos_y: 'int', width: 'int', height: 'int', color1: 'Color', color2: 'Color') -> 'None':
+    """Draw a horizontal-gradient-filled rectangle"""
+    _DrawRectangleGradientH(int(pos_x), int(pos_y), int(width), int(height), _color(color1), _color(color2))
+
+def draw_rectangle_gradient_ex(rec: 'Rectangle', col1: 'Color', col2: 'Color', col3: 'Color', col4: 'Color') -> 'None':
+    """Draw a gradient-filled rectangle with custom vertex colors"""
+    _DrawRectangleGradientEx(_rect(rec), _color(col1), _color(col2), _color(col3), _color(col4))
+
+def draw_rectangle_lines(pos_x: 'int', pos_y: 'int', width: 'int', height: 'int', color: 'Color') -> 'None':
+    """Draw rectangle outline"""
+    _DrawRectangleLines(int(pos_x), int(pos_y), int(width), int(height), _color(color))
+
+def draw_rectangle_lines_ex(rec: 'Rectangle', line_thick: 'float', color: 'Color') -> 'None':
+    """Draw rectangle outline with extended parameters"""
+    _DrawRectangleLinesEx(_rect(rec), float(line_thick), _color(color))
+
+def draw_rectangle_rounded(rec: 'Rectangle', roundness: 'float', segments: 'int', color: 'Color') -> 'None':
+    """Draw rectangle with rounded edges"""
+    _DrawRectangleRounded(_rect(rec), float(roundness), int(segments), _color(color))
+
+def draw_rectangle_rounded_lines(rec: 'Rectangle', roundness: 'float', segments: 'int', line_thick: 'float', color: 'Color') -> 'None':
+    """Draw rectangle with rounded edges outline"""
+    _DrawRectangleRoundedLines(_rect(rec), float(roundness), int(segments), float(line_thick), _color(color))
+
+def draw_triangle(v1: 'Vector2', v2: 'Vector2', v3: 'Vector2', color: 'Color') -> 'None':
+    """Draw a color-filled triangle (vertex in counter-clockwise order!)"""
+    _DrawTriangle(_vec2(v1), _vec2(v2), _vec2(v3), _color(color))
+
+def draw_triangle_lines(v1: 'Vector2', v2: 'Vector2', v3: 'Vector2', color: 'Color') -> 'None':
+    """Draw triangle outline (vertex in counter-clockwise order!)"""
+    _DrawTriangleLines(_vec2(v1), _vec2(v2), _vec2(v3), _color(color))
+
+def draw_triangle_fan(points: 'Vector2Ptr', color: 'Color') -> 'None':
+    """Draw a triangle fan defined by points (first vertex is the center)"""
+    _DrawTriangleFan(_arr_in(Vector2, points), len(points), _color(color))
+
+def draw_triangle_strip(points: 'Vector2Ptr', color: 'Color') -> 'None':
+    """Draw a triangle strip defined by points"""
+    _DrawTriangleStrip(_arr_in(Vector2, points), len(points), _color(color))
+
+def draw_poly(center: 'Vector2', sides: 'int', radius: 'float', rotation: 'float', color: 'Color') -> 'None':
+    """Draw a regular polygon (Vector version)"""
+    _DrawPoly(_vec2(center), int(sides), float(radius), float(rotation), _color(color))
+
+def draw_poly_lines(center: 'Vector2', sides: 'int', radius: 'float', rotation: 'float', color: 'Color') -> 'None':
+    """Draw a polygon outline of n sides"""
+    _DrawPolyLines(_vec2(center), int(sides), float(radius), float(rotation), _color(color))
+
+def draw_poly_lines_ex(center: 'Vector2', sides: 'int', radius: 'float', rotation: 'float', line_thick: 'float', color: 'Color') -> 'None':
+    """Draw a polygon outline of n sides with extended parameters"""
+    _DrawPolyLinesEx(_vec2(center), int(sides), float(radius), float(rotation), float(line_thick), _color(color))
+
+def check_collision_recs(rec1: 'Rectangle', rec2: 'Rectangle') -> 'bool':
+    """Check collision between two rectangles"""
+    result = _CheckCollisionRecs(_rect(rec1), _rect(rec2))
+    return result
+
+def check_collision_circles(center1: 'Vector2', radius1: 'float', center2: 'Vector2', radius2: 'float') -> 'bool':
+    """Check collision between two circles"""
+    result = _CheckCollisionCircles(_vec2(center1), float(radius1), _vec2(center2), float(radius2))
+    return result
+
+def check_collision_circle_rec(center: 'Vector2', radius: 'float', rec: 'Rectangle') -> 'bool':
+    """Check collision between circle and rectangle"""
+    result = _CheckCollisionCircleRec(_vec2(center), float(radius), _rect(rec))
+    return result
+
+def check_collision_point_rec(point: 'Vector2', rec: 'Rectangle') -> 'bool':
+    """Check if point is inside rectangle"""
+    result = _CheckCollisionPointRec(_vec2(point), _rect(rec))
+    return result
+
+def check_collision_point_circle(point: 'Vector2', center: 'Vector2', radius: 'float') -> 'bool':
+    """Check if point is inside circle"""
+    result = _CheckCollisionPointCircle(_vec2(point), _vec2(center), float(radius))
+    return result
+
+def check_collision_point_triangle(point: 'Vector2', p1: 'Vector2', p2: 'Vector2', p3: 'Vector2') -> 'bool':
+    """Check if point is inside a triangle"""
+    result = _CheckCollisionPointTriangle(_vec2(point), _vec2(p1), _vec2(p2), _vec2(p3))
+    return result
+
+def check_collision_lines(start_pos1: 'Vector2', end_pos1: 'Vector2', start_pos2: 'Vector2', end_pos2: 'Vector2', collision_point: 'Vector2Ptr') -> 'bool':
+    """Check the collision between two lines defined by two points each, returns collision point by reference"""
+    # raylib writes through the pointer: a caller's Vector2 goes by reference, anything else into a struct of its own,
+    # never one of the cached or scratch structs of _vec2()
+    if not isinstance(collision_point, Vector2):
+        x, y = collision_point
+        collision_point = Vector2(float(x), float(y))
+    result = _CheckCollisionLines(_vec2(start_pos1), _vec2(end_pos1), _vec2(start_pos2), _vec2(end_pos2), byref(collision_point))
+    return result
+
+def check_collision_point_line(point: 'Vector2', p1: 'Vector2', p2: 'Vector2', threshold: 'int') -> 'bool':
+    """Check if point belongs to line created between two points [p1] and [p2] with defined margin in pixels [threshold]"""
+    result = _CheckCollisionPointLine(_vec2(point), _vec2(p1), _vec2(p2), int(threshold))
+    return result
+
+def get_collision_rec(rec1: 'Rectangle', rec2: 'Rectangle') -> 'Rectangle':
+    """Get collision rectangle for two rectangles collision"""
+    result = _GetCollisionRec(_rect(rec1), _rect(rec2))
+    return result
+
+
+# region BATCHED DRAWING
+
+# corners of the two triangles making up a rect, as (right?, bottom?) flags:
+# top-left, bottom-left, top-right, then top-right, bottom-left, bottom-right
+_QUAD_CORNERS = ((0, 0), (0, 1), (1, 0), (1, 0), (0, 1), (1, 1))
+_IDENTITY = Matrix(m0=1.0, m5=1.0, m10=1.0, m15=1.0)
+
+
+class _RectBatch:
+    '''Dynamic mesh that batched rectangles are streamed into, grown on demand'''
+
+    def __init__(self):
+        self.mesh = None
+        self.material = None
+        self.capacity = 0 # in rectangles
+        self.vertices = array('f') # x, y, z of 6 vertices per rect, z stays 0
+        self.colors = array('B') # r, g, b, a of 6 vertices per rect
+
+    def reserve(self, count):
+        '''Makes sure the buffers and the mesh hold at least `count` rectangles'''
+        from .models import Mesh, _LoadMaterialDefault, _UnloadMesh, _UploadMesh
+        if self.material is None:
+            self.material = _LoadMaterialDefault()
+        if count <= self.capacity:
+            return
+        if self.mesh is not None:
+            _UnloadMesh(self.mesh)
+
+        capacity = max(count, 2 * self.capacity, 256)
+        self.vertices = array('f', bytes(72 * capacity))
+        self.colors = array('B', bytes(24 * capacity))
+        mesh = Mesh(vertex_count=capacity * 6, triangle_count=capacity * 2)
+        mesh.vertices = cast(self.vertices.buffer_info()[0], FloatPtr)
+        mesh.colors = cast(self.colors.buffer_info()[0], UCharPtr)
+        _UploadMesh(byref(mesh), True)
+        # the GPU has its own copy now, and UnloadMesh() must not free Python memory
+        mesh.vertices = None
+        mesh.colors = None
+        self.mesh, self.capacity = mesh, capacity
+
+    def draw(self, floats, colors, count):
+        '''Draws `count` rects given as flat x, y, width, height floats and either
+        one Color or flat r, g, b, a bytes'''
+        from .models import _DrawMesh, _UpdateMeshBuffer
+        self.reserve(count)
+        vertices, vertex_colors = self.vertices, self.colors
+
+        xs, ys = floats[0::4], floats[1::4]
+        rights, bottoms = array('f', map(add, xs, floats[2::4])), array('f', map(add, ys, floats[3::4]))
+        end = 18 * count
+        for corner, (right, bottom) in enumerate(_QUAD_CORNERS):
+            vertices[3 * corner:end:18] = rights if right else xs
+            vertices[3 * corner + 1:end:18] = bottoms if bottom else ys
+
+        end = 24 * count
+        if isinstance(colors, Color):
+            vertex_colors[:end] = array('B', bytes(colors) * (6 * count))
+        else:
+            for corner in range(6):
+                for channel in range(4):
+                    vertex_colors[4 * corner + channel:end:24] = colors[channel::4]
+
+        _rlDrawRenderBatchActive() # whatever was drawn before goes underneath
+        _UpdateMeshBuffer(self.mesh, 0, vertices.buffer_info()[0], count * 72, 0)
+        _UpdateMeshBuffer(self.mesh, 3, vertex_colors.buffer_info()[0], count * 24, 0)
+        self.mesh.vertex_count = count * 6
+        self.mesh.triangle_count = count * 2
+        _DrawMesh(self.mesh, self.material, _IDENTITY)
+
+
+_RECT_BATCH = _RectBatch()
+
+
+def _packed(items, typecode, size, convert):
+    '''The raw bytes of every item, `size` each, as an array of `typecode`'''
+    data = array(typecode)
+    try:
+        data.frombytes(memoryview(items).cast('B'))
+        return data
+    except TypeError: # not a buffer
+        pass
+    try: # structs, or tuples that happen to be laid out as bytes (colors)
+        raw = b''.join(map(bytes, items))
+    except (TypeError, ValueError):
+        raw = None
+    if raw is None or len(raw) != size * len(items):
+        raw = b''.join([bytes(convert(item)) for item in items])
+    data.frombytes(raw)
+    return data
+
+
+def draw_rectangles(recs: 'Seq[Rectangle]', colors: 'Union[Color, Seq[Color]]') -> 'None':
+    """Draw many color-filled rectangles at once, as a single mesh
+
+    `recs` is a sequence of rectangles or any buffer of float32 x, y, width, height
+    quadruples (a `Rectangle * n` array, a NumPy array of shape (n, 4)...), `colors`
+    either one `Color` for all of them or one color per rect in the same forms.
+    """
+    floats = _packed(recs, 'f', 16, _rect)
+    if len(floats) % 4:
+        raise ValueError("rects must be 4 float32 each, got {} floats".format(len(floats)))
+    count = len(floats) // 4
+    if not count:
+        return
+    if not isinstance(colors, Color):
+        colors = _packed(colors, 'B', 4, _color)
+        if len(colors) != 4 * count:
+            raise ValueError("got {} rects but {} colors".format(count, len(colors) // 4))
+    _RECT_BATCH.draw(floats, colors, count)
+
+# endregion (batched drawing)
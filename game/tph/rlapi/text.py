@@ -0,0 +1,410 @@
+"""raylib bindings for fonts and text drawing/management"""
+
+from enum import IntEnum
+from typing import Sequence as Seq, Union
+from ctypes import Structure, POINTER, byref
+
+from ._lib import binder
+from .core import (
+    Bool, Char, CharPtr, CharPtrPtr, Color, Float, Image, Int, IntPtr, Rectangle, RectanglePtr,
+    Texture2D, UCharPtr, UInt, Vector2, VoidPtr, _color, _ptr_out, _str_in, _str_in2, _vec2
+)
+
+_wrap = binder(globals())
+
+
+class GlyphInfo(Structure):
+    '''GlyphInfo, font characters glyphs info'''
+    _fields_ = [
+        ('value', Int),
+        ('offset_x', Int),
+        ('offset_y', Int),
+        ('advance_x', Int),
+        ('image', Image),
+    ]
+
+
+    @classmethod
+    def array_of(cls, glyph_info_sequence):
+        '''Creates and returns an array of GlyphInfos'''
+        arr = cls * len(glyph_info_sequence)
+        return arr(*glyph_info_sequence)
+
+
+    def __init__(self, value: int = None,
+                 offset_x: int = None,
+                 offset_y: int = None,
+                 advance_x: int = None,
+                 image: Image = None):
+        '''Initializes this GlyphInfo struct'''
+        super(GlyphInfo, self).__init__(
+            value or 0,
+            offset_x or 0,
+            offset_y or 0,
+            advance_x or 0,
+            image or Image()
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this GlyphInfo instance'''
+        return byref(self)
+
+
+
+# Pointer type to GlyphInfos
+GlyphInfoPtr = POINTER(GlyphInfo)
+
+class Font(Structure):
+    '''Font, font texture and GlyphInfo array data'''
+    _fields_ = [
+        ('base_size', Int),
+        ('glyph_count', Int),
+        ('glyph_padding', Int),
+        ('texture', Texture2D),
+        ('recs', RectanglePtr),
+        ('glyphs', GlyphInfoPtr),
+    ]
+
+
+    @classmethod
+    def array_of(cls, font_sequence):
+        '''Creates and returns an array of Fonts'''
+        arr = cls * len(font_sequence)
+        return arr(*font_sequence)
+
+
+    def __init__(self, base_size: int = None,
+                 glyph_count: int = None,
+                 glyph_padding: int = None,
+                 texture: Texture2D = None,
+                 recs: RectanglePtr = None,
+                 glyphs: GlyphInfoPtr = None):
+        '''Initializes this Font struct'''
+        super(Font, self).__init__(
+            base_size or 0,
+            glyph_count or 0,
+            glyph_padding or 0,
+            texture or Texture2D(),
+            recs,
+            glyphs
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this Font instance'''
+        return byref(self)
+
+
+    def __str__(self):
+        return "[{} at {}]".format(self.__class__.__name__, id(self))
+
+    def __repr__(self):
+        return self.__str__()
+
+    def unload(self) -> 'None':
+        """Unload font from GPU memory (VRAM)"""
+        _UnloadFont(self)
+
+    def draw_text_ex(self, text: 'Union[str, CharPtr]', position: 'Vector2', font_size: 'float', spacing: 'float', tint: 'Color') -> 'None':
+        """Draw text using font and additional parameters"""
+        _DrawTextEx(self, _str_in(text), _vec2(position), float(font_size), float(spacing), _color(tint))
+
+    def draw_text_pro(self, text: 'Union[str, CharPtr]', position: 'Vector2', origin: 'Vector2', rotation: 'float', font_size: 'float', spacing: 'float', tint: 'Color') -> 'None':
+        """Draw text using Font and pro parameters (rotation)"""
+        _DrawTextPro(self, _str_in(text), _vec2(position), _vec2(origin), float(rotation), float(font_size), float(spacing), _color(tint))
+
+    def draw_text_codepoint(self, codepoint: 'int', position: 'Vector2', font_size: 'float', tint: 'Color') -> 'None':
+        """Draw one character (codepoint)"""
+        _DrawTextCodepoint(self, int(codepoint), _vec2(position), float(font_size), _color(tint))
+
+    def draw_text_codepoints(self, codepoints: 'Union[Seq[int], IntPtr]', position: 'Vector2', font_size: 'float', spacing: 'float', tint: 'Color') -> 'None':
+        """Draw multiple character (codepoint)"""
+        _DrawTextCodepoints(self, _str_in(codepoints), len(codepoints), _vec2(position), float(font_size), float(spacing), _color(tint))
+
+    def measure_text_ex(self, text: 'Union[str, CharPtr]', font_size: 'float', spacing: 'float') -> 'Vector2':
+        """Measure string size for Font"""
+        result = _MeasureTextEx(self, _str_in(text), float(font_size), float(spacing))
+        return result
+
+    def get_glyph_index(self, codepoint: 'int') -> 'int':
+        """Get glyph index position in font for a codepoint (unicode character), fallback to '?' if not found"""
+        result = _GetGlyphIndex(self, int(codepoint))
+        return result
+
+    def get_glyph_info(self, codepoint: 'int') -> 'GlyphInfo':
+        """Get glyph font info data for a codepoint (unicode character), fallback to '?' if not found"""
+        result = _GetGlyphInfo(self, int(codepoint))
+        return result
+
+    def get_glyph_atlas_rec(self, codepoint: 'int') -> 'Rectangle':
+        """Get glyph rectangle in font atlas for a codepoint (unicode character), fallback to '?' if not found"""
+        result = _GetGlyphAtlasRec(self, int(codepoint))
+        return result
+
+
+# Pointer type to Fonts
+FontPtr = POINTER(Font)
+
+class FontType(IntEnum):
+    """Font type, defines generation method"""
+
+    FONT_DEFAULT = 0
+    """Default font generation, anti-aliased"""
+
+    FONT_BITMAP = 1
+    """Bitmap font generation, no anti-aliasing"""
+
+    FONT_SDF = 2
+    """SDF font generation, requires external shader"""
+
+
+
+FONT_DEFAULT = FontType.FONT_DEFAULT
+FONT_BITMAP = FontType.FONT_BITMAP
+FONT_SDF = FontType.FONT_SDF
+
+_GetFontDefault = _wrap('GetFontDefault', [], Font)
+_LoadFont = _wrap('LoadFont', [CharPtr], Font)
+_LoadFontEx = _wrap('LoadFontEx', [CharPtr, Int, IntPtr, Int], Font)
+_LoadFontFromImage = _wrap('LoadFontFromImage', [Image, Color, Int], Font)
+_LoadFontFromMemory = _wrap('LoadFontFromMemory', [CharPtr, UCharPtr, Int, Int, IntPtr, Int], Font)
+_LoadFontData = _wrap('LoadFontData', [UCharPtr, Int, Int, IntPtr, Int, Int], GlyphInfoPtr)
+_GenImageFontAtlas = _wrap('GenImageFontAtlas', [GlyphInfoPtr, RectanglePtr, Int, Int, Int, Int], Image)
+_UnloadFontData = _wrap('UnloadFontData', [GlyphInfoPtr, Int], None)
+_UnloadFont = _wrap('UnloadFont', [Font], None)
+_ExportFontAsCode = _wrap('ExportFontAsCode', [Font, CharPtr], Bool)
+_DrawFPS = _wrap('DrawFPS', [Int, Int], None)
+_DrawText = _wrap('DrawText', [CharPtr, Int, Int, Int, Color], None)
+_DrawTextEx = _wrap('DrawTextEx', [Font, CharPtr, Vector2, Float, Float, Color], None)
+_DrawTextPro = _wrap('DrawTextPro', [Font, CharPtr, Vector2, Vector2, Float, Float, Float, Color], None)
+_DrawTextCodepoint = _wrap('DrawTextCodepoint', [Font, Int, Vector2, Float, Color], None)
+_DrawTextCodepoints = _wrap('DrawTextCodepoints', [Font, IntPtr, Int, Vector2, Float, Float, Color], None)
+_MeasureText = _wrap('MeasureText', [CharPtr, Int], Int)
+_MeasureTextEx = _wrap('MeasureTextEx', [Font, CharPtr, Float, Float], Vector2)
+_GetGlyphIndex = _wrap('GetGlyphIndex', [Font, Int], Int)
+_GetGlyphInfo = _wrap('GetGlyphInfo', [Font, Int], GlyphInfo)
+_GetGlyphAtlasRec = _wrap('GetGlyphAtlasRec', [Font, Int], Rectangle)
+_LoadCodepoints = _wrap('LoadCodepoints', [CharPtr, IntPtr], IntPtr)
+_UnloadCodepoints = _wrap('UnloadCodepoints', [IntPtr], None)
+_GetCodepointCount = _wrap('GetCodepointCount', [CharPtr], Int)
+_GetCodepoint = _wrap('GetCodepoint', [CharPtr, IntPtr], Int)
+_CodepointToUTF8 = _wrap('CodepointToUTF8', [Int, IntPtr], CharPtr)
+_TextCodepointsToUTF8 = _wrap('TextCodepointsToUTF8', [IntPtr, Int], CharPtr)
+_TextCopy = _wrap('TextCopy', [CharPtr, CharPtr], Int)
+_TextIsEqual = _wrap('TextIsEqual', [CharPtr, CharPtr], Bool)
+_TextLength = _wrap('TextLength', [CharPtr], UInt)
+_TextFormat = _wrap('TextFormat', [CharPtr, VoidPtr], CharPtr)
+_TextSubtext = _wrap('TextSubtext', [CharPtr, Int, Int], CharPtr)
+_TextReplace = _wrap('TextReplace', [CharPtr, CharPtr, CharPtr], CharPtr)
+_TextInsert = _wrap('TextInsert', [CharPtr, CharPtr, Int], CharPtr)
+_TextJoin = _wrap('TextJoin', [CharPtrPtr, Int, CharPtr], CharPtr)
+_TextSplit = _wrap('TextSplit', [CharPtr, Char, IntPtr], CharPtrPtr)
+_TextAppend = _wrap('TextAppend', [CharPtr, CharPtr, IntPtr], None)
+_TextFindIndex = _wrap('TextFindIndex', [CharPtr, CharPtr], Int)
+_TextToUpper = _wrap('TextToUpper', [CharPtr], CharPtr)
+_TextToLower = _wrap('TextToLower', [CharPtr], CharPtr)
+_TextToPascal = _wrap('TextToPascal', [CharPtr], CharPtr)
+_TextToInteger = _wrap('TextToInteger', [CharPtr], Int)
+
+def get_font_default() -> 'Font':
+    """Get the default Font"""
+    result = _GetFontDefault()
+    return result
+
+def load_font(file_name: 'Union[str, CharPtr]') -> 'Font':
+    """Load font from file into GPU memory (VRAM)"""
+    result = _LoadFont(_str_in(file_name))
+    return result
+
+def load_font_ex(file_name: 'Union[str, CharPtr]', font_size: 'int', font_chars: 'Union[Seq[int], IntPtr]', glyph_count: 'int') -> 'Font':
+    """Load font from file with extended parameters, use NULL for fontChars and 0 for glyphCount to load the default character set"""
+    result = _LoadFontEx(_str_in(file_name), int(font_size), font_chars, int(glyph_count))
+    return result
+
+def load_font_from_image(image: 'Image', key: 'Color', first_char: 'int') -> 'Font':
+    """Load font from Image (XNA style)"""
+    result = _LoadFontFromImage(image, _color(key), int(first_char))
+    return result
+
+def load_font_from_memory(file_type: 'Union[str, CharPtr]', file_data: 'Union[Seq[int], UCharPtr]', data_size: 'int', font_size: 'int', font_chars: 'Union[Seq[int], IntPtr]', glyph_count: 'int') -> 'Font':
+    """Load font from memory buffer, fileType refers to extension: i.e. '.ttf'"""
+    result = _LoadFontFromMemory(_str_in(file_type), _str_in(file_data), int(data_size), int(font_size), font_chars, int(glyph_count))
+    return result
+
+def load_font_data(file_data: 'Union[Seq[int], UCharPtr]', data_size: 'int', font_size: 'int', font_chars: 'Union[Seq[int], IntPtr]', glyph_count: 'int', type: 'int') -> 'GlyphInfoPtr':
+    """Load font data for further use"""
+    result = _ptr_out(_LoadFontData(_str_in(file_data), int(data_size), int(font_size), font_chars, int(glyph_count), int(type)))
+    return result
+
+def gen_image_font_atlas(chars: 'GlyphInfoPtr', recs: 'RectanglePtr', glyph_count: 'int', font_size: 'int', padding: 'int', pack_method: 'int') -> 'Image':
+    """Generate image font atlas using chars info"""
+    result = _GenImageFontAtlas(chars, recs, int(glyph_count), int(font_size), int(padding), int(pack_method))
+    return result
+
+def unload_font_data(chars: 'GlyphInfoPtr', glyph_count: 'int') -> 'None':
+    """Unload font chars info data (RAM)"""
+    _UnloadFontData(chars, int(glyph_count))
+
+def unload_font(font: 'Font') -> 'None':
+    """Unload font from GPU memory (VRAM)"""
+    _UnloadFont(font)
+
+def export_font_as_code(font: 'Font', file_name: 'Union[str, CharPtr]') -> 'bool':
+    """Export font as code file, returns true on success"""
+    result = _ExportFontAsCode(font, _str_in(file_name))
+    return result
+
+def draw_fps(pos_x: 'int', pos_y: 'int') -> 'None':
+    """Draw current FPS"""
+    _DrawFPS(int(pos_x), int(pos_y))
+
+def draw_text(text: 'Union[str, CharPtr]', pos_x: 'int', pos_y: 'int', font_size: 'int', color: 'Color') -> 'None':
+    """Draw text (using default font)"""
+    _DrawText(_str_in(text), int(pos_x), int(pos_y), int(font_size), _color(color))
+
+def draw_text_ex(font: 'Font', text: 'Union[str, CharPtr]', position: 'Vector2', font_size: 'float', spacing: 'float', tint: 'Color') -> 'None':
+    """Draw text using font and additional parameters"""
+    _DrawTextEx(font, _str_in(text), _vec2(position), float(font_size), float(spacing), _color(tint))
+
+def draw_text_pro(font: 'Font', text: 'Union[str, CharPtr]', position: 'Vector2', origin: 'Vector2', rotation: 'float', font_size: 'float', spacing: 'float', tint: 'Color') -> 'None':
+    """Draw text using Font and pro parameters (rotation)"""
+    _DrawTextPro(font, _str_in(text), _vec2(position), _vec2(origin), float(rotation), float(font_size), float(spacing), _color(tint))
+
+def draw_text_codepoint(font: 'Font', codepoint: 'int', position: 'Vector2', font_size: 'float', tint: 'Color') -> 'None':
+    """Draw one character (codepoint)"""
+    _DrawTextCodepoint(font, int(codepoint), _vec2(position), float(font_size), _color(tint))
+
+def draw_text_codepoints(font: 'Font', codepoints: 'Union[Seq[int], IntPtr]', position: 'Vector2', font_size: 'float', spacing: 'float', tint: 'Color') -> 'None':
+    """Draw multiple character (codepoint)"""
+    _DrawTextCodepoints(font, _str_in(codepoints), len(codepoints), _vec2(position), float(font_size), float(spacing), _color(tint))
+
+def measure_text(text: 'Union[str, CharPtr]', font_size: 'int') -> 'int':
+    """Measure string width for default font"""
+    result = _MeasureText(_str_in(text), int(font_size))
+    return result
+
+def measure_text_ex(font: 'Font', text: 'Union[str, CharPtr]', font_size: 'float', spacing: 'float') -> 'Vector2':
+    """Measure string size for Font"""
+    result = _MeasureTextEx(font, _str_in(text), float(font_size), float(spacing))
+    return result
+
+def get_glyph_index(font: 'Font', codepoint: 'int') -> 'int':
+    """Get glyph index position in font for a codepoint (unicode character), fallback to '?' if not found"""
+    result = _GetGlyphIndex(font, int(codepoint))
+    return result
+
+def get_glyph_info(font: 'Font', codepoint: 'int') -> 'GlyphInfo':
+    """Get glyph font info data for a codepoint (unicode character), fallback to '?' if not found"""
+    result = _GetGlyphInfo(font, int(codepoint))
+    return result
+
+def get_glyph_atlas_rec(font: 'Font', codepoint: 'int') -> 'Rectangle':
+    """Get glyph rectangle in font atlas for a codepoint (unicode character), fallback to '?' if not found"""
+    result = _GetGlyphAtlasRec(font, int(codepoint))
+    return result
+
+def load_codepoints(text: 'Union[str, CharPtr]', count: 'Union[Seq[int], IntPtr]') -> 'Union[Seq[int], IntPtr]':
+    """Load all codepoints from a UTF-8 text string, codepoints count returned by parameter"""
+    result = _ptr_out(_LoadCodepoints(_str_in(text), count))
+    return result
+
+def unload_codepoints(codepoints: 'Union[Seq[int], IntPtr]') -> 'None':
+    """Unload codepoints data from memory"""
+    _UnloadCodepoints(codepoints)
+
+def get_codepoint_count(text: 'Union[str, CharPtr]') -> 'int':
+    """Get total number of codepoints in a UTF-8 encoded string"""
+    result = _GetCodepointCount(_str_in(text))
+    return result
+
+def get_codepoint(text: 'Union[str, CharPtr]', bytes_processed: 'Union[Seq[int], IntPtr]') -> 'int':
+    """Get next codepoint in a UTF-8 encoded string, 0x3f('?') is returned on failure"""
+    result = _GetCodepoint(_str_in(text), bytes_processed)
+    return result
+
+def codepoint_to_utf8(codepoint: 'int', byte_size: 'Union[Seq[int], IntPtr]') -> 'Union[str, CharPtr]':
+    """Encode one codepoint into UTF-8 byte array (array length returned as parameter)"""
+    result = _ptr_out(_CodepointToUTF8(int(codepoint), byte_size))
+    return result
+
+def text_codepoints_to_utf8(codepoints: 'Union[Seq[int], IntPtr]', length: 'int') -> 'Union[str, CharPtr]':
+    """Encode text as codepoints array into UTF-8 text string (WARNING: memory must be freed!)"""
+    result = _ptr_out(_TextCodepointsToUTF8(codepoints, int(length)))
+    return result
+
+def text_copy(dst: 'Union[str, CharPtr]', src: 'Union[str, CharPtr]') -> 'int':
+    """Copy one string to another, returns bytes copied"""
+    result = _TextCopy(_str_in(dst), _str_in(src))
+    return result
+
+def text_is_equal(text1: 'Union[str, CharPtr]', text2: 'Union[str, CharPtr]') -> 'bool':
+    """Check if two text string are equal"""
+    result = _TextIsEqual(_str_in(text1), _str_in(text2))
+    return result
+
+def text_length(text: 'Union[str, CharPtr]') -> 'int':
+    """Get text length, checks for '\0' ending"""
+    result = _TextLength(_str_in(text))
+    return result
+
+def text_format(text: 'Union[str, CharPtr]', args: 'bytes') -> 'Union[str, CharPtr]':
+    """Text formatting with variables (sprintf() style)"""
+    result = _ptr_out(_TextFormat(_str_in(text), args))
+    return result
+
+def text_subtext(text: 'Union[str, CharPtr]', position: 'int', length: 'int') -> 'Union[str, CharPtr]':
+    """Get a piece of a text string"""
+    result = _ptr_out(_TextSubtext(_str_in(text), int(position), int(length)))
+    return result
+
+def text_replace(text: 'Union[str, CharPtr]', replace: 'Union[str, CharPtr]', by: 'Union[str, CharPtr]') -> 'Union[str, CharPtr]':
+    """Replace text string (WARNING: memory must be freed!)"""
+    result = _ptr_out(_TextReplace(_str_in(text), _str_in(replace), _str_in(by)))
+    return result
+
+def text_insert(text: 'Union[str, CharPtr]', insert: 'Union[str, CharPtr]', position: 'int') -> 'Union[str, CharPtr]':
+    """Insert text in a position (WARNING: memory must be freed!)"""
+    result = _ptr_out(_TextInsert(_str_in(text), _str_in(insert), int(position)))
+    return result
+
+def text_join(text_list: 'Seq[Union[str, CharPtr]]', count: 'int', delimiter: 'Union[str, CharPtr]') -> 'Union[str, CharPtr]':
+    """Join text strings with delimiter"""
+    result = _ptr_out(_TextJoin(_str_in2(text_list), int(count), _str_in(delimiter)))
+    return result
+
+def text_split(text: 'Union[str, CharPtr]', delimiter: 'int', count: 'Union[Seq[int], IntPtr]') -> 'Seq[Union[str, CharPtr]]':
+    """Split text into multiple strings"""
+    result = _ptr_out(_TextSplit(_str_in(text), int(delimiter), count))
+    return result
+
+def text_append(text: 'Union[str, CharPtr]', append: 'Union[str, CharPtr]', position: 'Union[Seq[int], IntPtr]') -> 'None':
+    """Append text at specific position and move cursor!"""
+    _TextAppend(_str_in(text), _str_in(append), position)
+
+def text_find_index(text: 'Union[str, CharPtr]', find: 'Union[str, CharPtr]') -> 'int':
+    """Find first text occurrence within a string"""
+    result = _TextFindIndex(_str_in(text), _str_in(find))
+    return result
+
+def text_to_upper(text: 'Union[str, CharPtr]') -> 'Union[str, CharPtr]':
+    """Get upper case version of provided string"""
+    result = _ptr_out(_TextToUpper(_str_in(text)))
+    return result
+
+def text_to_lower(text: 'Union[str, CharPtr]') -> 'Union[str, CharPtr]':
+    """Get lower case version of provided string"""
+    result = _ptr_out(_TextToLower(_str_in(text)))
+    return result
+
+def text_to_pascal(text: 'Union[str, CharPtr]') -> 'Union[str, CharPtr]':
+    """Get Pascal case notation version of provided string"""
+    result = _ptr_out(_TextToPascal(_str_in(text)))
+    return result
+
+def text_to_integer(text: 'Union[str, CharPtr]') -> 'int':
+    """Get integer value from text (negative values not supported)"""
+    result = _TextToInteger(_str_in(text))
+    return result
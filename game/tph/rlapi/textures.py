@@ -0,0 +1,762 @@
+"""raylib bindings for images, textures, texture drawing and color helpers"""
+
+from enum import IntEnum
+from typing import Sequence as Seq, Union
+from ctypes import Structure, POINTER, byref
+
+from ._lib import binder
+from .core import (
+    Bool, CharPtr, Color, ColorPtr, Float, Image, ImagePtr, Int, IntPtr, Rectangle,
+    RenderTexture2D, Texture2D, Texture2DPtr, TextureCubemap, UCharPtr, UInt, Vector2, Vector2Ptr,
+    Vector3, Vector4, VoidPtr, _arr_in, _color, _ptr_out, _rect, _str_in, _vec2, _vec4
+)
+from .text import Font
+
+_wrap = binder(globals())
+
+
+class NPatchInfo(Structure):
+    '''NPatchInfo, n-patch layout info'''
+    _fields_ = [
+        ('source', Rectangle),
+        ('left', Int),
+        ('top', Int),
+        ('right', Int),
+        ('bottom', Int),
+        ('layout', Int),
+    ]
+
+
+    @classmethod
+    def array_of(cls, npatch_info_sequence):
+        '''Creates and returns an array of NPatchInfos'''
+        arr = cls * len(npatch_info_sequence)
+        return arr(*npatch_info_sequence)
+
+
+    def __init__(self, source: Rectangle = None,
+                 left: int = None,
+                 top: int = None,
+                 right: int = None,
+                 bottom: int = None,
+                 layout: int = None):
+        '''Initializes this NPatchInfo struct'''
+        super(NPatchInfo, self).__init__(
+            source or Rectangle(),
+            left or 0,
+            top or 0,
+            right or 0,
+            bottom or 0,
+            layout or 0
+        )
+
+
+    @property
+    def byref(self):
+        '''Gets a reference to this NPatchInfo instance'''
+        return byref(self)
+
+
+
+# Pointer type to NPatchInfos
+NPatchInfoPtr = POINTER(NPatchInfo)
+
+class PixelFormat(IntEnum):
+    """Pixel formats"""
+
+    PIXELFORMAT_UNCOMPRESSED_GRAYSCALE = 1
+    """8 bit per pixel (no alpha)"""
+
+    PIXELFORMAT_UNCOMPRESSED_GRAY_ALPHA = 2
+    """8*2 bpp (2 channels)"""
+
+    PIXELFORMAT_UNCOMPRESSED_R5G6B5 = 3
+    """16 bpp"""
+
+    PIXELFORMAT_UNCOMPRESSED_R8G8B8 = 4
+    """24 bpp"""
+
+    PIXELFORMAT_UNCOMPRESSED_R5G5B5A1 = 5
+    """16 bpp (1 bit alpha)"""
+
+    PIXELFORMAT_UNCOMPRESSED_R4G4B4A4 = 6
+    """16 bpp (4 bit alpha)"""
+
+    PIXELFORMAT_UNCOMPRESSED_R8G8B8A8 = 7
+    """32 bpp"""
+
+    PIXELFORMAT_UNCOMPRESSED_R32 = 8
+    """32 bpp (1 channel - float)"""
+
+    PIXELFORMAT_UNCOMPRESSED_R32G32B32 = 9
+    """32*3 bpp (3 channels - float)"""
+
+    PIXELFORMAT_UNCOMPRESSED_R32G32B32A32 = 10
+    """32*4 bpp (4 channels - float)"""
+
+    PIXELFORMAT_COMPRESSED_DXT1_RGB = 11
+    """4 bpp (no alpha)"""
+
+    PIXELFORMAT_COMPRESSED_DXT1_RGBA = 12
+    """4 bpp (1 bit alpha)"""
+
+    PIXELFORMAT_COMPRESSED_DXT3_RGBA = 13
+    """8 bpp"""
+
+    PIXELFORMAT_COMPRESSED_DXT5_RGBA = 14
+    """8 bpp"""
+
+    PIXELFORMAT_COMPRESSED_ETC1_RGB = 15
+    """4 bpp"""
+
+    PIXELFORMAT_COMPRESSED_ETC2_RGB = 16
+    """4 bpp"""
+
+    PIXELFORMAT_COMPRESSED_ETC2_EAC_RGBA = 17
+    """8 bpp"""
+
+    PIXELFORMAT_COMPRESSED_PVRT_RGB = 18
+    """4 bpp"""
+
+    PIXELFORMAT_COMPRESSED_PVRT_RGBA = 19
+    """4 bpp"""
+
+    PIXELFORMAT_COMPRESSED_ASTC_4x4_RGBA = 20
+    """8 bpp"""
+
+    PIXELFORMAT_COMPRESSED_ASTC_8x8_RGBA = 21
+    """2 bpp"""
+
+
+
+PIXELFORMAT_UNCOMPRESSED_GRAYSCALE = PixelFormat.PIXELFORMAT_UNCOMPRESSED_GRAYSCALE
+PIXELFORMAT_UNCOMPRESSED_GRAY_ALPHA = PixelFormat.PIXELFORMAT_UNCOMPRESSED_GRAY_ALPHA
+PIXELFORMAT_UNCOMPRESSED_R5G6B5 = PixelFormat.PIXELFORMAT_UNCOMPRESSED_R5G6B5
+PIXELFORMAT_UNCOMPRESSED_R8G8B8 = PixelFormat.PIXELFORMAT_UNCOMPRESSED_R8G8B8
+PIXELFORMAT_UNCOMPRESSED_R5G5B5A1 = PixelFormat.PIXELFORMAT_UNCOMPRESSED_R5G5B5A1
+PIXELFORMAT_UNCOMPRESSED_R4G4B4A4 = PixelFormat.PIXELFORMAT_UNCOMPRESSED_R4G4B4A4
+PIXELFORMAT_UNCOMPRESSED_R8G8B8A8 = PixelFormat.PIXELFORMAT_UNCOMPRESSED_R8G8B8A8
+PIXELFORMAT_UNCOMPRESSED_R32 = PixelFormat.PIXELFORMAT_UNCOMPRESSED_R32
+PIXELFORMAT_UNCOMPRESSED_R32G32B32 = PixelFormat.PIXELFORMAT_UNCOMPRESSED_R32G32B32
+PIXELFORMAT_UNCOMPRESSED_R32G32B32A32 = PixelFormat.PIXELFORMAT_UNCOMPRESSED_R32G32B32A32
+PIXELFORMAT_COMPRESSED_DXT1_RGB = PixelFormat.PIXELFORMAT_COMPRESSED_DXT1_RGB
+PIXELFORMAT_COMPRESSED_DXT1_RGBA = PixelFormat.PIXELFORMAT_COMPRESSED_DXT1_RGBA
+PIXELFORMAT_COMPRESSED_DXT3_RGBA = PixelFormat.PIXELFORMAT_COMPRESSED_DXT3_RGBA
+PIXELFORMAT_COMPRESSED_DXT5_RGBA = PixelFormat.PIXELFORMAT_COMPRESSED_DXT5_RGBA
+PIXELFORMAT_COMPRESSED_ETC1_RGB = PixelFormat.PIXELFORMAT_COMPRESSED_ETC1_RGB
+PIXELFORMAT_COMPRESSED_ETC2_RGB = PixelFormat.PIXELFORMAT_COMPRESSED_ETC2_RGB
+PIXELFORMAT_COMPRESSED_ETC2_EAC_RGBA = PixelFormat.PIXELFORMAT_COMPRESSED_ETC2_EAC_RGBA
+PIXELFORMAT_COMPRESSED_PVRT_RGB = PixelFormat.PIXELFORMAT_COMPRESSED_PVRT_RGB
+PIXELFORMAT_COMPRESSED_PVRT_RGBA = PixelFormat.PIXELFORMAT_COMPRESSED_PVRT_RGBA
+PIXELFORMAT_COMPRESSED_ASTC_4x4_RGBA = PixelFormat.PIXELFORMAT_COMPRESSED_ASTC_4x4_RGBA
+PIXELFORMAT_COMPRESSED_ASTC_8x8_RGBA = PixelFormat.PIXELFORMAT_COMPRESSED_ASTC_8x8_RGBA
+
+class TextureFilter(IntEnum):
+    """Texture parameters: filter mode"""
+
+    TEXTURE_FILTER_POINT = 0
+    """No filter, just pixel approximation"""
+
+    TEXTURE_FILTER_BILINEAR = 1
+    """Linear filtering"""
+
+    TEXTURE_FILTER_TRILINEAR = 2
+    """Trilinear filtering (linear with mipmaps)"""
+
+    TEXTURE_FILTER_ANISOTROPIC_4X = 3
+    """Anisotropic filtering 4x"""
+
+    TEXTURE_FILTER_ANISOTROPIC_8X = 4
+    """Anisotropic filtering 8x"""
+
+    TEXTURE_FILTER_ANISOTROPIC_16X = 5
+    """Anisotropic filtering 16x"""
+
+
+
+TEXTURE_FILTER_POINT = TextureFilter.TEXTURE_FILTER_POINT
+TEXTURE_FILTER_BILINEAR = TextureFilter.TEXTURE_FILTER_BILINEAR
+TEXTURE_FILTER_TRILINEAR = TextureFilter.TEXTURE_FILTER_TRILINEAR
+TEXTURE_FILTER_ANISOTROPIC_4X = TextureFilter.TEXTURE_FILTER_ANISOTROPIC_4X
+TEXTURE_FILTER_ANISOTROPIC_8X = TextureFilter.TEXTURE_FILTER_ANISOTROPIC_8X
+TEXTURE_FILTER_ANISOTROPIC_16X = TextureFilter.TEXTURE_FILTER_ANISOTROPIC_16X
+
+class TextureWrap(IntEnum):
+    """Texture parameters: wrap mode"""
+
+    TEXTURE_WRAP_REPEAT = 0
+    """Repeats texture in tiled mode"""
+
+    TEXTURE_WRAP_CLAMP = 1
+    """Clamps texture to edge pixel in tiled mode"""
+
+    TEXTURE_WRAP_MIRROR_REPEAT = 2
+    """Mirrors and repeats the texture in tiled mode"""
+
+    TEXTURE_WRAP_MIRROR_CLAMP = 3
+    """Mirrors and clamps to border the texture in tiled mode"""
+
+
+
+TEXTURE_WRAP_REPEAT = TextureWrap.TEXTURE_WRAP_REPEAT
+TEXTURE_WRAP_CLAMP = TextureWrap.TEXTURE_WRAP_CLAMP
+TEXTURE_WRAP_MIRROR_REPEAT = TextureWrap.TEXTURE_WRAP_MIRROR_REPEAT
+TEXTURE_WRAP_MIRROR_CLAMP = TextureWrap.TEXTURE_WRAP_MIRROR_CLAMP
+
+class CubemapLayout(IntEnum):
+    """Cubemap layouts"""
+
+    CUBEMAP_LAYOUT_AUTO_DETECT = 0
+    """Automatically detect layout type"""
+
+    CUBEMAP_LAYOUT_LINE_VERTICAL = 1
+    """Layout is defined by a vertical line with faces"""
+
+    CUBEMAP_LAYOUT_LINE_HORIZONTAL = 2
+    """Layout is defined by an horizontal line with faces"""
+
+    CUBEMAP_LAYOUT_CROSS_THREE_BY_FOUR = 3
+    """Layout is defined by a 3x4 cross with cubemap faces"""
+
+    CUBEMAP_LAYOUT_CROSS_FOUR_BY_THREE = 4
+    """Layout is defined by a 4x3 cross with cubemap faces"""
+
+    CUBEMAP_LAYOUT_PANORAMA = 5
+    """Layout is defined by a panorama image (equirectangular map)"""
+
+
+
+CUBEMAP_LAYOUT_AUTO_DETECT = CubemapLayout.CUBEMAP_LAYOUT_AUTO_DETECT
+CUBEMAP_LAYOUT_LINE_VERTICAL = CubemapLayout.CUBEMAP_LAYOUT_LINE_VERTICAL
+CUBEMAP_LAYOUT_LINE_HORIZONTAL = CubemapLayout.CUBEMAP_LAYOUT_LINE_HORIZONTAL
+CUBEMAP_LAYOUT_CROSS_THREE_BY_FOUR = CubemapLayout.CUBEMAP_LAYOUT_CROSS_THREE_BY_FOUR
+CUBEMAP_LAYOUT_CROSS_FOUR_BY_THREE = CubemapLayout.CUBEMAP_LAYOUT_CROSS_FOUR_BY_THREE
+CUBEMAP_LAYOUT_PANORAMA = CubemapLayout.CUBEMAP_LAYOUT_PANORAMA
+
+class NPatchLayout(IntEnum):
+    """N-patch layout"""
+
+    NPATCH_NINE_PATCH = 0
+    """Npatch layout: 3x3 tiles"""
+
+    NPATCH_THREE_PATCH_VERTICAL = 1
+    """Npatch layout: 1x3 tiles"""
+
+    NPATCH_THREE_PATCH_HORIZONTAL = 2
+    """Npatch layout: 3x1 tiles"""
+
+
+
+NPATCH_NINE_PATCH = NPatchLayout.NPATCH_NINE_PATCH
+NPATCH_THREE_PATCH_VERTICAL = NPatchLayout.NPATCH_THREE_PATCH_VERTICAL
+NPATCH_THREE_PATCH_HORIZONTAL = NPatchLayout.NPATCH_THREE_PATCH_HORIZONTAL
+
+_LoadImage = _wrap('LoadImage', [CharPtr], Image)
+_LoadImageRaw = _wrap('LoadImageRaw', [CharPtr, Int, Int, Int, Int], Image)
+_LoadImageAnim = _wrap('LoadImageAnim', [CharPtr, IntPtr], Image)
+_LoadImageFromMemory = _wrap('LoadImageFromMemory', [CharPtr, UCharPtr, Int], Image)
+_LoadImageFromTexture = _wrap('LoadImageFromTexture', [Texture2D], Image)
+_LoadImageFromScreen = _wrap('LoadImageFromScreen', [], Image)
+_UnloadImage = _wrap('UnloadImage', [Image], None)
+_ExportImage = _wrap('ExportImage', [Image, CharPtr], Bool)
+_ExportImageAsCode = _wrap('ExportImageAsCode', [Image, CharPtr], Bool)
+_GenImageColor = _wrap('GenImageColor', [Int, Int, Color], Image)
+_GenImageGradientV = _wrap('GenImageGradientV', [Int, Int, Color, Color], Image)
+_GenImageGradientH = _wrap('GenImageGradientH', [Int, Int, Color, Color], Image)
+_GenImageGradientRadial = _wrap('GenImageGradientRadial', [Int, Int, Float, Color, Color], Image)
+_GenImageChecked = _wrap('GenImageChecked', [Int, Int, Int, Int, Color, Color], Image)
+_GenImageWhiteNoise = _wrap('GenImageWhiteNoise', [Int, Int, Float], Image)
+_GenImageCellular = _wrap('GenImageCellular', [Int, Int, Int], Image)
+_ImageCopy = _wrap('ImageCopy', [Image], Image)
+_ImageFromImage = _wrap('ImageFromImage', [Image, Rectangle], Image)
+_ImageText = _wrap('ImageText', [CharPtr, Int, Color], Image)
+_ImageTextEx = _wrap('ImageTextEx', [Font, CharPtr, Float, Float, Color], Image)
+_ImageFormat = _wrap('ImageFormat', [ImagePtr, Int], None)
+_ImageToPOT = _wrap('ImageToPOT', [ImagePtr, Color], None)
+_ImageCrop = _wrap('ImageCrop', [ImagePtr, Rectangle], None)
+_ImageAlphaCrop = _wrap('ImageAlphaCrop', [ImagePtr, Float], None)
+_ImageAlphaClear = _wrap('ImageAlphaClear', [ImagePtr, Color, Float], None)
+_ImageAlphaMask = _wrap('ImageAlphaMask', [ImagePtr, Image], None)
+_ImageAlphaPremultiply = _wrap('ImageAlphaPremultiply', [ImagePtr], None)
+_ImageResize = _wrap('ImageResize', [ImagePtr, Int, Int], None)
+_ImageResizeNN = _wrap('ImageResizeNN', [ImagePtr, Int, Int], None)
+_ImageResizeCanvas = _wrap('ImageResizeCanvas', [ImagePtr, Int, Int, Int, Int, Color], None)
+_ImageMipmaps = _wrap('ImageMipmaps', [ImagePtr], None)
+_ImageDither = _wrap('ImageDither', [ImagePtr, Int, Int, Int, Int], None)
+_ImageFlipVertical = _wrap('ImageFlipVertical', [ImagePtr], None)
+_ImageFlipHorizontal = _wrap('ImageFlipHorizontal', [ImagePtr], None)
+_ImageRotateCW = _wrap('ImageRotateCW', [ImagePtr], None)
+_ImageRotateCCW = _wrap('ImageRotateCCW', [ImagePtr], None)
+_ImageColorTint = _wrap('ImageColorTint', [ImagePtr, Color], None)
+_ImageColorInvert = _wrap('ImageColorInvert', [ImagePtr], None)
+_ImageColorGrayscale = _wrap('ImageColorGrayscale', [ImagePtr], None)
+_ImageColorContrast = _wrap('ImageColorContrast', [ImagePtr, Float], None)
+_ImageColorBrightness = _wrap('ImageColorBrightness', [ImagePtr, Int], None)
+_ImageColorReplace = _wrap('ImageColorReplace', [ImagePtr, Color, Color], None)
+_LoadImageColors = _wrap('LoadImageColors', [Image], ColorPtr)
+_LoadImagePalette = _wrap('LoadImagePalette', [Image, Int, IntPtr], ColorPtr)
+_UnloadImageColors = _wrap('UnloadImageColors', [ColorPtr], None)
+_UnloadImagePalette = _wrap('UnloadImagePalette', [ColorPtr], None)
+_GetImageAlphaBorder = _wrap('GetImageAlphaBorder', [Image, Float], Rectangle)
+_GetImageColor = _wrap('GetImageColor', [Image, Int, Int], Color)
+_ImageClearBackground = _wrap('ImageClearBackground', [ImagePtr, Color], None)
+_ImageDrawPixel = _wrap('ImageDrawPixel', [ImagePtr, Int, Int, Color], None)
+_ImageDrawPixelV = _wrap('ImageDrawPixelV', [ImagePtr, Vector2, Color], None)
+_ImageDrawLine = _wrap('ImageDrawLine', [ImagePtr, Int, Int, Int, Int, Color], None)
+_ImageDrawLineV = _wrap('ImageDrawLineV', [ImagePtr, Vector2, Vector2, Color], None)
+_ImageDrawCircle = _wrap('ImageDrawCircle', [ImagePtr, Int, Int, Int, Color], None)
+_ImageDrawCircleV = _wrap('ImageDrawCircleV', [ImagePtr, Vector2, Int, Color], None)
+_ImageDrawRectangle = _wrap('ImageDrawRectangle', [ImagePtr, Int, Int, Int, Int, Color], None)
+_ImageDrawRectangleV = _wrap('ImageDrawRectangleV', [ImagePtr, Vector2, Vector2, Color], None)
+_ImageDrawRectangleRec = _wrap('ImageDrawRectangleRec', [ImagePtr, Rectangle, Color], None)
+_ImageDrawRectangleLines = _wrap('ImageDrawRectangleLines', [ImagePtr, Rectangle, Int, Color], None)
+_ImageDraw = _wrap('ImageDraw', [ImagePtr, Image, Rectangle, Rectangle, Color], None)
+_ImageDrawText = _wrap('ImageDrawText', [ImagePtr, CharPtr, Int, Int, Int, Color], None)
+_ImageDrawTextEx = _wrap('ImageDrawTextEx', [ImagePtr, Font, CharPtr, Vector2, Float, Float, Color], None)
+_LoadTexture = _wrap('LoadTexture', [CharPtr], Texture2D)
+_LoadTextureFromImage = _wrap('LoadTextureFromImage', [Image], Texture2D)
+_LoadTextureCubemap = _wrap('LoadTextureCubemap', [Image, Int], TextureCubemap)
+_LoadRenderTexture = _wrap('LoadRenderTexture', [Int, Int], RenderTexture2D)
+_UnloadTexture = _wrap('UnloadTexture', [Texture2D], None)
+_UnloadRenderTexture = _wrap('UnloadRenderTexture', [RenderTexture2D], None)
+_UpdateTexture = _wrap('UpdateTexture', [Texture2D, VoidPtr], None)
+_UpdateTextureRec = _wrap('UpdateTextureRec', [Texture2D, Rectangle, VoidPtr], None)
+_GenTextureMipmaps = _wrap('GenTextureMipmaps', [Texture2DPtr], None)
+_SetTextureFilter = _wrap('SetTextureFilter', [Texture2D, Int], None)
+_SetTextureWrap = _wrap('SetTextureWrap', [Texture2D, Int], None)
+_DrawTexture = _wrap('DrawTexture', [Texture2D, Int, Int, Color], None)
+_DrawTextureV = _wrap('DrawTextureV', [Texture2D, Vector2, Color], None)
+_DrawTextureEx = _wrap('DrawTextureEx', [Texture2D, Vector2, Float, Float, Color], None)
+_DrawTextureRec = _wrap('DrawTextureRec', [Texture2D, Rectangle, Vector2, Color], None)
+_DrawTextureQuad = _wrap('DrawTextureQuad', [Texture2D, Vector2, Vector2, Rectangle, Color], None)
+_DrawTextureTiled = _wrap('DrawTextureTiled', [Texture2D, Rectangle, Rectangle, Vector2, Float, Float, Color], None)
+_DrawTexturePro = _wrap('DrawTexturePro', [Texture2D, Rectangle, Rectangle, Vector2, Float, Color], None)
+_DrawTextureNPatch = _wrap('DrawTextureNPatch', [Texture2D, NPatchInfo, Rectangle, Vector2, Float, Color], None)
+_DrawTexturePoly = _wrap('DrawTexturePoly', [Texture2D, Vector2, Vector2Ptr, Vector2Ptr, Int, Color], None)
+_Fade = _wrap('Fade', [Color, Float], Color)
+_ColorToInt = _wrap('ColorToInt', [Color], Int)
+_ColorNormalize = _wrap('ColorNormalize', [Color], Vector4)
+_ColorFromNormalized = _wrap('ColorFromNormalized', [Vector4], Color)
+_ColorToHSV = _wrap('ColorToHSV', [Color], Vector3)
+_ColorFromHSV = _wrap('ColorFromHSV', [Float, Float, Float], Color)
+_ColorAlpha = _wrap('ColorAlpha', [Color, Float], Color)
+_ColorAlphaBlend = _wrap('ColorAlphaBlend', [Color, Color, Color], Color)
+_GetColor = _wrap('GetColor', [UInt], Color)
+_GetPixelColor = _wrap('GetPixelColor', [VoidPtr, Int], Color)
+_SetPixelColor = _wrap('SetPixelColor', [VoidPtr, Color, Int], None)
+_GetPixelDataSize = _wrap('GetPixelDataSize', [Int, Int, Int], Int)
+
+def load_image(file_name: 'Union[str, CharPtr]') -> 'Image':
+    """Load image from file into CPU memory (RAM)"""
+    result = _LoadImage(_str_in(file_name))
+    return result
+
+def load_image_raw(file_name: 'Union[str, CharPtr]', width: 'int', height: 'int', format: 'int', header_size: 'int') -> 'Image':
+    """Load image from RAW file data"""
+    result = _LoadImageRaw(_str_in(file_name), int(width), int(height), int(format), int(header_size))
+    return result
+
+def load_image_anim(file_name: 'Union[str, CharPtr]', frames: 'Union[Seq[int], IntPtr]') -> 'Image':
+    """Load image sequence from file (frames appended to image.data)"""
+    result = _LoadImageAnim(_str_in(file_name), frames)
+    return result
+
+def load_image_from_memory(file_type: 'Union[str, CharPtr]', file_data: 'Union[Seq[int], UCharPtr]', data_size: 'int') -> 'Image':
+    """Load image from memory buffer, fileType refers to extension: i.e. '.png'"""
+    result = _LoadImageFromMemory(_str_in(file_type), _str_in(file_data), int(data_size))
+    return result
+
+def load_image_from_texture(texture: 'Texture2D') -> 'Image':
+    """Load image from GPU texture data"""
+    result = _LoadImageFromTexture(texture)
+    return result
+
+def load_image_from_screen() -> 'Image':
+    """Load image from screen buffer and (screenshot)"""
+    result = _LoadImageFromScreen()
+    return result
+
+def unload_image(image: 'Image') -> 'None':
+    """Unload image from CPU memory (RAM)"""
+    _UnloadImage(image)
+
+def export_image(image: 'Image', file_name: 'Union[str, CharPtr]') -> 'bool':
+    """Export image data to file, returns true on success"""
+    result = _ExportImage(image, _str_in(file_name))
+    return result
+
+def export_image_as_code(image: 'Image', file_name: 'Union[str, CharPtr]') -> 'bool':
+    """Export image as code file defining an array of bytes, returns true on success"""
+    result = _ExportImageAsCode(image, _str_in(file_name))
+    return result
+
+def gen_image_color(width: 'int', height: 'int', color: 'Color') -> 'Image':
+    """Generate image: plain color"""
+    result = _GenImageColor(int(width), int(height), _color(color))
+    return result
+
+def gen_image_gradient_v(width: 'int', height: 'int', top: 'Color', bottom: 'Color') -> 'Image':
+    """Generate image: vertical gradient"""
+    result = _GenImageGradientV(int(width), int(height), _color(top), _color(bottom))
+    return result
+
+def gen_image_gradient_h(width: 'int', height: 'int', left: 'Color', right: 'Color') -> 'Image':
+    """Generate image: horizontal gradient"""
+    result = _GenImageGradientH(int(width), int(height), _color(left), _color(right))
+    return result
+
+def gen_image_gradient_radial(width: 'int', height: 'int', density: 'float', inner: 'Color', outer: 'Color') -> 'Image':
+    """Generate image: radial gradient"""
+    result = _GenImageGradientRadial(int(width), int(height), float(density), _color(inner), _color(outer))
+    return result
+
+def gen_image_checked(width: 'int', height: 'int', checks_x: 'int', checks_y: 'int', col1: 'Color', col2: 'Color') -> 'Image':
+    """Generate image: checked"""
+    result = _GenImageChecked(int(width), int(height), int(checks_x), int(checks_y), _color(col1), _color(col2))
+    return result
+
+def gen_image_white_noise(width: 'int', height: 'int', factor: 'float') -> 'Image':
+    """Generate image: white noise"""
+    result = _GenImageWhiteNoise(int(width), int(height), float(factor))
+    return result
+
+def gen_image_cellular(width: 'int', height: 'int', tile_size: 'int') -> 'Image':
+    """Generate image: cellular algorithm, bigger tileSize means bigger cells"""
+    result = _GenImageCellular(int(width), int(height), int(tile_size))
+    return result
+
+def image_copy(image: 'Image') -> 'Image':
+    """Create an image duplicate (useful for transformations)"""
+    result = _ImageCopy(image)
+    return result
+
+def image_from_image(image: 'Image', rec: 'Rectangle') -> 'Image':
+    """Create an image from another image piece"""
+    result = _ImageFromImage(image, _rect(rec))
+    return result
+
+def image_text(text: 'Union[str, CharPtr]', font_size: 'int', color: 'Color') -> 'Image':
+    """Create an image from text (default font)"""
+    result = _ImageText(_str_in(text), int(font_size), _color(color))
+    return result
+
+def image_text_ex(font: 'Font', text: 'Union[str, CharPtr]', font_size: 'float', spacing: 'float', tint: 'Color') -> 'Image':
+    """Create an image from text (custom sprite font)"""
+    result = _ImageTextEx(font, _str_in(text), float(font_size), float(spacing), _color(tint))
+    return result
+
+def image_format(image: 'ImagePtr', new_format: 'int') -> 'None':
+    """Convert image data to desired format"""
+    _ImageFormat(image, int(new_format))
+
+def image_to_pot(image: 'ImagePtr', fill: 'Color') -> 'None':
+    """Convert image to POT (power-of-two)"""
+    _ImageToPOT(image, _color(fill))
+
+def image_crop(image: 'ImagePtr', crop: 'Rectangle') -> 'None':
+    """Crop an image to a defined rectangle"""
+    _ImageCrop(image, _rect(crop))
+
+def image_alpha_crop(image: 'ImagePtr', threshold: 'float') -> 'None':
+    """Crop image depending on alpha value"""
+    _ImageAlphaCrop(image, float(threshold))
+
+def image_alpha_clear(image: 'ImagePtr', color: 'Color', threshold: 'float') -> 'None':
+    """Clear alpha channel to desired color"""
+    _ImageAlphaClear(image, _color(color), float(threshold))
+
+def image_alpha_mask(image: 'ImagePtr', alpha_mask: 'Image') -> 'None':
+    """Apply alpha mask to image"""
+    _ImageAlphaMask(image, alpha_mask)
+
+def image_alpha_premultiply(image: 'ImagePtr') -> 'None':
+    """Premultiply alpha channel"""
+    _ImageAlphaPremultiply(image)
+
+def image_resize(image: 'ImagePtr', new_width: 'int', new_height: 'int') -> 'None':
+    """Resize image (Bicubic scaling algorithm)"""
+    _ImageResize(image, int(new_width), int(new_height))
+
+def image_resize_nn(image: 'ImagePtr', new_width: 'int', new_height: 'int') -> 'None':
+    """Resize image (Nearest-Neighbor scaling algorithm)"""
+    _ImageResizeNN(image, int(new_width), int(new_height))
+
+def image_resize_canvas(image: 'ImagePtr', new_width: 'int', new_height: 'int', offset_x: 'int', offset_y: 'int', fill: 'Color') -> 'None':
+    """Resize canvas and fill with color"""
+    _ImageResizeCanvas(image, int(new_width), int(new_height), int(offset_x), int(offset_y), _color(fill))
+
+def image_mipmaps(image: 'ImagePtr') -> 'None':
+    """Compute all mipmap levels for a provided image"""
+    _ImageMipmaps(image)
+
+def image_dither(image: 'ImagePtr', r_bpp: 'int', g_bpp: 'int', b_bpp: 'int', a_bpp: 'int') -> 'None':
+    """Dither image data to 16bpp or lower (Floyd-Steinberg dithering)"""
+    _ImageDither(image, int(r_bpp), int(g_bpp), int(b_bpp), int(a_bpp))
+
+def image_flip_vertical(image: 'ImagePtr') -> 'None':
+    """Flip image vertically"""
+    _ImageFlipVertical(image)
+
+def image_flip_horizontal(image: 'ImagePtr') -> 'None':
+    """Flip image horizontally"""
+    _ImageFlipHorizontal(image)
+
+def image_rotate_cw(image: 'ImagePtr') -> 'None':
+    """Rotate image clockwise 90deg"""
+    _ImageRotateCW(image)
+
+def image_rotate_ccw(image: 'ImagePtr') -> 'None':
+    """Rotate image counter-clockwise 90deg"""
+    _ImageRotateCCW(image)
+
+def image_color_tint(image: 'ImagePtr', color: 'Color') -> 'None':
+    """Modify image color: tint"""
+    _ImageColorTint(image, _color(color))
+
+def image_color_invert(image: 'ImagePtr') -> 'None':
+    """Modify image color: invert"""
+    _ImageColorInvert(image)
+
+def image_color_grayscale(image: 'ImagePtr') -> 'None':
+    """Modify image color: grayscale"""
+    _ImageColorGrayscale(image)
+
+def image_color_contrast(image: 'ImagePtr', contrast: 'float') -> 'None':
+    """Modify image color: contrast (-100 to 100)"""
+    _ImageColorContrast(image, float(contrast))
+
+def image_color_brightness(image: 'ImagePtr', brightness: 'int') -> 'None':
+    """Modify image color: brightness (-255 to 255)"""
+    _ImageColorBrightness(image, int(brightness))
+
+def image_color_replace(image: 'ImagePtr', color: 'Color', replace: 'Color') -> 'None':
+    """Modify image color: replace color"""
+    _ImageColorReplace(image, _color(color), _color(replace))
+
+def load_image_colors(image: 'Image') -> 'ColorPtr':
+    """Load color data from image as a Color array (RGBA - 32bit)"""
+    result = _ptr_out(_LoadImageColors(image))
+    return result
+
+def load_image_palette(image: 'Image', max_palette_size: 'int') -> 'ColorPtr':
+    """Load colors palette from image as a Color array (RGBA - 32bit)"""
+    color_count = Int(0)
+    result = _ptr_out(_LoadImagePalette(image, int(max_palette_size), byref(color_count)), color_count.value)
+    return result
+
+def unload_image_colors(colors: 'ColorPtr') -> 'None':
+    """Unload color data loaded with LoadImageColors()"""
+    _UnloadImageColors(_color(colors))
+
+def unload_image_palette(colors: 'ColorPtr') -> 'None':
+    """Unload colors palette loaded with LoadImagePalette()"""
+    _UnloadImagePalette(_color(colors))
+
+def get_image_alpha_border(image: 'Image', threshold: 'float') -> 'Rectangle':
+    """Get image alpha border rectangle"""
+    result = _GetImageAlphaBorder(image, float(threshold))
+    return result
+
+def get_image_color(image: 'Image', x: 'int', y: 'int') -> 'Color':
+    """Get image pixel color at (x, y) position"""
+    result = _GetImageColor(image, int(x), int(y))
+    return result
+
+def image_clear_background(dst: 'ImagePtr', color: 'Color') -> 'None':
+    """Clear image background with given color"""
+    _ImageClearBackground(dst, _color(color))
+
+def image_draw_pixel(dst: 'ImagePtr', pos_x: 'int', pos_y: 'int', color: 'Color') -> 'None':
+    """Draw pixel within an image"""
+    _ImageDrawPixel(dst, int(pos_x), int(pos_y), _color(color))
+
+def image_draw_pixel_v(dst: 'ImagePtr', position: 'Vector2', color: 'Color') -> 'None':
+    """Draw pixel within an image (Vector version)"""
+    _ImageDrawPixelV(dst, _vec2(position), _color(color))
+
+def image_draw_line(dst: 'ImagePtr', start_pos_x: 'int', start_pos_y: 'int', end_pos_x: 'int', end_pos_y: 'int', color: 'Color') -> 'None':
+    """Draw line within an image"""
+    _ImageDrawLine(dst, int(start_pos_x), int(start_pos_y), int(end_pos_x), int(end_pos_y), _color(color))
+
+def image_draw_line_v(dst: 'ImagePtr', start: 'Vector2', end: 'Vector2', color: 'Color') -> 'None':
+    """Draw line within an image (Vector version)"""
+    _ImageDrawLineV(dst, _vec2(start), _vec2(end), _color(color))
+
+def image_draw_circle(dst: 'ImagePtr', center_x: 'int', center_y: 'int', radius: 'int', color: 'Color') -> 'None':
+    """Draw circle within an image"""
+    _ImageDrawCircle(dst, int(center_x), int(center_y), int(radius), _color(color))
+
+def image_draw_circle_v(dst: 'ImagePtr', center: 'Vector2', radius: 'int', color: 'Color') -> 'None':
+    """Draw circle within an image (Vector version)"""
+    _ImageDrawCircleV(dst, _vec2(center), int(radius), _color(color))
+
+def image_draw_rectangle(dst: 'ImagePtr', pos_x: 'int', pos_y: 'int', width: 'int', height: 'int', color: 'Color') -> 'None':
+    """Draw rectangle within an image"""
+    _ImageDrawRectangle(dst, int(pos_x), int(pos_y), int(width), int(height), _color(color))
+
+def image_draw_rectangle_v(dst: 'ImagePtr', position: 'Vector2', size: 'Vector2', color: 'Color') -> 'None':
+    """Draw rectangle within an image (Vector version)"""
+    _ImageDrawRectangleV(dst, _vec2(position), _vec2(size), _color(color))
+
+def image_draw_rectangle_rec(dst: 'ImagePtr', rec: 'Rectangle', color: 'Color') -> 'None':
+    """Draw rectangle within an image"""
+    _ImageDrawRectangleRec(dst, _rect(rec), _color(color))
+
+def image_draw_rectangle_lines(dst: 'ImagePtr', rec: 'Rectangle', thick: 'int', color: 'Color') -> 'None':
+    """Draw rectangle lines within an image"""
+    _ImageDrawRectangleLines(dst, _rect(rec), int(thick), _color(color))
+
+def image_draw(dst: 'ImagePtr', src: 'Image', src_rec: 'Rectangle', dst_rec: 'Rectangle', tint: 'Color') -> 'None':
+    """Draw a source image within a destination image (tint applied to source)"""
+    _ImageDraw(dst, src, _rect(src_rec), _rect(dst_rec), _color(tint))
+
+def image_draw_text(dst: 'ImagePtr', text: 'Union[str, CharPtr]', pos_x: 'int', pos_y: 'int', font_size: 'int', color: 'Color') -> 'None':
+    """Draw text (using default font) within an image (destination)"""
+    _ImageDrawText(dst, _str_in(text), int(pos_x), int(pos_y), int(font_size), _color(color))
+
+def image_draw_text_ex(dst: 'ImagePtr', font: 'Font', text: 'Union[str, CharPtr]', position: 'Vector2', font_size: 'float', spacing: 'float', tint: 'Color') -> 'None':
+    """Draw text (custom sprite font) within an image (destination)"""
+    _ImageDrawTextEx(dst, font, _str_in(text), _vec2(position), float(font_size), float(spacing), _color(tint))
+
+def load_texture(file_name: 'Union[str, CharPtr]') -> 'Texture2D':
+    """Load texture from file into GPU memory (VRAM)"""
+    result = _LoadTexture(_str_in(file_name))
+    return result
+
+def load_texture_from_image(image: 'Image') -> 'Texture2D':
+    """Load texture from image data"""
+    result = _LoadTextureFromImage(image)
+    return result
+
+def load_texture_cubemap(image: 'Image', layout: 'int') -> 'TextureCubemap':
+    """Load cubemap from image, multiple image cubemap layouts supported"""
+    result = _LoadTextureCubemap(image, int(layout))
+    return result
+
+def load_render_texture(width: 'int', height: 'int') -> 'RenderTexture2D':
+    """Load texture for rendering (framebuffer)"""
+    result = _LoadRenderTexture(int(width), int(height))
+    return result
+
+def unload_texture(texture: 'Texture2D') -> 'None':
+    """Unload texture from GPU memory (VRAM)"""
+    _UnloadTexture(texture)
+
+def unload_render_texture(target: 'RenderTexture2D') -> 'None':
+    """Unload render texture from GPU memory (VRAM)"""
+    _UnloadRenderTexture(target)
+
+def update_texture(texture: 'Texture2D', pixels: 'bytes') -> 'None':
+    """Update GPU texture with new data"""
+    _UpdateTexture(texture, pixels)
+
+def update_texture_rec(texture: 'Texture2D', rec: 'Rectangle', pixels: 'bytes') -> 'None':
+    """Update GPU texture rectangle with new data"""
+    _UpdateTextureRec(texture, _rect(rec), pixels)
+
+def gen_texture_mipmaps(texture: 'Texture2DPtr') -> 'None':
+    """Generate GPU mipmaps for a texture"""
+    _GenTextureMipmaps(texture)
+
+def set_texture_filter(texture: 'Texture2D', filter: 'int') -> 'None':
+    """Set texture scaling filter mode"""
+    _SetTextureFilter(texture, int(filter))
+
+def set_texture_wrap(texture: 'Texture2D', wrap: 'int') -> 'None':
+    """Set texture wrapping mode"""
+    _SetTextureWrap(texture, int(wrap))
+
+def draw_texture(texture: 'Texture2D', pos_x: 'int', pos_y: 'int', tint: 'Color') -> 'None':
+    """Draw a Texture2D"""
+    _DrawTexture(texture, int(pos_x), int(pos_y), _color(tint))
+
+def draw_texture_v(texture: 'Texture2D', position: 'Vector2', tint: 'Color') -> 'None':
+    """Draw a Texture2D with position defined as Vector2"""
+    _DrawTextureV(texture, _vec2(position), _color(tint))
+
+def draw_texture_ex(texture: 'Texture2D', position: 'Vector2', rotation: 'float', scale: 'float', tint: 'Color') -> 'None':
+    """Draw a Texture2D with extended parameters"""
+    _DrawTextureEx(texture, _vec2(position), float(rotation), float(scale), _color(tint))
+
+def draw_texture_rec(texture: 'Texture2D', source: 'Rectangle', position: 'Vector2', tint: 'Color') -> 'None':
+    """Draw a part of a texture defined by a rectangle"""
+    _DrawTextureRec(texture, _rect(source), _vec2(position), _color(tint))
+
+def draw_texture_quad(texture: 'Texture2D', tiling: 'Vector2', offset: 'Vector2', quad: 'Rectangle', tint: 'Color') -> 'None':
+    """Draw texture quad with tiling and offset parameters"""
+    _DrawTextureQuad(texture, _vec2(tiling), _vec2(offset), _rect(quad), _color(tint))
+
+def draw_texture_tiled(texture: 'Texture2D', source: 'Rectangle', dest: 'Rectangle', origin: 'Vector2', rotation: 'float', scale: 'float', tint: 'Color') -> 'None':
+    """Draw part of a texture (defined by a rectangle) with rotation and scale tiled into dest."""
+    _DrawTextureTiled(texture, _rect(source), _rect(dest), _vec2(origin), float(rotation), float(scale), _color(tint))
+
+def draw_texture_pro(texture: 'Texture2D', source: 'Rectangle', dest: 'Rectangle', origin: 'Vector2', rotation: 'float', tint: 'Color') -> 'None':
+    """Draw a part of a texture defined by a rectangle with 'pro' parameters"""
+    _DrawTexturePro(texture, _rect(source), _rect(dest), _vec2(origin), float(rotation), _color(tint))
+
+def draw_texture_npatch(texture: 'Texture2D', n_patch_info: 'NPatchInfo', dest: 'Rectangle', origin: 'Vector2', rotation: 'float', tint: 'Color') -> 'None':
+    """Draws a texture (or part of it) that stretches or shrinks nicely"""
+    _DrawTextureNPatch(texture, n_patch_info, _rect(dest), _vec2(origin), float(rotation), _color(tint))
+
+def draw_texture_poly(texture: 'Texture2D', center: 'Vector2', points: 'Vector2Ptr', texcoords: 'Vector2Ptr', tint: 'Color') -> 'None':
+    """Draw a textured polygon"""
+    _DrawTexturePoly(texture, _vec2(center), _arr_in(Vector2, points), _vec2(texcoords), len(points), _color(tint))
+
+def fade(color: 'Color', alpha: 'float') -> 'Color':
+    """Get color with alpha applied, alpha goes from 0.0f to 1.0f"""
+    result = _Fade(_color(color), float(alpha))
+    return result
+
+def color_to_int(color: 'Color') -> 'int':
+    """Get hexadecimal value for a Color"""
+    result = _ColorToInt(_color(color))
+    return result
+
+def color_normalize(color: 'Color') -> 'Vector4':
+    """Get Color normalized as float [0..1]"""
+    result = _ColorNormalize(_color(color))
+    return result
+
+def color_from_normalized(normalized: 'Vector4') -> 'Color':
+    """Get Color from normalized values [0..1]"""
+    result = _ColorFromNormalized(_vec4(normalized))
+    return result
+
+def color_to_hsv(color: 'Color') -> 'Vector3':
+    """Get HSV values for a Color, hue [0..360], saturation/value [0..1]"""
+    result = _ColorToHSV(_color(color))
+    return result
+
+def color_from_hsv(hue: 'float', saturation: 'float', value: 'float') -> 'Color':
+    """Get a Color from HSV values, hue [0..360], saturation/value [0..1]"""
+    result = _ColorFromHSV(float(hue), float(saturation), float(value))
+    return result
+
+def color_alpha(color: 'Color', alpha: 'float') -> 'Color':
+    """Get color with alpha applied, alpha goes from 0.0f to 1.0f"""
+    result = _ColorAlpha(_color(color), float(alpha))
+    return result
+
+def color_alpha_blend(dst: 'Color', src: 'Color', tint: 'Color') -> 'Color':
+    """Get src alpha-blended into dst color with tint"""
+    result = _ColorAlphaBlend(_color(dst), _color(src), _color(tint))
+    return result
+
+def get_color(hex_value: 'int') -> 'Color':
+    """Get Color structure from hexadecimal value"""
+    result = _GetColor(hex_value)
+    return result
+
+def get_pixel_color(src_ptr: 'bytes', format: 'int') -> 'Color':
+    """Get Color from a source pixel pointer of certain format"""
+    result = _GetPixelColor(src_ptr, int(format))
+    return result
+
+def set_pixel_color(dst_ptr: 'bytes', color: 'Color', format: 'int') -> 'None':
+    """Set color formatted into destination pixel pointer"""
+    _SetPixelColor(dst_ptr, _color(color), int(format))
+
+def get_pixel_data_size(width: 'int', height: 'int', format: 'int') -> 'int':
+    """Get pixel data size in bytes for certain format"""
+    result = _GetPixelDataSize(int(width), int(height), int(format))
+    return result
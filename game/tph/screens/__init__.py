@@ -50,9 +50,13 @@ class MainScreen(Screen):
         for entity_group in entity_groups:
             entity_group.refresh(self.ticker, None)
 
+        # deferred removal: whatever got flagged should_delete during this tick goes now, all at once
+        for group in [*sprite_groups, *entity_groups]:
+            group.sweep()
+
     def render(self, sprite_groups: list[sprites.SpriteGroup]) -> None:
-        rl.clear_background(rl.RAYWHITE)
-        rl.draw_fps(20, 20)
+        rl.fast.clear_background(rl.RAYWHITE)
+        rl.fast.draw_fps(20, 20)
 
         for group in sprite_groups:
             group.render(self.ticker)
\ No newline at end of file
@@ -0,0 +1,157 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#   
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#    
+#      http://www.apache.org/licenses/LICENSE-2.0
+#    
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import functools
+import typing
+from array import array
+from ctypes import addressof, memmove
+from struct import Struct
+
+from . import controls
+from .sprites.player import Player
+
+if typing.TYPE_CHECKING:
+    from .game import Game
+
+_MAGIC = b'TPHSNP2\0'
+# level seed, clock ticks, accumulator, alpha, screen ticker, actions held, chunks, platforms, entities,
+# store rows dumped (-1 for a group without a store), Players among the entities
+_HEADER = Struct('<QQddqBIIIqI')
+_RECT = 16 # bytes of a Rectangle, 4 floats
+_VECTOR = 8
+_FLOOR = 4 # a float of EntityStore.floors
+_FLOAT = Struct('<f')
+
+@functools.lru_cache(maxsize=16)
+def _jump_state(players: int) -> Struct:
+    "The jump state of that many Players, a column per attribute: jump_ticker, ticker, floor_height, stop_ticking_jump, integrated."
+    return Struct(f'<{players}q{players}q{players}d{players}?{players}?')
+
+def take(session: 'Game') -> bytes:
+    """The whole simulation state of a session as one packed blob.
+
+    The level goes in as its seed and the chunks loaded (they are regenerated from those on restore) plus every platform's hitbox.
+    The main group's hitboxes and velocities go in as whole columns when it has an EntityStore, entity by entity otherwise;
+    then the jump state of its Players, a column per attribute.
+    """
+    clock, world, group = session.clock, session.world, session.main_group
+    indices = sorted(world.chunks)
+    platforms = [platform for index in indices for platform in world.chunks[index]]
+    entities = list(group)
+    players = [entity for entity in entities if isinstance(entity, Player)]
+
+    if group.store is not None:
+        rows = group.store.high_water
+        bodies = [group.store.rows_of(entities).tobytes(), group.store.dump_columns()]
+    else:
+        rows = -1
+        zero = bytes(_VECTOR)
+        bodies = [
+            b''.join([bytes(entity.hitbox) for entity in entities]),
+            b''.join([bytes(entity.velocity) if hasattr(entity, 'velocity') else zero for entity in entities]),
+        ]
+
+    return b''.join([
+        _MAGIC,
+        _HEADER.pack(world.seed, clock.ticks, clock.accumulator, clock.alpha, session.screen.ticker,
+                     controls.snapshot.down, len(indices), len(platforms), len(entities), rows, len(players)),
+        array('q', indices).tobytes(),
+        b''.join([bytes(platform.hitbox) for platform in platforms]),
+        *bodies,
+        _jump_state(len(players)).pack(
+            *[player.jump_ticker for player in players], *[player.ticker for player in players],
+            *[player.floor_height for player in players], *[player.stop_ticking_jump for player in players],
+            *[player.integrated for player in players],
+        ),
+    ])
+
+def restore(session: 'Game', blob: bytes) -> None:
+    """Puts a session back into the state a blob of take() was made in.
+
+    Chunks loaded since are retired and the missing ones regenerated; the main group must hold the same entities as when
+    the blob was taken (they are restored in place, in order). Its spatial hash catches up in the next refresh, like after any move.
+    """
+    if blob[:len(_MAGIC)] != _MAGIC:
+        raise ValueError("not a tph world snapshot")
+    offset = len(_MAGIC)
+    (seed, ticks, accumulator, alpha, ticker, down,
+     chunk_count, platform_count, entity_count, rows, player_count) = _HEADER.unpack_from(blob, offset)
+    offset += _HEADER.size
+    world, group = session.world, session.main_group
+    entities = list(group)
+    players = [entity for entity in entities if isinstance(entity, Player)]
+    if seed != world.seed:
+        raise ValueError(f"the snapshot is of level {seed}, the session plays level {world.seed}")
+    if entity_count != len(entities) or player_count != len(players):
+        raise ValueError(f"the snapshot has {entity_count} entities ({player_count} Players), the session {len(entities)} ({len(players)})")
+    if (rows >= 0) != (group.store is not None):
+        raise ValueError("the snapshot and the session differ in whether the main group has a store")
+
+    clock = session.clock
+    clock.ticks, clock.accumulator, clock.alpha = ticks, accumulator, alpha
+    session.screen.ticker = ticker
+    controls.snapshot = controls.InputSnapshot(down, down) # held, without the edges of the frame it was taken on
+
+    # the level: same chunks, then every platform put where it was
+    indices = array('q')
+    indices.frombytes(blob[offset:offset + chunk_count * 8])
+    offset += chunk_count * 8
+    wanted = set(indices)
+    for index in [index for index in world.chunks if index not in wanted]:
+        world.retire(index)
+    for index in indices:
+        if index not in world.chunks:
+            world.load(index)
+    platforms = [platform for index in indices for platform in world.chunks[index]]
+    if len(platforms) != platform_count:
+        raise ValueError(f"the snapshot has {platform_count} platforms, the regenerated chunks {len(platforms)}")
+    for number, platform in enumerate(platforms):
+        rect = blob[offset + number * _RECT:offset + (number + 1) * _RECT]
+        if bytes(platform.hitbox) != rect: # as generated, most of the time
+            memmove(addressof(platform.hitbox), rect, _RECT)
+            session.platforms.spatial.update(platform)
+            session.platforms.heights.update(platform)
+    offset += platform_count * _RECT
+
+    if rows >= 0:
+        saved = array('q')
+        saved.frombytes(blob[offset:offset + entity_count * 8])
+        offset += entity_count * 8
+        columns = blob[offset:offset + rows * (_RECT + _VECTOR + 1 + _FLOOR)]
+        offset += len(columns)
+        if saved == group.store.rows_of(entities):
+            group.store.load_columns(columns, rows)
+        else: # the store has been compacted since: row by row
+            for entity, row in zip(entities, saved):
+                memmove(addressof(entity.hitbox), columns[row * _RECT:(row + 1) * _RECT], _RECT)
+                if hasattr(entity, 'velocity'):
+                    start = rows * _RECT + row * _VECTOR
+                    memmove(addressof(entity.velocity), columns[start:start + _VECTOR], _VECTOR)
+                floor, = _FLOAT.unpack_from(columns, rows * (_RECT + _VECTOR + 1) + row * _FLOOR)
+                group.store.set_floor(group.store.index_of(entity), floor)
+    else:
+        velocities = offset + entity_count * _RECT
+        for number, entity in enumerate(entities):
+            memmove(addressof(entity.hitbox), blob[offset + number * _RECT:offset + (number + 1) * _RECT], _RECT)
+            if hasattr(entity, 'velocity'):
+                start = velocities + number * _VECTOR
+                memmove(addressof(entity.velocity), blob[start:start + _VECTOR], _VECTOR)
+        offset = velocities + entity_count * _VECTOR
+
+    count = len(players)
+    state = _jump_state(count).unpack_from(blob, offset)
+    columns = [state[start:start + count] for start in range(0, 5 * count, count)]
+    for player, jump_ticker, ticker, floor_height, stop_ticking_jump, integrated in zip(players, *columns):
+        player.jump_ticker, player.ticker, player.floor_height = jump_ticker, ticker, floor_height
+        player.stop_ticking_jump, player.integrated = stop_ticking_jump, integrated
@@ -14,10 +14,20 @@
 
 import abc
 import typing
-import dataclasses
 
 from .. import rlapi as rl
+from .. import controls
 from ..colors import Colors
+from . import spatial
+from .spatial import CELL_SIZE, SpatialHash
+from .heights import HeightIndex
+from . import store
+from . import physics
+from .store import EntityStore
+from .slotmap import Handle, SlotMap
+from .pool import Pool
+
+WRAP_DISTANCE = 300 # moving further than this in one tick means wrapping around the screen
 
 # Class Definitions
 class Sprite(abc.ABC):
@@ -26,14 +36,47 @@ class Sprite(abc.ABC):
     def __init__(self, x: float, y: float, width: float, height: float) -> None:
         self.hitbox: rl.Rectangle = rl.Rectangle(x, y, width, height)
         self.should_delete: bool = False
+        self.layer: int = 0 # draw order in the render queue, lower layers first
         
         # private vars
         self._repr_text: str = ""
         self._hitbox_color: rl.Color = Colors.nothing
+        self._previous_xy: tuple[float, float] | None = None # position at the tick before the last one
+        self._interpolated: rl.Rectangle | None = None
 
     def __repr__(self) -> str:
         return self._repr_text
 
+    @property
+    def render_hitbox(self) -> rl.Rectangle:
+        "Where to draw the sprite: its hitbox, or between its last two positions once interpolate() was called."
+        return self._interpolated if self._interpolated is not None else self.hitbox
+
+    def remember_position(self) -> None:
+        "Called before every simulation tick, so that rendering can interpolate from there."
+        self._previous_xy = self.hitbox.x, self.hitbox.y
+
+    def interpolate(self, alpha: float) -> None:
+        if self._previous_xy is None:
+            return
+        previous_x, previous_y = self._previous_xy
+        x, y = self.hitbox.x, self.hitbox.y
+        if abs(x - previous_x) > WRAP_DISTANCE: # wrapped around the screen, don't sweep across it
+            previous_x = x
+        if self._interpolated is None:
+            self._interpolated = rl.Rectangle()
+        self._interpolated.xywh = (
+            previous_x + (x - previous_x) * alpha, previous_y + (y - previous_y) * alpha,
+            self.hitbox.width, self.hitbox.height,
+        )
+
+    def reset(self, x: float, y: float, width: float, height: float) -> None:
+        "Puts a recycled sprite back into the state __init__ leaves it in, reusing its hitbox; the default reset hook of a Pool."
+        self.hitbox.xywh = x, y, width, height
+        self.should_delete = False
+        self._previous_xy = None
+        self._interpolated = None
+
     # Function Definitions
     @abc.abstractmethod
     def refresh(self, ticker: int) -> None:
@@ -77,11 +120,12 @@ class ControllableEntity(Entity):
 
     def __init__(self, x: float, y: float, width: float, height: float) -> None:
         super().__init__(x, y, width, height)
-        self._keys: dict[rl.KeyboardKey, typing.Callable[[], None]]
+        self._actions: dict[controls.Action, typing.Callable[[], None]]
 
     def _kb_input(self) -> None:
-        for key, fn in self._keys.items():
-            fn() if rl.is_key_down(key) else None
+        down = controls.snapshot.down # sampled once per frame by controls.poll(), not asked of raylib per key
+        for action, fn in self._actions.items():
+            fn() if down >> action & 1 else None
 
     def collision(self, item: 'Entity | Sprite | None') -> None:
         pass
@@ -98,115 +142,276 @@ class ControllableEntity(Entity):
     def refresh(self, collision_item: 'Entity | Sprite | None', ticker: int) -> None:
         return super().refresh(collision_item, ticker)
 
-@dataclasses.dataclass
-class SpriteSlot():
-    "A slot for a Sprite that holds additional metadata and utility functions for cleaner code."
+class EntityView(Entity):
+    "A lightweight Entity that is nothing but a row of an EntityStore; its hitbox, velocity and should_delete are views into the store's columns."
+    __slots__ = ('store', 'index', 'generation')
 
-    content: Sprite
-    index: int = 0
+    layer: int = 0
+    _repr_text: str = ""
+    _hitbox_color: rl.Color = Colors.nothing
+    _previous_xy: tuple[float, float] | None = None
+    _interpolated: rl.Rectangle | None = None
 
-    def set_index(self, index: int) -> None:
+    def __init__(self, store: EntityStore, index: int) -> None:
+        self.store = store
         self.index = index
-    
-    def set_content(self, sprite: Sprite) -> None:
-        self.sprite = sprite
+        self.generation = store.generation(index) # of the row when it was handed out, see EntityStore.claim()
 
-    def __repr__(self) -> str:
-        return f"{self.content.__repr__()} at index {self.index}"
+    @property
+    def hitbox(self) -> rl.Rectangle:
+        return self.store.rect(self.index)
+
+    @hitbox.setter
+    def hitbox(self, rect: rl.Rectangle) -> None:
+        self.store.rect(self.index).xywh = rect.x, rect.y, rect.width, rect.height
 
-@dataclasses.dataclass
-class EntitySlot(SpriteSlot):
-    "A slot for an Entity that holds additional metadata and a few utility functions for cleaner code."
+    @property
+    def velocity(self) -> rl.Vector2:
+        return self.store.velocity(self.index)
 
-    content: Entity
+    @velocity.setter
+    def velocity(self, velocity: rl.Vector2) -> None:
+        self.store.velocity(self.index).xy = velocity.x, velocity.y
 
-    def set_content(self, entity: Entity) -> None:
-        self.content = entity
+    @property
+    def should_delete(self) -> bool:
+        chunk, row = divmod(self.index, self.store.chunk_size)
+        return bool(self.store.flags[chunk][row] & store.DELETE)
+
+    @should_delete.setter
+    def should_delete(self, value: bool) -> None:
+        chunk, row = divmod(self.index, self.store.chunk_size)
+        flags = self.store.flags[chunk]
+        flags[row] = flags[row] | store.DELETE if value else flags[row] & ~store.DELETE
+
+    def __repr__(self) -> str:
+        return f"EntityView at row {self.index} ({self.hitbox})"
 
 class SpriteGroup():
-    "Just an iterable group of sprites (with utility functions of course)" 
+    "Just an iterable group of sprites (with utility functions of course), kept in a SlotMap"
 
     def __init__(self, *sprites: Sprite) -> None:
-        self.items: list[SpriteSlot] = [SpriteSlot(sprite, index=count) for count, sprite in enumerate(sprites)]
-        self._current_index = 0 # for the iterator
+        self.items: SlotMap[Sprite] = SlotMap()
+        self._handles: dict[Sprite, Handle] = {}
+        for sprite in sprites:
+            self.register_item(sprite)
 
-        self._recently_deleted_items: list[int] = []
-        
-    def squeeze(self) -> None:
-        try:
-            if self.items[-1].content == None:
-                self.items.pop(-1)
-                try:
-                    self.squeeze()
-                except IndexError:
-                    return 
-        except IndexError:
-            return
+    def register_item(self, new_item: Sprite) -> Handle:
+        handle = self._handles[new_item] = self.items.insert(new_item)
+        return handle
 
-    def register_item(self, new_item: Sprite):
-        if len(self._recently_deleted_items) != 0:
-            self.items[self._recently_deleted_items.pop(-1)].set_content(new_item)
-            return
-        self.items.append(SpriteSlot(new_item, index=len(self.items)))
+    def delete_item(self, handle: Handle) -> None:
+        del self._handles[self.items.remove(handle)]
 
-    def delete_item(self, at_index: int) -> None:
-        self.items[at_index].set_content(None) # type: ignore
-        self._recently_deleted_items.append(at_index)
+    def handle_of(self, sprite: Sprite) -> Handle:
+        return self._handles[sprite]
 
-    def __iter__(self) -> 'SpriteGroup':
-        return self
-    
-    def __next__(self) -> SpriteSlot:
-        if self._current_index >= len(self.items):
-            self._current_index = 0
-            raise StopIteration
-        retval: SpriteSlot = self.items[self._current_index]
-        self._current_index += 1
-        return retval
-    
-    def __getitem__(self, index: int) -> SpriteSlot:
-        return self.items[index]
+    def sweep(self) -> list[Sprite]:
+        "Deferred removal: takes every sprite flagged should_delete out of the group in one batch, and returns them."
+        doomed = [sprite for sprite in self.items.values() if sprite.should_delete]
+        for sprite in doomed:
+            self.delete_item(self._handles[sprite])
+        return doomed
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> typing.Iterator[Sprite]:
+        return iter(self.items)
+
+    def __contains__(self, sprite: Sprite) -> bool:
+        return sprite in self._handles
+
+    def __getitem__(self, handle: Handle) -> Sprite:
+        return self.items[handle]
 
     def render(self, ticker: int) -> None:
-        for slot in self.items:
-            try:
-                slot.content.render(ticker)
-            except ValueError: # because can be None
-                pass
+        for sprite in self.items:
+            sprite.render(ticker)
+
+    def render_batched(self, ticker: int) -> None:
+        "Draws the hitboxes of all sprites in a single batched call, for sprites that render as plain rectangles."
+        sprites = self.items.values()
+        rl.draw_rectangles([sprite.render_hitbox for sprite in sprites], [sprite._hitbox_color for sprite in sprites])
 
     def refresh(self, ticker: int) -> None:
-        for slot in self.items:
-            slot.content.refresh(ticker)
+        for sprite in self.items:
+            sprite.refresh(ticker)
+
+    def remember_positions(self) -> None:
+        for sprite in self.items:
+            sprite.remember_position()
+
+    def interpolate(self, alpha: float) -> None:
+        for sprite in self.items:
+            sprite.interpolate(alpha)
 
 class EntityGroup(SpriteGroup):
-    def __init__(self, *entities: Entity) -> None:
-        self.items: list[EntitySlot] = [EntitySlot(entity, count) for count, entity in enumerate(entities)]
-        self._recently_deleted_items: list[int] = []
+    "A group of entities, with their hitboxes indexed in a SpatialHash so that contacts between them can be found quickly."
+
+    def __init__(self, *entities: Entity, cell_size: float = CELL_SIZE, store: EntityStore | None = None,
+                 pool: Pool[Entity] | None = None) -> None:
+        # optional struct-of-arrays backend: hitboxes and velocities of the group's entities live in its columns
+        self.store: EntityStore | None = store
+        self.pool: Pool[Entity] | None = pool # entities acquired from it go back into it when deleted
 
-    def register_item(self, new_item: Entity) -> None:
-        if len(self._recently_deleted_items) != 0:
-            self.items[self._recently_deleted_items.pop(-1)].set_content(new_item)
+        self.spatial: SpatialHash = SpatialHash(cell_size)
+        super().__init__(*entities)
+
+    def _store_item(self, entity: Entity) -> None:
+        if self.store is None:
+            return
+        if isinstance(entity, EntityView) and entity.store is self.store:
+            store = self.store
+            if store.is_live(entity.index):
+                reused = store.generation(entity.index) != entity.generation
+            else:
+                reused = not store.claim(entity.index, entity.generation)
+            if reused:
+                raise ValueError(f"the store row of {entity!r} has been reused since it was deleted")
+            self.store.attach(entity.index, entity)
+            return
+        self.store.adopt(entity)
+
+    def _unstore_item(self, entity: Entity) -> None:
+        if self.store is None:
             return
-        self.items.append(EntitySlot(new_item, index=len(self.items)))
-
-    def __next__(self) -> EntitySlot:
-        if self._current_index >= len(self.items):
-            self._current_index = 0
-            raise StopIteration
-        retval: EntitySlot = self.items[self._current_index]
-        self._current_index += 1
-        return retval
-
-    def __getitem__(self, index: int) -> EntitySlot:
-        return self.items[index]
- 
+        if isinstance(entity, EntityView) and entity.store is self.store:
+            self.store.release(entity.index)
+        else:
+            self.store.disown(entity)
+
+    def register_item(self, new_item: Entity) -> Handle:
+        self._store_item(new_item)
+        self.spatial.insert(new_item)
+        return super().register_item(new_item)
+
+    def delete_item(self, handle: Handle, release: bool = True) -> None:
+        "Takes an entity out of the group, and gives it back to the group's pool if it came from there (unless `release` is False)."
+        entity = self.items[handle]
+        self.spatial.remove(entity)
+        self._unstore_item(entity)
+        super().delete_item(handle)
+        if release and self.pool is not None and entity in self.pool:
+            self.pool.release(entity)
+
+    def store_index(self, entity: Entity) -> int:
+        "The row of an entity of this group in its store."
+        return self.store.index_of(entity)
+
+    def simulate(self, entity: Entity, enabled: bool = True) -> None:
+        """Hands an entity's gravity, integration and screen wrap over to the batched physics.step() in refresh(), or back.
+
+        Its floor_height (if it has one) goes into the store here: call simulate() again after changing it.
+        """
+        if self.store is None:
+            raise ValueError("simulate() needs an EntityGroup with a store")
+        if enabled:
+            self.store.set_flags(self.store_index(entity), store.PHYSICS)
+            self.store.set_floor(self.store_index(entity), getattr(entity, 'floor_height', None))
+        else:
+            self.store.clear_flags(self.store_index(entity), store.PHYSICS)
+        if hasattr(entity, 'integrated'): # Player and others that integrate themselves otherwise
+            entity.integrated = enabled
+
+    def spawn(self, x: float, y: float, width: float, height: float) -> EntityView:
+        "Creates an EntityView in the group's store and registers it."
+        if self.store is None:
+            raise ValueError("spawn() needs an EntityGroup with a store")
+        entity = EntityView(self.store, self.store.allocate(x, y, width, height))
+        self.register_item(entity)
+        return entity
+
+    def acquire(self, x: float, y: float, width: float, height: float) -> Entity:
+        "Takes an entity from the group's pool, resets it to the given hitbox and registers it."
+        if self.pool is None:
+            raise ValueError("acquire() needs an EntityGroup with a pool")
+        entity = self.pool.acquire(x, y, width, height)
+        self.register_item(entity)
+        return entity
+
+    def sweep(self) -> list[Entity]:
+        doomed = super().sweep()
+        if self.store is not None:
+            self.store.compact() # a few hundred rows per call, so the store shrinks back over a few frames
+        return doomed
+
+    def query(self, rect: rl.Rectangle) -> list[Entity]:
+        "The entities of this group whose hitboxes overlap the rectangle."
+        return [entity for entity in self.spatial.query(rect) if spatial.overlaps(rect, entity.hitbox)]
+
+    def refresh(self, ticker: int, collision_item: Entity | Sprite | None) -> None:
+        for entity in self.items:
+            entity.refresh(collision_item, ticker)
+        if self.store is not None:
+            physics.step(self.store)
+
+        update = self.spatial.update
+        for entity in self.items:
+            update(entity)
+
+        # broadphase through the spatial hash, then both entities of every touching pair get told
+        for entity, other in self.spatial.pairs():
+            entity.collision(other)
+            other.collision(entity)
+
+class PlatformGroup(EntityGroup):
+    "An EntityGroup for a vertical scroller, with its entities also kept in height order so that rendering, landing checks and recycling only touch the band of the level they need."
+
+    def __init__(self, *entities: Entity, cell_size: float = CELL_SIZE, store: EntityStore | None = None,
+                 pool: Pool[Entity] | None = None, visible_band: tuple[float, float] = (0, 900)) -> None:
+        self.heights: HeightIndex = HeightIndex(*entities) # sorted once here rather than one insert at a time
+        self.visible_band: tuple[float, float] = visible_band # top and bottom y of what is on screen
+        super().__init__(*entities, cell_size=cell_size, store=store, pool=pool)
+
+    def register_item(self, new_item: Entity) -> Handle:
+        handle = super().register_item(new_item)
+        if new_item not in self.heights:
+            self.heights.insert(new_item)
+        return handle
+
+    def delete_item(self, handle: Handle, release: bool = True) -> None:
+        self.heights.remove(self.items[handle])
+        super().delete_item(handle, release)
+
+    def visible(self) -> list[Entity]:
+        return self.heights.band(*self.visible_band)
+
+    def landing_candidates(self, entity: Entity, distance: float) -> list[Entity]:
+        "The entities whose tops lie at most `distance` below the entity's bottom and overlap it horizontally, i.e. what it can land on when falling that far."
+        left, right = entity.hitbox.x, entity.hitbox.x + entity.hitbox.width
+        bottom = entity.hitbox.y + entity.hitbox.height
+        return [
+            platform for platform in self.heights.band(bottom, bottom + distance)
+            if platform is not entity and bottom <= platform.hitbox.y <= bottom + distance
+            and platform.hitbox.x < right and left < platform.hitbox.x + platform.hitbox.width
+        ]
+
+    def recycle_below(self, y: float) -> list[Entity]:
+        "Takes every entity that is entirely below `y` (the bottom of the camera) out of the group and returns them, to be moved up and registered again."
+        removed = self.heights.remove_below(y)
+        for entity in removed:
+            EntityGroup.delete_item(self, self.handle_of(entity), release=False) # still in use, just not registered
+        return removed
+
     def render(self, ticker: int) -> None:
-        for slot in self.items:
-            try:
-                slot.content.render(ticker)
-            except ValueError: # because can be None
-                pass
+        for entity in self.visible():
+            entity.render(ticker)
 
     def refresh(self, ticker: int, collision_item: Entity | Sprite | None) -> None:
-        for slot in self.items:
-            slot.content.refresh(collision_item, ticker)
\ No newline at end of file
+        moved = self.visible()
+        for entity in moved:
+            entity.refresh(collision_item, ticker)
+        if self.store is not None:
+            physics.step(self.store)
+            moved = list(self.items) # the step integrates every simulated row, on screen or not
+        for entity in moved:
+            self.spatial.update(entity)
+            self.heights.update(entity)
+
+        # only the platforms around the collision item get told about it, not every pair in the group
+        if isinstance(collision_item, Entity):
+            for platform in self.query(collision_item.hitbox):
+                if platform is not collision_item:
+                    platform.collision(collision_item)
+                    collision_item.collision(platform)
@@ -0,0 +1,113 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#   
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#    
+#      http://www.apache.org/licenses/LICENSE-2.0
+#    
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import bisect
+import typing
+
+if typing.TYPE_CHECKING:
+    from . import Entity
+
+# Class Definitions
+class HeightIndex():
+    "Entities ordered by height (bottom of the level first), for y-band queries in O(log n)."
+
+    def __init__(self, *entities: 'Entity') -> None:
+        # sorted by -hitbox.y, so going up the level means appending; everything before
+        # self._start has been cut off at the bottom and is dropped on the next compaction
+        self._heights: list[float] = []
+        self._entities: list['Entity'] = []
+        self._start: int = 0
+        self._keys: dict['Entity', float] = {} # entity -> height it was indexed at
+        self._tallest: float = 0 # tallest hitbox so far, how far above a band to look for overlaps
+
+        for entity in sorted(entities, key=lambda entity: -entity.hitbox.y):
+            self.insert(entity)
+
+    def __len__(self) -> int:
+        return len(self._entities) - self._start
+
+    def __contains__(self, entity: 'Entity') -> bool:
+        return entity in self._keys
+
+    def __iter__(self) -> typing.Iterator['Entity']:
+        "Bottom to top."
+        return iter(self._entities[self._start:])
+
+    def lowest(self) -> 'Entity | None':
+        return self._entities[self._start] if len(self) else None
+
+    def highest(self) -> 'Entity | None':
+        return self._entities[-1] if len(self) else None
+
+    def _find(self, entity: 'Entity') -> int:
+        height = self._keys[entity]
+        index = bisect.bisect_left(self._heights, height, self._start)
+        while self._entities[index] is not entity: # entities at the same height
+            index += 1
+        return index
+
+    def _compact(self) -> None:
+        del self._heights[:self._start]
+        del self._entities[:self._start]
+        self._start = 0
+
+    def insert(self, entity: 'Entity') -> None:
+        "O(1) for an entity above all the others (new platforms at the top), O(n) elsewhere."
+        height = -entity.hitbox.y
+        self._keys[entity] = height
+        self._tallest = max(self._tallest, entity.hitbox.height)
+        if not self._heights or height >= self._heights[-1]:
+            self._heights.append(height)
+            self._entities.append(entity)
+            return
+        index = bisect.bisect_right(self._heights, height, self._start)
+        self._heights.insert(index, height)
+        self._entities.insert(index, entity)
+
+    def remove(self, entity: 'Entity') -> None:
+        index = self._find(entity)
+        del self._keys[entity]
+        if index == self._start:
+            self._start += 1
+            if self._start > len(self._entities) // 2:
+                self._compact()
+            return
+        del self._heights[index]
+        del self._entities[index]
+
+    def update(self, entity: 'Entity') -> None:
+        "Re-sorts an entity whose hitbox moved vertically."
+        if self._keys[entity] != -entity.hitbox.y:
+            self.remove(entity)
+            self.insert(entity)
+
+    def band(self, top: float, bottom: float) -> list['Entity']:
+        "The entities whose hitboxes overlap the band between the y coordinates `top` and `bottom`, bottom to top."
+        start = bisect.bisect_right(self._heights, -bottom, self._start)
+        end = bisect.bisect_right(self._heights, -(top - self._tallest), start)
+        return [
+            entity for entity in self._entities[start:end]
+            if entity.hitbox.y + entity.hitbox.height > top
+        ]
+
+    def remove_below(self, y: float) -> list['Entity']:
+        "Cuts off and returns every entity that is entirely below the y coordinate `y`, in O(log n) plus the entities removed."
+        end = bisect.bisect_right(self._heights, -y, self._start)
+        removed = self._entities[self._start:end]
+        for entity in removed:
+            del self._keys[entity]
+        self._start = end
+        if self._start > len(self._entities) // 2:
+            self._compact()
+        return removed
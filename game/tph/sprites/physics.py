@@ -0,0 +1,69 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#   
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#    
+#      http://www.apache.org/licenses/LICENSE-2.0
+#    
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from array import array
+
+from . import store as _store
+from .store import EntityStore
+
+GRAVITY = 2
+FLOOR_HEIGHT = 900
+SCREEN_WIDTH = 600
+
+# Function Definitions
+def step(store: EntityStore, gravity: float = GRAVITY, floor_height: float = FLOOR_HEIGHT, screen_width: float = SCREEN_WIDTH) -> None:
+    """One physics tick for every row of the store flagged PHYSICS: the rules of Player.refresh and Entity._screen_wrap, on whole columns.
+
+    Rows stop falling at their own floor (EntityStore.set_floor(), which EntityGroup.simulate() calls with an entity's
+    floor_height), `floor_height` is for the rows without one.
+    """
+    wanted = _store.LIVE | _store.PHYSICS
+    for (rects, velocities, flags, rows), floors in zip(store.columns(), store.floors):
+        active = [flag & wanted == wanted for flag in flags[:rows]]
+        if not any(active):
+            continue
+        n4, n2 = rows * 4, rows * 2
+
+        # gravity while above the floor, otherwise clamp onto it and stop
+        ys, heights, vys = rects[1:n4:4], rects[3:n4:4], velocities[1:n2:2]
+        tops = [(floor if floor == floor else floor_height) - height for floor, height in zip(floors[:rows], heights)] # NaN != NaN
+        velocities[1:n2:2] = array('f', [
+            (vy + gravity if y < top else 0.0) if on else vy
+            for on, y, top, vy in zip(active, ys, tops, vys)
+        ])
+        rects[1:n4:4] = array('f', [
+            top if on and y >= top else y
+            for on, y, top in zip(active, ys, tops)
+        ])
+
+        # integrate, reading back the columns so everything is rounded to float32 like the structs are
+        rects[0:n4:4] = array('f', [
+            x + vx if on else x
+            for on, x, vx in zip(active, rects[0:n4:4], velocities[0:n2:2])
+        ])
+        rects[1:n4:4] = array('f', [
+            y + vy if on else y
+            for on, y, vy in zip(active, rects[1:n4:4], velocities[1:n2:2])
+        ])
+
+        # screen wrap, the left edge checked after the right one like in Entity._screen_wrap
+        halves = [width / 2 for width in rects[2:n4:4]]
+        rects[0:n4:4] = array('f', [
+            0 - half if on and x > screen_width - half else x
+            for on, x, half in zip(active, rects[0:n4:4], halves)
+        ])
+        rects[0:n4:4] = array('f', [
+            screen_width - half if on and x < 0 - half else x
+            for on, x, half in zip(active, rects[0:n4:4], halves)
+        ])
@@ -0,0 +1,34 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#   
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#    
+#      http://www.apache.org/licenses/LICENSE-2.0
+#    
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License
+
+from . import Entity, Sprite
+from ..colors import Colors
+from .. import rlapi as rl
+
+PLATFORM_WIDTH = 60
+PLATFORM_HEIGHT = 16
+
+class Platform(Entity):
+    def __init__(self, x: float, y: float, width: float = PLATFORM_WIDTH, height: float = PLATFORM_HEIGHT) -> None:
+        super().__init__(x, y, width, height)
+        self._hitbox_color = Colors.gray
+
+    def collision(self, item: Entity | Sprite | None) -> None:
+        pass
+
+    def render(self, ticker: int) -> None:
+        rl.renderqueue.queue.submit(rl.fast.draw_rectangle_rec, (self.render_hitbox, self._hitbox_color), layer=self.layer)
+
+    def refresh(self, collision_item: Entity | Sprite | None, ticker: int) -> None:
+        self.collision(collision_item)
@@ -17,15 +17,16 @@ import typing
 from . import ControllableEntity, Entity, Sprite
 from ..colors import Colors
 from .. import rlapi as rl
+from .. import controls
 
 class Player(ControllableEntity):
     def __init__(self, x: float, y: float) -> None:
         super().__init__(x, y, 60, 80)
         self._hitbox_color = Colors.maroon
-        self._keys: dict[rl.KeyboardKey, typing.Callable[[], None]] = {
-            rl.KEY_LEFT: (lambda *_: self.move_to(self.hitbox.x - 10, self.hitbox.y)),
-            rl.KEY_RIGHT: (lambda *_: self.move_to(self.hitbox.x + 10, self.hitbox.y)),
-            rl.KEY_SPACE: (lambda *_: self.jump()),
+        self._actions: dict[controls.Action, typing.Callable[[], None]] = {
+            controls.Action.LEFT: (lambda *_: self.move_to(self.hitbox.x - 10, self.hitbox.y)),
+            controls.Action.RIGHT: (lambda *_: self.move_to(self.hitbox.x + 10, self.hitbox.y)),
+            controls.Action.JUMP: (lambda *_: self.jump()),
         }
 
         # physics related variables
@@ -34,6 +35,7 @@ class Player(ControllableEntity):
         self.stop_ticking_jump = False
         self.velocity = rl.Vector2(0, 0)
         self.floor_height = 900
+        self.integrated = False # gravity and movement done by sprites.physics.step() instead of refresh()
 
     def jump(self) -> None:
         if self.hitbox.y > self.floor_height - self.hitbox.height or self.jump_ticker > 0:
@@ -48,7 +50,7 @@ class Player(ControllableEntity):
             self.velocity.y = 3
             self.stop_ticking_jump = True
         
-        if rl.is_key_released(rl.KEY_SPACE):
+        if controls.snapshot.is_released(controls.Action.JUMP):
             self.velocity.y = 0
             self.jump_ticker = 0
             self.stop_ticking_jump = False
@@ -57,13 +59,16 @@ class Player(ControllableEntity):
         pass
 
     def render(self, ticker: int) -> None:
-        rl.draw_rectangle_rec(self.hitbox, self._hitbox_color)
+        rl.renderqueue.queue.submit(rl.fast.draw_rectangle_rec, (self.render_hitbox, self._hitbox_color), layer=self.layer)
     
     def refresh(self, collision_item: Entity | Sprite | None, ticker: int) -> None:
         self.ticker = ticker
         self._kb_input()
         self.collision(collision_item)
 
+        if self.integrated:
+            return
+
         if self.hitbox.y < self.floor_height - self.hitbox.height:
             self.velocity.y += 2
 
@@ -0,0 +1,72 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#   
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#    
+#      http://www.apache.org/licenses/LICENSE-2.0
+#    
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import typing
+
+T = typing.TypeVar('T')
+
+# Class Definitions
+class Pool(typing.Generic[T]):
+    """Recycles objects of one kind instead of constructing new ones: acquire() hands out a released one if there is one.
+
+    Objects come from `factory()` and are set up for their next use by `reset(obj, *args)`, which defaults to `obj.reset(*args)`.
+    """
+    __slots__ = ('factory', 'reset', '_free', '_in_use', 'hits', 'misses', 'high_water')
+
+    def __init__(self, factory: typing.Callable[[], T], size: int = 0,
+                 reset: typing.Callable[..., None] | None = None) -> None:
+        self.factory: typing.Callable[[], T] = factory
+        self.reset: typing.Callable[..., None] = reset if reset is not None else lambda obj, *args: obj.reset(*args)
+        self._free: list[T] = [factory() for _ in range(size)] # preallocated up front, not counted as misses
+        self._in_use: dict[int, T] = {} # id -> object, for the objects handed out
+
+        # counters
+        self.hits: int = 0 # acquire() calls served from the free list
+        self.misses: int = 0 # acquire() calls that had to construct
+        self.high_water: int = 0 # most objects handed out at once
+
+    def __len__(self) -> int:
+        "How many objects are handed out right now."
+        return len(self._in_use)
+
+    def __contains__(self, obj: T) -> bool:
+        "Whether the object was acquired from this pool and not released since."
+        return id(obj) in self._in_use
+
+    @property
+    def free(self) -> int:
+        return len(self._free)
+
+    def acquire(self, *args: typing.Any) -> T:
+        if len(self._free) != 0:
+            obj = self._free.pop()
+            self.hits += 1
+        else:
+            obj = self.factory()
+            self.misses += 1
+        self.reset(obj, *args)
+        self._in_use[id(obj)] = obj
+        if len(self._in_use) > self.high_water:
+            self.high_water = len(self._in_use)
+        return obj
+
+    def release(self, obj: T) -> None:
+        if id(obj) not in self._in_use:
+            raise ValueError(f"{obj!r} is not in use from this pool")
+        del self._in_use[id(obj)]
+        self._free.append(obj)
+
+    def reset_counters(self) -> None:
+        self.hits = self.misses = 0
+        self.high_water = len(self._in_use)
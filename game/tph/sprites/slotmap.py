@@ -0,0 +1,105 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#   
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#    
+#      http://www.apache.org/licenses/LICENSE-2.0
+#    
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import typing
+
+T = typing.TypeVar('T')
+
+# Class Definitions
+class Handle(typing.NamedTuple):
+    "Names a value in a SlotMap; goes stale once that value is removed, even if the slot gets reused."
+
+    index: int
+    generation: int
+
+_new_handle = Handle._make # skips the Python-level __new__ of NamedTuple
+
+class SlotMap(typing.Generic[T]):
+    "Values packed densely in a list, addressed through generational handles: O(1) insert, remove and lookup."
+    __slots__ = ('_values', '_owners', '_dense', '_generations', '_free')
+
+    def __init__(self) -> None:
+        self._values: list[T] = [] # dense, in no particular order
+        self._owners: list[int] = [] # slot of every dense value
+        self._dense: list[int] = [] # slot -> position in _values, only meaningful for occupied slots
+        self._generations: list[int] = [] # slot -> generation, odd while occupied
+        self._free: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> typing.Iterator[T]:
+        "The live values; remove() must not be called while iterating."
+        return iter(self._values)
+
+    def __contains__(self, handle: Handle) -> bool:
+        index, generation = handle
+        return index < len(self._generations) and self._generations[index] == generation
+
+    def __getitem__(self, handle: Handle) -> T:
+        index, generation = handle
+        if index >= len(self._generations) or self._generations[index] != generation:
+            raise KeyError(f"stale or unknown handle {handle}")
+        return self._values[self._dense[index]]
+
+    def get(self, handle: Handle, default: T | None = None) -> T | None:
+        return self[handle] if handle in self else default
+
+    def values(self) -> list[T]:
+        "The dense list of live values itself, not a copy: read it, don't change it."
+        return self._values
+
+    def handles(self) -> list[Handle]:
+        return [_new_handle((index, self._generations[index])) for index in self._owners]
+
+    def insert(self, value: T) -> Handle:
+        generations = self._generations
+        if len(self._free) != 0:
+            index = self._free.pop(-1)
+            generations[index] += 1
+            self._dense[index] = len(self._values)
+        else:
+            index = len(generations)
+            generations.append(1)
+            self._dense.append(len(self._values))
+        self._values.append(value)
+        self._owners.append(index)
+        return _new_handle((index, generations[index]))
+
+    def remove(self, handle: Handle) -> T:
+        "Takes a value out, moving the last dense value into its place."
+        index, generation = handle
+        generations = self._generations
+        if index >= len(generations) or generations[index] != generation:
+            raise KeyError(f"stale or unknown handle {handle}")
+        values, owners = self._values, self._owners
+        position = self._dense[index]
+        value = values[position]
+        last = values.pop()
+        last_owner = owners.pop()
+        if last_owner != index:
+            values[position] = last
+            owners[position] = last_owner
+            self._dense[last_owner] = position
+
+        generations[index] = generation + 1
+        self._free.append(index)
+        return value
+
+    def clear(self) -> None:
+        for index in self._owners:
+            self._generations[index] += 1
+            self._free.append(index)
+        self._values.clear()
+        self._owners.clear()
@@ -0,0 +1,143 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#   
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#    
+#      http://www.apache.org/licenses/LICENSE-2.0
+#    
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import typing
+
+from .. import rlapi as rl
+
+if typing.TYPE_CHECKING:
+    from . import Entity
+
+CELL_SIZE = 128
+
+# Function Definitions
+def overlaps(a: rl.Rectangle, b: rl.Rectangle) -> bool:
+    "Same test as rl.check_collision_recs, without the trip through ctypes."
+    ax, ay = a.x, a.y
+    bx, by = b.x, b.y
+    return ax < bx + b.width and bx < ax + a.width and ay < by + b.height and by < ay + a.height
+
+# Class Definitions
+class SpatialHash():
+    "A uniform grid over entity hitboxes, for finding the entities that can touch a rectangle without checking all of them."
+
+    def __init__(self, cell_size: float = CELL_SIZE) -> None:
+        self.cell_size: float = cell_size
+        self._cells: dict[tuple[int, int], set['Entity']] = {}
+        self._bounds: dict['Entity', tuple[int, int, int, int]] = {} # entity -> the cells it covers
+
+    def __len__(self) -> int:
+        return len(self._bounds)
+
+    def __contains__(self, entity: 'Entity') -> bool:
+        return entity in self._bounds
+
+    def _cell_bounds(self, rect: rl.Rectangle) -> tuple[int, int, int, int]:
+        x, y = rect.x, rect.y
+        size = self.cell_size
+        return int(x // size), int(y // size), int((x + rect.width) // size), int((y + rect.height) // size)
+
+    def _link(self, entity: 'Entity', bounds: tuple[int, int, int, int]) -> None:
+        cells = self._cells
+        left, top, right, bottom = bounds
+        for cx in range(left, right + 1):
+            for cy in range(top, bottom + 1):
+                try:
+                    cells[cx, cy].add(entity)
+                except KeyError:
+                    cells[cx, cy] = {entity}
+        self._bounds[entity] = bounds
+
+    def _unlink(self, entity: 'Entity', bounds: tuple[int, int, int, int]) -> None:
+        cells = self._cells
+        left, top, right, bottom = bounds
+        for cx in range(left, right + 1):
+            for cy in range(top, bottom + 1):
+                cell = cells[cx, cy]
+                cell.discard(entity)
+                if not cell:
+                    del cells[cx, cy]
+
+    def insert(self, entity: 'Entity') -> None:
+        self.update(entity)
+
+    def remove(self, entity: 'Entity') -> None:
+        bounds = self._bounds.pop(entity, None)
+        if bounds is not None:
+            self._unlink(entity, bounds)
+
+    def update(self, entity: 'Entity') -> None:
+        "Re-indexes an entity after it moved; only touches the grid when it crossed into other cells."
+        bounds = self._cell_bounds(entity.hitbox)
+        old = self._bounds.get(entity)
+        if old == bounds:
+            return
+        if old is not None:
+            self._unlink(entity, old)
+        self._link(entity, bounds)
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._bounds.clear()
+
+    def query(self, rect: rl.Rectangle) -> set['Entity']:
+        "Every entity sharing a cell with the rectangle (a superset of the ones overlapping it)."
+        left, top, right, bottom = self._cell_bounds(rect)
+        cells = self._cells
+        found: set['Entity'] = set()
+        for cx in range(left, right + 1):
+            for cy in range(top, bottom + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    found |= cell
+        return found
+
+    def candidates(self, entity: 'Entity') -> set['Entity']:
+        "The entities in the same cells as an indexed entity, without the entity itself."
+        left, top, right, bottom = self._bounds[entity]
+        if left == right and top == bottom:
+            found = set(self._cells[left, top])
+        else:
+            found = set()
+            for cx in range(left, right + 1):
+                for cy in range(top, bottom + 1):
+                    found |= self._cells[cx, cy]
+        found.discard(entity)
+        return found
+
+    def pairs(self) -> typing.Iterator[tuple['Entity', 'Entity']]:
+        "Every pair of indexed entities whose hitboxes overlap, each pair once."
+        # edges of every hitbox read once up front, the struct fields are slow to get at in the inner loop
+        boxes: dict['Entity', tuple[int, float, float, float, float]] = {}
+        for order, entity in enumerate(self._bounds):
+            hitbox = entity.hitbox
+            x, y = hitbox.x, hitbox.y
+            boxes[entity] = order, x, y, x + hitbox.width, y + hitbox.height
+
+        cells = self._cells
+        for entity, (left, top, right, bottom) in self._bounds.items():
+            if left == right and top == bottom:
+                others = cells[left, top]
+                if len(others) == 1:
+                    continue
+            else:
+                others = set()
+                for cx in range(left, right + 1):
+                    for cy in range(top, bottom + 1):
+                        others |= cells[cx, cy]
+            order, x, y, r, b = boxes[entity]
+            for other in others:
+                other_order, ox, oy, o_r, o_b = boxes[other]
+                if other_order > order and x < o_r and ox < r and y < o_b and oy < b:
+                    yield entity, other
@@ -0,0 +1,259 @@
+#    Copyright 2023 Eason Qin (ezntek, ezntek@xflymusic.com)
+#   
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#    
+#      http://www.apache.org/licenses/LICENSE-2.0
+#    
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import typing
+from array import array
+
+from .. import rlapi as rl
+
+if typing.TYPE_CHECKING:
+    from . import Entity
+
+CHUNK_SIZE = 1024
+_FLOAT_SIZE = array('f').itemsize
+_NO_FLOOR = array('f', [float('nan')]) # the floor of a row that set_floor() hasn't been called for
+
+# flag bits of EntityStore.flags
+LIVE = 1
+DELETE = 2
+PHYSICS = 4 # moved by physics.step()
+
+# Class Definitions
+class EntityStore():
+    """Struct-of-arrays storage for entities: hitboxes, velocities and flags each live in a contiguous column.
+
+    Columns are laid out like the raylib structs, so `rects[1::4]` is every y and a column can go to raylib as is.
+    They come in fixed-size chunks that are never resized, so the ctypes views handed out stay valid.
+    """
+
+    def __init__(self, chunk_size: int = CHUNK_SIZE) -> None:
+        self.chunk_size: int = chunk_size
+        self.rects: list[array] = [] # one float column per chunk, 4 per entity
+        self.velocities: list[array] = [] # one float column per chunk, 2 per entity
+        self.flags: list[array] = [] # one byte column per chunk
+        self.floors: list[array] = [] # one float column per chunk, NaN where physics.step() uses its default floor
+        self._rect_views: list[typing.Any] = [] # ctypes arrays over the columns, indexed to get a view
+        self._velocity_views: list[typing.Any] = []
+        self._free: set[int] = set()
+        self._top: int = 0 # indices below this one are live or free, the columns are only walked up to here
+        self._live: int = 0
+        self._owners: dict[int, 'Entity'] = {} # row -> entity viewing it, for compact() to rebind
+        self._rows: dict['Entity', int] = {}
+        # bumped every time a row is handed out; never shrunk, so rows of chunks compact() gave back don't start over
+        self._generations: array = array('L')
+
+    def __len__(self) -> int:
+        return self._live
+
+    @property
+    def high_water(self) -> int:
+        "Rows in use, live or free: what columns() walks and dump_columns() writes out."
+        return self._top
+
+    def _add_chunk(self) -> None:
+        size = self.chunk_size
+        rects = array('f', bytes(_FLOAT_SIZE * 4 * size))
+        velocities = array('f', bytes(_FLOAT_SIZE * 2 * size))
+        self.rects.append(rects)
+        self.velocities.append(velocities)
+        self.flags.append(array('B', bytes(size)))
+        self.floors.append(_NO_FLOOR * size)
+        self._rect_views.append((rl.Rectangle * size).from_buffer(rects))
+        self._velocity_views.append((rl.Vector2 * size).from_buffer(velocities))
+
+    def allocate(self, x: float = 0, y: float = 0, width: float = 0, height: float = 0) -> int:
+        "Claims a row for a new entity and returns its index."
+        if len(self._free) != 0:
+            index = self._free.pop()
+        else:
+            index = self._top
+            self._top += 1
+            if index >= len(self.rects) * self.chunk_size:
+                self._add_chunk()
+        chunk, row = divmod(index, self.chunk_size)
+        self.rects[chunk][row * 4:row * 4 + 4] = array('f', (x, y, width, height))
+        self.velocities[chunk][row * 2:row * 2 + 2] = array('f', (0, 0))
+        self.flags[chunk][row] = LIVE
+        self.floors[chunk][row] = _NO_FLOOR[0]
+        self._live += 1
+        self._bump(index)
+        return index
+
+    def _bump(self, index: int) -> None:
+        generations = self._generations
+        if index >= len(generations):
+            generations.extend(bytes(index + 1 - len(generations)))
+        generations[index] += 1
+
+    def generation(self, index: int) -> int:
+        "How many times the row has been handed out; a view holding an older generation is of an entity that was deleted."
+        return self._generations[index] if 0 <= index < len(self._generations) else 0
+
+    def release(self, index: int) -> None:
+        chunk, row = divmod(index, self.chunk_size)
+        self.flags[chunk][row] = 0
+        self._free.add(index)
+        self._live -= 1
+        owner = self._owners.pop(index, None)
+        if owner is not None:
+            del self._rows[owner]
+
+    def attach(self, index: int, entity: 'Entity') -> None:
+        "Records which entity views a row, so that compact() can move it."
+        self._owners[index] = entity
+        self._rows[entity] = index
+
+    def index_of(self, entity: 'Entity') -> int:
+        return self._rows[entity]
+
+    def rows_of(self, entities: typing.Iterable['Entity']) -> array:
+        return array('q', list(map(self._rows.__getitem__, entities)))
+
+    def claim(self, index: int, generation: int) -> bool:
+        "Takes a released row back as it was left, False if it has been handed out again since (even if released again)."
+        if index not in self._free or self.generation(index) != generation:
+            return False
+        self._free.remove(index)
+        chunk, row = divmod(index, self.chunk_size)
+        self.flags[chunk][row] = LIVE
+        self._live += 1
+        return True
+
+    def is_live(self, index: int) -> bool:
+        if not 0 <= index < self._top: # rows past the end, maybe in a chunk compact() gave back
+            return False
+        chunk, row = divmod(index, self.chunk_size)
+        return bool(self.flags[chunk][row] & LIVE)
+
+    def set_flags(self, index: int, bits: int) -> None:
+        chunk, row = divmod(index, self.chunk_size)
+        self.flags[chunk][row] |= bits
+
+    def clear_flags(self, index: int, bits: int) -> None:
+        chunk, row = divmod(index, self.chunk_size)
+        self.flags[chunk][row] &= ~bits
+
+    def set_floor(self, index: int, height: float | None) -> None:
+        "The height physics.step() stops the row falling at, None for the one it is called with."
+        chunk, row = divmod(index, self.chunk_size)
+        self.floors[chunk][row] = _NO_FLOOR[0] if height is None else height
+
+    def rect(self, index: int) -> rl.Rectangle:
+        "A Rectangle viewing the hitbox of the row, writes to it go into the column."
+        chunk, row = divmod(index, self.chunk_size)
+        return self._rect_views[chunk][row]
+
+    def velocity(self, index: int) -> rl.Vector2:
+        chunk, row = divmod(index, self.chunk_size)
+        return self._velocity_views[chunk][row]
+
+    def columns(self) -> typing.Iterator[tuple[array, array, array, int]]:
+        "(rects, velocities, flags, rows in use) for every chunk, for code working on whole columns at once."
+        size = self.chunk_size
+        for chunk, rects in enumerate(self.rects):
+            rows = min(size, self._top - chunk * size)
+            if rows <= 0:
+                return
+            yield rects, self.velocities[chunk], self.flags[chunk], rows
+
+    def dump_columns(self) -> bytes:
+        "The rects, velocities, flags and floors columns up to the last row in use, one after the other, for snapshots."
+        rects, velocities, flags, floors = [], [], [], []
+        for (rect_column, velocity_column, flag_column, rows), floor_column in zip(self.columns(), self.floors):
+            rects.append(memoryview(rect_column)[:rows * 4].tobytes())
+            velocities.append(memoryview(velocity_column)[:rows * 2].tobytes())
+            flags.append(memoryview(flag_column)[:rows].tobytes())
+            floors.append(memoryview(floor_column)[:rows].tobytes())
+        return b''.join(rects + velocities + flags + floors)
+
+    def load_columns(self, data: bytes, rows: int) -> None:
+        "Writes `rows` rows of dump_columns() back in place, so every view handed out sees them; the rows must belong to the same entities."
+        size = self.chunk_size
+        while len(self.rects) * size < rows:
+            self._add_chunk()
+        data = memoryview(data)
+        offset = 0
+        for columns, width in ((self.rects, 4 * _FLOAT_SIZE), (self.velocities, 2 * _FLOAT_SIZE), (self.flags, 1),
+                               (self.floors, _FLOAT_SIZE)):
+            for chunk in range(-(-rows // size)):
+                length = min(size, rows - chunk * size) * width
+                memoryview(columns[chunk]).cast('B')[:length] = data[offset:offset + length]
+                offset += length
+
+    def adopt(self, entity: 'Entity') -> int:
+        "Moves an entity's hitbox (and velocity, if it has one) into the store, rebinding them to views of its row."
+        hitbox = entity.hitbox
+        index = self.allocate(hitbox.x, hitbox.y, hitbox.width, hitbox.height)
+        entity.hitbox = self.rect(index)
+        velocity = getattr(entity, 'velocity', None)
+        if isinstance(velocity, rl.Vector2):
+            view = self.velocity(index)
+            view.x, view.y = velocity.x, velocity.y
+            entity.velocity = view
+        self.attach(index, entity)
+        return index
+
+    def disown(self, entity: 'Entity') -> None:
+        "Gives an adopted entity structs of its own again and frees its row."
+        entity.hitbox = rl.Rectangle.from_buffer_copy(entity.hitbox)
+        if isinstance(getattr(entity, 'velocity', None), rl.Vector2):
+            entity.velocity = rl.Vector2.from_buffer_copy(entity.velocity)
+        self.release(self._rows[entity])
+
+    def _move(self, source: int, target: int) -> None:
+        size = self.chunk_size
+        (source_chunk, source_row), (target_chunk, target_row) = divmod(source, size), divmod(target, size)
+        self.rects[target_chunk][target_row * 4:target_row * 4 + 4] = self.rects[source_chunk][source_row * 4:source_row * 4 + 4]
+        self.velocities[target_chunk][target_row * 2:target_row * 2 + 2] = self.velocities[source_chunk][source_row * 2:source_row * 2 + 2]
+        self.flags[target_chunk][target_row] = self.flags[source_chunk][source_row]
+        self.floors[target_chunk][target_row] = self.floors[source_chunk][source_row]
+        self.flags[source_chunk][source_row] = 0
+
+        self._bump(target) # handed out again, to the entity moving in
+        owner = self._owners.pop(source, None)
+        if owner is None:
+            return
+        self._owners[target] = owner
+        self._rows[owner] = target
+        if getattr(owner, 'store', None) is self: # an EntityView, just a row number
+            owner.index, owner.generation = target, self.generation(target)
+            return
+        owner.hitbox = self.rect(target)
+        if isinstance(getattr(owner, 'velocity', None), rl.Vector2):
+            owner.velocity = self.velocity(target)
+
+    def compact(self, limit: int = 256) -> int:
+        """Moves up to `limit` live rows from the end of the columns into free rows further down, rebinding their entities.
+
+        Run a little every frame, this keeps the rows walked by columns() close to the live count instead of the peak.
+        Returns how many rows were moved.
+        """
+        free = self._free
+        moved = 0
+        while True:
+            while self._top > 0 and self._top - 1 in free: # free rows at the end just get cut off
+                self._top -= 1
+                free.remove(self._top)
+            if moved >= limit or len(free) == 0:
+                break
+            self._top -= 1
+            self._move(self._top, free.pop())
+            moved += 1
+
+        # keep one spare chunk past the end, give the rest back
+        needed = self._top // self.chunk_size + 2
+        while len(self.rects) > needed:
+            for column in (self.rects, self.velocities, self.flags, self.floors, self._rect_views, self._velocity_views):
+                column.pop()
+        return moved